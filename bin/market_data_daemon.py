@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+from typing import Dict, List, Optional
+
+import path_util  # noqa: F401
+
+from hummingbot import init_logging
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    create_yml_files_legacy,
+    get_connector_class,
+    load_client_config_map_from_file,
+)
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
+from hummingbot.data_feed.market_data_daemon.market_data_daemon import MarketDataDaemon
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Shares the order books of the exchanges with all the bots running on the host.")
+        self.add_argument("--socket-path", "-s",
+                          type=str,
+                          default=None,
+                          help="The path of the Unix socket the bots connect to, in a directory only accessible by "
+                               "the user. Defaults to the one of the client configuration.")
+        self.add_argument("--market", "-m",
+                          type=str,
+                          action="append",
+                          required=True,
+                          help="A connector and the trading pairs to track, e.g. binance:BTC-USDT,ETH-USDT. "
+                               "Can be repeated.")
+        self.add_argument("--shared-memory-depth",
+                          type=int,
+                          default=0,
+                          help="The number of levels per side of the order books published to shared memory, "
+                               "0 to disable it.")
+        self.add_argument("--record-dir",
+                          type=str,
+                          default=None,
+                          help="The directory where the order book messages of each connector are recorded, to be "
+                               "replayed in backtests.")
+
+
+def parse_markets(markets: List[str]) -> Dict[str, List[str]]:
+    trading_pairs_by_connector: Dict[str, List[str]] = {}
+    for market in markets:
+        connector_name, trading_pairs = market.split(":")
+        trading_pairs_by_connector.setdefault(connector_name, []).extend(
+            trading_pair.strip() for trading_pair in trading_pairs.split(","))
+    return trading_pairs_by_connector
+
+
+def create_connector(connector_name: str, trading_pairs: List[str]) -> ConnectorBase:
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    connector_config = AllConnectorSettings.get_connector_config_keys(connector_name)
+    api_keys = {key: "" for key in connector_config.__fields__.keys() if key != "connector"}
+    init_params = AllConnectorSettings.get_connector_settings()[connector_name].conn_init_parameters(
+        trading_pairs=trading_pairs,
+        trading_required=False,
+        api_keys=api_keys,
+        client_config_map=client_config_map,
+    )
+    return get_connector_class(connector_name)(**init_params)
+
+
+async def run_daemon(socket_path: str,
+                     trading_pairs_by_connector: Dict[str, List[str]],
+                     shared_memory_depth: int,
+                     record_dir: Optional[str]):
+    connectors = {connector_name: create_connector(connector_name, trading_pairs)
+                  for connector_name, trading_pairs in trading_pairs_by_connector.items()}
+    daemon = MarketDataDaemon(
+        socket_path=socket_path,
+        data_sources={connector_name: connector.order_book_tracker.data_source
+                      for connector_name, connector in connectors.items()},
+        shared_memory_depth=shared_memory_depth,
+        record_dir=record_dir,
+    )
+    await daemon.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await daemon.stop()
+
+
+def main():
+    parser = CmdlineParser()
+    args = parser.parse_args()
+    trading_pairs_by_connector = parse_markets(args.market)
+    unsupported_connectors = [connector_name for connector_name in trading_pairs_by_connector
+                              if not RemoteAPIOrderBookDataSource.supports_connector(connector_name)]
+    if len(unsupported_connectors) > 0:
+        parser.error(f"The market data daemon can't serve {', '.join(unsupported_connectors)}.")
+    asyncio.get_event_loop().run_until_complete(create_yml_files_legacy())
+    init_logging("hummingbot_logs.yml", ClientConfigAdapter(ClientConfigMap()), strategy_file_path="market_data_daemon")
+    socket_path = args.socket_path or load_client_config_map_from_file().market_data_daemon.socket_path()
+    asyncio.get_event_loop().run_until_complete(run_daemon(
+        socket_path, trading_pairs_by_connector, args.shared_memory_depth, args.record_dir))
+
+
+if __name__ == "__main__":
+    main()
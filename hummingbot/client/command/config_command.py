@@ -87,6 +87,22 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "order_latency_metrics",
+                             "order_latency_metrics_enabled",
+                             "order_latency_metrics_host",
+                             "order_latency_metrics_port",
+                             "market_data_daemon",
+                             "market_data_daemon_enabled",
+                             "market_data_daemon_socket_path",
+                             "market_data_daemon_connectors",
+                             "order_book_shared_memory",
+                             "order_book_shared_memory_enabled",
+                             "order_book_shared_memory_depth",
+                             "rest_connection_pool",
+                             "rest_connection_limit_per_host",
+                             "rest_connection_keepalive_timeout",
+                             "rest_connection_keepalive_ping_interval",
+                             "rest_dns_cache_ttl",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
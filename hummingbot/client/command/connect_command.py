@@ -141,7 +141,7 @@ class ConnectCommand:
         err_msg = await self.validate_n_connect_connector(connector_name)
         if err_msg is None:
             self.notify(f"\nYou are now connected to {connector_name}.")
-            safe_ensure_future(TradingPairFetcher.get_instance(client_config_map=ClientConfigAdapter).fetch_all(client_config_map=ClientConfigAdapter))
+            safe_ensure_future(TradingPairFetcher.get_instance().fetch_trading_pairs(connector_name))
         else:
             self.notify(f"\nError: {err_msg}")
             if previous_keys is not None:
@@ -4,12 +4,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, TradeAggregate
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -42,18 +42,33 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        safe_ensure_future(self.history_report_from_store(start_time, verbose, precision))
+
+    async def history_report_from_store(self,  # type: HummingbotApplication
+                                        start_time: float,
+                                        verbose: bool = False,
+                                        precision: Optional[int] = None):
+        aggregates: List[TradeAggregate] = await self.get_trade_aggregates(start_time)
+        if not aggregates:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        await self.history_report_from_aggregates(start_time, aggregates, precision)
+
+    async def get_trade_aggregates(self,  # type: HummingbotApplication
+                                   start_time: float) -> List[TradeAggregate]:
+        """
+        Returns the totals of the trades of the current strategy since the start time by market and trading pair,
+        from the performance metrics store when available, otherwise recalculated from the trades in a worker thread.
+        """
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name
-            )
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+            aggregates: Optional[List[TradeAggregate]] = self.performance_metrics_store.get_aggregates(
+                session, self.strategy_file_name, start_time)
+        if aggregates is None:
+            aggregates = await self.performance_metrics_store.recalculate_aggregates(
+                self.trade_fill_db, self.strategy_file_name, start_time)
+        return aggregates
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -74,11 +89,41 @@ class HistoryCommand:
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+
+        async def create_performance_metrics(market: str, symbol: str, cur_balances: Dict[str, Decimal]):
+            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            return await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+
+        return await self._history_report_by_market(
+            start_time, market_info, create_performance_metrics, precision, display_report)
+
+    async def history_report_from_aggregates(self,  # type: HummingbotApplication
+                                             start_time: float,
+                                             aggregates: List[TradeAggregate],
+                                             precision: Optional[int] = None,
+                                             display_report: bool = True) -> Decimal:
+        aggregates_by_market: Dict[Tuple[str, str], TradeAggregate] = {
+            (aggregate.market, aggregate.trading_pair): aggregate for aggregate in aggregates
+        }
+
+        async def create_performance_metrics(market: str, symbol: str, cur_balances: Dict[str, Decimal]):
+            return await PerformanceMetrics.create_from_aggregate(
+                symbol, aggregates_by_market[(market, symbol)], cur_balances)
+
+        return await self._history_report_by_market(
+            start_time, set(aggregates_by_market), create_performance_metrics, precision, display_report)
+
+    async def _history_report_by_market(
+            self,  # type: HummingbotApplication
+            start_time: float,
+            market_info: Set[Tuple[str, str]],
+            create_performance_metrics: Callable[[str, str, Dict[str, Decimal]], Awaitable[PerformanceMetrics]],
+            precision: Optional[int] = None,
+            display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -87,7 +132,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await create_performance_metrics(market, symbol, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -527,13 +572,8 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name
-            )
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        aggregates: List[TradeAggregate] = await self.get_trade_aggregates(start_time)
+        avg_return = await self.history_report_from_aggregates(start_time, aggregates, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
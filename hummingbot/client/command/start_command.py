@@ -18,6 +18,7 @@ from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.security import Security
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
@@ -121,6 +122,8 @@ class StartCommand(GatewayChainApiManager):
             appnope.nope()
 
         self._initialize_notifiers()
+        # The strategy reads the decrypted connector configs
+        await Security.wait_til_decryption_done()
         try:
             self._initialize_strategy(self.strategy_name)
         except NotImplementedError:
@@ -16,6 +16,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.order_latency_tracker import OrderLatencyTracker
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger.application_warning import ApplicationWarning
@@ -77,8 +78,22 @@ class StatusCommand:
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        latency_status = [tracker.format_status(connector_name)
+                          for connector_name, tracker in self.order_latency_trackers().items()
+                          if len(tracker.histograms) > 0]
+        if len(latency_status) > 0:
+            status += "\n\n" + "\n\n".join(latency_status)
         return status
 
+    def order_latency_trackers(self,  # type: HummingbotApplication
+                               ) -> Dict[str, OrderLatencyTracker]:
+        trackers = {}
+        for connector_name, market in self.markets.items():
+            tracker = getattr(market, "order_latency_tracker", None)
+            if isinstance(tracker, OrderLatencyTracker):
+                trackers[connector_name] = tracker
+        return trackers
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -52,8 +52,13 @@ class StopCommand:
             RateOracle.get_instance().stop()
 
         if self.markets_recorder is not None:
+            await self.markets_recorder.flush()
             self.markets_recorder.stop()
 
+        if self._metrics_server is not None:
+            await self._metrics_server.stop()
+            self._metrics_server = None
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -26,6 +26,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.data_feed.market_data_daemon import protocol as market_data_daemon_protocol
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -173,6 +174,144 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class OrderLatencyMetricsConfigMap(BaseClientModel):
+    order_latency_metrics_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the Prometheus endpoint serving the order latency metrics"
+            ),
+        ),
+    )
+    order_latency_metrics_host: str = Field(
+        default="127.0.0.1",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interface the order latency metrics endpoint listens on (Default=127.0.0.1)"
+            ),
+        ),
+    )
+    order_latency_metrics_port: int = Field(
+        default=9464,
+        ge=1,
+        le=65535,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the port of the order latency metrics endpoint (Default=9464)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "order_latency_metrics"
+
+
+class MarketDataDaemonConfigMap(BaseClientModel):
+    market_data_daemon_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable reading the order books from the shared market data daemon"
+            ),
+        ),
+    )
+    market_data_daemon_socket_path: str = Field(
+        default="",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the path of the Unix socket of the market data daemon, in a directory only accessible by your user "
+                "(Default=data/market_data_daemon/market_data.sock)"
+            ),
+        ),
+    )
+    market_data_daemon_connectors: str = Field(
+        default="",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the comma separated names of the connectors served by the market data daemon "
+                "(e.g. binance,okx)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "market_data_daemon"
+
+    def serves_connector(self, connector_name: str) -> bool:
+        return (self.market_data_daemon_enabled
+                and connector_name in [name.strip() for name in self.market_data_daemon_connectors.split(",")])
+
+    def socket_path(self) -> str:
+        return self.market_data_daemon_socket_path or market_data_daemon_protocol.default_socket_path()
+
+
+class OrderBookSharedMemoryConfigMap(BaseClientModel):
+    order_book_shared_memory_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable publishing the top of the order books to shared memory for the local processes"
+            ),
+        ),
+    )
+    order_book_shared_memory_depth: int = Field(
+        default=20,
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of levels per side published to shared memory (Default=20)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "order_book_shared_memory"
+
+
+class RESTConnectionPoolConfigMap(BaseClientModel):
+    rest_connection_limit_per_host: int = Field(
+        default=30,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the maximum number of simultaneous connections to each exchange REST API host, 0 for no limit "
+                "(Default=30)"
+            ),
+        ),
+    )
+    rest_connection_keepalive_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time an idle connection to an exchange REST API is kept open, in seconds (Default=60)"
+            ),
+        ),
+    )
+    rest_connection_keepalive_ping_interval: float = Field(
+        default=30.0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the interval of the requests keeping the connections to the exchange REST APIs alive, in seconds, "
+                "0 to disable them (Default=30)"
+            ),
+        ),
+    )
+    rest_dns_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the time the DNS resolutions of the exchange REST API hosts are cached, in seconds (Default=300)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "rest_connection_pool"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -1102,6 +1241,10 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    order_latency_metrics: OrderLatencyMetricsConfigMap = Field(default=OrderLatencyMetricsConfigMap())
+    market_data_daemon: MarketDataDaemonConfigMap = Field(default=MarketDataDaemonConfigMap())
+    order_book_shared_memory: OrderBookSharedMemoryConfigMap = Field(default=OrderBookSharedMemoryConfigMap())
+    rest_connection_pool: RESTConnectionPoolConfigMap = Field(default=RESTConnectionPoolConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -78,6 +78,8 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
     """
     Since trading pair validation and autocomplete are UI optimizations that do not impact bot performances,
     in case of network issues or slow wifi, this check returns true and does not prevent users from proceeding,
+    The cached trading pairs can be a day old, so a trading pair not found in them (e.g. a market listed since) is
+    accepted while they are fetched again, and only rejected when they are up to date.
     """
     from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
     trading_pair_fetcher: TradingPairFetcher = TradingPairFetcher.get_instance()
@@ -85,7 +87,7 @@ def validate_market_trading_pair(market: str, value: str) -> Optional[str]:
         trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
         if len(trading_pairs) == 0:
             return None
-        elif value not in trading_pairs:
+        elif value not in trading_pairs and not trading_pair_fetcher.refresh_trading_pairs(market):
             return f"{value} is not an active market on {market}."
 
 
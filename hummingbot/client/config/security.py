@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -21,10 +22,17 @@ from hummingbot.logger import HummingbotLogger
 
 
 class Security:
+    """
+    Decrypts the connector configs in the background after the login. The key derivation releases the GIL, so the
+    configs are decrypted in parallel in a thread pool.
+    """
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
     _decryption_done = asyncio.Event()
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    DECRYPTION_WORKERS = 8
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -61,8 +69,9 @@ class Security:
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        connector_configs = cls._decryption_executor().map(load_connector_config_map_from_file, encrypted_files)
+        for file, connector_config in zip(encrypted_files, connector_configs):
+            cls._secure_configs[connector_name_from_file(file)] = connector_config
         cls._decryption_done.set()
 
     @classmethod
@@ -110,3 +119,10 @@ class Security:
             else {}
         )
         return keys
+
+    @classmethod
+    def _decryption_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.DECRYPTION_WORKERS,
+                                               thread_name_prefix="connector_config_decryption")
+        return cls._executor
@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance_metrics_store import PerformanceMetricsStore
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -32,6 +33,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -40,6 +42,7 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.notifier.notifier_base import NotifierBase
+from hummingbot.remote_iface.metrics_server import MetricsServer
 from hummingbot.remote_iface.mqtt import MQTTGateway
 from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -75,7 +78,7 @@ class HummingbotApplication(*commands):
         self.ssl_config_map: SSLConfigMap = (  # type-hint enables IDE auto-complete
             load_ssl_config_map_from_file()
         )
-        # This is to start fetching trading pairs for auto-complete
+        # This is to load the trading pairs cache for auto-complete, the pairs are fetched on demand
         TradingPairFetcher.get_instance(self.client_config_map)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         self.markets: Dict[str, ExchangeBase] = {}
@@ -104,10 +107,12 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_metrics_store: PerformanceMetricsStore = PerformanceMetricsStore(self.init_time)
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
         self._mqtt: MQTTGateway = None
+        self._metrics_server: Optional[MetricsServer] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -326,10 +331,22 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            self.performance_metrics_store,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
+        self._start_metrics_server()
+
+    def _start_metrics_server(self):
+        metrics_config = self.client_config_map.order_latency_metrics
+        if metrics_config.order_latency_metrics_enabled and self._metrics_server is None:
+            self._metrics_server = MetricsServer(
+                trackers_provider=self.order_latency_trackers,
+                host=metrics_config.order_latency_metrics_host,
+                port=metrics_config.order_latency_metrics_port,
+            )
+            safe_ensure_future(self._metrics_server.start())
 
     def _initialize_notifiers(self):
         self.notifiers.extend(
@@ -1,6 +1,6 @@
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -71,6 +71,15 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_aggregate(cls,
+                                    trading_pair: str,
+                                    aggregate: "TradeAggregate",
+                                    current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_aggregate(trading_pair, aggregate, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +205,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_averages()
+
+        return buys, sells
+
+    def _calculate_totals_and_averages(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +220,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -225,6 +237,10 @@ class PerformanceMetrics:
         return impact
 
     async def _calculate_fees(self, quote: str, trades: List[Any]):
+        self._accumulate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
+
+    def _accumulate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
             trade_price = None
@@ -248,6 +264,7 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -266,23 +283,32 @@ class PerformanceMetrics:
         self.trade_pnl = self.cur_value - self.hold_value
 
         # Handle trade_pnl differently for derivatives
-        if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
+        derivative_trade_pnl = self._derivative_trade_pnl(buys, sells)
+        if derivative_trade_pnl is not None:
+            self.trade_pnl = derivative_trade_pnl
+
+    def _derivative_trade_pnl(self, buys: list, sells: list) -> Optional[Decimal]:
+        """
+        Calculates the PnL of the closed positions, or returns None if the trades are not derivative trades
+        """
+        if not (self._are_derivatives(buys) or self._are_derivatives(sells)):
+            return None
+        buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
+        long = []
+        short = []
 
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
+        while True:
+            lng = self.position_order(buys_copy, sells_copy)
+            if lng is not None:
+                long.append(lng)
 
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
+            sht = self.position_order(sells_copy, buys_copy)
+            if sht is not None:
+                short.append(sht)
+            if lng is None and sht is None:
+                break
 
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+        return Decimal(str(sum(self.derivative_pnl(long, short))))
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -302,15 +328,71 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(
+            trading_pair=trading_pair,
+            start_price=Decimal(str(trades[0].price)),
+            last_trade_price=Decimal(str(trades[-1].price)),
+            current_balances=current_balances,
+        )
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_aggregate(self,
+                                                 trading_pair: str,
+                                                 aggregate: "TradeAggregate",
+                                                 current_balances: Dict[str, Decimal]):
+        """
+        Calculates the same metrics as `_initialize_metrics` from the running totals of the trades
+        :param trading_pair: the trading market to get performance metrics
+        :param aggregate: the aggregated trades of the market
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(trading_pair)
+        self.num_buys = aggregate.num_buys
+        self.num_sells = aggregate.num_sells
+        self.num_trades = self.num_buys + self.num_sells
+        self.b_vol_base = aggregate.b_vol_base
+        self.b_vol_quote = aggregate.b_vol_quote
+        self.s_vol_base = aggregate.s_vol_base
+        self.s_vol_quote = aggregate.s_vol_quote
+        self._calculate_totals_and_averages()
+
+        # The reports are built from the trades sorted from the newest to the oldest
+        await self._calculate_balances_and_values(
+            trading_pair=trading_pair,
+            start_price=aggregate.last_price,
+            last_trade_price=aggregate.first_price,
+            current_balances=current_balances,
+        )
+        self.trade_pnl = self.cur_value - self.hold_value
+        if aggregate.derivative_trade_pnl is not None:
+            self.trade_pnl = aggregate.derivative_trade_pnl
+
+        self.fees.update(aggregate.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal,
+                                             current_balances: Dict[str, Decimal]):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +400,85 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
 
-        await self._calculate_fees(quote, trades)
 
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+@dataclass
+class TradeAggregate:
+    """
+    Running totals of the trade fills of a market and trading pair, kept with the same conventions as
+    PerformanceMetrics (buy quote volume and sell base volume are negative) so that the performance report can be
+    built without going through all the trades again.
+    """
+    market: str
+    trading_pair: str
+    num_buys: int = 0
+    num_sells: int = 0
+    # Number of trades that open or close a derivative position, their PnL requires the full list of trades
+    num_position_trades: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+    first_price: Decimal = s_decimal_nan
+    last_price: Decimal = s_decimal_nan
+    first_timestamp: Optional[int] = None
+    last_timestamp: Optional[int] = None
+    # Only available when the aggregate is calculated from the full list of trades
+    derivative_trade_pnl: Optional[Decimal] = None
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @classmethod
+    def from_trades(cls,
+                    market: str,
+                    trading_pair: str,
+                    trades: List[TradeFill],
+                    calculate_derivative_trade_pnl: bool = True) -> "TradeAggregate":
+        """
+        Aggregates the trades, sorted from the oldest to the newest
+        :param calculate_derivative_trade_pnl: whether to calculate the PnL of the closed positions, this aggregates
+        the fills of the same order in place (see `PerformanceMetrics.aggregate_orders`)
+        """
+        aggregate = TradeAggregate(market=market, trading_pair=trading_pair)
+        for trade in trades:
+            aggregate.add_trade(trade)
+        if calculate_derivative_trade_pnl and aggregate.num_position_trades > 0:
+            performance = PerformanceMetrics()
+            buys = [t for t in trades if t.trade_type.upper() == TradeType.BUY.name.upper()]
+            sells = [t for t in trades if t.trade_type.upper() == TradeType.SELL.name.upper()]
+            aggregate.derivative_trade_pnl = performance._derivative_trade_pnl(buys, sells)
+        return aggregate
+
+    def add_trade(self, trade: TradeFill):
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+
+        trade_fee = trade.trade_fee
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * fee_percent * Decimal("-1")
+            _, quote = split_hb_trading_pair(self.trading_pair)
+            self.fees[quote] = self.fees.get(quote, s_decimal_0) + price * amount * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] = self.fees.get(flat_fee["token"], s_decimal_0) + Decimal(flat_fee["amount"])
+
+        if trade.position is not None and trade.position != PositionAction.NIL.value:
+            self.num_position_trades += 1
+        if self.first_timestamp is None or trade.timestamp < self.first_timestamp:
+            self.first_timestamp = trade.timestamp
+            self.first_price = price
+        if self.last_timestamp is None or trade.timestamp >= self.last_timestamp:
+            self.last_timestamp = trade.timestamp
+            self.last_price = price
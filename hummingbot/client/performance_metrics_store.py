@@ -0,0 +1,108 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.client.performance import TradeAggregate
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregate import TradeFillAggregate
+
+
+class PerformanceMetricsStore:
+    """
+    Keeps running totals of the trade fills by config file, market and trading pair, so that the performance reports
+    are calculated in O(number of pairs) instead of going through all the trades:
+
+    - the totals of all the trades of a config file are persisted in the TradeFillAggregate table
+    - the totals of the trades of the current session (since `session_start_timestamp`) are kept in memory
+
+    Reports over any other period, or with derivative positions, need the full list of trades. They are recalculated
+    on demand in a worker thread, which also rebuilds the persisted totals.
+    """
+    def __init__(self, session_start_timestamp: float):
+        """
+        :param session_start_timestamp: the start of the current session, in seconds
+        """
+        self._session_start_timestamp = int(session_start_timestamp * 1e3)
+        self._session_aggregates: Dict[str, Dict[Tuple[str, str], TradeAggregate]] = {}
+        self._recorded_fills_count: Dict[str, int] = {}
+
+    def record_trade_fill(self, sql_session: Session, trade_fill: TradeFill):
+        """
+        Adds the trade fill to the totals. It has to be called in the same transaction that stores the trade fill.
+        """
+        TradeFillAggregate.add_trade_fill(sql_session, trade_fill)
+        session_aggregates = self._session_aggregates.setdefault(trade_fill.config_file_path, {})
+        key = (trade_fill.market, trade_fill.symbol)
+        if key not in session_aggregates:
+            session_aggregates[key] = TradeAggregate(market=trade_fill.market, trading_pair=trade_fill.symbol)
+        session_aggregates[key].add_trade(trade_fill)
+        self._recorded_fills_count[trade_fill.config_file_path] = (
+            self._recorded_fills_count.get(trade_fill.config_file_path, 0) + 1)
+
+    def get_aggregates(self,
+                       sql_session: Session,
+                       config_file_path: str,
+                       start_timestamp: float) -> Optional[List[TradeAggregate]]:
+        """
+        Returns the totals of the trades of the config file since the start timestamp (in seconds), or None if they
+        have to be recalculated from the trades (see `recalculate_aggregates`)
+        """
+        start_timestamp_ms = int(start_timestamp * 1e3)
+        records = TradeFillAggregate.get_records(sql_session, config_file_path)
+        if (len(records) > 0
+                and all(record.is_complete for record in records)
+                and start_timestamp_ms <= min(record.first_timestamp for record in records)):
+            aggregates = [record.to_trade_aggregate() for record in records]
+        elif start_timestamp_ms == self._session_start_timestamp:
+            aggregates = list(self._session_aggregates.get(config_file_path, {}).values())
+        else:
+            return None
+        if any(aggregate.num_position_trades > 0 for aggregate in aggregates):
+            return None
+        return aggregates
+
+    async def recalculate_aggregates(self,
+                                     sql_manager: SQLConnectionManager,
+                                     config_file_path: str,
+                                     start_timestamp: float) -> List[TradeAggregate]:
+        """
+        Calculates the totals of the trades of the config file since the start timestamp (in seconds) from the trade
+        fills, in a worker thread. The persisted totals of the config file are rebuilt at the same time.
+        """
+        recorded_fills_count = self._recorded_fills_count.get(config_file_path, 0)
+        aggregates, all_time_aggregates = await asyncio.get_event_loop().run_in_executor(
+            None, self._calculate_aggregates, sql_manager, config_file_path, int(start_timestamp * 1e3))
+        if recorded_fills_count == self._recorded_fills_count.get(config_file_path, 0):
+            # Otherwise a fill was recorded while calculating, the totals are rebuilt on the next recalculation
+            with sql_manager.get_new_session() as session:
+                with session.begin():
+                    TradeFillAggregate.replace_records(session, config_file_path, all_time_aggregates)
+        return aggregates
+
+    @staticmethod
+    def _calculate_aggregates(sql_manager: SQLConnectionManager,
+                              config_file_path: str,
+                              start_timestamp_ms: int) -> Tuple[List[TradeAggregate], List[TradeAggregate]]:
+        with sql_manager.get_new_session() as session:
+            trades: List[TradeFill] = (session
+                                       .query(TradeFill)
+                                       .filter(TradeFill.config_file_path == config_file_path)
+                                       .order_by(TradeFill.timestamp.asc())
+                                       .all())
+            session.expunge_all()
+
+        trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = {}
+        for trade in trades:
+            trades_by_market.setdefault((trade.market, trade.symbol), []).append(trade)
+
+        aggregates = []
+        all_time_aggregates = []
+        for (market, symbol), market_trades in trades_by_market.items():
+            all_time_aggregates.append(
+                TradeAggregate.from_trades(market, symbol, market_trades, calculate_derivative_trade_pnl=False))
+            period_trades = [trade for trade in market_trades if trade.timestamp >= start_timestamp_ms]
+            if len(period_trades) > 0:
+                aggregates.append(TradeAggregate.from_trades(market, symbol, period_trades))
+        return aggregates, all_time_aggregates
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from cachetools import TTLCache
 
+from hummingbot.connector.order_latency_tracker import OrderLatencyTracker
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
@@ -61,6 +62,11 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        self._latency_tracker = OrderLatencyTracker()
+
+    @property
+    def latency_tracker(self) -> OrderLatencyTracker:
+        return self._latency_tracker
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -142,8 +148,10 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._latency_tracker.record_order_tracked(order)
 
     def stop_tracking_order(self, client_order_id: str):
+        self._latency_tracker.stop_tracking_order(client_order_id)
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
@@ -206,6 +214,7 @@ class ClientOrderTracker:
         tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
 
         if tracked_order:
+            self._latency_tracker.record_trade_update(tracked_order)
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
@@ -276,6 +285,7 @@ class ClientOrderTracker:
         )
 
         if tracked_order:
+            self._latency_tracker.record_order_update(tracked_order, order_update)
             if order_update.new_state == OrderState.FILLED and not tracked_order.is_done:
                 try:
                     await asyncio.wait_for(
@@ -304,10 +314,16 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _trigger_event(self, order: InFlightOrder, event_tag: MarketEvent, event):
+        start_timestamp = self._latency_tracker.now()
+        self._connector.trigger_event(event_tag, event)
+        self._latency_tracker.record_event_dispatch(order.trading_pair, start_timestamp)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
-        self._connector.trigger_event(
+        self._trigger_event(
+            order,
             event_tag,
             event_class(
                 self.current_timestamp,
@@ -324,7 +340,8 @@ class ClientOrderTracker:
         )
 
     def _trigger_cancelled_event(self, order: InFlightOrder):
-        self._connector.trigger_event(
+        self._trigger_event(
+            order,
             MarketEvent.OrderCancelled,
             OrderCancelledEvent(
                 timestamp=self.current_timestamp,
@@ -342,7 +359,8 @@ class ClientOrderTracker:
         trade_id: str,
         exchange_order_id: str,
     ):
-        self._connector.trigger_event(
+        self._trigger_event(
+            order,
             MarketEvent.OrderFilled,
             OrderFilledEvent(
                 timestamp=self.current_timestamp,
@@ -365,7 +383,8 @@ class ClientOrderTracker:
             MarketEvent.BuyOrderCompleted if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCompleted
         )
         event_class = BuyOrderCompletedEvent if order.trade_type is TradeType.BUY else SellOrderCompletedEvent
-        self._connector.trigger_event(
+        self._trigger_event(
+            order,
             event_tag,
             event_class(
                 self.current_timestamp,
@@ -380,7 +399,8 @@ class ClientOrderTracker:
         )
 
     def _trigger_failure_event(self, order: InFlightOrder):
-        self._connector.trigger_event(
+        self._trigger_event(
+            order,
             MarketEvent.OrderFailure,
             MarketOrderFailureEvent(
                 timestamp=self.current_timestamp,
@@ -113,6 +113,14 @@ class BinanceExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def order_status_request_limit_id(self) -> Optional[str]:
+        return CONSTANTS.ORDER_PATH_URL
+
+    @property
+    def open_orders_request_supported(self) -> bool:
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -510,6 +518,24 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_orders_updates(self, trading_pairs: List[str]) -> List[OrderUpdate]:
+        order_updates = []
+        for trading_pair in trading_pairs:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            open_orders = await self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": symbol},
+                is_auth_required=True)
+            for order_data in open_orders:
+                order_updates.append(OrderUpdate(
+                    client_order_id=order_data["clientOrderId"],
+                    exchange_order_id=str(order_data["orderId"]),
+                    trading_pair=trading_pair,
+                    update_timestamp=order_data["updateTime"] * 1e-3,
+                    new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+                ))
+        return order_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
@@ -66,6 +66,8 @@ ACCOUNT_INFO_PATH_URL = "/v5/account/info"
 BALANCE_PATH_URL = "/v5/account/wallet-balance"
 ORDER_PLACE_PATH_URL = "/v5/order/create"
 ORDER_CANCEL_PATH_URL = "/v5/order/cancel"
+BATCH_ORDER_PLACE_PATH_URL = "/v5/order/create-batch"
+BATCH_ORDER_CANCEL_PATH_URL = "/v5/order/cancel-batch"
 GET_ORDERS_PATH_URL = "/v5/order/realtime"
 TRADE_HISTORY_PATH_URL = "/v5/execution/list"
 EXCHANGE_FEE_RATE_PATH_URL = "/v5/account/fee-rate"
@@ -120,6 +122,9 @@ ONE_HOUR = 60 * 60
 MAX_REQUEST_SECURE_DIVIDER = 2
 MAX_REQUEST_LIMIT_DEFAULT = 20 / MAX_REQUEST_SECURE_DIVIDER  # 20/s is the max
 
+# Max number of orders in a spot batch request
+MAX_ORDERS_PER_BATCH = 10
+
 # No more than 600 requests are allowed in any 5-second window.
 # https://bybit-exchange.github.io/docs/v5/rate-limit#ip-rate-limit
 SHARED_RATE_LIMIT = 600  # per 5 second
@@ -184,6 +189,22 @@ RATE_LIMITS = {
             LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
         ]
     ),
+    RateLimit(
+        limit_id=BATCH_ORDER_PLACE_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
+    RateLimit(
+        limit_id=BATCH_ORDER_CANCEL_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
     RateLimit(
         limit_id=GET_ORDERS_PATH_URL,
         limit=MAX_REQUEST_LIMIT_DEFAULT,
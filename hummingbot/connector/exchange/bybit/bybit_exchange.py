@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from bidict import bidict
@@ -212,21 +212,28 @@ class BybitExchange(ExchangePyBase):
     async def _update_account_type(self):
         self._account_type = await self._get_account_type()
 
-    async def _place_order(self,
-                           order_id: str,
-                           trading_pair: str,
-                           amount: Decimal,
-                           trade_type: TradeType,
-                           order_type: OrderType,
-                           price: Decimal,
-                           **kwargs) -> Tuple[str, float]:
+    @property
+    def batch_order_create_max_size(self) -> int:
+        # The spot batch endpoints are only available for unified trading accounts
+        return CONSTANTS.MAX_ORDERS_PER_BATCH if self._account_type == "UNIFIED" else 1
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH if self._account_type == "UNIFIED" else 1
+
+    async def _order_creation_params(self,
+                                     order_id: str,
+                                     trading_pair: str,
+                                     amount: Decimal,
+                                     trade_type: TradeType,
+                                     order_type: OrderType,
+                                     price: Decimal) -> Dict[str, Any]:
         type_str = self.bybit_order_type(order_type)
 
         side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
 
         api_params = {
-            "category": self._category,
             "symbol": symbol,
             "side": side_str,
             "orderType": type_str,
@@ -237,6 +244,25 @@ class BybitExchange(ExchangePyBase):
         }
         if order_type == OrderType.LIMIT:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
+
+    async def _place_order(self,
+                           order_id: str,
+                           trading_pair: str,
+                           amount: Decimal,
+                           trade_type: TradeType,
+                           order_type: OrderType,
+                           price: Decimal,
+                           **kwargs) -> Tuple[str, float]:
+        api_params = {"category": self._category}
+        api_params.update(await self._order_creation_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        ))
 
         response = await self._api_post(
             path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
@@ -251,6 +277,36 @@ class BybitExchange(ExchangePyBase):
         transact_time = int(response["time"]) * 1e-3
         return (o_id, transact_time)
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        api_params = {
+            "category": self._category,
+            "request": [
+                await self._order_creation_params(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                for order in orders
+            ],
+        }
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_PLACE_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        transact_time = int(response["time"]) * 1e-3
+        return [
+            (str(order_result["orderId"]), transact_time)
+            if order_status.get("code", 0) == 0
+            else ValueError(f"{order_status.get('msg')}")
+            for order_result, order_status in self._batch_response_results(response)
+        ]
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         exchange_order_id = tracked_order.exchange_order_id
         client_order_id = tracked_order.client_order_id
@@ -276,6 +332,39 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _cancel_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        cancel_requests = []
+        for order in orders:
+            cancel_request = {"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)}
+            if order.exchange_order_id:
+                cancel_request["orderId"] = order.exchange_order_id
+            else:
+                cancel_request["orderLinkId"] = order.client_order_id
+            cancel_requests.append(cancel_request)
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data={"category": self._category, "request": cancel_requests},
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        results = []
+        for order_result, order_status in self._batch_response_results(response):
+            if order_status.get("code", 0) != 0:
+                results.append(ValueError(f"{order_status.get('msg')}"))
+            else:
+                results.append("orderLinkId" in order_result)
+        return results
+
+    @staticmethod
+    def _batch_response_results(response: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        # The result of each request of the batch, and its status in retExtInfo, are reported in the same position
+        orders_results = response.get("result", {}).get("list", [])
+        orders_statuses = response.get("retExtInfo", {}).get("list", [])
+        orders_statuses = orders_statuses + [{}] * (len(orders_results) - len(orders_statuses))
+        return list(zip(orders_results, orders_statuses))
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_pair_rules = exchange_info_dict.get("result", []).get("list", [])
         retval = []
@@ -14,6 +14,8 @@ NETWORK_CHECK_PATH_URL = "spot/currencies/BTC"
 SYMBOL_PATH_URL = "spot/currency_pairs"
 ORDER_CREATE_PATH_URL = "spot/orders"
 ORDER_DELETE_PATH_URL = "spot/orders/{order_id}"
+BATCH_ORDER_CREATE_PATH_URL = "spot/batch_orders"
+BATCH_ORDER_DELETE_PATH_URL = "spot/cancel_batch_orders"
 USER_BALANCES_PATH_URL = "spot/accounts"
 ORDER_STATUS_PATH_URL = "spot/orders/{order_id}"
 USER_ORDERS_PATH_URL = "spot/open_orders"
@@ -46,6 +48,11 @@ UPDATE_ORDER_STATUS_INTERVAL = 60.0
 # 10 minute interval to update trading rules, these would likely never change whilst running.
 INTERVAL_TRADING_RULES = 600
 
+# Batch requests limits
+MAX_ORDERS_PER_BATCH_CREATE = 10
+MAX_TRADING_PAIRS_PER_BATCH_CREATE = 4
+MAX_ORDERS_PER_BATCH_DELETE = 20
+
 PUBLIC_URL_POINTS_LIMIT_ID = "PublicPoints"
 PRIVATE_URL_POINTS_LIMIT_ID = "PrivatePoints"  # includes place-orders
 CANCEL_ORDERS_LIMITS_ID = "CancelOrders"
@@ -59,6 +66,10 @@ RATE_LIMITS = [
     RateLimit(limit_id=SYMBOL_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PUBLIC_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_CREATE_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_DELETE_LIMIT_ID, limit=5_000, time_interval=1, linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID)]),
+    RateLimit(limit_id=BATCH_ORDER_CREATE_PATH_URL, limit=900, time_interval=1,
+              linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID, MAX_ORDERS_PER_BATCH_CREATE)]),
+    RateLimit(limit_id=BATCH_ORDER_DELETE_PATH_URL, limit=5_000, time_interval=1,
+              linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID, MAX_ORDERS_PER_BATCH_DELETE)]),
     RateLimit(limit_id=USER_BALANCES_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_STATUS_LIMIT_ID, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=USER_ORDERS_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
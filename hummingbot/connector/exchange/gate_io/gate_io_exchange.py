@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -176,14 +176,21 @@ class GateIoExchange(ExchangePyBase):
                     f"Error parsing the trading pair rule {rule}. Skipping.", exc_info=True)
         return result
 
-    async def _place_order(self,
-                           order_id: str,
-                           trading_pair: str,
-                           amount: Decimal,
-                           trade_type: TradeType,
-                           order_type: OrderType,
-                           price: Decimal,
-                           **kwargs) -> Tuple[str, float]:
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_CREATE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH_DELETE
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -217,10 +224,26 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
+        return data
 
+    async def _place_order(self,
+                           order_id: str,
+                           trading_pair: str,
+                           amount: Decimal,
+                           trade_type: TradeType,
+                           order_type: OrderType,
+                           price: Decimal,
+                           **kwargs) -> Tuple[str, float]:
         # RESTRequest does not support json, and if we pass a dict
         # the underlying aiohttp will encode it to params
-        data = data
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
         order_result = await self._api_post(
             path_url=endpoint,
@@ -233,6 +256,57 @@ class GateIoExchange(ExchangePyBase):
         exchange_order_id = str(order_result["id"])
         return exchange_order_id, self.current_timestamp
 
+    def _split_orders_for_batch_create(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        # Gate.io accepts orders for a limited number of markets in each batch
+        batches = []
+        batch = []
+        batch_trading_pairs = set()
+        for order in orders:
+            is_new_pair = order.trading_pair not in batch_trading_pairs
+            if (len(batch) == self.batch_order_create_max_size
+                    or (is_new_pair and len(batch_trading_pairs) == CONSTANTS.MAX_TRADING_PAIRS_PER_BATCH_CREATE)):
+                batches.append(batch)
+                batch = []
+                batch_trading_pairs = set()
+            batch.append(order)
+            batch_trading_pairs.add(order.trading_pair)
+        if len(batch) > 0:
+            batches.append(batch)
+        return batches
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+        )
+        results_by_id = {order_result.get("text"): order_result for order_result in orders_results}
+        results = []
+        for order in orders:
+            order_result = results_by_id.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {orders_results}"))
+            elif not order_result.get("succeeded", False) or order_result.get("status") in {"cancelled"}:
+                results.append(IOError({
+                    "label": order_result.get("label", "ORDER_REJECTED"),
+                    "message": order_result.get("message", "Order rejected."),
+                }))
+            else:
+                results.append((str(order_result["id"]), self.current_timestamp))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation-specific method is called by _cancel
@@ -252,6 +326,43 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _cancel_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        # The orders still waiting for their exchange order id can't be canceled yet. They fail like a single
+        # cancelation would, without holding back the cancelation of the other orders
+        orders_with_id = [order for order in orders if order.exchange_order_id is not None]
+        cancel_results = []
+        if len(orders_with_id) > 0:
+            data = [
+                {
+                    "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                    "id": order.exchange_order_id,
+                }
+                for order in orders_with_id
+            ]
+            cancel_results = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_DELETE_PATH_URL,
+            )
+        results_by_id = {str(cancel_result.get("id")): cancel_result for cancel_result in cancel_results}
+        results = []
+        for order in orders:
+            if order.exchange_order_id is None:
+                results.append(asyncio.TimeoutError(f"The order {order.client_order_id} has no exchange order id yet"))
+                continue
+            cancel_result = results_by_id.get(order.exchange_order_id)
+            if cancel_result is None:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {cancel_results}"))
+            elif cancel_result.get("succeeded", False):
+                results.append(True)
+            else:
+                results.append(IOError({
+                    "label": cancel_result.get("label"),
+                    "message": cancel_result.get("message"),
+                }))
+        return results
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
@@ -1,6 +1,6 @@
 import sys
 
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
 
 MAX_ORDER_ID_LEN = 40
 TRADING_FEES_SYMBOL_LIMIT = 10
@@ -23,6 +23,8 @@ SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
 ORDERS_PATH_URL_HFT = "/api/v1/hf/orders"
+BATCH_ORDERS_PATH_URL = "/api/v1/orders/multi"
+BATCH_ORDERS_PATH_URL_HFT = "/api/v1/hf/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
@@ -37,6 +39,10 @@ WS_REQUEST_LIMIT_ID = "WSRequest"
 GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
+POST_BATCH_ORDERS_LIMIT_ID = "PostBatchOrders"
+
+# Batch order placement only accepts limit orders for a single market
+MAX_ORDERS_PER_BATCH = 5
 WS_PING_HEARTBEAT = 10
 
 DIFF_EVENT_TYPE = "trade.l2update"
@@ -63,6 +69,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=ORDER_CLIENT_ORDER_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
+    RateLimit(limit_id=POST_BATCH_ORDERS_LIMIT_ID, limit=45, time_interval=3,
+              linked_limits=[LinkedLimitWeightPair(POST_ORDER_LIMIT_ID, MAX_ORDERS_PER_BATCH)]),
     RateLimit(limit_id=ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL_HFT, limit=45, time_interval=3),
     RateLimit(limit_id=FILLS_PATH_URL, limit=9, time_interval=3),
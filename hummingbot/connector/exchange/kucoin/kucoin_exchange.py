@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -93,6 +93,10 @@ class KucoinExchange(ExchangePyBase):
     def orders_path_url(self):
         return CONSTANTS.ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_PATH_URL
 
+    @property
+    def batch_orders_path_url(self):
+        return CONSTANTS.BATCH_ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.BATCH_ORDERS_PATH_URL
+
     @property
     def fills_path_url(self):
         return CONSTANTS.FILLS_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.FILLS_PATH_URL
@@ -187,14 +191,17 @@ class KucoinExchange(ExchangePyBase):
                                                                         quote=symbol_data["quoteCurrency"])
         self._set_trading_pair_symbol_map(mapping)
 
-    async def _place_order(self,
-                           order_id: str,
-                           trading_pair: str,
-                           amount: Decimal,
-                           trade_type: TradeType,
-                           order_type: OrderType,
-                           price: Decimal,
-                           **kwargs) -> Tuple[str, float]:
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
@@ -209,6 +216,24 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
+        return data
+
+    async def _place_order(self,
+                           order_id: str,
+                           trading_pair: str,
+                           amount: Decimal,
+                           trade_type: TradeType,
+                           order_type: OrderType,
+                           price: Decimal,
+                           **kwargs) -> Tuple[str, float]:
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         exchange_order_id = await self._api_post(
             path_url=self.orders_path_url,
             data=data,
@@ -219,6 +244,56 @@ class KucoinExchange(ExchangePyBase):
             raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
         return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
 
+    def _split_orders_for_batch_create(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        # Kucoin only accepts limit orders for a single market in each batch. Market orders are placed individually
+        batches = []
+        limit_orders_by_pair: Dict[str, List[InFlightOrder]] = {}
+        for order in orders:
+            if order.order_type.is_limit_type():
+                limit_orders_by_pair.setdefault(order.trading_pair, []).append(order)
+            else:
+                batches.append([order])
+        for pair_orders in limit_orders_by_pair.values():
+            batches.extend(self._split_in_batches(pair_orders, self.batch_order_create_max_size))
+        return batches
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        orders_data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        if self.domain == "hft":
+            data = {"orderList": orders_data}
+        else:
+            data = {"symbol": orders_data[0]["symbol"], "orderList": orders_data}
+        response = await self._api_post(
+            path_url=self.batch_orders_path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_BATCH_ORDERS_LIMIT_ID,
+        )
+        if response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {response}")
+        # The HFT endpoint returns the list of results, the classic one nests it in a data field
+        orders_results = response["data"] if self.domain == "hft" else response["data"].get("data", [])
+
+        results = []
+        for order, order_result in zip(orders, orders_results):
+            exchange_order_id = order_result.get("orderId", order_result.get("id"))
+            succeeded = order_result.get("success", order_result.get("status") == "success")
+            if succeeded and exchange_order_id:
+                results.append((str(exchange_order_id), self.current_timestamp))
+            else:
+                results.append(IOError(f"Error placing order on Kucoin: {order_result.get('failMsg', order_result)}"))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
@@ -26,6 +26,7 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
+OKX_BATCH_PLACE_ORDERS_PATH = '/api/v5/trade/batch-orders'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
@@ -64,6 +65,15 @@ ORDER_TYPE_MAP = {
 
 NO_LIMIT = sys.maxsize
 
+# Maximum number of orders in a batch request. The batch endpoints rate limits count orders, not requests
+MAX_ORDERS_PER_BATCH = 20
+
+ORDER_CANCEL_SUCCESS_CODES = (
+    "0",
+    "51400",  # Cancelation failed because the order does not exist
+    "51401",  # Cancelation failed because order has been cancelled
+)
+
 RATE_LIMITS = [
     RateLimit(WS_CONNECTION_LIMIT_ID, limit=3, time_interval=1),
     RateLimit(WS_REQUEST_LIMIT_ID, limit=100, time_interval=10),
@@ -77,7 +87,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
-    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_PLACE_ORDERS_PATH, limit=300, time_interval=2, weight=MAX_ORDERS_PER_BATCH),
+    RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2, weight=MAX_ORDERS_PER_BATCH),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
 ]
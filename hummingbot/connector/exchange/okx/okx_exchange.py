@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -176,15 +176,21 @@ class OkxExchange(ExchangePyBase):
                                                                         quote=symbol_data["quoteCcy"])
         self._set_trading_pair_symbol_map(mapping)
 
-    async def _place_order(self,
-                           order_id: str,
-                           trading_pair: str,
-                           amount: Decimal,
-                           trade_type: TradeType,
-                           order_type: OrderType,
-                           price: Decimal,
-                           **kwargs) -> Tuple[str, float]:
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
 
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -198,6 +204,25 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
+        return data
+
+    async def _place_order(self,
+                           order_id: str,
+                           trading_pair: str,
+                           amount: Decimal,
+                           trade_type: TradeType,
+                           order_type: OrderType,
+                           price: Decimal,
+                           **kwargs) -> Tuple[str, float]:
+
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
 
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
@@ -211,6 +236,38 @@ class OkxExchange(ExchangePyBase):
             raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
         return str(data["ordId"]), self.current_timestamp
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+        )
+        # OKX reports the result of each order, even when the request code indicates a partial or total failure
+        results_by_id = {result["clOrdId"]: result for result in response.get("data", [])}
+        results = []
+        for order in orders:
+            result = results_by_id.get(order.client_order_id)
+            if result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response}"))
+            elif result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {result['sMsg']}"))
+            else:
+                results.append((str(result["ordId"]), self.current_timestamp))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
@@ -224,19 +281,30 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
-            # Cancelation failed because the order does not exist
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
-            # Cancelation failed because order has been cancelled
+        if cancel_result["data"][0]["sCode"] in CONSTANTS.ORDER_CANCEL_SUCCESS_CODES:
             final_result = True
         else:
             raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
 
         return final_result
 
+    async def _cancel_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        results_by_id = {result["clOrdId"]: result for result in response.get("data", [])}
+        results = []
+        for order in orders:
+            result = results_by_id.get(order.client_order_id)
+            if result is not None and result["sCode"] in CONSTANTS.ORDER_CANCEL_SUCCESS_CODES:
+                results.append(True)
+            else:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {result or response}"))
+        return results
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
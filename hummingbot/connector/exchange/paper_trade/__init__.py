@@ -1,9 +1,14 @@
-from typing import List
+from pathlib import Path
+from typing import List, Tuple, Union
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_data_source import (
+    OrderBookReplayIterator,
+    ReplayOrderBookDataSource,
+)
 
 
 def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
@@ -22,3 +27,23 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_replay_paper_trade_market(
+    exchange_name: str,
+    client_config_map: ClientConfigAdapter,
+    trading_pairs: List[str],
+    recording_path: Union[str, Path],
+) -> Tuple[PaperTradeExchange, OrderBookReplayIterator]:
+    """
+    Creates a paper trade market whose order books replay a recording of the exchange market data, for backtests.
+    The returned iterator must be added to the clock before the market.
+    """
+    tracker = OrderBookTracker(data_source=ReplayOrderBookDataSource(trading_pairs=trading_pairs,
+                                                                     recording_path=recording_path),
+                               trading_pairs=trading_pairs)
+    market = PaperTradeExchange(client_config_map,
+                                tracker,
+                                get_connector_class(exchange_name),
+                                exchange_name=exchange_name)
+    return market, OrderBookReplayIterator(tracker)
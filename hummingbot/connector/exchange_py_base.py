@@ -4,13 +4,14 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_latency_tracker import OrderLatencyTracker
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -23,6 +24,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -30,6 +32,8 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.request_timing_metrics import RequestTimingMetrics
+from hummingbot.core.web_assistant.rest_assistant import rest_request_timings
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -45,12 +49,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders requested individually per status polling when the rate limit of the order status
+    # requests is unknown (see order_status_request_limit_id)
+    MAX_ORDER_STATUS_REQUESTS_PER_POLL = 20
+    # Share of the rate limit of the order status requests used by the status polling, the rest is left for trading
+    ORDER_STATUS_POLL_RATE_SHARE = 0.5
+    # Time during which the orders whose state was just updated by the user stream are not polled
+    ORDER_STATUS_CONFIRMATION_BACKOFF = 30.0
+    # Number of connections to the exchange REST API opened when the network starts, and kept alive afterwards
+    REST_CONNECTIONS_WARM_UP_COUNT = 2
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
 
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
+        # Timestamp of the last status request of each in flight order (individual or from the open orders)
+        self._order_status_poll_timestamps: Dict[str, float] = {}
         self._trading_rules = {}
         self._trading_fees = {}
 
@@ -60,6 +75,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._rest_connections_keepalive_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -67,16 +83,33 @@ class ExchangePyBase(ExchangeBase, ABC):
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
 
+        # Orders waiting to be sent in the next batch request, with the future resolved with the request result
+        self._batch_create_queue: List[Tuple[InFlightOrder, asyncio.Future]] = []
+        self._batch_cancel_queue: List[Tuple[InFlightOrder, asyncio.Future]] = []
+        self._batch_create_flush_scheduled = False
+        self._batch_cancel_flush_scheduled = False
+
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        connection_pool_config = client_config_map.rest_connection_pool
+        self._web_assistants_factory.configure_connection_pool(
+            limit_per_host=connection_pool_config.rest_connection_limit_per_host,
+            keepalive_timeout=connection_pool_config.rest_connection_keepalive_timeout,
+            dns_cache_ttl=connection_pool_config.rest_dns_cache_ttl)
+        self._rest_connections_keepalive_ping_interval = float(
+            connection_pool_config.rest_connection_keepalive_ping_interval)
 
         # init OrderBook Data Source and Tracker
-        self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_tracker_data_source()
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
             domain=self.domain))
+        shared_memory_config = client_config_map.order_book_shared_memory
+        if shared_memory_config.order_book_shared_memory_enabled:
+            self.order_book_tracker.enable_shared_memory_publishing(
+                connector_name=self.name, depth=shared_memory_config.order_book_shared_memory_depth)
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -187,6 +220,58 @@ class ExchangePyBase(ExchangeBase, ABC):
     def name_cap(self) -> str:
         return self.name.capitalize()
 
+    @property
+    def rest_request_timing_metrics(self) -> RequestTimingMetrics:
+        """
+        Returns the duration of the stages (DNS, connect, time to first byte) of the REST requests sent by the
+        connector, by throttler limit id (e.g. the order creation and cancelation endpoints).
+        """
+        return self._web_assistants_factory.request_timing_metrics
+
+    @property
+    def order_latency_tracker(self) -> OrderLatencyTracker:
+        """
+        Returns the latency histograms of the order lifecycle stages (throttler wait, REST round trip, exchange
+        acknowledgement, cancelation), by trading pair.
+        """
+        return self._order_tracker.latency_tracker
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a single order creation request. Connectors supporting
+        batch creation implement `_place_orders_batch` and override this value. When it is 1 every order is placed
+        with its own request.
+        """
+        return 1
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        The maximum number of orders the exchange accepts in a single order cancelation request. Connectors supporting
+        batch cancelation implement `_cancel_orders_batch` and override this value. When it is 1 every order is
+        canceled with its own request.
+        """
+        return 1
+
+    @property
+    def order_status_request_limit_id(self) -> Optional[str]:
+        """
+        The id of the rate limit of the order status requests. The status polling requests per poll the orders
+        fitting in a share of this rate limit, and the ones left in the next polls. When it is None at most
+        MAX_ORDER_STATUS_REQUESTS_PER_POLL orders are requested per poll.
+        """
+        return None
+
+    @property
+    def open_orders_request_supported(self) -> bool:
+        """
+        Connectors able to request all the open orders of a trading pair at once implement
+        `_request_open_orders_updates` and return True. The status polling then requests individually only the
+        orders missing from the open orders.
+        """
+        return False
+
     @property
     def tracking_states(self) -> Dict[str, any]:
         """
@@ -280,6 +365,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        self._order_tracker.latency_tracker.record_submission(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.BUY,
             order_id=order_id,
@@ -310,6 +396,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
+        self._order_tracker.latency_tracker.record_submission(order_id)
         safe_ensure_future(self._create_order(
             trade_type=TradeType.SELL,
             order_id=order_id,
@@ -466,15 +553,26 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        latency_tracker = self._order_tracker.latency_tracker
+        # Collects the throttler wait and duration of the requests sent to create this order
+        request_timings_token = rest_request_timings.set([])
+        try:
+            latency_tracker.record_request_sent(order)
+            if self.batch_order_create_max_size > 1 and len(kwargs) == 0:
+                exchange_order_id, update_timestamp = await self._place_order_in_batch(order=order)
+            else:
+                exchange_order_id, update_timestamp = await self._place_order(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    **kwargs,
+                )
+            request_timings = rest_request_timings.get()
+        finally:
+            rest_request_timings.reset(request_timings_token)
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -483,6 +581,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             update_timestamp=update_timestamp,
             new_state=OrderState.OPEN,
         )
+        latency_tracker.record_rest_ack(order, order_update, request_timings)
         self._order_tracker.process_order_update(order_update)
 
         return exchange_order_id
@@ -537,7 +636,13 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        latency_tracker = self._order_tracker.latency_tracker
+        cancel_start = latency_tracker.now()
+        if self.batch_order_cancel_max_size > 1:
+            cancelled = await self._place_cancel_in_batch(order=order)
+        else:
+            cancelled = await self._place_cancel(order.client_order_id, order)
+        latency_tracker.record_cancel(order, cancel_start)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -567,6 +672,172 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    # === Batch orders ===
+
+    async def _place_order_in_batch(self, order: InFlightOrder) -> Tuple[str, float]:
+        """
+        Queues the order to be placed together with all the other orders requested in the same event loop iteration,
+        and waits for the result of the batch request for this order.
+
+        :return: the exchange order id and the update timestamp, like `_place_order`
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._batch_create_queue.append((order, future))
+        if not self._batch_create_flush_scheduled:
+            self._batch_create_flush_scheduled = True
+            safe_ensure_future(self._flush_batch_create_queue())
+        return await future
+
+    async def _place_cancel_in_batch(self, order: InFlightOrder) -> bool:
+        """
+        Queues the order to be canceled together with all the other cancelations requested in the same event loop
+        iteration, and waits for the result of the batch request for this order.
+
+        :return: True if the cancelation was accepted, like `_place_cancel`
+        """
+        future = asyncio.get_event_loop().create_future()
+        self._batch_cancel_queue.append((order, future))
+        if not self._batch_cancel_flush_scheduled:
+            self._batch_cancel_flush_scheduled = True
+            safe_ensure_future(self._flush_batch_cancel_queue())
+        return await future
+
+    async def _flush_batch_create_queue(self):
+        # The batch requests are shared by several orders, they are not attributed to the one that started the flush
+        rest_request_timings.set(None)
+        # Yield once so that every order requested in the current loop iteration joins the batch
+        await asyncio.sleep(0)
+        queued_orders, self._batch_create_queue = self._batch_create_queue, []
+        self._batch_create_flush_scheduled = False
+        orders, futures = self._group_batch_queue(queued_orders)
+        batches = self._split_orders_for_batch_create(orders)
+        await safe_gather(*[self._execute_orders_batch_create(orders=batch, futures=futures) for batch in batches])
+
+    async def _flush_batch_cancel_queue(self):
+        # The batch requests are shared by several orders, they are not attributed to the one that started the flush
+        rest_request_timings.set(None)
+        # Yield once so that every cancelation requested in the current loop iteration joins the batch
+        await asyncio.sleep(0)
+        queued_orders, self._batch_cancel_queue = self._batch_cancel_queue, []
+        self._batch_cancel_flush_scheduled = False
+        orders, futures = self._group_batch_queue(queued_orders)
+        batches = self._split_orders_for_batch_cancel(orders)
+        await safe_gather(*[self._execute_orders_batch_cancel(orders=batch, futures=futures) for batch in batches])
+
+    async def _execute_orders_batch_create(self, orders: List[InFlightOrder], futures: Dict[str, List[asyncio.Future]]):
+        try:
+            if len(orders) == 1:
+                order = orders[0]
+                results = [await self._place_order(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )]
+            else:
+                results = await self._place_orders_batch(orders=orders)
+        except asyncio.CancelledError:
+            self._cancel_batch_futures(orders=orders, futures=futures)
+            raise
+        except Exception as ex:
+            results = [ex] * len(orders)
+        self._resolve_batch_futures(orders=orders, results=results, futures=futures)
+
+    async def _execute_orders_batch_cancel(self, orders: List[InFlightOrder], futures: Dict[str, List[asyncio.Future]]):
+        try:
+            if len(orders) == 1:
+                results = [await self._place_cancel(orders[0].client_order_id, orders[0])]
+            else:
+                results = await self._cancel_orders_batch(orders=orders)
+        except asyncio.CancelledError:
+            self._cancel_batch_futures(orders=orders, futures=futures)
+            raise
+        except Exception as ex:
+            results = [ex] * len(orders)
+        self._resolve_batch_futures(orders=orders, results=results, futures=futures)
+
+    @staticmethod
+    def _group_batch_queue(
+            queued_orders: List[Tuple[InFlightOrder, asyncio.Future]]
+    ) -> Tuple[List[InFlightOrder], Dict[str, List[asyncio.Future]]]:
+        # An order queued more than once (e.g. canceled twice) is sent once, and all its waiters get the result
+        orders = []
+        futures = {}
+        for order, future in queued_orders:
+            if order.client_order_id not in futures:
+                orders.append(order)
+                futures[order.client_order_id] = []
+            futures[order.client_order_id].append(future)
+        return orders, futures
+
+    @staticmethod
+    def _resolve_batch_futures(orders: List[InFlightOrder], results: List[Any], futures: Dict[str, List[asyncio.Future]]):
+        for order, result in zip(orders, results):
+            for future in futures[order.client_order_id]:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        for order in orders[len(results):]:
+            for future in futures[order.client_order_id]:
+                if not future.done():
+                    future.set_exception(
+                        IOError(f"The batch request returned no result for order {order.client_order_id}")
+                    )
+
+    @staticmethod
+    def _cancel_batch_futures(orders: List[InFlightOrder], futures: Dict[str, List[asyncio.Future]]):
+        for order in orders:
+            for future in futures[order.client_order_id]:
+                future.cancel()
+
+    @staticmethod
+    def _split_in_batches(orders: List[InFlightOrder], max_size: int) -> List[List[InFlightOrder]]:
+        return [orders[index:index + max_size] for index in range(0, len(orders), max(max_size, 1))]
+
+    def _split_orders_for_batch_create(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        """
+        Splits the queued orders in the groups that will be sent in each batch creation request. By default the orders
+        are only split by the exchange maximum batch size. Connectors override it when the exchange has more
+        restrictions (e.g. all the orders of a batch must be for the same market).
+        """
+        return self._split_in_batches(orders, self.batch_order_create_max_size)
+
+    def _split_orders_for_batch_cancel(self, orders: List[InFlightOrder]) -> List[List[InFlightOrder]]:
+        """
+        Splits the queued orders in the groups that will be sent in each batch cancelation request. By default the
+        orders are only split by the exchange maximum batch size.
+        """
+        return self._split_in_batches(orders, self.batch_order_cancel_max_size)
+
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Places several orders with a single request to the exchange. Implemented by the connectors that support batch
+        order creation (see `batch_order_create_max_size`).
+
+        :param orders: the orders to place, already validated and tracked
+
+        :return: a list with one element per order, in the same order: the exchange order id and the update timestamp
+        if the order was accepted, or the exception describing why it was rejected
+        """
+        raise NotImplementedError
+
+    async def _cancel_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels several orders with a single request to the exchange. Implemented by the connectors that support batch
+        order cancelation (see `batch_order_cancel_max_size`).
+
+        :param orders: the orders to cancel
+
+        :return: a list with one element per order, in the same order: True if the cancelation was accepted, or the
+        exception describing why it was rejected
+        """
+        raise NotImplementedError
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -674,6 +945,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            self._rest_connections_keepalive_task = safe_ensure_future(self._rest_connections_keepalive_loop())
 
     async def stop_network(self):
         """
@@ -719,6 +991,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._rest_connections_keepalive_task is not None:
+            self._rest_connections_keepalive_task.cancel()
+            self._rest_connections_keepalive_task = None
 
     # === loops and sync related methods ===
     #
@@ -1012,8 +1287,93 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        """
+        Requests the state of the in flight orders whose state is the most stale, within the rate limit of the order
+        status requests. The orders still open are first updated with the open orders requests when the connector
+        supports them.
+        """
+        active_orders = list(self.in_flight_orders.values())
+        if self.open_orders_request_supported and len(active_orders) > 0:
+            active_orders = await self._update_open_orders(orders=active_orders)
+        orders_to_update = self._orders_to_poll(orders=active_orders)
+        orders_to_update_ids = {order.client_order_id for order in orders_to_update}
+        await self._update_orders_fills(orders=[
+            order for order in self._order_tracker.all_fillable_orders.values()
+            if order.client_order_id in orders_to_update_ids or order.client_order_id not in self.in_flight_orders
+        ])
+        await self._update_orders_with_error_handler(
+            orders=orders_to_update, error_handler=self._handle_update_error_for_active_order
+        )
+        poll_timestamp = self._time()
+        for order in orders_to_update:
+            self._order_status_poll_timestamps[order.client_order_id] = poll_timestamp
+
+    async def _update_open_orders(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the orders with the open orders of their trading pairs.
+
+        :return: the orders missing from the open orders, that have to be requested individually
+        """
+        try:
+            order_updates = await self._request_open_orders_updates(
+                trading_pairs=sorted({order.trading_pair for order in orders}))
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(f"Failed to fetch the open orders. Error: {request_error}", exc_info=request_error)
+            return orders
+        orders_by_id = {order.client_order_id: order for order in orders}
+        orders_by_exchange_id = {order.exchange_order_id: order for order in orders if order.exchange_order_id}
+        partially_filled_orders = []
+        for order_update in order_updates:
+            order = orders_by_id.pop(order_update.client_order_id, None)
+            if order is None and order_update.exchange_order_id in orders_by_exchange_id:
+                order = orders_by_exchange_id[order_update.exchange_order_id]
+                orders_by_id.pop(order.client_order_id, None)
+            if order is None:
+                continue
+            self._order_tracker.process_order_update(order_update)
+            self._order_status_poll_timestamps[order.client_order_id] = self._time()
+            if order_update.new_state == OrderState.PARTIALLY_FILLED:
+                partially_filled_orders.append(order)
+        # The open orders don't include the fills
+        await self._update_orders_fills(orders=partially_filled_orders)
+        return list(orders_by_id.values())
+
+    def _orders_to_poll(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Selects the orders requested in this poll, the ones whose state is the most stale first. The orders whose
+        state was updated by the user stream since their last request are skipped for a while.
+        """
+        now = self._time()
+        self._order_status_poll_timestamps = {
+            order_id: timestamp for order_id, timestamp in self._order_status_poll_timestamps.items()
+            if order_id in self.in_flight_orders
+        }
+        candidates = []
+        for order in orders:
+            last_poll_timestamp = self._order_status_poll_timestamps.get(order.client_order_id, 0)
+            confirmed_by_stream = (
+                order.last_update_timestamp > max(order.creation_timestamp, last_poll_timestamp)
+                and now - order.last_update_timestamp < self.ORDER_STATUS_CONFIRMATION_BACKOFF
+            )
+            if not confirmed_by_stream:
+                last_known_state_timestamp = max(order.last_update_timestamp, last_poll_timestamp)
+                candidates.append((last_known_state_timestamp, order))
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [order for _, order in candidates[:self._order_status_requests_per_poll()]]
+
+    def _order_status_requests_per_poll(self) -> int:
+        limit_id = self.order_status_request_limit_id
+        if limit_id is None:
+            return self.MAX_ORDER_STATUS_REQUESTS_PER_POLL
+        rate_limit, related_limits = self._throttler.get_related_limits(limit_id=limit_id)
+        limits = related_limits + ([(rate_limit, rate_limit.weight)] if rate_limit is not None else [])
+        requests_rates = [limit.limit / (weight * limit.time_interval) for limit, weight in limits if weight > 0]
+        if len(requests_rates) == 0:
+            return self.MAX_ORDER_STATUS_REQUESTS_PER_POLL
+        poll_interval = self._get_poll_interval(timestamp=self.current_timestamp)
+        return max(1, int(min(requests_rates) * poll_interval * self.ORDER_STATUS_POLL_RATE_SHARE))
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1049,6 +1409,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_orders_updates(self, trading_pairs: List[str]) -> List[OrderUpdate]:
+        """
+        Requests the open orders of the trading pairs. Only the connectors returning True in
+        `open_orders_request_supported` implement it.
+
+        :return: an order update for each open order of the trading pairs
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1057,6 +1426,22 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
         raise NotImplementedError
 
+    def _create_order_book_tracker_data_source(self) -> OrderBookTrackerDataSource:
+        """
+        Creates the data source of the order book tracker. The order books are read from the market data daemon
+        shared by the bots of the host when it is configured to serve this connector.
+        """
+        market_data_daemon_config = self._client_config.market_data_daemon
+        if market_data_daemon_config.serves_connector(self.name):
+            if RemoteAPIOrderBookDataSource.supports_connector(self.name):
+                return RemoteAPIOrderBookDataSource(
+                    trading_pairs=self.trading_pairs,
+                    connector_name=self.name,
+                    socket_path=market_data_daemon_config.socket_path())
+            self.logger().warning(f"The market data daemon can't serve {self.name}, "
+                                  f"its order books are read from the exchange.")
+        return self._create_order_book_data_source()
+
     @abstractmethod
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
         raise NotImplementedError
@@ -1078,6 +1463,27 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
+    async def _warm_up_rest_connections(self):
+        """
+        Sends concurrent lightweight requests to open the pooled connections to the exchange REST API, so that the
+        first orders do not have to wait for the DNS resolution and the TCP and TLS handshakes.
+        """
+        await safe_gather(
+            *[self._make_network_check_request() for _ in range(self.REST_CONNECTIONS_WARM_UP_COUNT)],
+            return_exceptions=True,
+        )
+
+    async def _rest_connections_keepalive_loop(self):
+        """
+        Warms up the connections to the exchange REST API and then pings them periodically, so that the pool does not
+        close them as idle between orders. The pings are disabled when the interval is 0.
+        """
+        while True:
+            await self._warm_up_rest_connections()
+            if self._rest_connections_keepalive_ping_interval <= 0:
+                break
+            await self._sleep(self._rest_connections_keepalive_ping_interval)
+
     async def _make_trading_rules_request(self) -> Any:
         exchange_info = await self._api_get(path_url=self.trading_rules_request_path)
         return exchange_info
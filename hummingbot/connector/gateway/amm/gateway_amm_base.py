@@ -11,6 +11,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeFeeBase, TradeUpdate
@@ -18,7 +19,6 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -39,6 +39,8 @@ class GatewayAMMBase(ConnectorBase):
     API_CALL_TIMEOUT = 10.0
     POLL_INTERVAL = 1.0
     UPDATE_BALANCE_INTERVAL = 30.0
+    QUOTE_CACHE_TTL = 5.0
+    BLOCK_NUMBER_POLL_INTERVAL = 1.0
 
     _connector_name: str
     _name: str
@@ -60,6 +62,9 @@ class GatewayAMMBase(ConnectorBase):
     _order_tracker: ClientOrderTracker
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _quote_cache: GatewayQuoteCache
+    _update_block_number_task: Optional[asyncio.Task]
+    _last_block_number_poll_timestamp: float
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -100,6 +105,9 @@ class GatewayAMMBase(ConnectorBase):
         self._native_currency = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._quote_cache = GatewayQuoteCache(ttl=self.QUOTE_CACHE_TTL)
+        self._update_block_number_task = None
+        self._last_block_number_poll_timestamp = 0.0
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -146,6 +154,10 @@ class GatewayAMMBase(ConnectorBase):
         except Exception:
             return []
 
+    @property
+    def quote_cache(self) -> GatewayQuoteCache:
+        return self._quote_cache
+
     @property
     def amm_orders(self) -> List[GatewayInFlightOrder]:
         return [
@@ -234,7 +246,6 @@ class GatewayAMMBase(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -243,7 +254,8 @@ class GatewayAMMBase(ConnectorBase):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Retrieves a quote price. The quotes are cached until they expire or a new block is seen, and shared by the
+        amounts with the same significant digits (see GatewayQuoteCache).
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -251,6 +263,18 @@ class GatewayAMMBase(ConnectorBase):
         :param ignore_shim: Ignore the price shim, and return the real price on the network
         :return: The quote price.
         """
+        key = (self.connector_name, self.chain, self.network, trading_pair, is_buy,
+               self._quote_cache.amount_bucket(amount), ignore_shim)
+        return await self._quote_cache.get(
+            key, lambda: self._request_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim))
+
+    async def _request_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool = False
+    ) -> Optional[Decimal]:
         pool_id = None
 
         try:
@@ -531,6 +555,24 @@ class GatewayAMMBase(ConnectorBase):
         if time.time() - self._last_poll_timestamp > self.POLL_INTERVAL:
             if self._poll_notifier is not None and not self._poll_notifier.is_set():
                 self._poll_notifier.set()
+        # The block number is only needed to invalidate the quotes, while they are used
+        if (self._quote_cache.has_quotes
+                and time.time() - self._last_block_number_poll_timestamp > self.BLOCK_NUMBER_POLL_INTERVAL
+                and (self._update_block_number_task is None or self._update_block_number_task.done())):
+            self._last_block_number_poll_timestamp = time.time()
+            self._update_block_number_task = safe_ensure_future(self._update_block_number())
+
+    async def _update_block_number(self):
+        try:
+            status = await self._get_gateway_instance().get_network_status(
+                chain=self.chain, network=self.network, fail_silently=True
+            )
+            if isinstance(status, dict):
+                self._quote_cache.update_block_number(status.get("currentBlockNumber"))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug(f"Error fetching the block number of {self.chain} {self.network}.", exc_info=True)
 
     async def update_balances(self, on_interval: bool = False):
         """
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class GatewayQuoteCache:
+    """
+    Caches the quotes of a Gateway connector (for a connector, chain and network) for a short time, so the strategies
+    asking for the same quote several times per tick send a single request to Gateway.
+
+    The quotes are dropped when they expire, or when a new block is seen on the chain (see update_block_number). The
+    amounts are bucketed to a number of significant digits, so quotes for nearly identical amounts are shared.
+    Concurrent requests for the same quote are merged into one Gateway request.
+    """
+
+    def __init__(self, ttl: float = 5.0, amount_significant_digits: int = 4, max_size: int = 1000):
+        """
+        :param ttl: the time the quotes are kept, in seconds
+        :param amount_significant_digits: the number of significant digits of the amounts sharing a quote
+        :param max_size: the maximum number of quotes kept
+        """
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._max_size = max_size
+        # The quotes by key, with the time they were requested at
+        self._quotes: Dict[Hashable, Tuple[float, Any]] = {}
+        self._in_flight_requests: Dict[Hashable, asyncio.Task] = {}
+        # The number of callers waiting for each request
+        self._in_flight_requests_waiters: Dict[asyncio.Task, int] = {}
+        self._block_number: Optional[int] = None
+        self._hits = 0
+        self._misses = 0
+        self._merged_requests = 0
+        self._requests_latency = 0.0
+
+    @property
+    def block_number(self) -> Optional[int]:
+        return self._block_number
+
+    @property
+    def has_quotes(self) -> bool:
+        return len(self._quotes) > 0 or len(self._in_flight_requests) > 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The share of the quotes served without a new Gateway request, including the merged requests
+        """
+        total = self._hits + self._merged_requests + self._misses
+        return (self._hits + self._merged_requests) / total if total > 0 else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """
+        The average duration of the Gateway requests, in seconds
+        """
+        return self._requests_latency / self._misses if self._misses > 0 else 0.0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "merged_requests": self._merged_requests,
+            "hit_rate": self.hit_rate,
+            "average_latency": self.average_latency,
+        }
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        if not amount.is_finite() or amount.is_zero():
+            return amount
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        return amount.quantize(Decimal(1).scaleb(exponent))
+
+    def update_block_number(self, block_number: Optional[int]):
+        """
+        Drops the quotes requested before a new block
+        """
+        if block_number is not None and (self._block_number is None or block_number > self._block_number):
+            self._block_number = block_number
+            self._quotes.clear()
+
+    def clear(self):
+        self._quotes.clear()
+
+    async def get(self, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached quote for the key, or requests it. The quotes requested as None (failed requests) are not
+        cached.
+
+        :param key: the key of the quote, including the amount bucket
+        :param request: the coroutine function requesting the quote to Gateway
+        """
+        now = self._time()
+        cached_quote = self._quotes.get(key)
+        if cached_quote is not None and now - cached_quote[0] <= self._ttl:
+            self._hits += 1
+            return cached_quote[1]
+
+        in_flight_request = self._in_flight_requests.get(key)
+        if in_flight_request is None:
+            self._misses += 1
+            in_flight_request = asyncio.ensure_future(self._request(key, request, now))
+            self._in_flight_requests[key] = in_flight_request
+        else:
+            self._merged_requests += 1
+        waiters = self._in_flight_requests_waiters.get(in_flight_request, 0)
+        self._in_flight_requests_waiters[in_flight_request] = waiters + 1
+        try:
+            # Shielded, the request belongs to the cache and is only cancelled when no caller waits for it anymore
+            return await asyncio.shield(in_flight_request)
+        except asyncio.CancelledError:
+            if self._in_flight_requests_waiters[in_flight_request] == 1:
+                in_flight_request.cancel()
+                # The next callers send a new request
+                self._remove_in_flight_request(key, in_flight_request)
+            raise
+        finally:
+            self._in_flight_requests_waiters[in_flight_request] -= 1
+            if self._in_flight_requests_waiters[in_flight_request] == 0:
+                del self._in_flight_requests_waiters[in_flight_request]
+
+    async def _request(self, key: Hashable, request: Callable[[], Awaitable[Any]], timestamp: float) -> Any:
+        block_number = self._block_number
+        request_start = time.perf_counter()
+        try:
+            quote = await request()
+        finally:
+            self._remove_in_flight_request(key, asyncio.current_task())
+            self._requests_latency += time.perf_counter() - request_start
+        if quote is not None and block_number == self._block_number:
+            self._store(key, timestamp, quote)
+        return quote
+
+    def _remove_in_flight_request(self, key: Hashable, in_flight_request: asyncio.Task):
+        if self._in_flight_requests.get(key) is in_flight_request:
+            del self._in_flight_requests[key]
+
+    def _store(self, key: Hashable, timestamp: float, quote: Any):
+        self._quotes.pop(key, None)
+        self._quotes[key] = (timestamp, quote)
+        if len(self._quotes) > self._max_size:
+            self._quotes = {quote_key: cached_quote for quote_key, cached_quote in self._quotes.items()
+                            if timestamp - cached_quote[0] <= self._ttl}
+            while len(self._quotes) > self._max_size:
+                # The oldest quote goes first, the quotes are kept in insertion order
+                del self._quotes[next(iter(self._quotes))]
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
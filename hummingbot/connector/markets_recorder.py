@@ -4,9 +4,10 @@ import logging
 import os.path
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -35,6 +36,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
@@ -48,10 +50,17 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+
+if TYPE_CHECKING:
+    from hummingbot.client.performance_metrics_store import PerformanceMetricsStore
 
 
 class MarketsRecorder:
+    # The executors are upserted by batches, one statement per batch. The number of bound parameters of a statement
+    # stays below the SQLite limit.
+    EXECUTORS_BATCH_SIZE = 50
+
     _logger = None
     _shared_instance: "MarketsRecorder" = None
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -76,7 +85,8 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 performance_metrics_store: Optional["PerformanceMetricsStore"] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -91,6 +101,12 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._performance_metrics_store: Optional["PerformanceMetricsStore"] = performance_metrics_store
+        # A single thread, the submitted writes are run in order
+        self._db_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1,
+                                                                   thread_name_prefix="markets_recorder_db")
+        self._stopped: bool = False
+        self._check_controller_performance()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -197,37 +213,119 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        # The writes already submitted are still run by the database thread, see flush to wait for them
+        self._stopped = True
+        self._db_executor.shutdown(wait=False)
+
+    async def flush(self):
+        """
+        Waits for the writes submitted so far, without blocking the event loop.
+        """
+        if not self._stopped:
+            await self._ev_loop.run_in_executor(self._db_executor, lambda: None)
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
-            existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
-            serialized_config = executor.executor_info.json()
-            executor_dict = json.loads(serialized_config)
-            if existing_executor:
-                # Update existing executor
-                for attr, value in executor_dict.items():
-                    setattr(existing_executor, attr, value)
-            else:
-                # Insert new executor
-                new_executor = Executors(**executor_dict)
-                session.add(new_executor)
-            session.commit()
+        self.store_or_update_executors([executor])
+
+    def store_or_update_executors(self, executors: List[Any]):
+        """
+        Stores the executors, or updates the ones already stored, on the calling thread.
+        """
+        self._upsert_executors(self._executors_rows(executors))
+
+    def submit_executors(self, executors: List[Any]) -> asyncio.Future:
+        """
+        Stores the executors, or updates the ones already stored, off the event loop. Their state is read right away.
+        """
+        return self._submit(self._upsert_executors, self._executors_rows(executors))
 
     def store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            session.add(position)
-            session.commit()
+        self._add_records([position])
+
+    def submit_positions(self, positions: List[Position]) -> asyncio.Future:
+        return self._submit(self._add_records, positions)
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
+        self._add_records([self._controller_record(controller_config)])
+
+    def submit_controller_config(self, controller_config: ControllerConfigBase) -> asyncio.Future:
+        return self._submit(self._add_records, [self._controller_record(controller_config)])
+
+    def get_controllers_performance(self) -> Dict[Optional[str], PerformanceReport]:
+        """
+        Returns the performance of the stored executors of each controller, from their running totals.
+        """
         with self._sql_manager.get_new_session() as session:
-            config = json.loads(controller_config.json())
-            base_columns = ["id", "timestamp", "type"]
-            controller = Controllers(id=config["id"],
-                                     timestamp=time.time(),
-                                     type=config["controller_type"],
-                                     config={k: v for k, v in config.items() if k not in base_columns})
-            session.add(controller)
-            session.commit()
+            return {record.controller: record.to_performance_report()
+                    for record in ControllerPerformance.get_records(session)}
+
+    def _submit(self, function: Callable, *args) -> asyncio.Future:
+        if self._stopped:
+            # Written on the calling thread, once the database thread is done with the writes submitted before
+            self._db_executor.shutdown(wait=True)
+            future = self._ev_loop.create_future()
+            try:
+                future.set_result(function(*args))
+            except Exception as exception:
+                future.set_exception(exception)
+        else:
+            future = self._ev_loop.run_in_executor(self._db_executor, function, *args)
+        future.add_done_callback(self._did_write)
+        return future
+
+    def _did_write(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            self.logger().error("Error writing to the database.", exc_info=future.exception())
+
+    @staticmethod
+    def _executors_rows(executors: List[Any]) -> List[Dict[str, Any]]:
+        rows = {}
+        for executor in executors:
+            row = json.loads(executor.executor_info.json())
+            # The last state of an executor submitted twice is kept
+            rows[row["id"]] = row
+        return list(rows.values())
+
+    @staticmethod
+    def _controller_record(controller_config: ControllerConfigBase) -> Controllers:
+        config = json.loads(controller_config.json())
+        base_columns = ["id", "timestamp", "type"]
+        return Controllers(id=config["id"],
+                           timestamp=time.time(),
+                           type=config["controller_type"],
+                           config={k: v for k, v in config.items() if k not in base_columns})
+
+    def _upsert_executors(self, rows: List[Dict[str, Any]]):
+        for start in range(0, len(rows), self.EXECUTORS_BATCH_SIZE):
+            batch = rows[start:start + self.EXECUTORS_BATCH_SIZE]
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    previous_executors = (
+                        session.query(Executors.id,
+                                      Executors.controller_id,
+                                      Executors.net_pnl_quote,
+                                      Executors.filled_amount_quote,
+                                      Executors.close_type)
+                        .filter(Executors.id.in_([row["id"] for row in batch]))
+                        .all()
+                    )
+                    ControllerPerformance.update_executors(session, previous_executors, batch)
+                    Executors.upsert(session, batch)
+
+    def _add_records(self, records: List[Any]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                session.add_all(records)
+
+    def _check_controller_performance(self):
+        """
+        Builds the running totals of the controllers from the stored executors, when the database has executors stored
+        without them. Done once when the recorder is created, before any write.
+        """
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                if ControllerPerformance.is_missing(session):
+                    ControllerPerformance.rebuild(session)
 
     def get_executors_by_ids(self, executor_ids: List[str]):
         with self._sql_manager.get_new_session() as session:
@@ -402,6 +500,8 @@ class MarketsRecorder:
                 )
                 session.add(order_status)
                 session.add(trade_fill_record)
+                if self._performance_metrics_store is not None:
+                    self._performance_metrics_store.record_trade_fill(session, trade_fill_record)
                 self.save_market_states(self._config_file_path, market, session=session)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
@@ -0,0 +1,245 @@
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate
+
+# Order lifecycle stages, timestamped with a monotonic clock in InFlightOrder.lifecycle_timestamps
+SUBMITTED_STAGE = "submitted"
+REQUEST_SENT_STAGE = "request_sent"
+REST_ACK_STAGE = "rest_ack"
+EXCHANGE_ACK_STAGE = "exchange_ack"
+FIRST_FILL_STAGE = "first_fill"
+
+# Latency metrics aggregated per trading pair
+THROTTLER_WAIT_METRIC = "throttler_wait"
+REST_RTT_METRIC = "rest_rtt"
+ORDER_ACK_METRIC = "order_ack"
+WS_ACK_DELAY_METRIC = "ws_ack_delay"
+CANCEL_RTT_METRIC = "cancel_rtt"
+EVENT_DISPATCH_METRIC = "event_dispatch"
+
+# Upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    Fixed buckets histogram of durations in seconds. Observing a value is a binary search and an increment, which
+    keeps it cheap enough for the order hot path.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self._buckets
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else 0.0
+
+    def observe(self, value: float):
+        value = max(value, 0.0)
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the quantile with the upper bound of the bucket that contains it (the maximum observed value for
+        the overflow bucket).
+        """
+        if self._count == 0:
+            return 0.0
+        target = q * self._count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count > 0:
+                return min(self._buckets[index], self._max) if index < len(self._buckets) else self._max
+        return self._max
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        result = []
+        cumulative = 0
+        for bound, bucket_count in zip(self._buckets + (float("inf"),), self._counts):
+            cumulative += bucket_count
+            result.append((bound, cumulative))
+        return result
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self._max,
+        }
+
+
+class OrderLatencyTracker:
+    """
+    Timestamps the stages of the order lifecycle (submission, request sent, REST acknowledgement, first exchange
+    update, first fill) for each InFlightOrder and aggregates the latency between them in histograms per trading pair:
+
+    - throttler_wait: time waiting for the rate limiter before sending the order creation request
+    - rest_rtt: duration of the order creation HTTP request
+    - order_ack: time between the order submission and the REST acknowledgement
+    - ws_ack_delay: time between the REST acknowledgement and the first update from the exchange (0 if it came first)
+    - cancel_rtt: duration of the order cancelation request
+    - event_dispatch: time spent by the listeners processing the order events
+    """
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._submission_timestamps: Dict[str, float] = {}
+        self._rest_ack_updates: Dict[str, "OrderUpdate"] = {}
+
+    @property
+    def histograms(self) -> Dict[Tuple[str, str], LatencyHistogram]:
+        return self._histograms
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def histogram(self, trading_pair: str, metric: str) -> LatencyHistogram:
+        key = (trading_pair, metric)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._histograms[key] = histogram
+        return histogram
+
+    def observe(self, trading_pair: str, metric: str, duration: float):
+        self.histogram(trading_pair, metric).observe(duration)
+
+    def reset(self):
+        self._histograms = {}
+
+    def record_submission(self, client_order_id: str):
+        self._submission_timestamps[client_order_id] = self.now()
+
+    def record_order_tracked(self, order: "InFlightOrder"):
+        submission_timestamp = self._submission_timestamps.pop(order.client_order_id, None)
+        order.lifecycle_timestamps[SUBMITTED_STAGE] = (
+            submission_timestamp if submission_timestamp is not None else self.now())
+
+    def record_request_sent(self, order: "InFlightOrder"):
+        order.lifecycle_timestamps[REQUEST_SENT_STAGE] = self.now()
+
+    def record_rest_ack(self,
+                        order: "InFlightOrder",
+                        order_update: "OrderUpdate",
+                        request_timings: Optional[Iterable[Tuple[float, float]]] = None):
+        """
+        Records the acknowledgement of the order creation request.
+
+        :param order: the created order
+        :param order_update: the order update built from the REST response, it does not count as an exchange update
+        :param request_timings: the throttler wait and round trip duration of the requests sent to create the order
+        """
+        timestamps = order.lifecycle_timestamps
+        timestamps[REST_ACK_STAGE] = now = self.now()
+        self._rest_ack_updates[order.client_order_id] = order_update
+
+        if request_timings:
+            throttler_wait = rest_rtt = 0.0
+            for request_throttler_wait, request_rtt in request_timings:
+                throttler_wait += request_throttler_wait
+                rest_rtt += request_rtt
+            self.observe(order.trading_pair, THROTTLER_WAIT_METRIC, throttler_wait)
+            self.observe(order.trading_pair, REST_RTT_METRIC, rest_rtt)
+        elif REQUEST_SENT_STAGE in timestamps:
+            self.observe(order.trading_pair, REST_RTT_METRIC, now - timestamps[REQUEST_SENT_STAGE])
+        if SUBMITTED_STAGE in timestamps:
+            self.observe(order.trading_pair, ORDER_ACK_METRIC, now - timestamps[SUBMITTED_STAGE])
+        if EXCHANGE_ACK_STAGE in timestamps:
+            # The exchange update arrived before the REST response
+            self.observe(order.trading_pair, WS_ACK_DELAY_METRIC, 0.0)
+
+    def record_order_update(self, order: "InFlightOrder", order_update: "OrderUpdate"):
+        if self._rest_ack_updates.get(order.client_order_id) is order_update:
+            return
+        self._record_exchange_ack(order)
+
+    def record_trade_update(self, order: "InFlightOrder"):
+        self._record_exchange_ack(order)
+        if FIRST_FILL_STAGE not in order.lifecycle_timestamps:
+            order.lifecycle_timestamps[FIRST_FILL_STAGE] = self.now()
+
+    def record_cancel(self, order: "InFlightOrder", start_timestamp: float):
+        self.observe(order.trading_pair, CANCEL_RTT_METRIC, self.now() - start_timestamp)
+
+    def stop_tracking_order(self, client_order_id: str):
+        self._submission_timestamps.pop(client_order_id, None)
+        self._rest_ack_updates.pop(client_order_id, None)
+
+    def record_event_dispatch(self, trading_pair: str, start_timestamp: float):
+        self.observe(trading_pair, EVENT_DISPATCH_METRIC, self.now() - start_timestamp)
+
+    def _record_exchange_ack(self, order: "InFlightOrder"):
+        timestamps = order.lifecycle_timestamps
+        if EXCHANGE_ACK_STAGE not in timestamps:
+            timestamps[EXCHANGE_ACK_STAGE] = now = self.now()
+            if REST_ACK_STAGE in timestamps:
+                self.observe(order.trading_pair, WS_ACK_DELAY_METRIC, now - timestamps[REST_ACK_STAGE])
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (trading_pair, metric), histogram in sorted(self._histograms.items()):
+            result.setdefault(trading_pair, {})[metric] = histogram.to_dict()
+        return result
+
+    def format_status(self, connector_name: str) -> str:
+        if len(self._histograms) == 0:
+            return ""
+        lines = [f"  {connector_name} order latency (ms):",
+                 f"    {'Pair':<16}{'Metric':<16}{'Count':>8}{'Mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'Max':>10}"]
+        for (trading_pair, metric), histogram in sorted(self._histograms.items()):
+            lines.append(
+                f"    {trading_pair:<16}{metric:<16}{histogram.count:>8}"
+                f"{histogram.mean * 1e3:>10.2f}{histogram.quantile(0.5) * 1e3:>10.2f}"
+                f"{histogram.quantile(0.9) * 1e3:>10.2f}{histogram.quantile(0.99) * 1e3:>10.2f}"
+                f"{histogram.max * 1e3:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+def render_prometheus_metrics(trackers: Dict[str, OrderLatencyTracker]) -> str:
+    """
+    Renders the latency histograms of the trackers, by connector name, in the Prometheus text exposition format.
+    """
+    metric_name = "hummingbot_order_latency_seconds"
+    lines = [f"# HELP {metric_name} Latency of the order lifecycle stages.",
+             f"# TYPE {metric_name} histogram"]
+    for connector_name, tracker in sorted(trackers.items()):
+        for (trading_pair, metric), histogram in sorted(tracker.histograms.items()):
+            labels = f'connector="{connector_name}",trading_pair="{trading_pair}",stage="{metric}"'
+            for bound, cumulative in histogram.cumulative_counts():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric_name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{metric_name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{metric_name}_count{{{labels}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
@@ -33,6 +33,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         self._last_funding_fee_payment_ts: Dict[str, float] = {}
 
         self._perpetual_trading = PerpetualTrading(self.trading_pairs)
+        self._perpetual_trading.add_funding_info_listener(self._trigger_funding_info_event)
         self._funding_info_listener_task: Optional[asyncio.Task] = None
         self._funding_fee_polling_task: Optional[asyncio.Task] = None
         self._funding_fee_poll_notifier = asyncio.Event()
@@ -119,6 +120,13 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def get_funding_info(self, trading_pair: str) -> FundingInfo:
         return self._perpetual_trading.get_funding_info(trading_pair)
 
+    def _trigger_funding_info_event(self, funding_info: FundingInfo):
+        """
+        Publishes the funding information of a trading pair each time it changes, so the listeners don't have to poll
+        the funding information of all the trading pairs.
+        """
+        self.trigger_event(MarketEvent.FundingInfo, funding_info)
+
     def start_tracking_order(
         self,
         order_id: str,
@@ -163,6 +171,10 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def _create_order_book_data_source(self) -> PerpetualAPIOrderBookDataSource:
         raise NotImplementedError
 
+    def _create_order_book_tracker_data_source(self) -> PerpetualAPIOrderBookDataSource:
+        # The funding info is not relayed by the market data daemon
+        return self._create_order_book_data_source()
+
     @abstractmethod
     async def _place_order(
         self,
@@ -3,7 +3,7 @@ import copy
 import logging
 import warnings
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -27,6 +27,7 @@ class PerpetualTrading:
         self._funding_info: Dict[str, FundingInfo] = {}
         self._funding_payment_span: List[int] = [0, 0]
         self._funding_info_stream = asyncio.Queue()
+        self._funding_info_listeners: List[Callable[[FundingInfo], None]] = []
 
         self._funding_info_updater_task: Optional[asyncio.Task] = None
 
@@ -69,6 +70,18 @@ class PerpetualTrading:
         Initializes a single trading pair funding information.
         """
         self._funding_info[funding_info.trading_pair] = funding_info
+        self._notify_funding_info_listeners(funding_info)
+
+    def add_funding_info_listener(self, listener: Callable[[FundingInfo], None]):
+        """
+        Registers a function called with the funding information of a trading pair each time it is initialized or
+        updated from the funding info stream.
+        """
+        self._funding_info_listeners.append(listener)
+
+    def remove_funding_info_listener(self, listener: Callable[[FundingInfo], None]):
+        if listener in self._funding_info_listeners:
+            self._funding_info_listeners.remove(listener)
 
     def is_funding_info_initialized(self) -> bool:
         """
@@ -174,11 +187,16 @@ class PerpetualTrading:
                 trading_pair = funding_info_message.trading_pair
                 funding_info = self._funding_info[trading_pair]
                 funding_info.update(funding_info_message)
+                self._notify_funding_info_listeners(funding_info)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Unexpected error updating funding info.", exc_info=True)
 
+    def _notify_funding_info_listeners(self, funding_info: FundingInfo):
+        for listener in self._funding_info_listeners:
+            listener(funding_info)
+
     def get_buy_collateral_token(self, trading_pair: str) -> str:
         warnings.warn(
             "This method is replaced by PerpetualDerivativePyBase.get_buy_collateral_token, and will be removed"
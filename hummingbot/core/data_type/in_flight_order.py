@@ -123,6 +123,7 @@ class InFlightOrder:
         self.last_update_timestamp: float = creation_timestamp
 
         self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
+        self.lifecycle_timestamps: Dict[str, float] = {}  # Dict[stage, monotonic time], see OrderLatencyTracker
 
         self.exchange_order_id_update_event = asyncio.Event()
         if self.exchange_order_id:
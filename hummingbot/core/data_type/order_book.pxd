@@ -20,6 +20,15 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _price_watch_enabled
+    cdef dict _price_watches
+    cdef dict _price_watch_states
+    cdef object _shared_memory_segment
+    cdef long long[:] _shared_memory_ints
+    cdef double[:] _shared_memory_doubles
+    cdef int _shared_memory_depth
+    cdef double _shared_memory_bid_limit
+    cdef double _shared_memory_ask_limit
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +39,9 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_update_price_watches(self, bint full_refresh, double max_bid_touched, double min_ask_touched)
+    cdef double c_walk_vwap(self, bint is_buy, double volume, double *limit_price)
+    cdef c_publish_to_shared_memory(self, bint refresh_bids, bint refresh_asks)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -14,12 +14,14 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+from libc.math cimport INFINITY, fabs, isnan
 from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
 )
 
+from hummingbot.core.data_type import order_book_shared_memory
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -27,6 +29,7 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookPriceChangeEvent,
     OrderBookTradeEvent
 )
 
@@ -35,9 +38,32 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+cdef extern from *:
+    """
+    #include <atomic>
+    static inline void order_book_memory_fence() { std::atomic_thread_fence(std::memory_order_seq_cst); }
+    """
+    void order_book_memory_fence() nogil
+
+cdef int SHM_SEQUENCE_SLOT = order_book_shared_memory.SEQUENCE_SLOT
+cdef int SHM_UPDATE_ID_SLOT = order_book_shared_memory.UPDATE_ID_SLOT
+cdef int SHM_BIDS_COUNT_SLOT = order_book_shared_memory.BIDS_COUNT_SLOT
+cdef int SHM_ASKS_COUNT_SLOT = order_book_shared_memory.ASKS_COUNT_SLOT
+cdef int SHM_TIMESTAMP_SLOT = order_book_shared_memory.TIMESTAMP_SLOT
+cdef int SHM_BEST_BID_SLOT = order_book_shared_memory.BEST_BID_SLOT
+cdef int SHM_BEST_ASK_SLOT = order_book_shared_memory.BEST_ASK_SLOT
+cdef int SHM_LEVELS_SLOT = order_book_shared_memory.LEVELS_SLOT
+
+
+cdef inline bint c_price_moved(double old_price, double new_price, double threshold):
+    if isnan(old_price) or isnan(new_price):
+        return isnan(old_price) != isnan(new_price)
+    return fabs(new_price - old_price) > threshold * fabs(old_price)
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_PRICE_CHANGE_EVENT_TAG = OrderBookEvent.PriceChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +81,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._price_watch_enabled = False
+        self._price_watches = {}
+        self._price_watch_states = {}
+        self._shared_memory_segment = None
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,15 +95,23 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            double max_bid_touched = -1
+            double min_ask_touched = float("inf")
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
+            if bid.getPrice() > max_bid_touched:
+                max_bid_touched = bid.getPrice()
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
         for ask in asks:
+            if ask.getPrice() < min_ask_touched:
+                min_ask_touched = ask.getPrice()
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
@@ -96,6 +134,22 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if self._price_watch_enabled:
+            self.c_update_price_watches(
+                previous_best_bid != self._best_bid or previous_best_ask != self._best_ask,
+                max_bid_touched,
+                min_ask_touched,
+            )
+
+        if self._shared_memory_segment is not None:
+            # A side is only copied again when the diff touched its published levels
+            self.c_publish_to_shared_memory(
+                previous_best_bid != self._best_bid
+                or (max_bid_touched >= 0 and max_bid_touched >= self._shared_memory_bid_limit),
+                previous_best_ask != self._best_ask
+                or (min_ask_touched != INFINITY and min_ask_touched <= self._shared_memory_ask_limit),
+            )
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -136,11 +190,222 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        if self._price_watch_enabled:
+            self.c_update_price_watches(True, NaN, NaN)
+
+        if self._shared_memory_segment is not None:
+            self.c_publish_to_shared_memory(True, True)
+
+    cdef c_update_price_watches(self, bint full_refresh, double max_bid_touched, double min_ask_touched):
+        """
+        Re-evaluates the registered price watches after the book changed and notifies the listeners of the ones that
+        moved beyond their threshold. A VWAP watch is only recalculated when the book top moved or when a diff touched
+        a level at or better than the deepest level the last VWAP walk reached.
+        """
+        cdef:
+            double volume
+            double threshold
+            double bid_price
+            double ask_price
+            double bid_limit
+            double ask_limit
+            list state
+
+        # The listeners may add or remove watches
+        for volume, state in list(self._price_watch_states.items()):
+            if volume not in self._price_watches:
+                continue
+            bid_limit = state[2]
+            ask_limit = state[3]
+            if volume <= 0:
+                bid_price = self._best_bid
+                ask_price = self._best_ask
+            elif full_refresh or not (max_bid_touched < bid_limit and min_ask_touched > ask_limit):
+                bid_price = self.c_walk_vwap(False, volume, &bid_limit)
+                ask_price = self.c_walk_vwap(True, volume, &ask_limit)
+                state[2] = bid_limit
+                state[3] = ask_limit
+            else:
+                continue
+            threshold = min(self._price_watches[volume])
+            if c_price_moved(state[0], bid_price, threshold) or c_price_moved(state[1], ask_price, threshold):
+                state[0] = bid_price
+                state[1] = ask_price
+                self.c_trigger_event(
+                    self.ORDER_BOOK_PRICE_CHANGE_EVENT_TAG,
+                    OrderBookPriceChangeEvent(
+                        update_id=max(self._last_diff_uid, self._snapshot_uid),
+                        volume=volume,
+                        bid_price=bid_price,
+                        ask_price=ask_price,
+                    )
+                )
+
+    cdef c_publish_to_shared_memory(self, bint refresh_bids, bint refresh_asks):
+        """
+        Copies the top levels of the refreshed sides and the book header to the shared memory segment. The sequence
+        number is odd during the update, so the readers can detect and retry the inconsistent copies.
+        """
+        cdef:
+            long long sequence = self._shared_memory_ints[SHM_SEQUENCE_SLOT]
+            int slot
+            int count
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            OrderBookEntry entry
+
+        self._shared_memory_ints[SHM_SEQUENCE_SLOT] = sequence + 1
+        order_book_memory_fence()
+
+        if refresh_bids:
+            slot = SHM_LEVELS_SLOT
+            count = 0
+            bid_iterator = self._bid_book.rbegin()
+            while count < self._shared_memory_depth and bid_iterator != self._bid_book.rend():
+                entry = deref(bid_iterator)
+                self._shared_memory_doubles[slot] = entry.getPrice()
+                self._shared_memory_doubles[slot + 1] = entry.getAmount()
+                slot += 2
+                count += 1
+                inc(bid_iterator)
+            self._shared_memory_ints[SHM_BIDS_COUNT_SLOT] = count
+            # Changes below the deepest published level don't require a new copy, unless there is room for more levels
+            self._shared_memory_bid_limit = (self._shared_memory_doubles[slot - 2]
+                                             if count == self._shared_memory_depth else -INFINITY)
+        if refresh_asks:
+            slot = SHM_LEVELS_SLOT + 2 * self._shared_memory_depth
+            count = 0
+            ask_iterator = self._ask_book.begin()
+            while count < self._shared_memory_depth and ask_iterator != self._ask_book.end():
+                entry = deref(ask_iterator)
+                self._shared_memory_doubles[slot] = entry.getPrice()
+                self._shared_memory_doubles[slot + 1] = entry.getAmount()
+                slot += 2
+                count += 1
+                inc(ask_iterator)
+            self._shared_memory_ints[SHM_ASKS_COUNT_SLOT] = count
+            self._shared_memory_ask_limit = (self._shared_memory_doubles[slot - 2]
+                                             if count == self._shared_memory_depth else INFINITY)
+
+        self._shared_memory_ints[SHM_UPDATE_ID_SLOT] = max(self._snapshot_uid, self._last_diff_uid)
+        self._shared_memory_doubles[SHM_TIMESTAMP_SLOT] = time.time()
+        self._shared_memory_doubles[SHM_BEST_BID_SLOT] = self._best_bid
+        self._shared_memory_doubles[SHM_BEST_ASK_SLOT] = self._best_ask
+
+        order_book_memory_fence()
+        self._shared_memory_ints[SHM_SEQUENCE_SLOT] = sequence + 2
+
+    def enable_shared_memory_publishing(self, segment: "OrderBookSharedMemorySegment"):
+        """
+        Mirrors the top levels of the book in the shared memory segment after every update, so that other processes
+        on the host can read them with an OrderBookSharedMemoryReader.
+
+        :param segment: the segment to publish to, its depth is the number of levels published per side
+        """
+        self._shared_memory_ints = segment.int_slots
+        self._shared_memory_doubles = segment.double_slots
+        self._shared_memory_depth = segment.depth
+        self._shared_memory_segment = segment
+        self.c_publish_to_shared_memory(True, True)
+
+    def disable_shared_memory_publishing(self):
+        """
+        Stops publishing to the shared memory segment. It has to be called before closing the segment.
+        """
+        self._shared_memory_segment = None
+        self._shared_memory_ints = None
+        self._shared_memory_doubles = None
+
+    @property
+    def shared_memory_segment(self) -> Optional["OrderBookSharedMemorySegment"]:
+        return self._shared_memory_segment
+
+    cdef double c_walk_vwap(self, bint is_buy, double volume, double *limit_price):
+        """
+        Walks the book from the top and returns the VWAP to fill the volume (NaN if the book is not deep enough).
+        The price of the deepest level used is written to limit_price.
+        """
+        cdef:
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            OrderBookEntry entry
+            double total_cost = 0
+            double total_volume = 0
+
+        limit_price[0] = NaN
+        while True:
+            if is_buy:
+                if ask_iterator == self._ask_book.end():
+                    break
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            else:
+                if bid_iterator == self._bid_book.rend():
+                    break
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            if entry.getAmount() >= volume - total_volume:
+                total_cost += (volume - total_volume) * entry.getPrice()
+                limit_price[0] = entry.getPrice()
+                return total_cost / volume
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+        return NaN
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    def add_price_change_watch(self, volume: float = 0.0, threshold: float = 0.0):
+        """
+        Registers a price watch on the book. Listeners of OrderBookEvent.PriceChangeEvent receive an
+        OrderBookPriceChangeEvent every time the best bid/ask (volume 0) or the VWAP for the volume moves by more
+        than the relative threshold since the last notification for that volume.
+
+        Watches are reference counted, so every call has to be paired with a call to remove_price_change_watch.
+
+        :param volume: the base amount the VWAP is calculated for, 0 to watch the best bid and ask
+        :param threshold: the relative price change that triggers a notification (e.g. 0.0001 for 1 bps)
+        """
+        cdef:
+            double bid_limit = NaN
+            double ask_limit = NaN
+            double bid_price
+            double ask_price
+        volume = float(volume)
+        if volume not in self._price_watches:
+            if volume <= 0:
+                bid_price = self._best_bid
+                ask_price = self._best_ask
+            else:
+                bid_price = self.c_walk_vwap(False, volume, &bid_limit)
+                ask_price = self.c_walk_vwap(True, volume, &ask_limit)
+            self._price_watches[volume] = []
+            self._price_watch_states[volume] = [bid_price, ask_price, bid_limit, ask_limit]
+        self._price_watches[volume].append(float(threshold))
+        self._price_watch_enabled = True
+
+    def remove_price_change_watch(self, volume: float = 0.0, threshold: float = 0.0):
+        """
+        Unregisters a price watch previously registered with add_price_change_watch.
+        """
+        volume = float(volume)
+        thresholds = self._price_watches.get(volume, [])
+        if float(threshold) in thresholds:
+            thresholds.remove(float(threshold))
+        if len(thresholds) == 0:
+            self._price_watches.pop(volume, None)
+            self._price_watch_states.pop(volume, None)
+        self._price_watch_enabled = len(self._price_watches) > 0
+
+    @property
+    def price_watches(self) -> Dict[float, Tuple[float, float]]:
+        """
+        Returns the last notified (bid, ask) prices for each registered watch volume.
+        """
+        return {volume: (state[0], state[1]) for volume, state in self._price_watch_states.items()}
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -280,6 +545,36 @@ cdef class OrderBook(PubSub):
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
             inc(it)
 
+    def copy_top_levels(self,
+                        double[:] bid_prices,
+                        double[:] bid_amounts,
+                        double[:] ask_prices,
+                        double[:] ask_amounts) -> Tuple[int, int]:
+        """
+        Copies the top levels of the book to the arrays, from the best ones, without creating Python objects. The
+        number of levels copied per side is bounded by the length of the arrays, the remaining items are left as is.
+
+        :return: the numbers of bid and ask levels copied
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t bids_depth = min(bid_prices.shape[0], bid_amounts.shape[0])
+            Py_ssize_t asks_depth = min(ask_prices.shape[0], ask_amounts.shape[0])
+            Py_ssize_t bids_count = 0
+            Py_ssize_t asks_count = 0
+        while bids_count < bids_depth and bid_it != self._bid_book.rend():
+            bid_prices[bids_count] = deref(bid_it).getPrice()
+            bid_amounts[bids_count] = deref(bid_it).getAmount()
+            bids_count += 1
+            inc(bid_it)
+        while asks_count < asks_depth and ask_it != self._ask_book.end():
+            ask_prices[asks_count] = deref(ask_it).getPrice()
+            ask_amounts[asks_count] = deref(ask_it).getAmount()
+            asks_count += 1
+            inc(ask_it)
+        return bids_count, asks_count
+
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
         amount_left = amount
         retval = []
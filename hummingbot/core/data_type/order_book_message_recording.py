@@ -0,0 +1,180 @@
+"""
+Compact binary recordings of the order book messages of a connector, replayed by ReplayOrderBookDataSource.
+
+A recording starts with a header (magic and format version), followed by records in the order the messages were
+received. Each record starts with its type (1 byte):
+
+    0, trading pair: index (uint16), name length (uint16), name (utf8)
+    1 or 2, snapshot or diff: trading pair index (uint16), timestamp (double), update id (int64),
+        first update id (int64), bids count (uint32), asks count (uint32), then the (price, amount) doubles of the
+        bids followed by the ones of the asks
+    3, trade: trading pair index (uint16), timestamp (double), trade type (uint8), price (double), amount (double),
+        trade id kind (uint8, 1 when it is an integer), trade id length (uint16), trade id (utf8)
+
+All the numbers are little endian. Recordings with a .gz suffix are compressed with gzip.
+"""
+import gzip
+import struct
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+FILE_MAGIC = b"HBOB"
+FORMAT_VERSION = 1
+
+TRADING_PAIR_RECORD = 0
+
+FILE_HEADER = struct.Struct("<4sB")
+RECORD_TYPE = struct.Struct("<B")
+TRADING_PAIR_HEADER = struct.Struct("<HH")
+BOOK_HEADER = struct.Struct("<HdqqII")
+TRADE_HEADER = struct.Struct("<HdBddBH")
+
+
+def _open_recording(path: Union[str, Path], mode: str) -> BinaryIO:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode, compresslevel=1)
+    return open(path, mode)
+
+
+class OrderBookMessageRecordWriter:
+    """
+    Appends order book messages to a recording. The trading pairs are written once and then referenced by index.
+    """
+    def __init__(self, path: Union[str, Path]):
+        self._file = _open_recording(path, "wb")
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION))
+        self._trading_pair_indexes: Dict[str, int] = {}
+
+    def write(self, message: OrderBookMessage):
+        trading_pair_index = self._trading_pair_index(message.trading_pair)
+        timestamp = message.timestamp if message.timestamp is not None else time.time()
+        if message.type is OrderBookMessageType.TRADE:
+            trade_id = message.trade_id
+            encoded_trade_id = str(trade_id).encode("utf8")
+            self._file.write(RECORD_TYPE.pack(message.type.value))
+            self._file.write(TRADE_HEADER.pack(
+                trading_pair_index,
+                timestamp,
+                int(float(message.content["trade_type"])),
+                float(message.content["price"]),
+                float(message.content["amount"]),
+                1 if isinstance(trade_id, int) else 0,
+                len(encoded_trade_id),
+            ))
+            self._file.write(encoded_trade_id)
+        else:
+            bids = message.bids
+            asks = message.asks
+            levels = [value for row in bids for value in (row.price, row.amount)]
+            levels.extend(value for row in asks for value in (row.price, row.amount))
+            self._file.write(RECORD_TYPE.pack(message.type.value))
+            self._file.write(BOOK_HEADER.pack(
+                trading_pair_index,
+                timestamp,
+                int(message.update_id),
+                int(message.first_update_id if message.type is OrderBookMessageType.DIFF else message.update_id),
+                len(bids),
+                len(asks),
+            ))
+            self._file.write(struct.pack(f"<{len(levels)}d", *levels))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def _trading_pair_index(self, trading_pair: str) -> int:
+        index = self._trading_pair_indexes.get(trading_pair)
+        if index is None:
+            index = len(self._trading_pair_indexes)
+            self._trading_pair_indexes[trading_pair] = index
+            encoded_trading_pair = trading_pair.encode("utf8")
+            self._file.write(RECORD_TYPE.pack(TRADING_PAIR_RECORD))
+            self._file.write(TRADING_PAIR_HEADER.pack(index, len(encoded_trading_pair)))
+            self._file.write(encoded_trading_pair)
+        return index
+
+
+class OrderBookMessageRecordReader:
+    """
+    Iterates over the order book messages of a recording, in the order they were recorded. A record truncated by a
+    recorder that did not stop cleanly ends the iteration.
+    """
+    def __init__(self, path: Union[str, Path]):
+        self._path = path
+        self._file: Optional[BinaryIO] = None
+
+    def __iter__(self) -> Iterator[OrderBookMessage]:
+        self.close()
+        self._file = _open_recording(self._path, "rb")
+        magic, version = FILE_HEADER.unpack(self._read(FILE_HEADER.size))
+        if magic != FILE_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self._path} is not an order book recording of version {FORMAT_VERSION}.")
+        trading_pairs: List[str] = []
+        try:
+            while True:
+                record_type_data = self._file.read(RECORD_TYPE.size)
+                if len(record_type_data) == 0:
+                    break
+                record_type = RECORD_TYPE.unpack(record_type_data)[0]
+                if record_type == TRADING_PAIR_RECORD:
+                    index, length = TRADING_PAIR_HEADER.unpack(self._read(TRADING_PAIR_HEADER.size))
+                    trading_pairs.insert(index, self._read(length).decode("utf8"))
+                elif record_type == OrderBookMessageType.TRADE.value:
+                    yield self._read_trade(trading_pairs)
+                else:
+                    yield self._read_book_message(OrderBookMessageType(record_type), trading_pairs)
+        except EOFError:
+            pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) < size:
+            raise EOFError
+        return data
+
+    def _read_book_message(self, message_type: OrderBookMessageType, trading_pairs: List[str]) -> OrderBookMessage:
+        trading_pair_index, timestamp, update_id, first_update_id, bids_count, asks_count = BOOK_HEADER.unpack(
+            self._read(BOOK_HEADER.size))
+        levels_count = 2 * (bids_count + asks_count)
+        levels = struct.unpack(f"<{levels_count}d", self._read(8 * levels_count))
+        bids = [OrderBookRow(levels[i], levels[i + 1], update_id) for i in range(0, 2 * bids_count, 2)]
+        asks = [OrderBookRow(levels[i], levels[i + 1], update_id) for i in range(2 * bids_count, levels_count, 2)]
+        content = {
+            "trading_pair": trading_pairs[trading_pair_index],
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }
+        if message_type is OrderBookMessageType.DIFF:
+            content["first_update_id"] = first_update_id
+        return OrderBookMessage(message_type, content, timestamp=timestamp)
+
+    def _read_trade(self, trading_pairs: List[str]) -> OrderBookMessage:
+        trading_pair_index, timestamp, trade_type, price, amount, integer_trade_id, trade_id_length = \
+            TRADE_HEADER.unpack(self._read(TRADE_HEADER.size))
+        trade_id = self._read(trade_id_length).decode("utf8")
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {
+                "trading_pair": trading_pairs[trading_pair_index],
+                "trade_type": float(trade_type),
+                "trade_id": int(trade_id) if integer_trade_id else trade_id,
+                "update_id": -1,
+                "price": price,
+                "amount": amount,
+            },
+            timestamp=timestamp,
+        )
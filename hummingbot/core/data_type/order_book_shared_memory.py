@@ -0,0 +1,205 @@
+"""
+Layout of the shared memory segment of an order book, in 8 bytes slots:
+
+    0: sequence number, odd while the publisher is writing
+    1: update id of the book
+    2: depth (maximum number of levels per side)
+    3: number of bid levels
+    4: number of ask levels
+    5: timestamp of the last update (seconds)
+    6: best bid
+    7: best ask
+    8: process id of the publisher
+    9: bid levels, from the best one, as (price, amount) pairs
+    9 + 2 * depth: ask levels, from the best one, as (price, amount) pairs
+
+The segment is a seqlock: the publisher increments the sequence number before and after every update, and the readers
+retry when the number was odd or changed while they copied the segment.
+"""
+import hashlib
+import os
+import re
+import struct
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple
+
+SEQUENCE_SLOT = 0
+UPDATE_ID_SLOT = 1
+DEPTH_SLOT = 2
+BIDS_COUNT_SLOT = 3
+ASKS_COUNT_SLOT = 4
+TIMESTAMP_SLOT = 5
+BEST_BID_SLOT = 6
+BEST_ASK_SLOT = 7
+PUBLISHER_PID_SLOT = 8
+LEVELS_SLOT = 9
+SLOT_SIZE = 8
+
+HEADER_STRUCT = struct.Struct("=qqqqqdddq")
+SEGMENT_NAME_PREFIX = "hb_ob_"
+# macOS limits the shared memory names to 31 characters
+MAX_SEGMENT_NAME_LENGTH = 30
+
+
+def segment_size(depth: int) -> int:
+    return (LEVELS_SLOT + 4 * depth) * SLOT_SIZE
+
+
+def segment_name(connector_name: str, trading_pair: str) -> str:
+    """
+    Returns the name of the shared memory segment of an order book. Names too long for every platform are shortened
+    with a hash.
+    """
+    name = SEGMENT_NAME_PREFIX + re.sub(r"[^A-Za-z0-9_]", "_", f"{connector_name}_{trading_pair}")
+    if len(name) > MAX_SEGMENT_NAME_LENGTH:
+        digest = hashlib.sha1(name.encode("utf8")).hexdigest()[:8]
+        name = f"{name[:MAX_SEGMENT_NAME_LENGTH - len(digest) - 1]}_{digest}"
+    return name
+
+
+class OrderBookSharedMemorySegment:
+    """
+    The shared memory segment an order book publishes its top levels to (see OrderBook.enable_shared_memory_publishing).
+    The segment is created by the publisher and removed when it is closed. A segment left by a publisher that is not
+    running anymore is replaced, but the one of a running publisher is never taken over.
+    """
+    def __init__(self, name: str, depth: int = 20):
+        """
+        :raises FileExistsError: if another publisher, in this process or another one, is publishing to the segment
+        """
+        if depth < 1:
+            raise ValueError("The depth of the order book shared memory segment must be at least 1.")
+        self._depth = depth
+        try:
+            self._shared_memory = SharedMemory(name=name, create=True, size=segment_size(depth))
+        except FileExistsError:
+            publisher_pid = self._publisher_pid(name)
+            if publisher_pid is not None and self._is_process_running(publisher_pid):
+                raise FileExistsError(f"The order book shared memory segment {name} is already published by the "
+                                      f"process {publisher_pid}.")
+            # Left by a publisher that did not stop cleanly
+            SharedMemory(name=name).unlink()
+            self._shared_memory = SharedMemory(name=name, create=True, size=segment_size(depth))
+        self._int_slots = self._shared_memory.buf.cast("q")
+        self._double_slots = self._shared_memory.buf.cast("d")
+        self._int_slots[PUBLISHER_PID_SLOT] = os.getpid()
+        self._int_slots[DEPTH_SLOT] = depth
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def int_slots(self) -> memoryview:
+        return self._int_slots
+
+    @property
+    def double_slots(self) -> memoryview:
+        return self._double_slots
+
+    def close(self):
+        self._int_slots.release()
+        self._double_slots.release()
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+    @staticmethod
+    def _publisher_pid(name: str) -> Optional[int]:
+        try:
+            shared_memory = SharedMemory(name=name)
+        except FileNotFoundError:
+            return None
+        # Only inspected, the segment must not be removed when this process exits
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+        try:
+            if shared_memory.size < HEADER_STRUCT.size:
+                return None
+            publisher_pid = HEADER_STRUCT.unpack_from(shared_memory.buf)[PUBLISHER_PID_SLOT]
+            return publisher_pid if publisher_pid > 0 else None
+        finally:
+            shared_memory.close()
+
+    @staticmethod
+    def _is_process_running(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Running under another user
+            return True
+        return True
+
+
+@dataclass
+class OrderBookSharedMemorySnapshot:
+    update_id: int
+    timestamp: float
+    best_bid: float
+    best_ask: float
+    bids: List[Tuple[float, float]]
+    asks: List[Tuple[float, float]]
+
+
+class OrderBookSharedMemoryReader:
+    """
+    Reads the top levels of an order book published by another process. It doesn't lock the publisher, and only
+    depends on the standard library.
+
+    Example:
+        reader = OrderBookSharedMemoryReader(segment_name("binance", "BTC-USDT"))
+        snapshot = reader.read()
+    """
+    def __init__(self, name: str):
+        self._shared_memory = SharedMemory(name=name)
+        # The segment belongs to the publisher, it must not be removed when this process exits
+        resource_tracker.unregister(self._shared_memory._name, "shared_memory")
+        self._int_slots = self._shared_memory.buf.cast("q")
+        self._depth = self._int_slots[DEPTH_SLOT]
+        self._size = segment_size(self._depth)
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def read(self, timeout: float = 1.0) -> OrderBookSharedMemorySnapshot:
+        """
+        Returns a consistent copy of the published levels, retrying while the publisher is updating them
+
+        :param timeout: the maximum time to retry, in seconds
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            sequence = self._int_slots[SEQUENCE_SLOT]
+            if sequence % 2 == 0:
+                data = self._shared_memory.buf[:self._size].tobytes()
+                if self._int_slots[SEQUENCE_SLOT] == sequence:
+                    return self._parse(data)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Could not read a consistent snapshot of {self._shared_memory.name}.")
+
+    def _parse(self, data: bytes) -> OrderBookSharedMemorySnapshot:
+        _, update_id, depth, bids_count, asks_count, timestamp, best_bid, best_ask, _ = HEADER_STRUCT.unpack_from(data)
+        levels = memoryview(data).cast("d")
+        asks_slot = LEVELS_SLOT + 2 * depth
+        return OrderBookSharedMemorySnapshot(
+            update_id=update_id,
+            timestamp=timestamp,
+            best_bid=best_bid,
+            best_ask=best_ask,
+            bids=list(zip(levels[LEVELS_SLOT:LEVELS_SLOT + 2 * bids_count:2],
+                          levels[LEVELS_SLOT + 1:LEVELS_SLOT + 2 * bids_count:2])),
+            asks=list(zip(levels[asks_slot:asks_slot + 2 * asks_count:2],
+                          levels[asks_slot + 1:asks_slot + 2 * asks_count:2])),
+        )
+
+    def close(self):
+        self._int_slots.release()
+        self._shared_memory.close()
@@ -10,6 +10,7 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_shared_memory import OrderBookSharedMemorySegment, segment_name
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -56,6 +57,10 @@ class OrderBookTracker:
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
 
+        self._shared_memory_connector_name: Optional[str] = None
+        self._shared_memory_depth: int = 0
+        self._shared_memory_segments: Dict[str, OrderBookSharedMemorySegment] = {}
+
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
         return self._data_source
@@ -75,6 +80,40 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def enable_shared_memory_publishing(self, connector_name: str, depth: int):
+        """
+        Publishes the top levels of the order books to shared memory, to be read by other local processes with an
+        OrderBookSharedMemoryReader. There can be only one publisher of each book on the host.
+
+        :param connector_name: the name used to build the name of the segments (see order_book_shared_memory)
+        :param depth: the number of levels published per side
+        """
+        self._shared_memory_connector_name = connector_name
+        self._shared_memory_depth = depth
+
+    def apply_message(self, message: OrderBookMessage):
+        """
+        Applies an order book message right away, without going through the message queues. Used to replay recorded
+        market data in backtests, where the clock doesn't let the event loop run. The diffs received before the first
+        snapshot of their order book are ignored.
+        """
+        trading_pair = message.trading_pair
+        order_book = self._order_books.get(trading_pair)
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            if order_book is None:
+                order_book = self._data_source.order_book_create_function()
+                self._order_books[trading_pair] = order_book
+                if all(pair in self._order_books for pair in self._trading_pairs):
+                    self._order_books_initialized.set()
+            order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        elif order_book is None:
+            return
+        elif message.type is OrderBookMessageType.DIFF:
+            if order_book.snapshot_uid <= message.update_id:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(self._trade_event(message))
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -138,6 +177,7 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        self._close_shared_memory_segments()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -178,6 +218,7 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._publish_to_shared_memory(trading_pair)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -185,6 +226,27 @@ class OrderBookTracker:
             await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    def _publish_to_shared_memory(self, trading_pair: str):
+        if self._shared_memory_connector_name is not None:
+            try:
+                segment = OrderBookSharedMemorySegment(
+                    name=segment_name(self._shared_memory_connector_name, trading_pair),
+                    depth=self._shared_memory_depth)
+                self._order_books[trading_pair].enable_shared_memory_publishing(segment)
+                self._shared_memory_segments[trading_pair] = segment
+            except FileExistsError as exception:
+                self.logger().warning(f"The {trading_pair} order book is not published to shared memory: {exception}")
+            except Exception:
+                self.logger().exception(f"Error publishing the {trading_pair} order book to shared memory.")
+
+    def _close_shared_memory_segments(self):
+        for trading_pair, segment in self._shared_memory_segments.items():
+            order_book = self._order_books.get(trading_pair)
+            if order_book is not None:
+                order_book.disable_shared_memory_publishing()
+            segment.close()
+        self._shared_memory_segments.clear()
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -310,15 +372,7 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                order_book.apply_trade(self._trade_event(trade_message))
 
                 messages_accepted += 1
 
@@ -340,6 +394,18 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _trade_event(trade_message: OrderBookMessage) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            trade_id=trade_message.trade_id,
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        )
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
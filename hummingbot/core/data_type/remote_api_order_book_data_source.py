@@ -1,126 +1,157 @@
-#!/usr/bin/env python
-
 import asyncio
-import aiohttp
-import base64
-import logging
-import pandas as pd
-from typing import (
-    Dict,
-    Optional,
-    Tuple,
-    AsyncIterable
-)
-import pickle
-import time
-import websockets
-from websockets.exceptions import ConnectionClosed
-
-import conf
-from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+import itertools
+from typing import Any, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.logger import HummingbotLogger
-from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.market_data_daemon import protocol
 
 
 class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
-    SNAPSHOT_REST_URL = "https://api.coinalpha.com/order_book_tracker/snapshot"
-    SNAPSHOT_STREAM_URL = "wss://api.coinalpha.com/ws/order_book_tracker/snapshot_stream"
-    DIFF_STREAM_URL = "wss://api.coinalpha.com/ws/order_book_tracker/diff_stream"
-
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
-    _raobds_logger: Optional[HummingbotLogger] = None
+    """
+    Order book data source reading the order book messages of a connector from the market data daemon running on the
+    same host (see MarketDataDaemon), instead of opening its own connections to the exchange.
+
+    The OrderBookMessage instances are rebuilt from the levels and trades relayed by the daemon, so the
+    OrderBookTracker and the OrderBook work exactly as with the exchange data source. Only the connectors in
+    SUPPORTED_CONNECTORS can be served: their exchange classes don't call any method specific to their own data source.
+    """
+    RECONNECT_DELAY = 5.0
+    REQUEST_TIMEOUT = 30.0
+    SUPPORTED_CONNECTORS = frozenset([
+        "ascend_ex",
+        "binance",
+        "binance_us",
+        "bing_x",
+        "bitmart",
+        "bitstamp",
+        "bybit",
+        "gate_io",
+        "htx",
+        "kraken",
+        "kucoin",
+        "mexc",
+        "okx",
+    ])
+
+    def __init__(self, trading_pairs: List[str], connector_name: str, socket_path: str):
+        super().__init__(trading_pairs)
+        self._connector_name = connector_name
+        self._socket_path = socket_path
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = asyncio.Event()
+        self._request_ids = itertools.count(1)
+        self._pending_requests: Dict[int, asyncio.Future] = {}
 
     @classmethod
-    def logger(cls) -> HummingbotLogger:
-        if cls._raobds_logger is None:
-            cls._raobds_logger = logging.getLogger(__name__)
-        return cls._raobds_logger
-
-    def __init__(self):
-        super().__init__()
-        self._client_session: Optional[aiohttp.ClientSession] = None
-
-    @property
-    def authentication_headers(self) -> Dict[str, str]:
-        auth_str: str = f"{conf.coinalpha_order_book_api_username}:{conf.coinalpha_order_book_api_password}"
-        encoded_auth: str = base64.standard_b64encode(auth_str.encode("utf8")).decode("utf8")
-        return {
-            "Authorization": f"Basic {encoded_auth}"
-        }
-
-    async def get_client_session(self) -> aiohttp.ClientSession:
-        if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
-        return self._client_session
-
-    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        auth: aiohttp.BasicAuth = aiohttp.BasicAuth(login=conf.coinalpha_order_book_api_username,
-                                                    password=conf.coinalpha_order_book_api_password)
-        client_session: aiohttp.ClientSession = await self.get_client_session()
-        response: aiohttp.ClientResponse = await client_session.get(self.SNAPSHOT_REST_URL, auth=auth)
-        timestamp: float = time.time()
-        if response.status != 200:
-            raise EnvironmentError(f"Error fetching order book tracker snapshot from {self.SNAPSHOT_REST_URL}.")
-
-        binary_data: bytes = await response.read()
-        order_book_tracker_data: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = pickle.loads(binary_data)
-        retval: Dict[str, OrderBookTrackerEntry] = {}
-
-        for trading_pair, (bids_df, asks_df) in order_book_tracker_data.items():
-            order_book: BinanceOrderBook = BinanceOrderBook()
-            order_book.apply_numpy_snapshot(bids_df.values, asks_df.values)
-            retval[trading_pair] = OrderBookTrackerEntry(trading_pair, timestamp, order_book)
-
-        return retval
-
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    pong_waiter = await ws.ping()
-                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
-
-    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+    def supports_connector(cls, connector_name: str) -> bool:
+        return connector_name in cls.SUPPORTED_CONNECTORS
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        response = await self._request({"type": protocol.LAST_TRADED_PRICES,
+                                        "connector": self._connector_name,
+                                        "trading_pairs": trading_pairs})
+        return response["prices"]
+
+    async def listen_for_subscriptions(self):
+        """
+        Connects to the market data daemon, subscribes to the trading pairs and stores every message received in its
+        queue. After a reconnection the order books are resynchronized with fresh snapshots.
+        """
+        reconnecting = False
         while True:
             try:
-                async with websockets.connect(self.DIFF_STREAM_URL,
-                                              extra_headers=self.authentication_headers) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for msg in self._inner_messages(ws):
-                        output.put_nowait(msg)
+                protocol.verify_private_socket_directory(self._socket_path)
+                reader, writer = await asyncio.open_unix_connection(self._socket_path)
+                listen_task = safe_ensure_future(self._read_messages(reader))
+                try:
+                    self._writer = writer
+                    self._connected.set()
+                    await self._request({"type": protocol.SUBSCRIBE,
+                                         "connector": self._connector_name,
+                                         "trading_pairs": self._trading_pairs})
+                    if reconnecting:
+                        await self._resynchronize_order_books()
+                    await listen_task
+                finally:
+                    listen_task.cancel()
+                    self._on_connection_lost(writer)
             except asyncio.CancelledError:
                 raise
+            except (ConnectionError, FileNotFoundError, PermissionError) as connection_exception:
+                self.logger().warning(f"The connection to the market data daemon was closed ({connection_exception})")
             except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+                self.logger().exception("Unexpected error occurred when listening to the market data daemon.")
+            reconnecting = True
+            await self._sleep(self.RECONNECT_DELAY)
 
-    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                async with websockets.connect(self.SNAPSHOT_STREAM_URL,
-                                              extra_headers=self.authentication_headers) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for msg in self._inner_messages(ws):
-                        output.put_nowait(msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+    async def _read_messages(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                try:
+                    message = await protocol.read_message(reader)
+                except asyncio.IncompleteReadError:
+                    raise ConnectionError("Connection closed by the market data daemon.")
+                if message["type"] == protocol.ORDER_BOOK_MESSAGE:
+                    order_book_message = protocol.order_book_message_from_data(message["message"])
+                    self._message_queue[self._queue_key(order_book_message)].put_nowait(order_book_message)
+                else:
+                    future = self._pending_requests.pop(message["request_id"], None)
+                    if future is not None and not future.done():
+                        if message["type"] == protocol.ERROR:
+                            future.set_exception(IOError(message["error"]))
+                        else:
+                            future.set_result(message)
+        finally:
+            self._fail_pending_requests()
+
+    async def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        await self._connected.wait()
+        request_id = next(self._request_ids)
+        future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = future
+        try:
+            self._writer.write(protocol.encode_message({**request, "request_id": request_id}))
+            return await asyncio.wait_for(future, timeout=self.REQUEST_TIMEOUT)
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+    async def _resynchronize_order_books(self):
+        snapshots_queue = self._message_queue[self._snapshot_messages_queue_key]
+        for trading_pair in self._trading_pairs:
+            snapshots_queue.put_nowait(await self._order_book_snapshot(trading_pair=trading_pair))
+
+    def _on_connection_lost(self, writer: asyncio.StreamWriter):
+        self._connected.clear()
+        self._writer = None
+        writer.close()
+        self._fail_pending_requests()
+
+    def _fail_pending_requests(self):
+        for future in self._pending_requests.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection to the market data daemon lost."))
+        self._pending_requests.clear()
+
+    def _queue_key(self, message: OrderBookMessage) -> str:
+        if message.type is OrderBookMessageType.TRADE:
+            return self._trade_messages_queue_key
+        elif message.type is OrderBookMessageType.DIFF:
+            return self._diff_messages_queue_key
+        return self._snapshot_messages_queue_key
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        response = await self._request({"type": protocol.SNAPSHOT,
+                                        "connector": self._connector_name,
+                                        "trading_pair": trading_pair})
+        return protocol.order_book_message_from_data(response["snapshot"])
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
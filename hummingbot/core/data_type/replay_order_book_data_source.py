@@ -0,0 +1,137 @@
+import asyncio
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_recording import OrderBookMessageRecordReader
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class ReplayOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Replays the order book messages of a recording (see order_book_message_recording), as if they were received from
+    the exchange.
+
+    In backtests (ClockMode.BACKTEST) the messages are applied to the order book tracker by an OrderBookReplayIterator,
+    on each tick of the clock. Otherwise they are published by listen_for_subscriptions, `speed` times faster than
+    they were recorded.
+    """
+
+    def __init__(self, trading_pairs: List[str], recording_path: Union[str, Path], speed: float = 1.0):
+        """
+        :param trading_pairs: the trading pairs to replay, the messages of the other ones are ignored
+        :param recording_path: the path of the recording
+        :param speed: the acceleration of the replay in real time mode, 0 to publish the messages without waiting
+        """
+        super().__init__(trading_pairs)
+        self._recording_path = recording_path
+        self._speed = speed
+        self._messages: Iterator[OrderBookMessage] = iter(OrderBookMessageRecordReader(recording_path))
+        self._read_messages: Deque[OrderBookMessage] = deque()
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def last_traded_prices(self) -> Dict[str, float]:
+        return self._last_traded_prices
+
+    def replay_until(self, timestamp: float) -> List[OrderBookMessage]:
+        """
+        Returns the recorded messages not replayed yet up to a timestamp
+
+        :param timestamp: the timestamp of the last message to replay
+        """
+        messages = []
+        while True:
+            message = self._peek_message()
+            if message is None or message.timestamp > timestamp:
+                break
+            messages.append(self._pop_message())
+        return messages
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs if trading_pair in self._last_traded_prices}
+
+    async def listen_for_subscriptions(self):
+        previous_timestamp: Optional[float] = None
+        while True:
+            message = self._pop_message()
+            if message is None:
+                self.logger().info(f"The replay of {self._recording_path} is complete.")
+                break
+            if previous_timestamp is not None and self._speed > 0:
+                await self._sleep(max(0.0, message.timestamp - previous_timestamp) / self._speed)
+            previous_timestamp = message.timestamp
+            if message.type is OrderBookMessageType.DIFF:
+                self._message_queue[self._diff_messages_queue_key].put_nowait(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._message_queue[self._snapshot_messages_queue_key].put_nowait(message)
+            else:
+                self._message_queue[self._trade_messages_queue_key].put_nowait(message)
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        # The messages read while looking for the snapshot are kept to be replayed later
+        for message in self._read_messages:
+            if message.type is OrderBookMessageType.SNAPSHOT and message.trading_pair == trading_pair:
+                return message
+        while self._read_next_message():
+            message = self._read_messages[-1]
+            if message.type is OrderBookMessageType.SNAPSHOT and message.trading_pair == trading_pair:
+                return message
+        raise ValueError(f"There is no {trading_pair} order book snapshot left in {self._recording_path}.")
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _peek_message(self) -> Optional[OrderBookMessage]:
+        if len(self._read_messages) == 0 and not self._read_next_message():
+            return None
+        return self._read_messages[0]
+
+    def _pop_message(self) -> Optional[OrderBookMessage]:
+        message = self._peek_message()
+        if message is not None:
+            self._read_messages.popleft()
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[message.trading_pair] = float(message.content["price"])
+        return message
+
+    def _read_next_message(self) -> bool:
+        for message in self._messages:
+            if message.trading_pair in self._trading_pairs:
+                self._read_messages.append(message)
+                return True
+        return False
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Applies the messages of a ReplayOrderBookDataSource to its order book tracker, up to the timestamp of each tick of
+    the clock. It must be added to the clock before the connectors reading the order books (e.g. a PaperTradeExchange),
+    so they see the books of the current tick.
+
+    Example:
+        clock = Clock(ClockMode.BACKTEST, start_time=start, end_time=end)
+        market, replay_iterator = create_replay_paper_trade_market("binance", client_config_map, ["BTC-USDT"], path)
+        clock.add_iterator(replay_iterator)
+        clock.add_iterator(market)
+    """
+
+    def __init__(self, order_book_tracker: OrderBookTracker):
+        super().__init__()
+        if not isinstance(order_book_tracker.data_source, ReplayOrderBookDataSource):
+            raise ValueError("The order book tracker does not replay a recording.")
+        self._order_book_tracker = order_book_tracker
+
+    def tick(self, timestamp: float):
+        for message in self._order_book_tracker.data_source.replay_until(timestamp):
+            self._order_book_tracker.apply_message(message)
@@ -38,6 +38,7 @@ class MarketEvent(Enum):
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
     OrderBookDataSourceUpdateEvent = 904
+    PriceChangeEvent = 905
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -156,6 +157,18 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookPriceChangeEvent(NamedTuple):
+    """
+    Emitted by an order book when the prices of a registered watch moved beyond the watch threshold.
+    For the top of book watch (volume 0) bid_price and ask_price are the best bid and ask, otherwise they are the
+    VWAP of selling and buying the watched volume (NaN if the book is not deep enough).
+    """
+    update_id: int
+    volume: float
+    bid_price: float
+    ask_price: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -1,18 +1,33 @@
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
 
 
 class TradingPairFetcher:
+    """
+    Serves the trading pairs of the connectors, used for autocompletion and validation, from a cache stored on disk.
+    The trading pairs of a connector are only fetched when they are requested and are missing or older than the cache
+    TTL. The connectors requested are refreshed in the background, one at a time, with a non trading instance of each
+    connector kept between the refreshes so the requests go through its throttler.
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CACHE_TTL = 60 * 60 * 24
+    RETRY_INTERVAL = 60
+    REFRESH_INTERVAL = 60 * 10
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -26,53 +41,183 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher(client_config_map)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    def __init__(self, client_config_map: ClientConfigAdapter, cache_path: Optional[Path] = None):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
-        self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
+        self._cache_path = cache_path or Path(data_path()) / "trading_pairs_cache.json"
+        # The time of the last successful fetch and of the last attempt of each connector
+        self._fetch_timestamps: Dict[str, float] = {}
+        self._attempt_timestamps: Dict[str, float] = {}
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        # The non trading connector instances, by name of the connector setting
+        self._connectors: Dict[str, Any] = {}
+        self._requested_connectors: Set[str] = set()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._load_cache()
+        self.ready = True
 
-    def _fetch_pairs_from_connector_setting(
-            self,
-            connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the cached trading pairs of the connector, and fetches them in the background if they are missing or
+        stale.
+        """
+        self._requested_connectors.add(connector_name)
+        if self._is_stale(connector_name):
+            self._schedule_fetch(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    async def fetch_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs of the connector, waiting for them to be fetched if they are missing or stale.
+        """
+        self._requested_connectors.add(connector_name)
+        if self._is_stale(connector_name):
+            fetch_task = self._schedule_fetch(connector_name)
+            if fetch_task is not None:
+                await fetch_task
+        return self.trading_pairs.get(connector_name, [])
+
+    def refresh_trading_pairs(self, connector_name: str) -> bool:
+        """
+        Fetches the trading pairs of the connector in the background even if the cached ones are not older than the
+        cache TTL, e.g. when a trading pair is not found in them because it was listed since. The trading pairs are not
+        fetched again if they were fetched or attempted less than the retry interval ago.
+
+        :return: False if the cached trading pairs are up to date, True if they may be outdated
+        """
+        self._requested_connectors.add(connector_name)
+        now = self._time()
+        if now - self._fetch_timestamps.get(connector_name, 0) < self.RETRY_INTERVAL:
+            return False
+        if now - self._attempt_timestamps.get(connector_name, 0) >= self.RETRY_INTERVAL:
+            self._schedule_fetch(connector_name)
+        return True
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        """
+        Fetches the trading pairs of all the connectors, or of the connected ones only, that are missing or stale.
+        """
         await Security.wait_til_decryption_done()
         connector_settings = self._all_connector_settings()
+        fetch_tasks = []
         for conn_setting in connector_settings.values():
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    source_setting = connector_settings[conn_setting.parent_name]
+                elif not self.fetch_pairs_from_all_exchanges and not conn_setting.connector_connected():
+                    continue
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-            except ModuleNotFoundError:
-                continue
+                    source_setting = conn_setting
+                self._requested_connectors.add(conn_setting.name)
+                if self._is_stale(conn_setting.name):
+                    fetch_tasks.append(self._schedule_fetch(conn_setting.name, source_setting))
             except Exception:
                 self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
                                         "Please check the logs")
+        await safe_gather(*[task for task in fetch_tasks if task is not None])
         self.ready = True
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            self._fetch_timestamps[exchange_name] = self._time()
+            self._save_cache()
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            self.trading_pairs.setdefault(exchange_name, [])
+
+    def _is_stale(self, connector_name: str) -> bool:
+        now = self._time()
+        fetch_timestamp = self._fetch_timestamps.get(connector_name)
+        if fetch_timestamp is not None and now - fetch_timestamp < self.CACHE_TTL:
+            return False
+        # Don't retry a failed fetch on every request
+        return now - self._attempt_timestamps.get(connector_name, 0) >= self.RETRY_INTERVAL
+
+    def _schedule_fetch(self,
+                        connector_name: str,
+                        connector_setting: Optional[ConnectorSetting] = None) -> Optional[asyncio.Task]:
+        fetch_task = self._fetch_tasks.get(connector_name)
+        if fetch_task is None or fetch_task.done():
+            connector_setting = connector_setting or self._source_connector_setting(connector_name)
+            if connector_setting is None:
+                return None
+            fetch_task = safe_ensure_future(self._fetch_pairs_from_connector_setting(connector_setting, connector_name))
+            self._fetch_tasks[connector_name] = fetch_task
+        if self._refresh_task is None:
+            self._refresh_task = safe_ensure_future(self._refresh_loop())
+        return fetch_task
+
+    def _source_connector_setting(self, connector_name: str) -> Optional[ConnectorSetting]:
+        connector_settings = self._all_connector_settings()
+        connector_setting = connector_settings.get(connector_name)
+        if connector_setting is not None and connector_setting.base_name().endswith("paper_trade"):
+            connector_setting = connector_settings.get(connector_setting.parent_name)
+        return connector_setting
+
+    async def _fetch_pairs_from_connector_setting(
+            self,
+            connector_setting: ConnectorSetting,
+            connector_name: Optional[str] = None):
+        connector_name = connector_name or connector_setting.name
+        self._attempt_timestamps[connector_name] = self._time()
+        connector = self._connectors.get(connector_setting.name)
+        if connector is None:
+            try:
+                connector = connector_setting.non_trading_connector_instance_with_default_configuration()
+            except ModuleNotFoundError:
+                return
+            except Exception:
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
+                                        "Please check the logs")
+                return
+            self._connectors[connector_setting.name] = connector
+        await self.call_fetch_pairs(connector.all_trading_pairs(), connector_name)
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self._sleep(self.REFRESH_INTERVAL)
+                for connector_name in list(self._requested_connectors):
+                    if self._is_stale(connector_name):
+                        fetch_task = self._schedule_fetch(connector_name)
+                        if fetch_task is not None:
+                            await fetch_task
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error refreshing the trading pairs.", exc_info=True)
+
+    def _load_cache(self):
+        try:
+            with open(self._cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+            for connector_name, entry in cache.items():
+                self.trading_pairs[connector_name] = entry["trading_pairs"]
+                self._fetch_timestamps[connector_name] = entry["timestamp"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self.logger().warning(f"Could not load the trading pairs cache {self._cache_path}.", exc_info=True)
+
+    def _save_cache(self):
+        cache = {
+            connector_name: {"timestamp": timestamp, "trading_pairs": self.trading_pairs.get(connector_name, [])}
+            for connector_name, timestamp in self._fetch_timestamps.items()
+        }
+        try:
+            temporary_path = self._cache_path.with_suffix(".tmp")
+            with open(temporary_path, "w") as cache_file:
+                json.dump(cache, cache_file)
+            temporary_path.replace(self._cache_path)
+        except Exception:
+            self.logger().warning(f"Could not save the trading pairs cache {self._cache_path}.", exc_info=True)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -84,3 +229,9 @@ class TradingPairFetcher:
 
         client_config_map = HummingbotApplication.main_application().client_config_map
         return client_config_map
+
+    def _time(self) -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
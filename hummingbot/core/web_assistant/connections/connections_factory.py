@@ -2,6 +2,7 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.request_timing_metrics import RequestTimingMetrics
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,13 +17,47 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The shared session keeps a pool of persistent connections per host and caches the DNS resolutions, so that order
+    requests do not pay for new TCP and TLS handshakes. The duration of each stage of the REST requests is collected
+    in `request_timing_metrics`.
     """
+    DEFAULT_LIMIT_PER_HOST = 30
+    DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+    DEFAULT_DNS_CACHE_TTL = 300
 
-    def __init__(self):
+    def __init__(self,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+                 dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL):
+        """
+        :param limit_per_host: the maximum number of simultaneous connections to the same host (0 for no limit)
+        :param keepalive_timeout: the time an idle connection is kept open in the pool, in seconds
+        :param dns_cache_ttl: the time a DNS resolution is cached, in seconds (None to cache it forever)
+        """
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._request_timing_metrics = RequestTimingMetrics()
+
+    @property
+    def request_timing_metrics(self) -> RequestTimingMetrics:
+        return self._request_timing_metrics
+
+    def configure_connection_pool(self,
+                                  limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                                  keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+                                  dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL):
+        """
+        Changes the settings of the connection pool. They only apply to the shared session created after the call.
+        """
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
@@ -35,5 +70,18 @@ class ConnectionsFactory:
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        self._shared_client = self._shared_client or self._create_client_session()
         return self._shared_client
+
+    def _create_client_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self._limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[self._request_timing_metrics.trace_config()],
+        )
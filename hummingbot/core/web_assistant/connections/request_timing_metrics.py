@@ -0,0 +1,123 @@
+import asyncio
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import aiohttp
+
+UNKNOWN_REQUEST_KEY = "unknown"
+REQUEST_STAGES = ("dns", "connect", "ttfb", "total")
+
+
+@dataclass
+class RequestTiming:
+    """
+    The duration in seconds of each stage of a REST request.
+
+    `connect` includes the TCP and the TLS handshakes (aiohttp does not report them separately) and is zero when the
+    request reused a pooled connection. `ttfb` is the time between sending the request headers and receiving the
+    response headers.
+    """
+    dns: float = 0
+    connect: float = 0
+    ttfb: float = 0
+    total: float = 0
+    reused_connection: bool = True
+
+
+@dataclass
+class RequestTimingStats:
+    count: int = 0
+    errors: int = 0
+    reused_connections: int = 0
+    total_duration: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(REQUEST_STAGES, 0.0))
+    max_duration: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(REQUEST_STAGES, 0.0))
+    last: Optional[RequestTiming] = None
+
+    def add(self, timing: RequestTiming):
+        self.count += 1
+        self.reused_connections += int(timing.reused_connection)
+        for stage in REQUEST_STAGES:
+            duration = getattr(timing, stage)
+            self.total_duration[stage] += duration
+            self.max_duration[stage] = max(self.max_duration[stage], duration)
+        self.last = timing
+
+    def mean(self, stage: str) -> float:
+        return self.total_duration[stage] / self.count if self.count > 0 else 0.0
+
+
+class RequestTimingMetrics:
+    """
+    Collects the duration of the stages of the REST requests sent through an `aiohttp.ClientSession`, grouped by the
+    throttler limit id of the request (e.g. the order creation and cancelation endpoints).
+
+    The collection is done with aiohttp tracing, the session has to be created with the `trace_config` of this class
+    and the requests have to pass their key as `trace_request_ctx`.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, RequestTimingStats] = {}
+
+    @property
+    def stats(self) -> Dict[str, RequestTimingStats]:
+        return self._stats
+
+    def stats_for(self, key: str) -> RequestTimingStats:
+        return self._stats.get(key, RequestTimingStats())
+
+    def reset(self):
+        self._stats = {}
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_dns_resolvehost_start.append(self._on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(self._on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_request_headers_sent.append(self._on_request_headers_sent)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_request_exception.append(self._on_request_exception)
+        return trace_config
+
+    def _stats_for_context(self, context: SimpleNamespace) -> RequestTimingStats:
+        key = context.trace_request_ctx or UNKNOWN_REQUEST_KEY
+        if key not in self._stats:
+            self._stats[key] = RequestTimingStats()
+        return self._stats[key]
+
+    async def _on_request_start(self, session, context: SimpleNamespace, params):
+        context.timing = RequestTiming()
+        context.request_start = self._time()
+        context.headers_sent = context.request_start
+
+    async def _on_dns_resolvehost_start(self, session, context: SimpleNamespace, params):
+        context.dns_start = self._time()
+
+    async def _on_dns_resolvehost_end(self, session, context: SimpleNamespace, params):
+        context.timing.dns = self._time() - context.dns_start
+
+    async def _on_connection_create_start(self, session, context: SimpleNamespace, params):
+        context.connection_start = self._time()
+
+    async def _on_connection_create_end(self, session, context: SimpleNamespace, params):
+        # The DNS resolution happens while the connection is being created
+        context.timing.connect = max(self._time() - context.connection_start - context.timing.dns, 0)
+        context.timing.reused_connection = False
+
+    async def _on_request_headers_sent(self, session, context: SimpleNamespace, params):
+        context.headers_sent = self._time()
+
+    async def _on_request_end(self, session, context: SimpleNamespace, params):
+        now = self._time()
+        context.timing.ttfb = now - context.headers_sent
+        context.timing.total = now - context.request_start
+        self._stats_for_context(context).add(context.timing)
+
+    async def _on_request_exception(self, session, context: SimpleNamespace, params):
+        self._stats_for_context(context).errors += 1
+
+    @staticmethod
+    def _time() -> float:
+        return asyncio.get_event_loop().time()
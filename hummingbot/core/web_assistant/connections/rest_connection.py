@@ -13,6 +13,7 @@ class RESTConnection:
             params=request.params,
             data=request.data,
             headers=request.headers,
+            trace_request_ctx=request.throttler_limit_id,
         )
 
         resp = await self._build_resp(aiohttp_resp)
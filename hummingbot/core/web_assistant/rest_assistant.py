@@ -1,7 +1,9 @@
 import json
+import time
 from asyncio import wait_for
+from contextvars import ContextVar
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -10,6 +12,11 @@ from hummingbot.core.web_assistant.connections.rest_connection import RESTConnec
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
+# When set, the throttler wait and the round trip duration (in seconds) of every request sent from the current context
+# are appended to the list. Used to attribute the REST latency to the operation that sent the requests.
+rest_request_timings: ContextVar[Optional[List[Tuple[float, float]]]] = ContextVar(
+    "rest_request_timings", default=None)
+
 
 class RESTAssistant:
     """A helper class to contain all REST-related logic.
@@ -90,8 +97,13 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
+        throttling_start = time.perf_counter()
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
+            request_start = time.perf_counter()
             response = await self.call(request=request, timeout=timeout)
+            timings = rest_request_timings.get()
+            if timings is not None:
+                timings.append((request_start - throttling_start, time.perf_counter() - request_start))
 
             if 400 <= response.status:
                 if not return_err:
@@ -0,0 +1,143 @@
+from collections import deque
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class AggregatedCandles:
+    """
+    Candles of an interval rolled up locally from the candles of a finer interval (the base feed) of the same exchange
+    and trading pair, so several intervals are served by one websocket stream and one history backfill.
+
+    The candles are aligned to multiples of the interval since the epoch, as the exchanges do for the intervals up to
+    one day. The oldest candle is dropped when the base candles don't cover all of it, and the last one is in progress,
+    like the last candle of the base feed. The candles are updated incrementally when read: only the base candles of
+    the last candle are aggregated again, unless the base feed was reset or its history was filled.
+    """
+    columns = CandlesBase.columns
+    # The longer intervals are aligned to the calendar (weeks, months) by the exchanges
+    MAX_INTERVAL_IN_SECONDS = 86400
+
+    def __init__(self, base_feed: CandlesBase, interval: str, max_records: int = 150):
+        if not self.supports_interval(interval):
+            raise ValueError(f"Interval {interval} can't be aggregated locally.")
+        self.interval = interval
+        self.max_records = max_records
+        self._candles = deque(maxlen=max_records)
+        self._first_base_timestamp: Optional[float] = None
+        self._base_feed: Optional[CandlesBase] = None
+        self.set_base_feed(base_feed)
+
+    @classmethod
+    def supports_interval(cls, interval: str) -> bool:
+        interval_in_seconds = CandlesBase.interval_to_seconds.get(interval)
+        return interval_in_seconds is not None and interval_in_seconds <= cls.MAX_INTERVAL_IN_SECONDS
+
+    @staticmethod
+    def required_base_records(interval: str, max_records: int, base_interval: str) -> int:
+        """
+        Returns the number of base candles covering max_records candles of the interval, including the partial
+        oldest one.
+        """
+        ratio = CandlesBase.interval_to_seconds[interval] // CandlesBase.interval_to_seconds[base_interval]
+        return (max_records + 1) * ratio
+
+    @property
+    def base_feed(self) -> CandlesBase:
+        return self._base_feed
+
+    @property
+    def name(self) -> str:
+        return self._base_feed.name
+
+    @property
+    def interval_in_seconds(self) -> int:
+        return CandlesBase.interval_to_seconds[self.interval]
+
+    @property
+    def ready(self) -> bool:
+        self._update()
+        return len(self._candles) == self._candles.maxlen
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        """
+        This property returns the aggregated candles as a Pandas DataFrame, with the columns of the base feed.
+        """
+        self._update()
+        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+
+    def set_base_feed(self, base_feed: CandlesBase):
+        """
+        Replaces the base feed, for example with one keeping more records. The candles are aggregated again.
+        """
+        if self.interval_in_seconds % base_feed.interval_in_seconds != 0:
+            raise ValueError(f"Interval {self.interval} is not a multiple of the base interval {base_feed.interval}.")
+        self._base_feed = base_feed
+        self._candles.clear()
+        self._first_base_timestamp = None
+
+    def start(self):
+        """
+        The base feed is started by its owner (see MarketDataProvider).
+        """
+        pass
+
+    def stop(self):
+        """
+        The base feed is stopped by its owner, once no aggregated candles use it.
+        """
+        pass
+
+    def _update(self):
+        base_candles = self._base_feed._candles
+        if len(base_candles) == 0:
+            self._candles.clear()
+            self._first_base_timestamp = None
+            return
+        first_base_timestamp = base_candles[0][0]
+        if (len(self._candles) == 0
+                or self._first_base_timestamp is None
+                or first_base_timestamp < self._first_base_timestamp
+                or base_candles[-1][0] < self._candles[-1][0]):
+            # The base candles were reset, or older ones were added
+            self._rebuild(np.array(base_candles))
+        else:
+            last_candle_timestamp = self._candles[-1][0]
+            rows = []
+            for base_candle in reversed(base_candles):
+                if base_candle[0] < last_candle_timestamp:
+                    break
+                rows.append(base_candle)
+            self._candles.pop()
+            self._candles.extend(self._aggregate(np.array(rows[::-1])))
+        self._first_base_timestamp = first_base_timestamp
+
+    def _rebuild(self, base_candles: np.ndarray):
+        candles = self._aggregate(base_candles)
+        if candles[0][0] != base_candles[0][0]:
+            # The oldest candle is partial
+            candles = candles[1:]
+        self._candles.clear()
+        self._candles.extend(candles)
+
+    def _aggregate(self, base_candles: np.ndarray) -> np.ndarray:
+        """
+        Rolls up the base candles (sorted by timestamp) into candles of the interval.
+        """
+        timestamps = base_candles[:, 0]
+        candle_timestamps = timestamps - timestamps % self.interval_in_seconds
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(candle_timestamps)) + 1))
+        ends = np.append(starts[1:], len(base_candles)) - 1
+        return np.column_stack([
+            candle_timestamps[starts],
+            base_candles[starts, 1],
+            np.maximum.reduceat(base_candles[:, 2], starts),
+            np.minimum.reduceat(base_candles[:, 3], starts),
+            base_candles[ends, 4],
+            # volume, quote_asset_volume, n_trades, taker_buy_base_volume, taker_buy_quote_volume
+            np.add.reduceat(base_candles[:, 5:], starts, axis=0),
+        ])
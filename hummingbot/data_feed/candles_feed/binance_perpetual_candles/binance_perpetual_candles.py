@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -107,6 +107,26 @@ class BinancePerpetualCandles(CandlesBase):
         }
         return payload
 
+    @property
+    def shared_websocket_supported(self) -> bool:
+        return True
+
+    def _ws_subscription_payloads(self, feeds: List[CandlesBase]) -> List[Dict[str, Any]]:
+        candle_params = [f"{feed._ex_trading_pair.lower()}@kline_{feed.interval}" for feed in feeds]
+        return [
+            {
+                "method": "SUBSCRIBE",
+                "params": candle_params[start:start + CONSTANTS.MAX_STREAMS_PER_SUBSCRIPTION],
+                "id": 1
+            }
+            for start in range(0, len(candle_params), CONSTANTS.MAX_STREAMS_PER_SUBSCRIPTION)
+        ]
+
+    def _ws_message_subscription_key(self, data: Any) -> Optional[Tuple[str, str]]:
+        if data is not None and data.get("e") == "kline":
+            return data["s"], data["k"]["i"]
+        return None
+
     def _parse_websocket_message(self, data):
         candles_row_dict: Dict[str, Any] = {}
         if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
@@ -27,6 +27,8 @@ INTERVALS = bidict({
     "1M": 2592000
 })
 MAX_RESULTS_PER_CANDLESTICK_REST_REQUEST = 1500
+# Streams subscribed per websocket subscription message
+MAX_STREAMS_PER_SUBSCRIPTION = 100
 REQUEST_WEIGHT = "REQUEST_WEIGHT"
 
 RATE_LIMITS = [
@@ -27,6 +27,8 @@ INTERVALS = bidict({
     "1M": "1M"
 })
 MAX_RESULTS_PER_CANDLESTICK_REST_REQUEST = 1000
+# Streams subscribed per websocket subscription message
+MAX_STREAMS_PER_SUBSCRIPTION = 100
 REQUEST_WEIGHT = "REQUEST_WEIGHT"
 
 RATE_LIMITS = [
@@ -2,7 +2,7 @@ import asyncio
 import os
 import time
 from collections import deque
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,9 @@ from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFa
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
 
 class CandlesBase(NetworkBase):
     """
@@ -57,6 +60,7 @@ class CandlesBase(NetworkBase):
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._hub: Optional["CandlesHub"] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -70,7 +74,10 @@ class CandlesBase(NetworkBase):
         """
         await self.stop_network()
         await self.initialize_exchange_data()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._hub is not None and self.shared_websocket_supported:
+            self._hub.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
@@ -79,6 +86,16 @@ class CandlesBase(NetworkBase):
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._hub is not None:
+            self._hub.unsubscribe(self)
+
+    def set_hub(self, hub: "CandlesHub"):
+        """
+        Makes the feed share the REST rate limits, and the websocket connections when supported, of the other feeds of
+        the exchange (see CandlesHub).
+        """
+        self._hub = hub
+        self._api_factory = hub.api_factory
 
     async def initialize_exchange_data(self):
         """
@@ -134,6 +151,22 @@ class CandlesBase(NetworkBase):
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
+    @property
+    def shared_websocket_supported(self) -> bool:
+        """
+        Feeds able to share a websocket connection with the other feeds of the exchange implement
+        `_ws_message_subscription_key` and return True.
+        """
+        return False
+
+    @property
+    def subscription_key(self) -> Tuple[str, str]:
+        """
+        The key of the websocket stream of the feed, the feeds with the same key share the stream. The interval is the
+        one of the feed configuration (e.g. 1m), also found in the websocket messages.
+        """
+        return self._ex_trading_pair, self.interval
+
     @property
     def interval_in_seconds(self):
         return self.get_seconds_from_interval(self.interval)
@@ -398,6 +431,20 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    def _ws_subscription_payloads(self, feeds: List["CandlesBase"]) -> List[Dict[str, Any]]:
+        """
+        Returns the payloads subscribing to the streams of several feeds of the exchange over one websocket connection.
+        Exchanges accepting several streams per subscription message override it to send fewer messages.
+        """
+        return [feed.ws_subscription_payload() for feed in feeds]
+
+    def _ws_message_subscription_key(self, data: Any) -> Optional[Tuple[str, str]]:
+        """
+        Returns the key of the stream of a websocket message (see subscription_key), or None when the message is not a
+        candle. Only the feeds supporting shared websocket connections implement it.
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages_task(self, websocket_assistant: WSAssistant):
         # TODO: Isolate ping pong logic
         async for ws_response in websocket_assistant.iter_messages():
@@ -407,27 +454,33 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._process_candle_update(parsed_message)
+
+    def _process_candle_update(self, parsed_message: Dict[str, Any]):
+        """
+        Adds a candle parsed from a websocket message, or updates the last one.
+        """
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
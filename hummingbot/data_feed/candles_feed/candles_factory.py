@@ -6,6 +6,7 @@ from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCa
 from hummingbot.data_feed.candles_feed.bybit_perpetual_candles.bybit_perpetual_candles import BybitPerpetualCandles
 from hummingbot.data_feed.candles_feed.bybit_spot_candles.bybit_spot_candles import BybitSpotCandles
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.candles_feed.gate_io_perpetual_candles import GateioPerpetualCandles
 from hummingbot.data_feed.candles_feed.gate_io_spot_candles import GateioSpotCandles
@@ -66,10 +67,13 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(
+            candles = connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
                 candles_config.max_records
             )
+            # The candles of an exchange share the REST rate limits, and the websocket when the exchange supports it
+            candles.set_hub(CandlesHub.get_instance(candles_config.connector, candles.rate_limits))
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
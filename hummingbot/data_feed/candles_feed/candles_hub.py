@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+SubscriptionKey = Tuple[str, str]
+
+
+class CandlesHub:
+    """
+    Shares the network resources of the candles feeds of an exchange:
+    - the REST requests (the historical candles backfills) go through one throttler, so the backfills of many feeds are
+    paced within the rate limits of the exchange
+    - the feeds supporting it share websocket connections, with up to `max_subscriptions_per_connection` streams each
+    - the feeds of the same trading pair and interval share one stream, each message updates all of them
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _instances: Dict[str, "CandlesHub"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls, connector_name: str, rate_limits: List[RateLimit]) -> "CandlesHub":
+        if connector_name not in cls._instances:
+            cls._instances[connector_name] = CandlesHub(connector_name=connector_name, rate_limits=rate_limits)
+        return cls._instances[connector_name]
+
+    def __init__(self, connector_name: str, rate_limits: List[RateLimit], max_subscriptions_per_connection: int = 200):
+        self._connector_name = connector_name
+        self._max_subscriptions_per_connection = max_subscriptions_per_connection
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=rate_limits))
+        self._feeds: Dict[SubscriptionKey, List["CandlesBase"]] = {}
+        self._connections: List[_CandlesHubConnection] = []
+
+    @property
+    def api_factory(self) -> WebAssistantsFactory:
+        return self._api_factory
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def subscriptions_count(self) -> int:
+        return len(self._feeds)
+
+    def feeds(self, key: SubscriptionKey) -> List["CandlesBase"]:
+        return self._feeds.get(key, [])
+
+    def subscribe(self, feed: "CandlesBase"):
+        """
+        Starts updating the feed with the stream of its trading pair and interval, subscribing to it when the feed is
+        the first one using it.
+        """
+        key = feed.subscription_key
+        feeds = self._feeds.setdefault(key, [])
+        if feed in feeds:
+            return
+        feeds.append(feed)
+        if len(feeds) == 1:
+            connection = next((connection for connection in self._connections if not connection.full), None)
+            if connection is None:
+                connection = _CandlesHubConnection(hub=self, max_subscriptions=self._max_subscriptions_per_connection)
+                self._connections.append(connection)
+            connection.add_subscription(key)
+
+    def unsubscribe(self, feed: "CandlesBase"):
+        """
+        Stops updating the feed. The connections left without streams are closed, the messages of the streams left
+        without feeds are ignored.
+        """
+        key = feed.subscription_key
+        feeds = self._feeds.get(key, [])
+        if feed not in feeds:
+            return
+        feeds.remove(feed)
+        if len(feeds) == 0:
+            del self._feeds[key]
+            connection = next(connection for connection in self._connections if key in connection.subscriptions)
+            connection.remove_subscription(key)
+            if len(connection.subscriptions) == 0:
+                connection.stop()
+                self._connections.remove(connection)
+
+
+class _CandlesHubConnection:
+    """
+    A websocket connection of a CandlesHub, with the streams subscribed through it
+    """
+
+    def __init__(self, hub: CandlesHub, max_subscriptions: int):
+        self._hub = hub
+        self._max_subscriptions = max_subscriptions
+        self.subscriptions: List[SubscriptionKey] = []
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def full(self) -> bool:
+        return len(self.subscriptions) >= self._max_subscriptions
+
+    def add_subscription(self, key: SubscriptionKey):
+        self.subscriptions.append(key)
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self._listen())
+        elif self._ws is not None:
+            safe_ensure_future(self._subscribe(self._ws, [key]))
+
+    def remove_subscription(self, key: SubscriptionKey):
+        self.subscriptions.remove(key)
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    def _any_feed(self) -> Optional["CandlesBase"]:
+        return next((self._hub.feeds(key)[0] for key in self.subscriptions if len(self._hub.feeds(key)) > 0), None)
+
+    async def _listen(self):
+        while True:
+            ws: Optional[WSAssistant] = None
+            try:
+                feed = self._any_feed()
+                if feed is None:
+                    return
+                ws = await feed._connected_websocket_assistant()
+                # Set first, the streams added while subscribing are subscribed on their own
+                self._ws = ws
+                await self._subscribe(ws, list(self.subscriptions))
+                await self._process_websocket_messages(ws, feed)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self._hub.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self._hub.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await asyncio.sleep(1.0)
+            finally:
+                self._ws = None
+                ws and await ws.disconnect()
+                for key in self.subscriptions:
+                    for feed in self._hub.feeds(key):
+                        await feed._on_order_stream_interruption()
+
+    async def _subscribe(self, ws: WSAssistant, keys: List[SubscriptionKey]):
+        feeds = [self._hub.feeds(key)[0] for key in keys if len(self._hub.feeds(key)) > 0]
+        if len(feeds) == 0:
+            return
+        for payload in feeds[0]._ws_subscription_payloads(feeds):
+            await ws.send(WSJSONRequest(payload=payload))
+        self._hub.logger().info(f"Subscribed to {len(feeds)} public klines streams...")
+
+    async def _process_websocket_messages(self, ws: WSAssistant, feed: "CandlesBase"):
+        while True:
+            try:
+                await asyncio.wait_for(self._process_websocket_messages_task(ws, feed), timeout=feed._ping_timeout)
+            except asyncio.TimeoutError:
+                if feed._ping_timeout is not None:
+                    await ws.send(request=WSJSONRequest(payload=feed._ping_payload))
+
+    async def _process_websocket_messages_task(self, ws: WSAssistant, feed: "CandlesBase"):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            key = feed._ws_message_subscription_key(data)
+            feeds = self._hub.feeds(key) if key is not None else []
+            parsed_message = (feeds[0] if len(feeds) > 0 else feed)._parse_websocket_message(data)
+            # parsed messages may be ping or pong messages
+            if isinstance(parsed_message, WSJSONRequest):
+                await ws.send(request=parsed_message)
+            elif isinstance(parsed_message, dict) and len(parsed_message) > 0:
+                for subscribed_feed in feeds:
+                    subscribed_feed._process_candle_update(parsed_message)
@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookPriceChangeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass(frozen=True)
+class CycleLeg:
+    """
+    One conversion of a cycle: trading from `from_asset` to `to_asset` on `trading_pair`.
+    `is_buy` is True when the base asset of the pair is bought with its quote asset.
+    """
+    trading_pair: str
+    is_buy: bool
+    from_asset: str
+    to_asset: str
+
+
+@dataclass
+class CycleOpportunity:
+    """
+    The result of the evaluation of a cycle for the configured start amount.
+    """
+    legs: Tuple[CycleLeg, ...]
+    start_asset: str
+    start_amount: Decimal
+    end_amount: Decimal
+    profitability: Decimal
+    timestamp: float
+
+    @property
+    def path(self) -> str:
+        return " -> ".join([leg.from_asset for leg in self.legs] + [self.start_asset])
+
+
+class CycleArbitrageScanner:
+    """
+    Scans the order books tracked by a connector for profitable multi-leg (triangular and longer) arbitrage cycles.
+
+    All the cycles of the currency graph up to `max_legs` legs are enumerated once and indexed by trading pair. The
+    scanner registers a top of book price watch on every book, and each scan only re-evaluates the cycles that touch
+    a pair whose top of book changed since the last scan. Each leg is priced with the VWAP for the amount that flows
+    through it and charged the taker fee of the connector fee schema.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 order_books: Dict[str, OrderBook],
+                 start_amounts: Dict[str, Decimal],
+                 trade_fee_schema: Optional[TradeFeeSchema] = None,
+                 max_legs: int = 3,
+                 min_profitability: Decimal = Decimal("0"),
+                 price_change_threshold: Decimal = Decimal("0"),
+                 update_interval: float = 0.1,
+                 on_opportunities: Optional[Callable[[List[CycleOpportunity]], None]] = None):
+        """
+        :param order_books: the order books to scan, by trading pair
+        :param start_amounts: the amount to trade through the cycles, by the asset the cycles start from
+        :param trade_fee_schema: the fee schema of the exchange, the taker fee is charged on every leg
+        :param max_legs: the maximum number of legs of a cycle (at least 3)
+        :param min_profitability: the minimum profitability for a cycle to be reported as an opportunity
+        :param price_change_threshold: the relative top of book change that makes the cycles of a pair stale
+        :param update_interval: the minimum time between two scans when running as a service
+        :param on_opportunities: called with the ranked opportunities after every scan that changed them (cycles or
+        end amounts)
+        """
+        if max_legs < 3:
+            raise ValueError("Cycles need at least 3 legs.")
+        self._order_books = order_books
+        self._start_amounts = start_amounts
+        self._taker_fee = float((trade_fee_schema or TradeFeeSchema()).taker_percent_fee_decimal)
+        self._max_legs = max_legs
+        self._min_profitability = min_profitability
+        self._price_change_threshold = float(price_change_threshold)
+        self._update_interval = update_interval
+        self._on_opportunities = on_opportunities
+
+        self._cycles: List[Tuple[CycleLeg, ...]] = []
+        self._cycles_by_pair: Dict[str, List[int]] = {}
+        self._opportunities: Dict[int, CycleOpportunity] = {}
+        self._reported_ranking: Optional[List[Tuple[Tuple[CycleLeg, ...], Decimal]]] = None
+        self._dirty_pairs: Set[str] = set()
+        self._watched_books: Dict[str, OrderBook] = {}
+        self._book_pairs: Dict[int, str] = {}
+        self._price_change_forwarder = SourceInfoEventForwarder(self._process_price_change_event)
+        self._changed_event = asyncio.Event()
+        self._scan_task: Optional[asyncio.Task] = None
+
+        self.rebuild_cycle_index()
+
+    @classmethod
+    def from_connector(cls, connector: ConnectorBase, start_amounts: Dict[str, Decimal], **kwargs):
+        """
+        Creates a scanner over all the order books tracked by the connector, using the connector fee schema.
+        """
+        return cls(order_books=connector.order_books,
+                   start_amounts=start_amounts,
+                   trade_fee_schema=connector.trade_fee_schema(),
+                   **kwargs)
+
+    @property
+    def cycles(self) -> List[Tuple[CycleLeg, ...]]:
+        return self._cycles
+
+    @property
+    def ranked_opportunities(self) -> List[CycleOpportunity]:
+        """
+        Returns the profitable cycles found by the last scan, the most profitable first.
+        """
+        return sorted(self._opportunities.values(), key=lambda opportunity: opportunity.profitability, reverse=True)
+
+    def cycles_for_pair(self, trading_pair: str) -> List[Tuple[CycleLeg, ...]]:
+        return [self._cycles[cycle_id] for cycle_id in self._cycles_by_pair.get(trading_pair, [])]
+
+    def rebuild_cycle_index(self):
+        """
+        Enumerates the cycles of the currency graph and indexes them by trading pair. It has to be called again when
+        the set of tracked order books changes. All the cycles are marked as stale.
+        """
+        self._unwatch_order_books()
+        graph: Dict[str, Dict[str, CycleLeg]] = {}
+        for trading_pair in self._order_books:
+            base, quote = split_hb_trading_pair(trading_pair)
+            graph.setdefault(quote, {}).setdefault(base, CycleLeg(trading_pair, True, quote, base))
+            graph.setdefault(base, {}).setdefault(quote, CycleLeg(trading_pair, False, base, quote))
+
+        self._cycles = []
+        self._cycles_by_pair = {}
+        self._opportunities = {}
+        for start_asset in sorted(graph):
+            if start_asset in self._start_amounts:
+                self._find_cycles(graph, start_asset, [start_asset], [])
+        for cycle_id, legs in enumerate(self._cycles):
+            for leg in legs:
+                self._cycles_by_pair.setdefault(leg.trading_pair, []).append(cycle_id)
+
+        self._watch_order_books()
+        self._dirty_pairs = set(self._cycles_by_pair.keys())
+
+    def _find_cycles(self, graph: Dict[str, Dict[str, CycleLeg]], start_asset: str, path: List[str],
+                     legs: List[CycleLeg]):
+        current_asset = path[-1]
+        for next_asset, leg in graph[current_asset].items():
+            if next_asset == start_asset and len(legs) >= 2:
+                self._cycles.append(tuple(legs + [leg]))
+            elif (len(legs) < self._max_legs - 1
+                  and next_asset not in path
+                  and self._is_canonical_member(start_asset, next_asset)):
+                self._find_cycles(graph, start_asset, path + [next_asset], legs + [leg])
+
+    def _is_canonical_member(self, start_asset: str, asset: str) -> bool:
+        # Every cycle is enumerated once per direction from the smallest asset with a start amount it contains
+        return asset not in self._start_amounts or asset > start_asset
+
+    def scan(self, timestamp: float = 0) -> List[CycleOpportunity]:
+        """
+        Re-evaluates the cycles touching a pair whose top of book changed since the last scan.
+
+        :return: the ranked opportunities
+        """
+        if not self._dirty_pairs:
+            return self.ranked_opportunities
+        stale_cycles: Set[int] = set()
+        for trading_pair in self._dirty_pairs:
+            stale_cycles.update(self._cycles_by_pair.get(trading_pair, []))
+        self._dirty_pairs.clear()
+
+        for cycle_id in stale_cycles:
+            opportunity = self.evaluate_cycle(self._cycles[cycle_id], timestamp)
+            if opportunity is not None and opportunity.profitability > self._min_profitability:
+                self._opportunities[cycle_id] = opportunity
+            else:
+                self._opportunities.pop(cycle_id, None)
+        return self.ranked_opportunities
+
+    def evaluate_cycle(self, legs: Tuple[CycleLeg, ...], timestamp: float = 0) -> Optional[CycleOpportunity]:
+        """
+        Simulates trading the start amount through the cycle legs, taking the book depth and fees into account.
+
+        :return: the evaluated opportunity, or None if any of the books is not deep enough
+        """
+        start_asset = legs[0].from_asset
+        start_amount = self._start_amounts[start_asset]
+        amount = float(start_amount)
+        fee_factor = 1 - self._taker_fee
+        for leg in legs:
+            order_book = self._order_books[leg.trading_pair]
+            if leg.is_buy:
+                # The amount is in quote, estimate the base volume with the best ask before walking the book
+                try:
+                    best_ask = order_book.get_price(True)
+                except EnvironmentError:
+                    return None
+                if not best_ask > 0:
+                    return None
+                vwap = order_book.get_vwap_for_volume(True, amount / best_ask).result_price
+                if math.isnan(vwap):
+                    return None
+                amount = amount / vwap * fee_factor
+            else:
+                vwap = order_book.get_vwap_for_volume(False, amount).result_price
+                if math.isnan(vwap):
+                    return None
+                amount = amount * vwap * fee_factor
+        end_amount = Decimal(str(amount))
+        return CycleOpportunity(
+            legs=legs,
+            start_asset=start_asset,
+            start_amount=start_amount,
+            end_amount=end_amount,
+            profitability=(end_amount - start_amount) / start_amount,
+            timestamp=timestamp,
+        )
+
+    def start(self):
+        if self._scan_task is None:
+            self._changed_event.set()
+            self._scan_task = safe_ensure_future(self._scan_loop())
+
+    def stop(self):
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+            self._scan_task = None
+        self._unwatch_order_books()
+
+    async def _scan_loop(self):
+        while True:
+            try:
+                await self._changed_event.wait()
+                self._changed_event.clear()
+                opportunities = self.scan(timestamp=self._time())
+                ranking = [(opportunity.legs, opportunity.end_amount) for opportunity in opportunities]
+                if self._on_opportunities is not None and ranking != self._reported_ranking:
+                    self._on_opportunities(opportunities)
+                self._reported_ranking = ranking
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error scanning arbitrage cycles.", exc_info=True)
+            await self._sleep(self._update_interval)
+
+    def _watch_order_books(self):
+        for trading_pair in self._cycles_by_pair:
+            order_book = self._order_books[trading_pair]
+            order_book.add_price_change_watch(0, self._price_change_threshold)
+            order_book.add_listener(OrderBookEvent.PriceChangeEvent, self._price_change_forwarder)
+            self._watched_books[trading_pair] = order_book
+            self._book_pairs[id(order_book)] = trading_pair
+
+    def _unwatch_order_books(self):
+        for order_book in self._watched_books.values():
+            order_book.remove_listener(OrderBookEvent.PriceChangeEvent, self._price_change_forwarder)
+            order_book.remove_price_change_watch(0, self._price_change_threshold)
+        self._watched_books = {}
+        self._book_pairs = {}
+
+    def _process_price_change_event(self, event_tag: int, order_book: OrderBook, event: OrderBookPriceChangeEvent):
+        if event.volume == 0:
+            trading_pair = self._book_pairs.get(id(order_book))
+            if trading_pair is not None:
+                self._dirty_pairs.add(trading_pair)
+                self._changed_event.set()
+
+    def _time(self) -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
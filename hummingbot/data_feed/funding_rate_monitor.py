@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class FundingRateOpportunity:
+    """
+    A funding rate spread between two venues for a token: long on the venue with the lowest funding rate, short on the
+    one with the highest. `spread` is the difference of the funding rates over the profitability interval.
+    """
+    token: str
+    long_connector: str
+    long_trading_pair: str
+    short_connector: str
+    short_trading_pair: str
+    spread: Decimal
+    timestamp: float
+
+
+class FundingRateMonitor:
+    """
+    Keeps the funding information (rate, mark and index prices, next funding time) of all the trading pairs of a set of
+    perpetual connectors in a columnar table, updated from the funding info events published by the connectors instead
+    of polling them.
+
+    The funding rates of the same token on different venues are compared after each update, only for the tokens that
+    changed. Each pair of trading pairs of the token listed on two different venues is compared. The rates are
+    normalized by the funding interval of each venue before being compared, and the spreads above `min_spread` are
+    reported as ranked opportunities. The trading pairs watched are the ones the connectors were created with.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    COLUMNS = ["timestamp", "rate", "mark_price", "index_price", "next_funding_timestamp"]
+    DEFAULT_FUNDING_INTERVAL = 60 * 60 * 8
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 funding_intervals: Optional[Dict[str, int]] = None,
+                 profitability_interval: int = 60 * 60 * 24,
+                 min_spread: Decimal = Decimal("0"),
+                 history_size: int = 100000,
+                 update_interval: float = 1.0,
+                 on_opportunities: Optional[Callable[[List[FundingRateOpportunity]], None]] = None):
+        """
+        :param connectors: the perpetual connectors to watch, by name
+        :param funding_intervals: the time between two funding payments of each connector, in seconds, 8 hours by
+        default
+        :param profitability_interval: the interval the spreads are expressed for, in seconds (one day by default)
+        :param min_spread: the minimum spread for a pair of venues to be reported as an opportunity
+        :param history_size: the number of updates kept in the history table
+        :param update_interval: the minimum time between two evaluations of the spreads when running as a service
+        :param on_opportunities: called with the ranked opportunities after every evaluation that changed them
+        """
+        self._connectors = connectors
+        self._funding_intervals = funding_intervals or {}
+        self._profitability_interval = profitability_interval
+        self._min_spread = min_spread
+        self._update_interval = update_interval
+        self._on_opportunities = on_opportunities
+
+        # The last funding information of each (connector, trading pair), one row each
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._keys: List[Tuple[str, str]] = []
+        self._columns: Dict[str, np.ndarray] = {column: np.full(16, np.nan) for column in self.COLUMNS}
+        # The rows of each token, the venues its rates are compared between
+        self._token_rows: Dict[str, List[int]] = {}
+        # The history of the updates, as a circular buffer
+        self._history_size = history_size
+        self._history_rows = np.zeros(history_size, dtype=np.int64)
+        self._history_columns: Dict[str, np.ndarray] = {column: np.zeros(history_size) for column in self.COLUMNS}
+        self._history_count = 0
+
+        # The opportunities by the (connector, trading pair) of both venues
+        self._opportunities: Dict[Tuple[Tuple[str, str], Tuple[str, str]], FundingRateOpportunity] = {}
+        self._reported_ranking: Optional[List[Tuple[str, str, str, str, Decimal]]] = None
+        self._dirty_tokens: Set[str] = set()
+        self._connector_names: Dict[int, str] = {}
+        self._funding_info_forwarder = SourceInfoEventForwarder(self._process_funding_info_event)
+        self._changed_event = asyncio.Event()
+        self._evaluation_task: Optional[asyncio.Task] = None
+
+    @property
+    def ranked_opportunities(self) -> List[FundingRateOpportunity]:
+        """
+        Returns the opportunities found by the last evaluation, the largest spread first.
+        """
+        return sorted(self._opportunities.values(), key=lambda opportunity: opportunity.spread, reverse=True)
+
+    def funding_table(self) -> pd.DataFrame:
+        """
+        Returns the last funding information of each connector and trading pair.
+        """
+        rows_count = len(self._keys)
+        index = pd.MultiIndex.from_tuples(self._keys, names=["connector", "trading_pair"]) if rows_count > 0 else None
+        return pd.DataFrame({column: values[:rows_count] for column, values in self._columns.items()}, index=index)
+
+    def funding_history(self, connector_name: Optional[str] = None, trading_pair: Optional[str] = None) -> pd.DataFrame:
+        """
+        Returns the funding information updates kept in the history, indexed by time, optionally for a connector and
+        a trading pair only.
+        """
+        count = min(self._history_count, self._history_size)
+        order = np.arange(self._history_count - count, self._history_count) % self._history_size
+        rows = self._history_rows[order]
+        mask = np.ones(count, dtype=bool)
+        if connector_name is not None:
+            mask &= np.array([self._keys[row][0] == connector_name for row in rows], dtype=bool)
+        if trading_pair is not None:
+            mask &= np.array([self._keys[row][1] == trading_pair for row in rows], dtype=bool)
+        selected_rows = rows[mask]
+        history = pd.DataFrame({
+            "connector": [self._keys[row][0] for row in selected_rows],
+            "trading_pair": [self._keys[row][1] for row in selected_rows],
+            **{column: values[order][mask] for column, values in self._history_columns.items()},
+        })
+        return history.set_index("timestamp")
+
+    def update_funding_info(self, connector_name: str, funding_info: FundingInfo, timestamp: Optional[float] = None):
+        """
+        Stores the funding information of a trading pair and marks the spreads of its token as stale.
+        """
+        key = (connector_name, funding_info.trading_pair)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._add_row(key)
+        values = {
+            "timestamp": self._time() if timestamp is None else timestamp,
+            "rate": float(funding_info.rate),
+            "mark_price": float(funding_info.mark_price),
+            "index_price": float(funding_info.index_price),
+            "next_funding_timestamp": float(funding_info.next_funding_utc_timestamp),
+        }
+        history_position = self._history_count % self._history_size
+        self._history_rows[history_position] = row
+        for column, value in values.items():
+            self._columns[column][row] = value
+            self._history_columns[column][history_position] = value
+        self._history_count += 1
+        self._dirty_tokens.add(self._token(funding_info.trading_pair))
+        self._changed_event.set()
+
+    def evaluate(self, timestamp: float = 0) -> List[FundingRateOpportunity]:
+        """
+        Compares the funding rates of the tokens updated since the last evaluation across venues.
+
+        :return: the ranked opportunities
+        """
+        if not self._dirty_tokens:
+            return self.ranked_opportunities
+        for token in self._dirty_tokens:
+            self._evaluate_token(token, timestamp)
+        self._dirty_tokens.clear()
+        return self.ranked_opportunities
+
+    def start(self):
+        """
+        Loads the funding information already known by the connectors and listens to their updates.
+        """
+        for connector_name, connector in self._connectors.items():
+            self._connector_names[id(connector)] = connector_name
+            connector.add_listener(MarketEvent.FundingInfo, self._funding_info_forwarder)
+            for trading_pair in connector.trading_pairs:
+                try:
+                    self.update_funding_info(connector_name, connector.get_funding_info(trading_pair))
+                except KeyError:
+                    # Not initialized yet, it will come with the first update
+                    pass
+        if self._evaluation_task is None:
+            self._evaluation_task = safe_ensure_future(self._evaluation_loop())
+
+    def stop(self):
+        if self._evaluation_task is not None:
+            self._evaluation_task.cancel()
+            self._evaluation_task = None
+        for connector in self._connectors.values():
+            connector.remove_listener(MarketEvent.FundingInfo, self._funding_info_forwarder)
+        self._connector_names = {}
+
+    def _evaluate_token(self, token: str, timestamp: float):
+        rows = self._token_rows.get(token, [])
+        normalized_rates = [self._columns["rate"][row] / self._funding_interval(self._keys[row][0]) for row in rows]
+        for i, row in enumerate(rows):
+            for j in range(i + 1, len(rows)):
+                other_row = rows[j]
+                if self._keys[row][0] == self._keys[other_row][0]:
+                    # Trading pairs of the token on the same venue, e.g. quoted in different tokens
+                    continue
+                if normalized_rates[i] <= normalized_rates[j]:
+                    long_row, short_row = row, other_row
+                else:
+                    long_row, short_row = other_row, row
+                spread = abs(normalized_rates[i] - normalized_rates[j]) * self._profitability_interval
+                opportunity_key = (self._keys[row], self._keys[other_row])
+                if not np.isnan(spread) and spread > self._min_spread:
+                    self._opportunities[opportunity_key] = FundingRateOpportunity(
+                        token=token,
+                        long_connector=self._keys[long_row][0],
+                        long_trading_pair=self._keys[long_row][1],
+                        short_connector=self._keys[short_row][0],
+                        short_trading_pair=self._keys[short_row][1],
+                        spread=Decimal(str(spread)),
+                        timestamp=timestamp,
+                    )
+                else:
+                    self._opportunities.pop(opportunity_key, None)
+
+    def _add_row(self, key: Tuple[str, str]) -> int:
+        row = len(self._keys)
+        if row == len(self._columns["rate"]):
+            for column, values in self._columns.items():
+                self._columns[column] = np.concatenate([values, np.full(len(values), np.nan)])
+        self._rows[key] = row
+        self._keys.append(key)
+        self._token_rows.setdefault(self._token(key[1]), []).append(row)
+        return row
+
+    def _funding_interval(self, connector_name: str) -> int:
+        return self._funding_intervals.get(connector_name, self.DEFAULT_FUNDING_INTERVAL)
+
+    @staticmethod
+    def _token(trading_pair: str) -> str:
+        return split_hb_trading_pair(trading_pair)[0]
+
+    async def _evaluation_loop(self):
+        while True:
+            try:
+                await self._changed_event.wait()
+                self._changed_event.clear()
+                opportunities = self.evaluate(timestamp=self._time())
+                ranking = [(opportunity.long_connector, opportunity.long_trading_pair, opportunity.short_connector,
+                            opportunity.short_trading_pair, opportunity.spread) for opportunity in opportunities]
+                if self._on_opportunities is not None and ranking != self._reported_ranking:
+                    self._on_opportunities(opportunities)
+                self._reported_ranking = ranking
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error evaluating funding rate spreads.", exc_info=True)
+            await self._sleep(self._update_interval)
+
+    def _process_funding_info_event(self, event_tag: int, connector: ConnectorBase, funding_info: FundingInfo):
+        connector_name = self._connector_names.get(id(connector))
+        if connector_name is not None:
+            self.update_funding_info(connector_name, funding_info)
+
+    def _time(self) -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
@@ -0,0 +1,217 @@
+import os
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+ORDER_BOOK_DATA_TYPE = "order_book"
+TRADES_DATA_TYPE = "trades"
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class _OrderBookChunk:
+    """
+    The top levels of an order book captured since the last write. The levels missing when the book is not deep enough
+    are left as NaN.
+    """
+    def __init__(self, size: int, depth: int):
+        self.timestamps = np.zeros(size, dtype=np.int64)
+        self.update_ids = np.zeros(size, dtype=np.int64)
+        self.bid_prices = np.full((size, depth), np.nan)
+        self.bid_amounts = np.full((size, depth), np.nan)
+        self.ask_prices = np.full((size, depth), np.nan)
+        self.ask_amounts = np.full((size, depth), np.nan)
+        self.length = 0
+        self.day: Optional[int] = None
+        self.last_update_id: Optional[int] = None
+
+    @property
+    def full(self) -> bool:
+        return self.length == len(self.timestamps)
+
+    def clear(self):
+        for levels in (self.bid_prices, self.bid_amounts, self.ask_prices, self.ask_amounts):
+            levels[:self.length].fill(np.nan)
+        self.length = 0
+        self.day = None
+
+
+class _TradesChunk:
+    def __init__(self):
+        self.timestamps: List[int] = []
+        self.prices: List[float] = []
+        self.amounts: List[float] = []
+        self.sides: List[str] = []
+        self.trade_ids: List[str] = []
+        self.day: Optional[int] = None
+
+    def clear(self):
+        for column in (self.timestamps, self.prices, self.amounts, self.sides, self.trade_ids):
+            column.clear()
+        self.day = None
+
+
+class MarketDataCapture:
+    """
+    Captures the top levels of order books and the public trades to Parquet files compressed with zstd, in a directory
+    per trading pair, type of data and day (UTC): <output_dir>/<connector>_<trading pair>_<data type>/YYYYMMDD/.
+
+    The order book files have a row per captured state, with the timestamp (microseconds), the update id, and a column
+    per level and field (bid_price_0, bid_amount_0, ..., ask_price_0, ...). The timestamps and update ids are delta
+    encoded, and the levels byte stream split, which compresses well consecutive states that differ little. The levels
+    are copied straight from the order book, and the states whose update id didn't change are not captured again.
+
+    The rows are buffered and each chunk is written to its own file (part-0.parquet, part-1.parquet, ...), complete
+    once written, so that no file is kept open and a day can be read while it is captured (pq.read_table(directory)).
+    The parts are written under a hidden name and renamed, readers never see a partial part.
+    """
+    def __init__(self, output_dir: str, connector_name: str, depth: int = 50, chunk_size: int = 3600):
+        """
+        :param output_dir: the directory of the files
+        :param connector_name: the name of the connector, used to name the files
+        :param depth: the number of levels captured per side
+        :param chunk_size: the number of rows buffered per trading pair and type of data before writing them
+        """
+        self._output_dir = output_dir
+        self._connector_name = connector_name
+        self._depth = depth
+        self._chunk_size = chunk_size
+        self._order_book_chunks: Dict[str, _OrderBookChunk] = {}
+        self._trades_chunks: Dict[str, _TradesChunk] = {}
+        self._next_parts: Dict[Tuple[str, str, int], int] = {}
+        self._order_book_schema = pa.schema(
+            [("timestamp", pa.int64()), ("update_id", pa.int64())]
+            + [(f"{side}_{field}_{level}", pa.float64())
+               for side in ("bid", "ask") for level in range(depth) for field in ("price", "amount")])
+        self._trades_schema = pa.schema([
+            ("timestamp", pa.int64()),
+            ("price", pa.float64()),
+            ("amount", pa.float64()),
+            ("side", pa.string()),
+            ("trade_id", pa.string()),
+        ])
+
+    def capture_order_book(self, trading_pair: str, timestamp: float, order_book: OrderBook):
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        chunk = self._order_book_chunks.get(trading_pair)
+        if chunk is None:
+            chunk = _OrderBookChunk(self._chunk_size, self._depth)
+            self._order_book_chunks[trading_pair] = chunk
+        if chunk.last_update_id == update_id:
+            return
+        day = int(timestamp // SECONDS_PER_DAY)
+        if chunk.day is not None and chunk.day != day:
+            self._write_order_book_chunk(trading_pair, chunk)
+        row = chunk.length
+        order_book.copy_top_levels(chunk.bid_prices[row], chunk.bid_amounts[row],
+                                   chunk.ask_prices[row], chunk.ask_amounts[row])
+        chunk.timestamps[row] = int(timestamp * 1e6)
+        chunk.update_ids[row] = update_id
+        chunk.length += 1
+        chunk.day = day
+        chunk.last_update_id = update_id
+        if chunk.full:
+            self._write_order_book_chunk(trading_pair, chunk)
+
+    def capture_trade(self, event: OrderBookTradeEvent):
+        chunk = self._trades_chunks.get(event.trading_pair)
+        if chunk is None:
+            chunk = _TradesChunk()
+            self._trades_chunks[event.trading_pair] = chunk
+        day = int(event.timestamp // SECONDS_PER_DAY)
+        if chunk.day is not None and chunk.day != day:
+            self._write_trades_chunk(event.trading_pair, chunk)
+        chunk.timestamps.append(int(event.timestamp * 1e6))
+        chunk.prices.append(float(event.price))
+        chunk.amounts.append(float(event.amount))
+        chunk.sides.append("buy" if event.type is TradeType.BUY else "sell")
+        chunk.trade_ids.append(str(event.trade_id))
+        chunk.day = day
+        if len(chunk.timestamps) >= self._chunk_size:
+            self._write_trades_chunk(event.trading_pair, chunk)
+
+    def flush(self):
+        """
+        Writes the buffered rows
+        """
+        for trading_pair, order_book_chunk in self._order_book_chunks.items():
+            self._write_order_book_chunk(trading_pair, order_book_chunk)
+        for trading_pair, trades_chunk in self._trades_chunks.items():
+            self._write_trades_chunk(trading_pair, trades_chunk)
+
+    def close(self):
+        """
+        Writes the buffered rows
+        """
+        self.flush()
+
+    def _write_order_book_chunk(self, trading_pair: str, chunk: _OrderBookChunk):
+        if chunk.length == 0:
+            return
+        length = chunk.length
+        columns = [pa.array(chunk.timestamps[:length]), pa.array(chunk.update_ids[:length])]
+        for prices, amounts in ((chunk.bid_prices, chunk.bid_amounts), (chunk.ask_prices, chunk.ask_amounts)):
+            for level in range(self._depth):
+                columns.append(pa.array(prices[:length, level]))
+                columns.append(pa.array(amounts[:length, level]))
+        table = pa.Table.from_arrays(columns, schema=self._order_book_schema)
+        self._write_part(trading_pair, ORDER_BOOK_DATA_TYPE, chunk.day, table)
+        chunk.clear()
+
+    def _write_trades_chunk(self, trading_pair: str, chunk: _TradesChunk):
+        if len(chunk.timestamps) == 0:
+            return
+        table = pa.Table.from_arrays(
+            [pa.array(chunk.timestamps, type=pa.int64()),
+             pa.array(chunk.prices, type=pa.float64()),
+             pa.array(chunk.amounts, type=pa.float64()),
+             pa.array(chunk.sides, type=pa.string()),
+             pa.array(chunk.trade_ids, type=pa.string())],
+            schema=self._trades_schema)
+        self._write_part(trading_pair, TRADES_DATA_TYPE, chunk.day, table)
+        chunk.clear()
+
+    def _write_part(self, trading_pair: str, data_type: str, day: int, table: pa.Table):
+        directory = self._directory(trading_pair, data_type, day)
+        part = self._next_part(trading_pair, data_type, day, directory)
+        hidden_path = os.path.join(directory, f".part-{part}.parquet")
+        pq.write_table(
+            table,
+            hidden_path,
+            compression="zstd",
+            use_dictionary=["side"] if data_type == TRADES_DATA_TYPE else False,
+            column_encoding=self._column_encoding(table.schema),
+        )
+        os.replace(hidden_path, os.path.join(directory, f"part-{part}.parquet"))
+
+    def _next_part(self, trading_pair: str, data_type: str, day: int, directory: str) -> int:
+        key = (trading_pair, data_type, day)
+        part = self._next_parts.get(key)
+        if part is None:
+            # The parts of a previous capture of the same day are kept
+            os.makedirs(directory, exist_ok=True)
+            part = 0
+            while os.path.exists(os.path.join(directory, f"part-{part}.parquet")):
+                part += 1
+        self._next_parts[key] = part + 1
+        return part
+
+    def _directory(self, trading_pair: str, data_type: str, day: int) -> str:
+        date = datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc).strftime("%Y%m%d")
+        return os.path.join(self._output_dir, f"{self._connector_name}_{trading_pair}_{data_type}", date)
+
+    @staticmethod
+    def _column_encoding(schema: pa.Schema) -> Dict[str, str]:
+        encoding = {}
+        for field in schema:
+            if pa.types.is_integer(field.type):
+                encoding[field.name] = "DELTA_BINARY_PACKED"
+            elif pa.types.is_floating(field.type):
+                encoding[field.name] = "BYTE_STREAM_SPLIT"
+        return encoding
@@ -0,0 +1,352 @@
+import asyncio
+import logging
+import os
+import stat
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_recording import OrderBookMessageRecordWriter
+from hummingbot.core.data_type.order_book_shared_memory import OrderBookSharedMemorySegment, segment_name
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.market_data_daemon import protocol
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataDaemon:
+    """
+    Owns the exchange order book data sources of the connectors shared by all the bots running on the host, and
+    publishes the order book messages to the bots connected to its Unix socket (see RemoteAPIOrderBookDataSource).
+    The top of the books can also be published to shared memory (see order_book_shared_memory), and the messages
+    recorded to be replayed in backtests (see ReplayOrderBookDataSource).
+
+    The daemon keeps its own copy of every order book, updated before each message is published, so the snapshots it
+    serves are always consistent with the diffs already sent to the subscribers. Each message is serialized once, no
+    matter the number of subscribers.
+
+    The socket is created in a directory only accessible by the user running the daemon. The daemon refuses to start
+    when the socket path is used by another user or by a running daemon, only a stale socket of its user is replaced.
+    """
+    PENDING_DIFFS_WINDOW_SIZE = 1000
+    # Clients that don't read their messages are disconnected, they resynchronize their books when reconnecting
+    MAX_CLIENT_WRITE_BUFFER_SIZE = 16 * 1024 * 1024
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 socket_path: str,
+                 data_sources: Dict[str, OrderBookTrackerDataSource],
+                 shared_memory_depth: int = 0,
+                 record_dir: Optional[str] = None):
+        """
+        :param socket_path: the path of the Unix socket the bots connect to, in a directory private to the user
+        :param data_sources: the exchange order book data sources, by connector name, already configured with the
+        trading pairs to track
+        :param shared_memory_depth: the number of levels per side published to shared memory, 0 to disable it
+        :param record_dir: the directory where the messages of each connector are recorded, None to disable it
+        """
+        self._socket_path = socket_path
+        self._data_sources = data_sources
+        self._shared_memory_depth = shared_memory_depth
+        self._shared_memory_segments: Dict[Tuple[str, str], OrderBookSharedMemorySegment] = {}
+        self._record_dir = record_dir
+        self._record_writers: Dict[str, OrderBookMessageRecordWriter] = {}
+        self._order_books: Dict[str, Dict[str, OrderBook]] = defaultdict(dict)
+        self._order_books_initialized: Dict[Tuple[str, str], asyncio.Event] = defaultdict(asyncio.Event)
+        self._pending_diffs: Dict[Tuple[str, str], Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.PENDING_DIFFS_WINDOW_SIZE))
+        self._last_trade_prices: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._subscribers: Dict[Tuple[str, str], Set[asyncio.StreamWriter]] = defaultdict(set)
+        self._client_subscriptions: Dict[asyncio.StreamWriter, Set[Tuple[str, str]]] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._socket_inode: Optional[int] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def order_books(self) -> Dict[str, Dict[str, OrderBook]]:
+        return self._order_books
+
+    @property
+    def clients_count(self) -> int:
+        return len(self._client_subscriptions)
+
+    async def start(self):
+        await self._prepare_socket_path()
+        loop = asyncio.get_event_loop()
+        for connector_name, data_source in self._data_sources.items():
+            if self._record_dir is not None:
+                record_path = Path(self._record_dir) / f"{connector_name}_{time.strftime('%Y%m%d_%H%M%S')}.hbob.gz"
+                self._record_writers[connector_name] = OrderBookMessageRecordWriter(record_path)
+                self.logger().info(f"Recording the {connector_name} market data to {record_path}")
+            diff_queue = asyncio.Queue()
+            snapshot_queue = asyncio.Queue()
+            trade_queue = asyncio.Queue()
+            self._tasks.extend([
+                safe_ensure_future(data_source.listen_for_subscriptions()),
+                safe_ensure_future(data_source.listen_for_order_book_diffs(loop, diff_queue)),
+                safe_ensure_future(data_source.listen_for_order_book_snapshots(loop, snapshot_queue)),
+                safe_ensure_future(data_source.listen_for_trades(loop, trade_queue)),
+                safe_ensure_future(self._process_messages(connector_name, diff_queue)),
+                safe_ensure_future(self._process_messages(connector_name, snapshot_queue)),
+                safe_ensure_future(self._process_messages(connector_name, trade_queue)),
+                safe_ensure_future(self._init_order_books(connector_name)),
+            ])
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self._socket_path)
+        self._socket_inode = os.stat(self._socket_path).st_ino
+        self.logger().info(f"Serving the market data of {', '.join(self._data_sources)} on {self._socket_path}")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._client_subscriptions):
+            self._disconnect_client(writer)
+        for (connector_name, trading_pair), segment in self._shared_memory_segments.items():
+            self._order_books[connector_name][trading_pair].disable_shared_memory_publishing()
+            segment.close()
+        self._shared_memory_segments.clear()
+        for record_writer in self._record_writers.values():
+            record_writer.close()
+        self._record_writers.clear()
+        self._remove_own_socket()
+
+    async def _prepare_socket_path(self):
+        """
+        Makes sure the socket can be created: its directory has to be private to the user, and an existing socket is
+        only removed when it belongs to the user and no daemon is listening on it anymore.
+
+        :raises PermissionError: if the directory or the existing socket is not the user's
+        :raises FileExistsError: if the path is not a socket or another daemon is serving on it
+        """
+        protocol.ensure_private_socket_directory(self._socket_path)
+        try:
+            socket_stat = os.lstat(self._socket_path)
+        except FileNotFoundError:
+            return
+        if socket_stat.st_uid != os.getuid():
+            raise PermissionError(f"{self._socket_path} belongs to another user.")
+        if not stat.S_ISSOCK(socket_stat.st_mode):
+            raise FileExistsError(f"{self._socket_path} exists and is not a socket.")
+        try:
+            _, writer = await asyncio.open_unix_connection(self._socket_path)
+        except ConnectionRefusedError:
+            # Left by a daemon that did not stop cleanly
+            os.remove(self._socket_path)
+        else:
+            writer.close()
+            raise FileExistsError(f"Another market data daemon is serving on {self._socket_path}.")
+
+    def _remove_own_socket(self):
+        # The socket is not removed if it was replaced since the daemon started
+        try:
+            if self._socket_inode is not None and os.stat(self._socket_path).st_ino == self._socket_inode:
+                os.remove(self._socket_path)
+        except FileNotFoundError:
+            pass
+        self._socket_inode = None
+
+    async def _init_order_books(self, connector_name: str):
+        data_source = self._data_sources[connector_name]
+        for trading_pair in data_source._trading_pairs:
+            while True:
+                try:
+                    order_book = await data_source.get_new_order_book(trading_pair)
+                    break
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().exception(f"Error initializing the {connector_name} order book for {trading_pair}. "
+                                            f"Retrying in 5 seconds...")
+                    await asyncio.sleep(5.0)
+            self._set_order_book(connector_name, trading_pair, order_book)
+            self.logger().info(f"Initialized the {connector_name} order book for {trading_pair}.")
+
+    def _set_order_book(self, connector_name: str, trading_pair: str, order_book: OrderBook):
+        for diff_message in self._pending_diffs.pop((connector_name, trading_pair), []):
+            if diff_message.update_id > order_book.snapshot_uid:
+                order_book.apply_diffs(diff_message.bids, diff_message.asks, diff_message.update_id)
+        self._order_books[connector_name][trading_pair] = order_book
+        if self._shared_memory_depth > 0:
+            self._publish_to_shared_memory(connector_name, trading_pair, order_book)
+        # The recordings start with a snapshot consistent with the diffs recorded afterwards
+        self._record(connector_name, self._snapshot_message(connector_name, trading_pair))
+        self._order_books_initialized[(connector_name, trading_pair)].set()
+
+    def _publish_to_shared_memory(self, connector_name: str, trading_pair: str, order_book: OrderBook):
+        try:
+            segment = OrderBookSharedMemorySegment(name=segment_name(connector_name, trading_pair),
+                                                   depth=self._shared_memory_depth)
+        except FileExistsError as exception:
+            self.logger().warning(f"The {connector_name} {trading_pair} order book is not published to shared memory: "
+                                  f"{exception}")
+            return
+        order_book.enable_shared_memory_publishing(segment)
+        self._shared_memory_segments[(connector_name, trading_pair)] = segment
+
+    async def _process_messages(self, connector_name: str, queue: asyncio.Queue):
+        while True:
+            message: OrderBookMessage = await queue.get()
+            try:
+                self._apply_message(connector_name, message)
+                self._publish(connector_name, message)
+                self._record(connector_name, message)
+            except Exception:
+                self.logger().exception(f"Unexpected error processing a {connector_name} order book message.")
+
+    def _apply_message(self, connector_name: str, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        order_book = self._order_books[connector_name].get(trading_pair)
+        if message.type is OrderBookMessageType.DIFF:
+            if order_book is None:
+                self._pending_diffs[(connector_name, trading_pair)].append(message)
+            elif message.update_id > order_book.snapshot_uid:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            if order_book is None:
+                order_book = self._data_sources[connector_name].order_book_create_function()
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                self._set_order_book(connector_name, trading_pair, order_book)
+            else:
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        elif message.type is OrderBookMessageType.TRADE:
+            self._last_trade_prices[connector_name][trading_pair] = float(message.content["price"])
+
+    def _publish(self, connector_name: str, message: OrderBookMessage):
+        subscribers = self._subscribers.get((connector_name, message.trading_pair))
+        if subscribers:
+            frame = protocol.encode_message({"type": protocol.ORDER_BOOK_MESSAGE,
+                                             "connector": connector_name,
+                                             "message": protocol.order_book_message_to_data(message)})
+            for writer in list(subscribers):
+                self._write(writer, frame)
+
+    def _record(self, connector_name: str, message: OrderBookMessage):
+        record_writer = self._record_writers.get(connector_name)
+        if record_writer is not None:
+            record_writer.write(message)
+
+    def _write(self, writer: asyncio.StreamWriter, frame: bytes):
+        if writer.transport.get_write_buffer_size() > self.MAX_CLIENT_WRITE_BUFFER_SIZE:
+            self.logger().warning("A market data client is not reading its messages. Disconnecting it.")
+            self._disconnect_client(writer)
+        else:
+            writer.write(frame)
+
+    def _disconnect_client(self, writer: asyncio.StreamWriter):
+        for key in self._client_subscriptions.pop(writer, set()):
+            self._subscribers[key].discard(writer)
+        writer.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._client_subscriptions[writer] = set()
+        try:
+            while True:
+                request = await protocol.read_message(reader)
+                if request["type"] == protocol.SUBSCRIBE:
+                    # Processed right away, every message published after the answer is sent to the client
+                    self._write(writer, protocol.encode_message(self._subscribe(writer, request)))
+                else:
+                    safe_ensure_future(self._process_request(writer, request))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (ValueError, KeyError, TypeError):
+            self.logger().warning("A market data client sent a malformed message. Disconnecting it.")
+        finally:
+            self._disconnect_client(writer)
+
+    def _subscribe(self, writer: asyncio.StreamWriter, request: Dict[str, Any]) -> Dict[str, Any]:
+        connector_name = request["connector"]
+        error_response = self._untracked_pairs_error_response(request, request["trading_pairs"])
+        if error_response is not None:
+            return error_response
+        if writer in self._client_subscriptions:
+            for trading_pair in request["trading_pairs"]:
+                key = (connector_name, trading_pair)
+                self._subscribers[key].add(writer)
+                self._client_subscriptions[writer].add(key)
+        return {"type": protocol.SUBSCRIBE, "request_id": request["request_id"]}
+
+    async def _process_request(self, writer: asyncio.StreamWriter, request: Dict[str, Any]):
+        try:
+            if request["connector"] not in self._data_sources:
+                response = self._error_response(
+                    request, f"The market data daemon does not serve {request['connector']}.")
+            elif request["type"] == protocol.SNAPSHOT:
+                # The snapshot of an order book not tracked would never be ready
+                response = self._untracked_pairs_error_response(request, [request["trading_pair"]])
+                if response is None:
+                    response = {"type": protocol.SNAPSHOT,
+                                "request_id": request["request_id"],
+                                "snapshot": protocol.order_book_message_to_data(
+                                    await self._snapshot(request["connector"], request["trading_pair"]))}
+            elif request["type"] == protocol.LAST_TRADED_PRICES:
+                response = {"type": protocol.LAST_TRADED_PRICES,
+                            "request_id": request["request_id"],
+                            "prices": await self._get_last_traded_prices(request["connector"],
+                                                                         request["trading_pairs"])}
+            else:
+                response = self._error_response(request, f"Unknown request type {request['type']}.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            self.logger().exception(f"Error processing the market data request {request}.")
+            response = self._error_response(request, str(exception))
+        if writer in self._client_subscriptions:
+            self._write(writer, protocol.encode_message(response))
+
+    async def _snapshot(self, connector_name: str, trading_pair: str) -> OrderBookMessage:
+        await self._order_books_initialized[(connector_name, trading_pair)].wait()
+        return self._snapshot_message(connector_name, trading_pair)
+
+    def _snapshot_message(self, connector_name: str, trading_pair: str) -> OrderBookMessage:
+        order_book = self._order_books[connector_name][trading_pair]
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+                "bids": list(order_book.bid_entries()),
+                "asks": list(order_book.ask_entries()),
+            },
+            timestamp=time.time(),
+        )
+
+    async def _get_last_traded_prices(self, connector_name: str, trading_pairs: List[str]) -> Dict[str, float]:
+        known_prices = self._last_trade_prices[connector_name]
+        prices = {trading_pair: known_prices[trading_pair]
+                  for trading_pair in trading_pairs if trading_pair in known_prices}
+        missing_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in prices]
+        if len(missing_pairs) > 0:
+            prices.update(await self._data_sources[connector_name].get_last_traded_prices(trading_pairs=missing_pairs))
+        return prices
+
+    def _untracked_pairs_error_response(self,
+                                        request: Dict[str, Any],
+                                        trading_pairs: List[str]) -> Optional[Dict[str, Any]]:
+        connector_name = request["connector"]
+        if connector_name not in self._data_sources:
+            return self._error_response(request, f"The market data daemon does not serve {connector_name}.")
+        tracked_pairs = self._data_sources[connector_name]._trading_pairs
+        missing_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in tracked_pairs]
+        if len(missing_pairs) > 0:
+            return self._error_response(
+                request, f"The market data daemon does not track {', '.join(missing_pairs)} on {connector_name}.")
+        return None
+
+    @staticmethod
+    def _error_response(request: Dict[str, Any], error: str) -> Dict[str, Any]:
+        return {"type": protocol.ERROR, "request_id": request.get("request_id"), "error": error}
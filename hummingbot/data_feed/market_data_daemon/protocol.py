@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import stat
+import struct
+from typing import Any, Dict
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+# Every frame is the length of the payload (4 bytes, big endian) followed by the message encoded in JSON. Only plain
+# data is exchanged, the order book messages are converted with order_book_message_to_data.
+FRAME_HEADER = struct.Struct("!I")
+MAX_PAYLOAD_SIZE = 64 * 1024 * 1024
+
+# Requests sent by the bots, answered with a message of the same type and request id (or an ERROR)
+SUBSCRIBE = "subscribe"
+SNAPSHOT = "snapshot"
+LAST_TRADED_PRICES = "last_traded_prices"
+ERROR = "error"
+# Messages pushed by the daemon to the subscribers of a trading pair
+ORDER_BOOK_MESSAGE = "order_book_message"
+
+SOCKET_DIRECTORY_NAME = "market_data_daemon"
+SOCKET_FILE_NAME = "market_data.sock"
+
+
+def default_socket_path() -> str:
+    return os.path.join(data_path(), SOCKET_DIRECTORY_NAME, SOCKET_FILE_NAME)
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    payload = json.dumps(message, separators=(",", ":")).encode("utf8")
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    header = await reader.readexactly(FRAME_HEADER.size)
+    (payload_size,) = FRAME_HEADER.unpack(header)
+    if payload_size > MAX_PAYLOAD_SIZE:
+        raise ConnectionError(f"Market data message of {payload_size} bytes exceeds the maximum size.")
+    payload = await reader.readexactly(payload_size)
+    return json.loads(payload)
+
+
+def order_book_message_to_data(message: OrderBookMessage) -> Dict[str, Any]:
+    """
+    Converts an order book message to the plain data sent to the bots. The levels are taken from the bids and asks
+    of the message, so the exchange specific formats of the content are not relayed.
+    """
+    data = {
+        "type": message.type.value,
+        "timestamp": message.timestamp,
+        "trading_pair": message.trading_pair,
+    }
+    if message.type is OrderBookMessageType.TRADE:
+        data.update({
+            "trade_type": float(message.content["trade_type"]),
+            "trade_id": message.trade_id,
+            "price": float(message.content["price"]),
+            "amount": float(message.content["amount"]),
+        })
+    else:
+        data.update({
+            "update_id": message.update_id,
+            "bids": [[row.price, row.amount] for row in message.bids],
+            "asks": [[row.price, row.amount] for row in message.asks],
+        })
+        if message.type is OrderBookMessageType.DIFF:
+            data["first_update_id"] = message.first_update_id
+    return data
+
+
+def order_book_message_from_data(data: Dict[str, Any]) -> OrderBookMessage:
+    message_type = OrderBookMessageType(data["type"])
+    if message_type is OrderBookMessageType.TRADE:
+        content = {
+            "trading_pair": data["trading_pair"],
+            "trade_type": float(data["trade_type"]),
+            "trade_id": data["trade_id"],
+            "update_id": -1,
+            "price": float(data["price"]),
+            "amount": float(data["amount"]),
+        }
+    else:
+        content = {
+            "trading_pair": data["trading_pair"],
+            "update_id": int(data["update_id"]),
+            "bids": [(float(price), float(amount)) for price, amount in data["bids"]],
+            "asks": [(float(price), float(amount)) for price, amount in data["asks"]],
+        }
+        if message_type is OrderBookMessageType.DIFF:
+            content["first_update_id"] = int(data["first_update_id"])
+    return OrderBookMessage(message_type, content, timestamp=data["timestamp"])
+
+
+def ensure_private_socket_directory(socket_path: str):
+    """
+    Creates the directory of the socket, only accessible by the current user, or checks that the existing one is.
+
+    :raises PermissionError: if the directory is owned by another user or accessible by other users
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    verify_private_socket_directory(socket_path)
+
+
+def verify_private_socket_directory(socket_path: str):
+    """
+    Checks that the directory of the socket is owned by the current user and not accessible by other users, so that
+    no other user can replace the socket.
+
+    :raises PermissionError: if the directory is owned by another user or accessible by other users
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    directory_stat = os.stat(directory)
+    if directory_stat.st_uid != os.getuid() or stat.S_IMODE(directory_stat.st_mode) & 0o077:
+        raise PermissionError(f"The directory {directory} of the market data socket has to be owned by the current "
+                              f"user and only accessible by it (mode 0700).")
@@ -15,6 +15,8 @@ from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResu
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
@@ -30,8 +32,17 @@ class MarketDataProvider:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60):
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 rates_update_interval: int = 60,
+                 aggregate_candles: bool = False):
+        """
+        :param aggregate_candles: when True, the candles of the intervals up to one day are rolled up locally from the
+        feed of the finest interval requested for the connector and trading pair (see AggregatedCandles)
+        """
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self._aggregate_candles = aggregate_candles
+        self._base_candles_feeds: Dict[str, CandlesBase] = {}  # The feeds of the aggregated candles
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
@@ -44,6 +55,9 @@ class MarketDataProvider:
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
+        for base_candles_feed in self._base_candles_feeds.values():
+            base_candles_feed.stop()
+        self._base_candles_feeds.clear()
         if self._rates_update_task:
             self._rates_update_task.cancel()
             self._rates_update_task = None
@@ -122,6 +136,10 @@ class MarketDataProvider:
         Initializes a list of candle feeds based on the given configurations.
         :param config_list: List[CandlesConfig]
         """
+        if self._aggregate_candles:
+            # The finest intervals first, so the feeds created are the ones the other intervals are aggregated from
+            config_list = sorted(config_list,
+                                 key=lambda config: CandlesBase.interval_to_seconds.get(config.interval, 0))
         for config in config_list:
             self.get_candles_feed(config)
 
@@ -138,6 +156,12 @@ class MarketDataProvider:
         if existing_feed and existing_feed.max_records >= config.max_records:
             # Existing feed is sufficient, return it
             return existing_feed
+        elif self._aggregate_candles and AggregatedCandles.supports_interval(config.interval):
+            candle_feed = AggregatedCandles(base_feed=self._get_base_candles_feed(config),
+                                            interval=config.interval,
+                                            max_records=config.max_records)
+            self.candles_feeds[key] = candle_feed
+            return candle_feed
         else:
             # Create a new feed or restart the existing one with updated max_records
             candle_feed = CandlesFactory.get_candle(config)
@@ -146,6 +170,42 @@ class MarketDataProvider:
                 candle_feed.start()
             return candle_feed
 
+    def _get_base_candles_feed(self, config: CandlesConfig) -> CandlesBase:
+        """
+        Returns the feed of the finest interval dividing the interval of the config, for the connector and trading pair,
+        keeping enough records to aggregate the config max_records. The feed is created, or replaced by one keeping
+        more records, when needed.
+        """
+        interval_in_seconds = CandlesBase.interval_to_seconds[config.interval]
+        base_feed_key = None
+        for feed_key, feed in self._base_candles_feeds.items():
+            if (feed_key.startswith(f"{config.connector}_{config.trading_pair}_")
+                    and interval_in_seconds % feed.interval_in_seconds == 0
+                    and (base_feed_key is None
+                         or feed.interval_in_seconds < self._base_candles_feeds[base_feed_key].interval_in_seconds)):
+                base_feed_key = feed_key
+        base_feed = self._base_candles_feeds.get(base_feed_key)
+        base_interval = base_feed.interval if base_feed is not None else config.interval
+        required_records = AggregatedCandles.required_base_records(interval=config.interval,
+                                                                   max_records=config.max_records,
+                                                                   base_interval=base_interval)
+        if base_feed is not None and base_feed.max_records >= required_records:
+            return base_feed
+
+        base_config = CandlesConfig(connector=config.connector,
+                                    trading_pair=config.trading_pair,
+                                    interval=base_interval,
+                                    max_records=max(required_records, base_feed.max_records if base_feed else 0))
+        new_base_feed = CandlesFactory.get_candle(base_config)
+        self._base_candles_feeds[self._generate_candle_feed_key(base_config)] = new_base_feed
+        new_base_feed.start()
+        if base_feed is not None:
+            for candle_feed in self.candles_feeds.values():
+                if isinstance(candle_feed, AggregatedCandles) and candle_feed.base_feed is base_feed:
+                    candle_feed.set_base_feed(new_base_feed)
+            base_feed.stop()
+        return new_base_feed
+
     @staticmethod
     def _generate_candle_feed_key(config: CandlesConfig) -> str:
         """
@@ -165,6 +225,16 @@ class MarketDataProvider:
         if candle_feed and hasattr(candle_feed, 'stop'):
             candle_feed.stop()
             del self.candles_feeds[key]
+        if isinstance(candle_feed, AggregatedCandles):
+            self._stop_unused_base_candles_feeds()
+
+    def _stop_unused_base_candles_feeds(self):
+        used_base_feeds = [candle_feed.base_feed for candle_feed in self.candles_feeds.values()
+                           if isinstance(candle_feed, AggregatedCandles)]
+        for feed_key, base_feed in list(self._base_candles_feeds.items()):
+            if not any(base_feed is used_base_feed for used_base_feed in used_base_feeds):
+                base_feed.stop()
+                del self._base_candles_feeds[feed_key]
 
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
@@ -0,0 +1,139 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import JSON, Column, Float, Integer, Text, func
+from sqlalchemy.orm import Session
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.executors import Executors
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import PerformanceReport
+
+# The primary key can't be NULL, the executors without controller are totaled under this id
+NO_CONTROLLER_ID = ""
+
+
+class ControllerPerformance(HummingbotBase):
+    """
+    Running totals of the Executors records of a controller, updated with every stored executor, so the performance
+    of the controllers is restored at startup without reading all the executors.
+    """
+    __tablename__ = "ControllerPerformance"
+
+    controller_id = Column(Text, primary_key=True, nullable=False)
+    realized_pnl_quote = Column(Float, nullable=False)
+    volume_traded = Column(Float, nullable=False)
+    close_type_counts = Column(JSON, nullable=False)
+    executors_count = Column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"ControllerPerformance(controller_id='{self.controller_id}', " \
+               f"realized_pnl_quote={self.realized_pnl_quote}, volume_traded={self.volume_traded}, " \
+               f"close_type_counts={self.close_type_counts}, executors_count={self.executors_count})"
+
+    @classmethod
+    def get_records(cls, sql_session: Session) -> List["ControllerPerformance"]:
+        return sql_session.query(cls).all()
+
+    @classmethod
+    def is_missing(cls, sql_session: Session) -> bool:
+        """
+        True when executors were stored before the totals were kept
+        """
+        return (sql_session.query(cls.controller_id).first() is None
+                and sql_session.query(Executors.id).first() is not None)
+
+    @classmethod
+    def rebuild(cls, sql_session: Session) -> None:
+        """
+        Replaces the totals with the ones calculated by the database from all the Executors records
+        """
+        sql_session.query(cls).delete()
+        records: Dict[str, ControllerPerformance] = {}
+        totals = (
+            sql_session.query(Executors.controller_id,
+                              Executors.close_type,
+                              func.sum(Executors.net_pnl_quote),
+                              func.sum(Executors.filled_amount_quote),
+                              func.count(Executors.id))
+            .group_by(Executors.controller_id, Executors.close_type)
+            .all()
+        )
+        for controller_id, close_type, realized_pnl_quote, volume_traded, executors_count in totals:
+            record = records.get(controller_id or NO_CONTROLLER_ID)
+            if record is None:
+                record = cls(controller_id=controller_id or NO_CONTROLLER_ID,
+                             realized_pnl_quote=0.0,
+                             volume_traded=0.0,
+                             close_type_counts={},
+                             executors_count=0)
+                records[record.controller_id] = record
+            record.realized_pnl_quote += realized_pnl_quote or 0.0
+            record.volume_traded += volume_traded or 0.0
+            record.executors_count += executors_count
+            if close_type:
+                record.close_type_counts = {**record.close_type_counts, str(close_type): executors_count}
+        sql_session.add_all(records.values())
+
+    @classmethod
+    def update_executors(cls,
+                         sql_session: Session,
+                         previous_executors: Iterable[Tuple[str, Optional[str], float, float, Optional[int]]],
+                         executors: Iterable[Dict[str, Any]]) -> None:
+        """
+        Updates the totals with executors about to be stored, replacing the values of the ones already stored.
+
+        :param previous_executors: the (id, controller_id, net_pnl_quote, filled_amount_quote, close_type) of the
+        executors already stored
+        :param executors: the executors rows being stored
+        """
+        changes: Dict[str, List] = {}
+
+        def add(controller_id: Optional[str], pnl: Any, volume: Any, close_type: Optional[int], count: int):
+            change = changes.setdefault(controller_id or NO_CONTROLLER_ID, [0.0, 0.0, {}, 0])
+            change[0] += float(pnl) * count
+            change[1] += float(volume) * count
+            if close_type:
+                change[2][str(close_type)] = change[2].get(str(close_type), 0) + count
+            change[3] += count
+
+        for _, controller_id, pnl, volume, close_type in previous_executors:
+            add(controller_id, pnl, volume, close_type, -1)
+        for executor in executors:
+            add(executor["controller_id"], executor["net_pnl_quote"], executor["filled_amount_quote"],
+                executor["close_type"], 1)
+
+        records = {
+            record.controller_id: record
+            for record in sql_session.query(cls).filter(cls.controller_id.in_(list(changes.keys()))).all()
+        }
+        for controller_id, (pnl, volume, close_type_counts, count) in changes.items():
+            record = records.get(controller_id)
+            if record is None:
+                record = cls(controller_id=controller_id,
+                             realized_pnl_quote=0.0,
+                             volume_traded=0.0,
+                             close_type_counts={},
+                             executors_count=0)
+                sql_session.add(record)
+            record.realized_pnl_quote += pnl
+            record.volume_traded += volume
+            record.executors_count += count
+            counts = dict(record.close_type_counts)
+            for close_type, close_type_count in close_type_counts.items():
+                counts[close_type] = counts.get(close_type, 0) + close_type_count
+            # A new dict, the changes inside the JSON value are not tracked
+            record.close_type_counts = {close_type: close_type_count
+                                        for close_type, close_type_count in counts.items() if close_type_count > 0}
+
+    @property
+    def controller(self) -> Optional[str]:
+        return None if self.controller_id == NO_CONTROLLER_ID else self.controller_id
+
+    def to_performance_report(self) -> PerformanceReport:
+        return PerformanceReport(
+            realized_pnl_quote=Decimal(str(self.realized_pnl_quote)),
+            volume_traded=Decimal(str(self.volume_traded)),
+            close_type_counts={CloseType(int(close_type)): count
+                               for close_type, count in self.close_type_counts.items()},
+        )
@@ -1,6 +1,9 @@
 from decimal import Decimal
+from typing import Any, Dict, List
 
 from sqlalchemy import JSON, BigInteger, Boolean, Column, Float, Index, Integer, Text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
 
 from hummingbot.model import HummingbotBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -34,6 +37,30 @@ class Executors(HummingbotBase):
     custom_info = Column(JSON, nullable=False)
     controller_id = Column(Text, nullable=True)
 
+    @classmethod
+    def upsert(cls, sql_session: Session, executors: List[Dict[str, Any]]) -> None:
+        """
+        Inserts the executors rows, or updates the ones already stored, with a single statement
+        """
+        if len(executors) == 0:
+            return
+        dialect_name = sql_session.get_bind().dialect.name
+        columns = [column.name for column in cls.__table__.columns if column.name != "id"]
+        if dialect_name in ("sqlite", "postgresql"):
+            insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+            statement = insert(cls).values(executors)
+            statement = statement.on_conflict_do_update(
+                index_elements=[cls.id],
+                set_={column: statement.excluded[column] for column in columns})
+            sql_session.execute(statement)
+        elif dialect_name == "mysql":
+            statement = mysql.insert(cls).values(executors)
+            statement = statement.on_duplicate_key_update({column: statement.inserted[column] for column in columns})
+            sql_session.execute(statement)
+        else:
+            for executor in executors:
+                sql_session.merge(cls(**executor))
+
     def to_executor_info(self) -> ExecutorInfo:
         """
         Return an ExecutorInfo object based on the current instance.
@@ -0,0 +1,128 @@
+from decimal import Decimal
+from typing import List, Optional
+
+from sqlalchemy import JSON, BigInteger, Boolean, Column, Integer, Numeric, Text, UniqueConstraint
+from sqlalchemy.orm import Session
+
+from hummingbot.client.performance import TradeAggregate
+from hummingbot.model import HummingbotBase
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradeFillAggregate(HummingbotBase):
+    """
+    Running totals of the TradeFill records of a config file, market and trading pair, updated with every fill.
+    `is_complete` is False when the totals were started after some of the trades were recorded, in that case they
+    have to be rebuilt from the TradeFill records before being used.
+    """
+    __tablename__ = "TradeFillAggregate"
+    __table_args__ = (
+        UniqueConstraint("config_file_path", "market", "symbol"),
+    )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    is_complete = Column(Boolean, nullable=False)
+    num_buys = Column(Integer, nullable=False)
+    num_sells = Column(Integer, nullable=False)
+    num_position_trades = Column(Integer, nullable=False)
+    buy_volume_base = Column(Numeric(48, 18), nullable=False)
+    buy_volume_quote = Column(Numeric(48, 18), nullable=False)
+    sell_volume_base = Column(Numeric(48, 18), nullable=False)
+    sell_volume_quote = Column(Numeric(48, 18), nullable=False)
+    fees = Column(JSON, nullable=False)
+    first_price = Column(Numeric(48, 18), nullable=True)
+    last_price = Column(Numeric(48, 18), nullable=True)
+    first_timestamp = Column(BigInteger, nullable=True)
+    last_timestamp = Column(BigInteger, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"TradeFillAggregate(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', is_complete={self.is_complete}, num_buys={self.num_buys}, " \
+               f"num_sells={self.num_sells}, first_timestamp={self.first_timestamp}, " \
+               f"last_timestamp={self.last_timestamp})"
+
+    @classmethod
+    def get_records(cls, sql_session: Session, config_file_path: str) -> List["TradeFillAggregate"]:
+        return sql_session.query(cls).filter(cls.config_file_path == config_file_path).all()
+
+    @classmethod
+    def get_record(cls,
+                   sql_session: Session,
+                   config_file_path: str,
+                   market: str,
+                   symbol: str) -> Optional["TradeFillAggregate"]:
+        return (
+            sql_session.query(cls)
+            .filter(cls.config_file_path == config_file_path, cls.market == market, cls.symbol == symbol)
+            .one_or_none()
+        )
+
+    @classmethod
+    def add_trade_fill(cls, sql_session: Session, trade_fill: TradeFill) -> None:
+        record = cls.get_record(sql_session, trade_fill.config_file_path, trade_fill.market, trade_fill.symbol)
+        if record is None:
+            previous_trade = (
+                sql_session.query(TradeFill.exchange_trade_id)
+                .filter(TradeFill.config_file_path == trade_fill.config_file_path,
+                        TradeFill.market == trade_fill.market,
+                        TradeFill.symbol == trade_fill.symbol,
+                        TradeFill.exchange_trade_id != trade_fill.exchange_trade_id)
+                .first()
+            )
+            aggregate = TradeAggregate(market=trade_fill.market, trading_pair=trade_fill.symbol)
+            aggregate.add_trade(trade_fill)
+            record = cls(config_file_path=trade_fill.config_file_path, is_complete=previous_trade is None)
+            record.update_from_aggregate(aggregate)
+            sql_session.add(record)
+        else:
+            aggregate = record.to_trade_aggregate()
+            aggregate.add_trade(trade_fill)
+            record.update_from_aggregate(aggregate)
+
+    @classmethod
+    def replace_records(cls, sql_session: Session, config_file_path: str, aggregates: List[TradeAggregate]) -> None:
+        """
+        Replaces the totals of the config file with complete ones, calculated from all its TradeFill records
+        """
+        sql_session.query(cls).filter(cls.config_file_path == config_file_path).delete()
+        for aggregate in aggregates:
+            record = cls(config_file_path=config_file_path, is_complete=True)
+            record.update_from_aggregate(aggregate)
+            sql_session.add(record)
+
+    def to_trade_aggregate(self) -> TradeAggregate:
+        return TradeAggregate(
+            market=self.market,
+            trading_pair=self.symbol,
+            num_buys=self.num_buys,
+            num_sells=self.num_sells,
+            num_position_trades=self.num_position_trades,
+            b_vol_base=Decimal(str(self.buy_volume_base)),
+            b_vol_quote=Decimal(str(self.buy_volume_quote)),
+            s_vol_base=Decimal(str(self.sell_volume_base)),
+            s_vol_quote=Decimal(str(self.sell_volume_quote)),
+            fees={token: Decimal(amount) for token, amount in self.fees.items()},
+            first_price=Decimal(str(self.first_price)),
+            last_price=Decimal(str(self.last_price)),
+            first_timestamp=self.first_timestamp,
+            last_timestamp=self.last_timestamp,
+        )
+
+    def update_from_aggregate(self, aggregate: TradeAggregate):
+        self.market = aggregate.market
+        self.symbol = aggregate.trading_pair
+        self.num_buys = aggregate.num_buys
+        self.num_sells = aggregate.num_sells
+        self.num_position_trades = aggregate.num_position_trades
+        self.buy_volume_base = aggregate.b_vol_base
+        self.buy_volume_quote = aggregate.b_vol_quote
+        self.sell_volume_base = aggregate.s_vol_base
+        self.sell_volume_quote = aggregate.s_vol_quote
+        self.fees = {token: str(amount) for token, amount in aggregate.fees.items()}
+        self.first_price = aggregate.first_price
+        self.last_price = aggregate.last_price
+        self.first_timestamp = aggregate.first_timestamp
+        self.last_timestamp = aggregate.last_timestamp
@@ -0,0 +1,61 @@
+import logging
+from typing import Callable, Dict, Optional
+
+from aiohttp import web
+
+from hummingbot.connector.order_latency_tracker import OrderLatencyTracker, render_prometheus_metrics
+from hummingbot.logger import HummingbotLogger
+
+METRICS_PATH = "/metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain"
+
+
+class MetricsServer:
+    """
+    Serves the order latency histograms of the connectors in the Prometheus text exposition format.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 trackers_provider: Callable[[], Dict[str, OrderLatencyTracker]],
+                 host: str = "127.0.0.1",
+                 port: int = 9464):
+        """
+        :param trackers_provider: returns the latency trackers to expose, by connector name
+        :param host: the interface to listen on
+        :param port: the port to listen on
+        """
+        self._trackers_provider = trackers_provider
+        self._host = host
+        self._port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    async def start(self):
+        if self._runner is None:
+            app = web.Application()
+            app.router.add_get(METRICS_PATH, self._metrics_handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, self._host, self._port)
+            await site.start()
+            self._runner = runner
+            self.logger().info(f"Serving order latency metrics on http://{self._host}:{self._port}{METRICS_PATH}")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _metrics_handler(self, request: web.Request) -> web.Response:
+        return web.Response(text=render_prometheus_metrics(self._trackers_provider()),
+                            content_type=PROMETHEUS_CONTENT_TYPE)
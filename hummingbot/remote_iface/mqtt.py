@@ -6,10 +6,11 @@ import logging
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from hummingbot import get_logging_conf
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -51,6 +52,26 @@ from hummingbot.remote_iface.messages import (
 
 mqtts_logger: HummingbotLogger = None
 
+MQTT_EVENT_TYPES: Dict[int, str] = {
+    market_event.value: market_event.name for market_event in (
+        events.MarketEvent.BuyOrderCreated,
+        events.MarketEvent.BuyOrderCompleted,
+        events.MarketEvent.SellOrderCreated,
+        events.MarketEvent.SellOrderCompleted,
+        events.MarketEvent.OrderFilled,
+        events.MarketEvent.OrderCancelled,
+        events.MarketEvent.OrderExpired,
+        events.MarketEvent.OrderFailure,
+        events.MarketEvent.FundingPaymentCompleted,
+        events.MarketEvent.RangePositionLiquidityAdded,
+        events.MarketEvent.RangePositionLiquidityRemoved,
+        events.MarketEvent.RangePositionUpdate,
+        events.MarketEvent.RangePositionUpdateFailure,
+        events.MarketEvent.RangePositionFeeCollected,
+        events.MarketEvent.RangePositionClosed,
+    )
+}
+
 
 class CommandTopicSpecs:
     START: str = '/start'
@@ -309,6 +330,11 @@ class MQTTCommands:
                     timeout=timeout
                 )
                 response.msg = res if res is not None else ''
+                response.data = call_sync(
+                    self._order_latency_status(),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
         except asyncio.exceptions.TimeoutError:
             response.msg = f'Hummingbot status command timed out after {timeout} seconds'
             response.status = MQTT_STATUS_CODE.ERROR
@@ -317,6 +343,15 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    async def _order_latency_status(self) -> Dict[str, Any]:
+        # Built on the event loop, which updates the markets and their latency histograms
+        return {
+            'order_latency': {
+                connector_name: tracker.to_dict()
+                for connector_name, tracker in self._hb_app.order_latency_trackers().items()
+            }
+        }
+
     def _on_cmd_history(self, msg: HistoryCommandMessage.Request):
         response = HistoryCommandMessage.Response()
         try:
@@ -378,6 +413,12 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    _MAX_QUEUE_SIZE = 10000
+    _MAX_BATCH_SIZE = 100
+    # Time during which the events following the first one are collected into the same batch
+    _BATCH_INTERVAL = 0.1
+    _DROPPED_EVENTS_LOG_INTERVAL = 10.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -426,6 +467,16 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+        # When the broker can't keep up the oldest events are dropped
+        self._events_queue: Deque[Tuple[int, Any]] = deque(maxlen=self._MAX_QUEUE_SIZE)
+        self._events_available = asyncio.Event()
+        self._dropped_events_count = 0
+        self._last_dropped_events_log_ts = 0.0
+        # A single thread keeps the events in order
+        self._publish_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mqtt_events")
+        self._publish_events_task: Optional[asyncio.Task] = safe_ensure_future(
+            self._publish_events_loop(), loop=self._ev_loop
+        )
         self._start_event_listeners()
 
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
@@ -437,27 +488,50 @@ class MQTTMarketEventForwarder:
                 event
             )
             return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdate.value: "RangePositionUpdate",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-                events.MarketEvent.RangePositionFeeCollected.value: "RangePositionFeeCollected",
-                events.MarketEvent.RangePositionClosed.value: "RangePositionClosed",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+        # Only the reference is queued here, the event is serialized and published by the worker so that
+        # a slow broker never delays the event triggering code.
+        if len(self._events_queue) == self._events_queue.maxlen:
+            self._dropped_events_count += 1
+            self._log_dropped_events()
+        self._events_queue.append((event_tag, event))
+        self._events_available.set()
+
+    @property
+    def dropped_events_count(self) -> int:
+        return self._dropped_events_count
+
+    def _log_dropped_events(self):
+        now = time.time()
+        if now - self._last_dropped_events_log_ts >= self._DROPPED_EVENTS_LOG_INTERVAL:
+            self._last_dropped_events_log_ts = now
+            self.logger().warning(
+                f"The MQTT events queue is full, {self._dropped_events_count} events were dropped so far."
+            )
+
+    async def _publish_events_loop(self):
+        while True:
+            try:
+                await self._events_available.wait()
+                await asyncio.sleep(self._BATCH_INTERVAL)
+                self._events_available.clear()
+                while len(self._events_queue) > 0:
+                    batch = [self._events_queue.popleft()
+                             for _ in range(min(len(self._events_queue), self._MAX_BATCH_SIZE))]
+                    await self._ev_loop.run_in_executor(self._publish_executor, self._publish_events, batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error publishing MQTT events.", exc_info=True)
+
+    def _publish_events(self, batch: List[Tuple[int, Any]]):
+        # The batch is serialized and published in one executor call, but each event stays its own message on the
+        # events topic, which is what its subscribers read
+        messages = [self._make_event_message(event_tag, event) for event_tag, event in batch]
+        for message in messages:
+            self.event_fw_pub.publish(message)
+
+    def _make_event_message(self, event_tag: int, event) -> InternalEventMessage:
+        event_type = MQTT_EVENT_TYPES.get(event_tag, "Unknown")
 
         if is_dataclass(event):
             event_data = asdict(event)
@@ -476,12 +550,10 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
-        self.event_fw_pub.publish(
-            InternalEventMessage(
-                timestamp=int(timestamp),
-                type=event_type,
-                data=event_data
-            )
+        return InternalEventMessage(
+            timestamp=int(timestamp),
+            type=event_type,
+            data=event_data
         )
 
     def _make_event_payload(self, event_data):
@@ -518,6 +590,13 @@ class MQTTMarketEventForwarder:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
 
+    def stop(self):
+        self._stop_event_listeners()
+        if self._publish_events_task is not None:
+            self._publish_events_task.cancel()
+            self._publish_events_task = None
+        self._publish_executor.shutdown(wait=False)
+
 
 class MQTTNotifier(NotifierBase):
     def __init__(self,
@@ -745,7 +824,7 @@ class MQTTGateway(Node):
 
     def _remove_market_event_listeners(self):
         if self._market_events is not None:
-            self._market_events._stop_event_listeners()
+            self._market_events.stop()
 
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
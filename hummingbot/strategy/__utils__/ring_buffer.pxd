@@ -8,13 +8,22 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        # Running sums of the values in the buffer, of their squares and of the squares of the differences between
+        # consecutive values
+        double _sum
+        double _sum_of_squares
+        double _sum_of_squared_differences
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
     cdef double c_get_last_value(self)
+    cdef double c_get_first_value(self)
+    cdef int64_t c_size(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef void c_update_running_sums(self)
+    cdef tuple c_get_views(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
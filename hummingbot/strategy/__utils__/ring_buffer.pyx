@@ -1,6 +1,8 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isinf, isnan
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
@@ -18,13 +20,45 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._sum = 0
+        self._sum_of_squares = 0
+        self._sum_of_squared_differences = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double oldest
+            double next_oldest
+            double last
+            bint update_running_sums = False
+
+        if self._is_full:
+            oldest = self._buffer[self._delimiter]
+            self._sum -= oldest
+            self._sum_of_squares -= oldest * oldest
+            if self._length > 1:
+                next_oldest = self._buffer[(self._delimiter + 1) % self._length]
+                self._sum_of_squared_differences -= (next_oldest - oldest) * (next_oldest - oldest)
+            # A NaN or infinite value leaving the buffer can't be subtracted from the running sums
+            update_running_sums = isnan(oldest) or isinf(oldest)
+        if not self.c_is_empty() and (self._length > 1 or not self._is_full):
+            last = self._buffer[(self._delimiter - 1) % self._length]
+            self._sum_of_squared_differences += (val - last) * (val - last)
+        self._sum += val
+        self._sum_of_squares += val * val
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
+        # The running sums are computed again once per cycle of the buffer, so the rounding errors don't accumulate
+        if update_running_sums or self._delimiter == 0:
+            self.c_update_running_sums()
+
+    cdef void c_update_running_sums(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+        self._sum = np.sum(values)
+        self._sum_of_squares = np.sum(np.square(values))
+        self._sum_of_squared_differences = np.sum(np.square(np.diff(values)))
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -39,13 +73,21 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter if self._is_full else 0]
+
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._sum / self._length
         return result
 
     cdef double c_variance(self):
@@ -60,21 +102,33 @@ cdef class RingBuffer:
             result = np.std(self.c_get_as_numpy_array())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
+    cdef tuple c_get_views(self):
+        buffer = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            older = buffer[:self._delimiter]
+            newer = buffer[:0]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            older = buffer[self._delimiter:]
+            newer = buffer[:self._delimiter]
+        older.flags.writeable = False
+        newer.flags.writeable = False
+        return older, newer
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        older, newer = self.c_get_views()
+        return np.concatenate((older, newer))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._sum = 0
+        self._sum_of_squares = 0
+        self._sum_of_squared_differences = 0
+
+    def __len__(self):
+        return self.c_size()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,9 +136,38 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_views(self):
+        """
+        Returns the values of the buffer as two read-only views of it, without copying them: the older values, then the
+        newer ones.
+        """
+        return self.c_get_views()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def sum_of_squares(self) -> float:
+        return self._sum_of_squares
+
+    @property
+    def sum_of_squared_differences(self) -> float:
+        """
+        The sum of the squares of the differences between consecutive values.
+        """
+        return self._sum_of_squared_differences
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -113,6 +196,9 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._sum = 0
+        self._sum_of_squares = 0
+        self._sum_of_squared_differences = 0
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,5 +1,5 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +7,47 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        # The sum of the samples weighted by their decay, updated in O(1) per sample. It matches an adjusted
+        # exponential moving average over the sampling buffer (pandas ewm with adjust=True).
+        self._weighted_sum = 0.0
+        self._samples_since_update = 0
+
+    @property
+    def _decay(self) -> float:
+        # alpha = 2 / (span + 1), with the sampling length as span
+        return 1 - 2 / (self.sampling_length + 1)
+
+    def add_sample(self, value: float):
+        decay = self._decay
+        self._weighted_sum = value + decay * self._weighted_sum
+        if self._sampling_buffer.is_full:
+            self._weighted_sum -= decay ** self.sampling_length * self._sampling_buffer.get_first_value()
+        self._samples_since_update += 1
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        # The weighted sum is computed again once per cycle of the buffer, so the rounding errors don't accumulate
+        if self._samples_since_update >= self.sampling_length:
+            self._update_weighted_sum()
+        decay = self._decay
+        size = self._sampling_buffer.size
+        weights_sum = (1 - decay ** size) / (1 - decay) if decay > 0 else 1
+        return self._weighted_sum / weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    def _update_weighted_sum(self):
+        samples = self._sampling_buffer.get_as_numpy_array()
+        weights = self._decay ** np.arange(samples.size - 1, -1, -1)
+        self._weighted_sum = float(np.dot(weights, samples))
+        self._samples_since_update = 0
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._update_weighted_sum()
@@ -1,18 +1,38 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log prices of the sampling buffer, whose running sums give the variance of the log returns
+        self._log_prices_buffer = RingBuffer(sampling_length)
+
+    def add_sample(self, value: float):
+        self._log_prices_buffer.add_value(np.log(value))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        returns_count = self._log_prices_buffer.size - 1
+        if returns_count > 0:
+            # The sum of the log returns is the difference between the last and the first log prices
+            mean_log_return = (self._log_prices_buffer.get_last_value() -
+                               self._log_prices_buffer.get_first_value()) / returns_count
+            mean_squared_log_return = self._log_prices_buffer.sum_of_squared_differences / returns_count
+            return max(mean_squared_log_return - mean_log_return ** 2, 0)
+        return np.nan
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_prices_buffer.length = value
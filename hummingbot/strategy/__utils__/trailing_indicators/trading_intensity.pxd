@@ -12,17 +12,25 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
-        dict _trade_samples
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
+        list _sample_timestamps
+        dict _sample_volumes
+        dict _level_volumes
+        dict _level_sample_counts
+        list _price_levels
+        bint _fit_required
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, double sample_timestamp, double price_level, double amount)
+    cdef c_trim_samples(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,6 +2,8 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from array import array
+from bisect import bisect_left, insort
 from decimal import Decimal
 from typing import Tuple
 
@@ -26,11 +28,19 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity parameters (alpha, kappa) of the Avellaneda market making model by fitting
+    alpha * exp(-kappa * price_level) to the volume traded at each distance from the mid price.
+
+    The quotes are kept in arrays ordered by timestamp so that each trade is matched to the last quote before it with
+    a binary search, and the volume by price level of the samples in the buffer is maintained incrementally (added
+    when a trade is sampled, subtracted when its sample leaves the buffer). The curve is only fitted again when the
+    volumes changed.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
-        self._trade_samples = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +48,18 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = array("d")
+        self._quote_prices = array("d")
+        # Sample timestamps in ascending order, and the volume by price level of each sample
+        self._sample_timestamps = []
+        self._sample_volumes = {}
+        # Volume and number of samples by price level, for all the samples in the buffer
+        self._level_volumes = {}
+        self._level_sample_counts = {}
+        # Ascending order of the price levels with volume
+        self._price_levels = []
+        self._fit_required = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +69,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._sample_timestamps) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._sample_timestamps)
+        self._samples_length = len(self._sample_timestamps)
         return is_changed
 
     @property
@@ -66,54 +87,49 @@ cdef class TradingIntensityIndicator:
 
     @property
     def last_quotes(self) -> list:
-        """A helper method to be used in unit tests"""
-        return self._last_quotes
+        """A helper method to be used in unit tests. Returns the quotes in descending order of timestamp"""
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
-        """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        """A helper method to be used in unit tests. Expects the quotes in descending order of timestamp"""
+        quotes = sorted(reversed(value), key=lambda quote: quote["timestamp"])
+        self._quote_timestamps = array("d", [quote["timestamp"] for quote in quotes])
+        self._quote_prices = array("d", [float(quote["price"]) for quote in quotes])
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int latest_processed_quote_idx = -1
+            int quote_idx
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # The last quote strictly before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx >= 0:
+                latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+                self.c_add_trade_to_sample(self._quote_timestamps[quote_idx] + 1,
+                                           abs(trade.price - self._quote_prices[quote_idx]),
+                                           trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        self.c_trim_samples()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._fit_required:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,33 +139,58 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
+    cdef c_add_trade_to_sample(self, double sample_timestamp, double price_level, double amount):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+            dict sample_volumes = self._sample_volumes.get(sample_timestamp)
+            int level_sample_count
+
+        if sample_volumes is None:
+            sample_volumes = {}
+            self._sample_volumes[sample_timestamp] = sample_volumes
+            insort(self._sample_timestamps, sample_timestamp)
+
+        if price_level in sample_volumes:
+            sample_volumes[price_level] += amount
+        else:
+            sample_volumes[price_level] = amount
+            level_sample_count = self._level_sample_counts.get(price_level, 0)
+            if level_sample_count == 0:
+                insort(self._price_levels, price_level)
+                self._level_volumes[price_level] = 0.0
+            self._level_sample_counts[price_level] = level_sample_count + 1
+
+        self._level_volumes[price_level] += amount
+        self._fit_required = True
+
+    cdef c_trim_samples(self):
+        cdef:
+            int excess_samples = len(self._sample_timestamps) - self._sampling_length
+            int level_sample_count
+
+        if excess_samples <= 0:
+            return
+
+        for sample_timestamp in self._sample_timestamps[:excess_samples]:
+            for price_level, amount in self._sample_volumes.pop(sample_timestamp).items():
+                level_sample_count = self._level_sample_counts[price_level] - 1
+                if level_sample_count == 0:
+                    del self._level_sample_counts[price_level]
+                    del self._level_volumes[price_level]
+                    del self._price_levels[bisect_left(self._price_levels, price_level)]
+                else:
+                    self._level_sample_counts[price_level] = level_sample_count
+                    self._level_volumes[price_level] -= amount
+        del self._sample_timestamps[:excess_samples]
+        self._fit_required = True
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+    cdef c_estimate_intensity(self):
+        # Descending order of price levels, and their trading intensities
+        price_levels = np.array(self._price_levels[::-1], dtype=np.float64)
+        lambdas = np.array([self._level_volumes[price_level] for price_level in self._price_levels[::-1]],
+                           dtype=np.float64)
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
@@ -164,3 +205,4 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+        self._fit_required = False
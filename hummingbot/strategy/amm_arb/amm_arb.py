@@ -11,6 +11,7 @@ from hummingbot.client.settings import AllConnectorSettings, GatewayConnectionSe
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.amm.gateway_ethereum_amm import GatewayEthereumAMM
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -457,6 +458,22 @@ class AmmArbStrategy(StrategyPyBase):
                 ["    " + line for line in network_fees_df.to_string(index=False).split("\n")]
             )
 
+        columns = ["Exchange", "Quote Hit Rate", "Merged Requests", "Gateway Latency (ms)"]
+        data = []
+        for market_info in [self._market_info_1, self._market_info_2]:
+            quote_cache: Optional[GatewayQuoteCache] = getattr(market_info.market, "quote_cache", None)
+            if isinstance(quote_cache, GatewayQuoteCache):
+                data.append([market_info.market.display_name,
+                             f"{quote_cache.hit_rate:.1%}",
+                             quote_cache.stats["merged_requests"],
+                             f"{quote_cache.average_latency * 1000:.0f}"])
+        if len(data) > 0:
+            quote_cache_df = pd.DataFrame(data=data, columns=columns)
+            lines.extend(
+                ["", "  Gateway Quotes:"] +
+                ["    " + line for line in quote_cache_df.to_string(index=False).split("\n")]
+            )
+
         assets_df = self.wallet_balance_data_frame([self._market_info_1, self._market_info_2])
         lines.extend(["", "  Assets:"] +
                      ["    " + line for line in str(assets_df).split("\n")])
@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -35,6 +35,7 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
 from .order_id_market_pair_tracker import OrderIDMarketPairTracker
+from .taker_vwap_cache import TakerVWAPCache
 
 s_float_nan = float("nan")
 s_decimal_zero = Decimal(0)
@@ -110,6 +111,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._market_pair_tracker = OrderIDMarketPairTracker()
+        self._taker_vwap_cache = TakerVWAPCache()
+        # The conversion rates of the market pairs, only cached while main() runs
+        self._main_conversion_rates = None
 
         # Holds ongoing hedging orders mapped to their respective maker fill trades
         self._ongoing_hedging = bidict()
@@ -247,6 +251,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         return market_info.market.name in AllConnectorSettings.get_gateway_amm_connector_names()
 
     def get_conversion_rates(self, market_pair: MarketTradingPairTuple):
+        if self._main_conversion_rates is not None and market_pair in self._main_conversion_rates:
+            return self._main_conversion_rates[market_pair]
         quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate, gas_pair, gas_rate_source, \
             gas_rate = self._config_map.conversion_rate_mode.get_conversion_rates(market_pair)
         if quote_rate is None:
@@ -255,8 +261,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self.logger().warning(f"Can't find a conversion rate for {base_pair}")
         if gas_rate is None:
             self.logger().warning(f"Can't find a conversion rate for {gas_pair}")
-        return quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate, gas_pair, \
-            gas_rate_source, gas_rate
+        conversion_rates = quote_pair, quote_rate_source, quote_rate, base_pair, base_rate_source, base_rate, \
+            gas_pair, gas_rate_source, gas_rate
+        if self._main_conversion_rates is not None:
+            self._main_conversion_rates[market_pair] = conversion_rates
+        return conversion_rates
 
     def log_conversion_rates(self):
         for market_pair in self._market_pairs.values():
@@ -363,6 +372,10 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def stop(self, clock: Clock):
+        self._taker_vwap_cache.clear()
+        super().stop(clock)
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -423,6 +436,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._cancel_outdated_orders_task = safe_ensure_future(self.apply_gateway_transaction_cancel_interval())
 
     async def main(self, timestamp: float):
+        # The pricing and checks of the active orders all use the same conversion rates
+        self._main_conversion_rates = {}
         try:
             # Calculate a mapping from market pair to list of active limit orders on the market.
             market_pair_to_active_orders = defaultdict(list)
@@ -443,11 +458,15 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             for market_pair in self._market_pairs.values():
                 await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
 
+            # Stop watching the taker volumes that are no longer priced
+            self._taker_vwap_cache.prune()
+
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
                 self.log_conversion_rates()
                 self._last_conv_rates_logged = timestamp
         finally:
+            self._main_conversion_rates = None
             self._last_timestamp = timestamp
 
     async def get_gateway_quotes(self):
@@ -581,6 +600,35 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         If a limit order previously made to the maker side has been filled, hedge it on the taker side.
         :param order_filled_event: event object
         """
+        market_pair = self.record_maker_fill(order_filled_event)
+        if market_pair is not None:
+            # Call check_and_hedge_orders() to emit the orders on the taker side.
+            try:
+                await self.check_and_hedge_orders(maker_order_id, market_pair)
+            except Exception:
+                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+
+    def hedge_filled_maker_order_on_order_book(self,
+                                               maker_order_id: str,
+                                               order_filled_event: OrderFilledEvent):
+        """
+        Same as hedge_filled_maker_order(), for taker markets with an order book. The hedging prices are read from the
+        taker order book, so the hedge is placed right away from the fill event.
+        :param order_filled_event: event object
+        """
+        market_pair = self.record_maker_fill(order_filled_event)
+        if market_pair is not None:
+            try:
+                self.hedge_orders(maker_order_id, market_pair)
+            except Exception:
+                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+
+    def record_maker_fill(self, order_filled_event: OrderFilledEvent) -> Optional[MakerTakerMarketPair]:
+        """
+        Stores the fill event of a maker limit order, s.t. it can be hedged.
+        :param order_filled_event: event object
+        :return: the market pair of the filled order, None if the order isn't a maker limit order
+        """
         order_id = order_filled_event.order_id
         market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
 
@@ -616,12 +664,8 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         f"({market_pair.maker.trading_pair}) Maker sell order of "
                         f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
                     )
-
-            # Call check_and_hedge_orders() to emit the orders on the taker side.
-            try:
-                await self.check_and_hedge_orders(maker_order_id, market_pair)
-            except Exception:
-                self.log_with_clock(logging.ERROR, "Unexpected error.", exc_info=True)
+            return market_pair
+        return None
 
     def hedge_tasks_cleanup(self):
         hedge_maker_order_tasks = []
@@ -657,10 +701,14 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
                 self._maker_to_hedging_trades[maker_order_id] += [exchange_trade_id]
 
-                self.hedge_tasks_cleanup()
-                self._hedge_maker_order_task = safe_ensure_future(
-                    self.hedge_filled_maker_order(maker_order_id, order_filled_event)
-                )
+                market_pair = self._market_pair_tracker.get_market_pair_from_order_id(maker_order_id)
+                if market_pair is not None and not self.is_gateway_market(market_pair.taker):
+                    self.hedge_filled_maker_order_on_order_book(maker_order_id, order_filled_event)
+                else:
+                    self.hedge_tasks_cleanup()
+                    self._hedge_maker_order_tasks += [safe_ensure_future(
+                        self.hedge_filled_maker_order(maker_order_id, order_filled_event)
+                    )]
 
     def did_cancel_order(self, order_canceled_event: OrderCancelledEvent):
         if order_canceled_event.order_id in self._taker_to_maker_order_ids.keys():
@@ -852,6 +900,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         :param market_pair: cross exchange market pair
         """
+        if not self.is_gateway_market(market_pair.taker):
+            self.hedge_orders(maker_order_id, market_pair)
+            return
 
         buy_fill_records = self.get_unhedged_buy_records(market_pair)
         sell_fill_records = self.get_unhedged_sell_records(market_pair)
@@ -859,8 +910,6 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         buy_fill_quantity = sum([fill_event.amount for _, fill_event in buy_fill_records])
         sell_fill_quantity = sum([fill_event.amount for _, fill_event in sell_fill_records])
 
-        global s_decimal_zero
-
         taker_trading_pair = market_pair.taker.trading_pair
         taker_market = market_pair.taker.market
 
@@ -870,145 +919,172 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         if buy_fill_quantity > 0:
             # Maker buy
             # Taker sell
-            taker_slippage_adjustment_factor = Decimal("1") - self.slippage_buffer
+            quantized_hedge_amount = self.get_taker_hedge_amount(market_pair, False, buy_fill_quantity / base_rate)
+            self.check_multiple_buy_orders(buy_fill_records)
+            order_price = await taker_market.get_order_price(taker_trading_pair, False, quantized_hedge_amount)
+            if order_price is None:
+                self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                return
+            self.place_hedge_order(market_pair, False, maker_order_id, buy_fill_records, quantized_hedge_amount,
+                                   order_price, order_price)
 
-            hedged_order_quantity = min(
-                buy_fill_quantity / base_rate,
-                taker_market.get_available_balance(market_pair.taker.base_asset) *
-                self.order_size_taker_balance_factor
+        if sell_fill_quantity > 0:
+            # Maker sell
+            # Taker buy
+            taker_price = await taker_market.get_order_price(taker_trading_pair, True, sell_fill_quantity / base_rate)
+            if taker_price is None:
+                self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                return
+            quantized_hedge_amount = self.get_taker_hedge_amount(
+                market_pair, True, sell_fill_quantity / base_rate, taker_price
             )
-            quantized_hedge_amount = taker_market.quantize_order_amount(taker_trading_pair, Decimal(hedged_order_quantity))
+            self.check_multiple_sell_orders(sell_fill_records)
+            order_price = await taker_market.get_order_price(taker_trading_pair, True, quantized_hedge_amount)
+            if order_price is None:
+                self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                return
+            self.place_hedge_order(market_pair, True, maker_order_id, sell_fill_records, quantized_hedge_amount,
+                                   order_price, order_price)
 
-            avg_fill_price = (sum([r.price * r.amount for _, r in buy_fill_records]) /
-                              sum([r.amount for _, r in buy_fill_records]))
+    def hedge_orders(self, maker_order_id: str, market_pair: MakerTakerMarketPair):
+        """
+        Same as check_and_hedge_orders(), for taker markets with an order book. The hedging prices are read from the
+        taker order book, so the hedging orders are emitted without waiting for a task to run.
 
-            self.check_multiple_buy_orders(buy_fill_records)
-            if self.is_gateway_market(market_pair.taker):
-                order_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    False,
-                    quantized_hedge_amount)
-                if order_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
-                taker_top = order_price
-            else:
-                taker_top = taker_market.get_price(taker_trading_pair, False)
-                order_price = taker_market.get_price_for_volume(
-                    taker_trading_pair, False, quantized_hedge_amount
-                ).result_price
+        :param market_pair: cross exchange market pair
+        """
+        buy_fill_records = self.get_unhedged_buy_records(market_pair)
+        sell_fill_records = self.get_unhedged_sell_records(market_pair)
 
-            self.log_with_clock(logging.INFO, f"Calculated by HB order_price: {order_price}")
-            order_price *= taker_slippage_adjustment_factor
-            order_price = taker_market.quantize_order_price(taker_trading_pair, order_price)
-            self.log_with_clock(logging.INFO, f"Slippage buffer adjusted order_price: {order_price}")
+        buy_fill_quantity = sum([fill_event.amount for _, fill_event in buy_fill_records])
+        sell_fill_quantity = sum([fill_event.amount for _, fill_event in sell_fill_records])
 
-            if quantized_hedge_amount > s_decimal_zero:
-                self.place_order(
-                    market_pair,
-                    False,
-                    False,
-                    quantized_hedge_amount,
-                    order_price,
-                    maker_order_id,
-                    buy_fill_records
-                )
+        taker_trading_pair = market_pair.taker.trading_pair
+        taker_market = market_pair.taker.market
 
-                if LogOption.MAKER_ORDER_HEDGED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Hedged maker buy order(s) of "
-                        f"{buy_fill_quantity} {market_pair.maker.base_asset} on taker market to lock in profits. "
-                        f"(maker avg price={avg_fill_price}, taker top={taker_top})"
-                    )
-            else:
-                self.log_with_clock(
-                    logging.INFO,
-                    f"({market_pair.maker.trading_pair}) Current maker buy fill amount of "
-                    f"{buy_fill_quantity} {market_pair.maker.base_asset} is less than the minimum order amount "
-                    f"allowed on the taker market. No hedging possible yet."
-                )
+        # Convert maker order size (in maker base asset) to taker order size (in taker base asset)
+        _, _, quote_rate, _, _, base_rate, _, _, _ = self.get_conversion_rates(market_pair)
+
+        if buy_fill_quantity > 0:
+            # Maker buy
+            # Taker sell
+            quantized_hedge_amount = self.get_taker_hedge_amount(market_pair, False, buy_fill_quantity / base_rate)
+            self.check_multiple_buy_orders(buy_fill_records)
+            taker_top = taker_market.get_price(taker_trading_pair, False)
+            order_price = taker_market.get_price_for_volume(
+                taker_trading_pair, False, quantized_hedge_amount
+            ).result_price
+            self.place_hedge_order(market_pair, False, maker_order_id, buy_fill_records, quantized_hedge_amount,
+                                   order_price, taker_top)
 
         if sell_fill_quantity > 0:
             # Maker sell
             # Taker buy
-            taker_slippage_adjustment_factor = Decimal("1") + self.slippage_buffer
-
-            if self.is_gateway_market(market_pair.taker):
-                taker_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    True,
-                    sell_fill_quantity / base_rate
-                )
-                if taker_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
-            else:
-                taker_price = taker_market.get_price_for_volume(
-                    taker_trading_pair,
-                    True,
-                    sell_fill_quantity / base_rate
-                ).result_price
+            taker_price = taker_market.get_price_for_volume(
+                taker_trading_pair, True, sell_fill_quantity / base_rate
+            ).result_price
+            quantized_hedge_amount = self.get_taker_hedge_amount(
+                market_pair, True, sell_fill_quantity / base_rate, taker_price
+            )
+            self.check_multiple_sell_orders(sell_fill_records)
+            taker_top = taker_market.get_price(taker_trading_pair, True)
+            order_price = taker_market.get_price_for_volume(
+                taker_trading_pair, True, quantized_hedge_amount
+            ).result_price
+            self.place_hedge_order(market_pair, True, maker_order_id, sell_fill_records, quantized_hedge_amount,
+                                   order_price, taker_top)
+
+    def get_taker_hedge_amount(self,
+                               market_pair: MakerTakerMarketPair,
+                               is_buy: bool,
+                               fill_quantity: Decimal,
+                               taker_price: Decimal = None) -> Decimal:
+        """
+        Returns the taker order amount hedging the maker fills, limited by the available balance on the taker market.
 
+        :param market_pair: cross exchange market pair
+        :param is_buy: Whether the taker order is a buy.
+        :param fill_quantity: The maker fill quantity, in the taker base asset.
+        :param taker_price: The taker price the quote balance is converted at, for taker buys.
+        :return: a Decimal which is the quantized taker order amount
+        """
+        taker_market = market_pair.taker.market
+        if is_buy:
             hedged_order_quantity = min(
-                sell_fill_quantity / base_rate,
+                fill_quantity,
                 taker_market.get_available_balance(market_pair.taker.quote_asset) /
                 taker_price * self.order_size_taker_balance_factor
             )
-            quantized_hedge_amount = taker_market.quantize_order_amount(
-                taker_trading_pair,
-                Decimal(hedged_order_quantity)
+        else:
+            hedged_order_quantity = min(
+                fill_quantity,
+                taker_market.get_available_balance(market_pair.taker.base_asset) *
+                self.order_size_taker_balance_factor
             )
+        return taker_market.quantize_order_amount(market_pair.taker.trading_pair, Decimal(hedged_order_quantity))
+
+    def place_hedge_order(self,
+                          market_pair: MakerTakerMarketPair,
+                          is_buy: bool,
+                          maker_order_id: str,
+                          fill_records: List[OrderFilledEvent],
+                          amount: Decimal,
+                          order_price: Decimal,
+                          taker_top: Decimal):
+        """
+        Places the taker order hedging the maker fill records, with the order price adjusted by the slippage buffer.
 
-            avg_fill_price = (sum([r.price * r.amount for _, r in sell_fill_records]) /
-                              sum([r.amount for _, r in sell_fill_records]))
+        :param market_pair: cross exchange market pair
+        :param is_buy: Whether the taker order is a buy.
+        :param maker_order_id: The id of the filled maker order.
+        :param fill_records: The maker fill records hedged by the order.
+        :param amount: The quantized taker order amount.
+        :param order_price: The taker price to fill the amount.
+        :param taker_top: The top of the taker market, for logging.
+        """
+        global s_decimal_zero
 
-            self.check_multiple_sell_orders(sell_fill_records)
-            if self.is_gateway_market(market_pair.taker):
-                order_price = await market_pair.taker.market.get_order_price(
-                    taker_trading_pair,
-                    True,
-                    quantized_hedge_amount)
-                if order_price is None:
-                    self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
-                    return
-                taker_top = order_price
-            else:
-                taker_top = taker_market.get_price(taker_trading_pair, True)
-                order_price = taker_market.get_price_for_volume(
-                    taker_trading_pair, True, quantized_hedge_amount
-                ).result_price
+        taker_trading_pair = market_pair.taker.trading_pair
+        taker_market = market_pair.taker.market
+        maker_side = "sell" if is_buy else "buy"
+        fill_quantity = sum([r.amount for _, r in fill_records])
+        avg_fill_price = sum([r.price * r.amount for _, r in fill_records]) / fill_quantity
 
-            self.log_with_clock(logging.INFO, f"Calculated by HB order_price: {order_price}")
-            order_price *= taker_slippage_adjustment_factor
-            order_price = taker_market.quantize_order_price(taker_trading_pair, order_price)
-            self.log_with_clock(logging.INFO, f"Slippage buffer adjusted order_price: {order_price}")
+        if is_buy:
+            taker_slippage_adjustment_factor = Decimal("1") + self.slippage_buffer
+        else:
+            taker_slippage_adjustment_factor = Decimal("1") - self.slippage_buffer
 
-            if quantized_hedge_amount > s_decimal_zero:
-                self.place_order(
-                    market_pair,
-                    True,
-                    False,
-                    quantized_hedge_amount,
-                    order_price,
-                    maker_order_id,
-                    sell_fill_records,
-                )
+        self.log_with_clock(logging.INFO, f"Calculated by HB order_price: {order_price}")
+        order_price *= taker_slippage_adjustment_factor
+        order_price = taker_market.quantize_order_price(taker_trading_pair, order_price)
+        self.log_with_clock(logging.INFO, f"Slippage buffer adjusted order_price: {order_price}")
 
-                if LogOption.MAKER_ORDER_HEDGED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Hedged maker sell order(s) of "
-                        f"{sell_fill_quantity} {market_pair.maker.base_asset} on taker market to lock in profits. "
-                        f"(maker avg price={avg_fill_price}, taker top={taker_top})"
-                    )
-            else:
+        if amount > s_decimal_zero:
+            self.place_order(
+                market_pair,
+                is_buy,
+                False,
+                amount,
+                order_price,
+                maker_order_id,
+                fill_records
+            )
+
+            if LogOption.MAKER_ORDER_HEDGED in self.logging_options:
                 self.log_with_clock(
                     logging.INFO,
-                    f"({market_pair.maker.trading_pair}) Current maker sell fill amount of "
-                    f"{sell_fill_quantity} {market_pair.maker.base_asset} is less than the minimum order amount "
-                    f"allowed on the taker market. No hedging possible yet."
+                    f"({market_pair.maker.trading_pair}) Hedged maker {maker_side} order(s) of "
+                    f"{fill_quantity} {market_pair.maker.base_asset} on taker market to lock in profits. "
+                    f"(maker avg price={avg_fill_price}, taker top={taker_top})"
                 )
+        else:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_pair.maker.trading_pair}) Current maker {maker_side} fill amount of "
+                f"{fill_quantity} {market_pair.maker.base_asset} is less than the minimum order amount "
+                f"allowed on the taker market. No hedging possible yet."
+            )
 
     def get_adjusted_limit_order_size(self, market_pair: MakerTakerMarketPair) -> Tuple[Decimal, Decimal]:
         """
@@ -1095,9 +1171,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return s_decimal_zero
             else:
                 try:
-                    taker_price = taker_market.get_vwap_for_volume(
-                        taker_trading_pair, False, taker_size
-                    ).result_price
+                    taker_price = self.get_taker_vwap(market_pair, False, taker_size)
                 except ZeroDivisionError:
                     assert size == s_decimal_zero
                     return s_decimal_zero
@@ -1197,7 +1271,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return s_decimal_nan
             else:
                 try:
-                    taker_price = taker_market.get_vwap_for_volume(taker_trading_pair, False, size).result_price
+                    taker_price = self.get_taker_vwap(market_pair, False, size)
                 except ZeroDivisionError:
                     return s_decimal_nan
 
@@ -1246,7 +1320,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return s_decimal_nan
             else:
                 try:
-                    taker_price = taker_market.get_vwap_for_volume(taker_trading_pair, True, size).result_price
+                    taker_price = self.get_taker_vwap(market_pair, True, size)
                 except ZeroDivisionError:
                     return s_decimal_nan
 
@@ -1271,6 +1345,23 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
             return maker_price
 
+    def get_taker_vwap(self, market_pair: MakerTakerMarketPair, is_buy: bool, volume: Decimal) -> Decimal:
+        """
+        Returns the VWAP to fill the volume on the taker order book. Unless the taker is a paper trade exchange, the
+        VWAP is served from a price watch on the book, which the order book diffs keep up to date.
+        :param market_pair: The cross exchange market pair.
+        :param is_buy: Whether the taker order would be a buy.
+        :param volume: The size of the taker order, in the taker base asset.
+        :return: a Decimal which is the VWAP, NaN if the taker order book is not deep enough
+        """
+        taker_market = market_pair.taker.market
+        taker_trading_pair = market_pair.taker.trading_pair
+        if volume > s_decimal_zero:
+            order_book = taker_market.get_order_book(taker_trading_pair)
+            if self._taker_vwap_cache.is_supported(order_book):
+                return self._taker_vwap_cache.get_vwap(order_book, is_buy, volume)
+        return taker_market.get_vwap_for_volume(taker_trading_pair, is_buy, volume).result_price
+
     async def calculate_effective_hedging_price(self,
                                                 market_pair: MarketTradingPairTuple,
                                                 is_bid: bool,
@@ -1303,7 +1394,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return s_decimal_nan
             else:
                 try:
-                    taker_price = taker_market.get_vwap_for_volume(taker_trading_pair, False, size).result_price
+                    taker_price = self.get_taker_vwap(market_pair, False, size)
                 except ZeroDivisionError:
                     return None
 
@@ -1324,7 +1415,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     return s_decimal_nan
             else:
                 try:
-                    taker_price = taker_market.get_vwap_for_volume(taker_trading_pair, True, size).result_price
+                    taker_price = self.get_taker_vwap(market_pair, True, size)
                 except ZeroDivisionError:
                     return None
 
@@ -0,0 +1,63 @@
+from decimal import Decimal
+from typing import Dict, Set, Tuple
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class TakerVWAPCache:
+    """
+    Serves the VWAPs of the taker order books from price watches registered on the books. The watched VWAPs are
+    updated as the diffs are applied, and only walked again when a diff touches the levels they were calculated from,
+    instead of walking the book every time the strategy prices or checks an order.
+    """
+
+    def __init__(self):
+        # The watched order books and volumes, by order book id and volume
+        self._watches: Dict[Tuple[int, float], Tuple[OrderBook, float]] = {}
+        self._used_watches: Set[Tuple[int, float]] = set()
+
+    @staticmethod
+    def is_supported(order_book: OrderBook) -> bool:
+        # The composite order books of the paper trade exchange deduct the simulated fills from their entries, which
+        # the price watches don't see
+        return not isinstance(order_book, CompositeOrderBook)
+
+    @property
+    def watches(self) -> Set[Tuple[OrderBook, float]]:
+        return set(self._watches.values())
+
+    def get_vwap(self, order_book: OrderBook, is_buy: bool, volume: Decimal) -> Decimal:
+        """
+        Returns the VWAP to fill the volume on the order book (NaN if the book is not deep enough), watching the volume
+        from the first call on.
+
+        :param order_book: the taker order book
+        :param is_buy: True for the VWAP of the asks, False for the VWAP of the bids
+        :param volume: the base amount to fill, has to be positive
+        """
+        volume = float(volume)
+        key = (id(order_book), volume)
+        if key not in self._watches:
+            order_book.add_price_change_watch(volume)
+            self._watches[key] = (order_book, volume)
+        self._used_watches.add(key)
+        bid_price, ask_price = order_book.price_watches[volume]
+        return Decimal(str(ask_price if is_buy else bid_price))
+
+    def prune(self):
+        """
+        Removes the watches that weren't used since the last call, e.g. for sizes that changed or books that were
+        replaced, so the books don't keep updating them.
+        """
+        for key in list(self._watches.keys()):
+            if key not in self._used_watches:
+                order_book, volume = self._watches.pop(key)
+                order_book.remove_price_change_watch(volume)
+        self._used_watches.clear()
+
+    def clear(self):
+        for order_book, volume in self._watches.values():
+            order_book.remove_price_change_watch(volume)
+        self._watches.clear()
+        self._used_watches.clear()
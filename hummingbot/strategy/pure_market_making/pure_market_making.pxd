@@ -59,7 +59,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         object _moving_price_band
 
+        object _price_quantum
+        object _size_quantum
+        double _price_tick
+        double _size_tick
+
     cdef object c_get_mid_price(self)
+    cdef tuple c_get_reference_prices(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
@@ -67,6 +73,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_apply_ping_pong(self, object proposal)
     cdef c_apply_order_price_modifiers(self, object proposal)
     cdef c_apply_order_size_modifiers(self, object proposal)
+    cdef object c_get_inventory_skew_ratios(self)
     cdef c_apply_inventory_skew(self, object proposal)
     cdef c_apply_budget_constraint(self, object proposal)
 
@@ -81,3 +88,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
+
+    cdef bint c_update_tick_sizes(self)
+    cdef object c_price_to_decimal(self, double price)
+    cdef object c_size_to_decimal(self, double size)
+    cdef object c_create_proposal_in_ticks(self)
+    cdef object c_create_base_proposal_in_ticks(self)
+    cdef c_apply_order_optimization_in_ticks(self, object proposal)
+    cdef c_floor_proposal_prices_to_tick(self, object proposal)
+    cdef double c_get_fee_percent(self, object order_type, object trade_type, object order)
+    cdef c_apply_add_transaction_costs_in_ticks(self, object proposal)
+    cdef c_apply_inventory_skew_in_ticks(self, object proposal)
+    cdef c_apply_budget_constraint_in_ticks(self, object proposal)
+    cdef object c_floor_to_size_quantum(self, object amount)
+    cdef c_convert_proposal_to_decimal(self, object proposal)
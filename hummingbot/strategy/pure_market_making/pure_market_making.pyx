@@ -1,13 +1,16 @@
 import logging
-from decimal import Decimal
+from decimal import ROUND_FLOOR, Decimal
 from math import ceil, floor
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from libc.math cimport ceil as c_ceil, floor as c_floor, round as c_round
 
 import numpy as np
 import pandas as pd
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -33,6 +36,17 @@ NaN = float("nan")
 s_decimal_zero = Decimal(0)
 s_decimal_neg_one = Decimal(-1)
 pmm_logger = None
+# Error absorbed, in ticks, when rounding a float to a tick, for the values on the grid, e.g. 0.29 / 0.01 = 28.999...
+# It is absolute so that it stays a few ULPs wide, far below a tick, whatever the number of ticks.
+cdef double TICK_EPSILON = 1e-9
+
+
+cdef inline double c_floor_to_tick(double value, double tick):
+    return c_floor(value / tick + TICK_EPSILON) * tick
+
+
+cdef inline double c_ceil_to_tick(double value, double tick):
+    return c_ceil(value / tick - TICK_EPSILON) * tick
 
 
 cdef class PureMarketMakingStrategy(StrategyBase):
@@ -683,6 +697,23 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return "\n".join(lines)
 
+    def get_tick_sizes(self) -> Optional[Tuple[Decimal, Decimal]]:
+        """
+        Returns the price and amount increments of the trading rule of the trading pair when the market quantizes the
+        orders with them, so the proposals can be computed on their grids in floats, None otherwise.
+        """
+        market = self._market_info.market
+        if (not isinstance(market, ExchangePyBase)
+                or type(market).get_order_price_quantum is not ExchangePyBase.get_order_price_quantum
+                or type(market).get_order_size_quantum is not ExchangePyBase.get_order_size_quantum):
+            return None
+        trading_rule = market.trading_rules.get(self.trading_pair)
+        if (trading_rule is None
+                or not trading_rule.min_price_increment > 0
+                or not trading_rule.min_base_amount_increment > 0):
+            return None
+        return Decimal(trading_rule.min_price_increment), Decimal(trading_rule.min_base_amount_increment)
+
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
     def execute_orders_proposal(self, proposal: Proposal):
@@ -739,16 +770,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
+                if self.c_update_tick_sizes():
+                    # Same steps, in floats on the tick grids of the trading rule
+                    proposal = self.c_create_proposal_in_ticks()
+                else:
+                    # 1. Create base order proposals
+                    proposal = self.c_create_base_proposal()
+                    # 2. Apply functions that limit numbers of buys and sells proposal
+                    self.c_apply_order_levels_modifiers(proposal)
+                    # 3. Apply functions that modify orders price
+                    self.c_apply_order_price_modifiers(proposal)
+                    # 4. Apply functions that modify orders size
+                    self.c_apply_order_size_modifiers(proposal)
+                    # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+                    self.c_apply_budget_constraint(proposal)
 
                 if not self._take_if_crossed:
                     self.c_filter_out_takers(proposal)
@@ -763,11 +798,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_base_proposal(self):
+    cdef tuple c_get_reference_prices(self):
         cdef:
             ExchangeBase market = self._market_info.market
-            list buys = []
-            list sells = []
 
         buy_reference_price = sell_reference_price = self.get_price()
 
@@ -780,6 +813,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 base_balance = float(market.get_balance(self._market_info.base_asset))
                 if base_balance > 0:
                     raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
+        return buy_reference_price, sell_reference_price
+
+    cdef object c_create_base_proposal(self):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list buys = []
+            list sells = []
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
 
         # First to check if a customized order override is configured, otherwise the proposal will be created according
         # to order spread, amount, and levels setting.
@@ -887,23 +929,26 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if self._inventory_skew_enabled:
             self.c_apply_inventory_skew(proposal)
 
-    cdef c_apply_inventory_skew(self, object proposal):
-        cdef:
-            ExchangeBase market = self._market_info.market
-            object bid_adj_ratio
-            object ask_adj_ratio
-            object size
-
+    cdef object c_get_inventory_skew_ratios(self):
         base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_orders)
 
         total_order_size = calculate_total_order_size(self._order_amount, self._order_level_amount, self._order_levels)
-        bid_ask_ratios = c_calculate_bid_ask_ratios_from_base_asset_ratio(
+        return c_calculate_bid_ask_ratios_from_base_asset_ratio(
             float(base_balance),
             float(quote_balance),
             float(self.get_price()),
             float(self._inventory_target_base_pct),
             float(total_order_size * self._inventory_range_multiplier)
         )
+
+    cdef c_apply_inventory_skew(self, object proposal):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object bid_adj_ratio
+            object ask_adj_ratio
+            object size
+
+        bid_ask_ratios = self.c_get_inventory_skew_ratios()
         bid_adj_ratio = Decimal(bid_ask_ratios.bid_ratio)
         ask_adj_ratio = Decimal(bid_ask_ratios.ask_ratio)
 
@@ -1054,6 +1099,235 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             price = sell.price * (Decimal(1) + fee.percent)
             sell.price = market.c_quantize_order_price(self.trading_pair, price)
 
+    cdef bint c_update_tick_sizes(self):
+        tick_sizes = self.get_tick_sizes()
+        if tick_sizes is None:
+            return False
+        self._price_quantum, self._size_quantum = tick_sizes
+        self._price_tick = float(self._price_quantum)
+        self._size_tick = float(self._size_quantum)
+        return True
+
+    cdef object c_price_to_decimal(self, double price):
+        return self._price_quantum * <int64_t>c_round(price / self._price_tick)
+
+    cdef object c_size_to_decimal(self, double size):
+        return self._size_quantum * <int64_t>c_round(size / self._size_tick)
+
+    cdef object c_create_proposal_in_ticks(self):
+        """
+        Creates the proposal with the prices and sizes as floats rounded down to the price and amount increments of
+        the trading rule, instead of quantizing Decimals through the market at each step. They are converted to
+        Decimal, as multiples of the increments, once the proposal is complete.
+        """
+        proposal = self.c_create_base_proposal_in_ticks()
+        self.c_apply_order_levels_modifiers(proposal)
+        if self._order_optimization_enabled:
+            self.c_apply_order_optimization_in_ticks(proposal)
+        if self._add_transaction_costs_to_orders:
+            self.c_apply_add_transaction_costs_in_ticks(proposal)
+        elif self._order_optimization_enabled:
+            self.c_floor_proposal_prices_to_tick(proposal)
+        if self._inventory_skew_enabled:
+            self.c_apply_inventory_skew_in_ticks(proposal)
+        self.c_apply_budget_constraint_in_ticks(proposal)
+        self.c_convert_proposal_to_decimal(proposal)
+        return proposal
+
+    cdef object c_create_base_proposal_in_ticks(self):
+        cdef:
+            list buys = []
+            list sells = []
+            double reference_price
+            double price
+            double size
+            double bid_spread = float(self._bid_spread)
+            double ask_spread = float(self._ask_spread)
+            double order_level_spread = float(self._order_level_spread)
+            double order_amount = float(self._order_amount)
+            double order_level_amount = float(self._order_level_amount)
+            int level
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
+
+        order_override = self._order_override
+        if order_override is not None and len(order_override) > 0:
+            for key, value in order_override.items():
+                if str(value[0]) == "buy" and not buy_reference_price.is_nan():
+                    price = c_floor_to_tick(float(buy_reference_price) * (1 - float(value[1]) / 100),
+                                            self._price_tick)
+                    size = c_floor_to_tick(float(value[2]), self._size_tick)
+                    if size > 0 and price > 0:
+                        buys.append(PriceSize(price, size))
+                elif str(value[0]) == "sell" and not sell_reference_price.is_nan():
+                    price = c_floor_to_tick(float(sell_reference_price) * (1 + float(value[1]) / 100),
+                                            self._price_tick)
+                    size = c_floor_to_tick(float(value[2]), self._size_tick)
+                    if size > 0 and price > 0:
+                        sells.append(PriceSize(price, size))
+        else:
+            if not buy_reference_price.is_nan():
+                reference_price = float(buy_reference_price)
+                for level in range(0, self._buy_levels):
+                    price = c_floor_to_tick(reference_price * (1 - bid_spread - level * order_level_spread),
+                                            self._price_tick)
+                    size = c_floor_to_tick(order_amount + order_level_amount * level, self._size_tick)
+                    if size > 0:
+                        buys.append(PriceSize(price, size))
+            if not sell_reference_price.is_nan():
+                reference_price = float(sell_reference_price)
+                for level in range(0, self._sell_levels):
+                    price = c_floor_to_tick(reference_price * (1 + ask_spread + level * order_level_spread),
+                                            self._price_tick)
+                    size = c_floor_to_tick(order_amount + order_level_amount * level, self._size_tick)
+                    if size > 0:
+                        sells.append(PriceSize(price, size))
+
+        return Proposal(buys, sells)
+
+    cdef c_apply_order_optimization_in_ticks(self, object proposal):
+        """
+        Like c_apply_order_optimization, the prices of the levels are left between two price increments, they are
+        rounded down once, by the transaction costs or right after the optimization.
+        """
+        cdef:
+            object own_buy_size = s_decimal_zero
+            object own_sell_size = s_decimal_zero
+            double top_bid_price
+            double top_ask_price
+            double lower_buy_price
+            double higher_sell_price
+            double order_level_spread = float(self._order_level_spread)
+            double spread_ratio
+
+        for order in self.active_orders:
+            if order.is_buy:
+                own_buy_size = order.quantity
+            else:
+                own_sell_size = order.quantity
+
+        if len(proposal.buys) > 0:
+            top_bid_price = float(self._market_info.get_price_for_volume(
+                False, self._bid_order_optimization_depth + own_buy_size).result_price)
+            # The price above the top bid, lowered to the top pricing proposal
+            proposal.buys = sorted(proposal.buys, key = lambda p: p.price, reverse = True)
+            lower_buy_price = min(proposal.buys[0].price,
+                                  c_ceil_to_tick(top_bid_price, self._price_tick) + self._price_tick)
+            for i, proposed in enumerate(proposal.buys):
+                if self._split_order_levels_enabled:
+                    spread_ratio = ((1 - float(self._bid_order_level_spreads[i]) / 100)
+                                    / (1 - float(self._bid_order_level_spreads[0]) / 100))
+                else:
+                    spread_ratio = 1 - order_level_spread * i
+                proposed.price = lower_buy_price * spread_ratio
+
+        if len(proposal.sells) > 0:
+            top_ask_price = float(self._market_info.get_price_for_volume(
+                True, self._ask_order_optimization_depth + own_sell_size).result_price)
+            # The price below the top ask, raised to the top pricing proposal
+            proposal.sells = sorted(proposal.sells, key = lambda p: p.price)
+            higher_sell_price = max(proposal.sells[0].price,
+                                    c_floor_to_tick(top_ask_price, self._price_tick) - self._price_tick)
+            for i, proposed in enumerate(proposal.sells):
+                if self._split_order_levels_enabled:
+                    spread_ratio = ((1 + float(self._ask_order_level_spreads[i]) / 100)
+                                    / (1 + float(self._ask_order_level_spreads[0]) / 100))
+                else:
+                    spread_ratio = 1 + order_level_spread * i
+                proposed.price = higher_sell_price * spread_ratio
+
+    cdef c_floor_proposal_prices_to_tick(self, object proposal):
+        for order in proposal.buys + proposal.sells:
+            order.price = c_floor_to_tick(order.price, self._price_tick)
+
+    cdef double c_get_fee_percent(self, object order_type, object trade_type, object order):
+        cdef:
+            ExchangeBase market = self._market_info.market
+        fee = market.c_get_fee(self.base_asset, self.quote_asset, order_type, trade_type,
+                               self.c_size_to_decimal(order.size), self.c_price_to_decimal(order.price))
+        return float(fee.percent)
+
+    cdef c_apply_add_transaction_costs_in_ticks(self, object proposal):
+        cdef:
+            double fee_percent
+        # The fee percent doesn't depend on the order amount, it is queried once per side
+        if len(proposal.buys) > 0:
+            fee_percent = self.c_get_fee_percent(self._limit_order_type, TradeType.BUY, proposal.buys[0])
+            for buy in proposal.buys:
+                buy.price = c_floor_to_tick(buy.price * (1 - fee_percent), self._price_tick)
+        if len(proposal.sells) > 0:
+            fee_percent = self.c_get_fee_percent(self._limit_order_type, TradeType.SELL, proposal.sells[0])
+            for sell in proposal.sells:
+                sell.price = c_floor_to_tick(sell.price * (1 + fee_percent), self._price_tick)
+
+    cdef c_apply_inventory_skew_in_ticks(self, object proposal):
+        cdef:
+            double bid_adj_ratio
+            double ask_adj_ratio
+
+        bid_ask_ratios = self.c_get_inventory_skew_ratios()
+        bid_adj_ratio = bid_ask_ratios.bid_ratio
+        ask_adj_ratio = bid_ask_ratios.ask_ratio
+
+        for buy in proposal.buys:
+            buy.size = c_floor_to_tick(buy.size * bid_adj_ratio, self._size_tick)
+
+        for sell in proposal.sells:
+            sell.size = c_floor_to_tick(sell.size * ask_adj_ratio, self._size_tick)
+
+    cdef c_apply_budget_constraint_in_ticks(self, object proposal):
+        """
+        Same as c_apply_budget_constraint, the sizes are only converted to Decimal to be compared to the balances and
+        rounded down to them, so that a balance just below a grid point is not rounded up to it.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object quote_size
+            object base_size
+
+        base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+
+        if len(proposal.buys) > 0:
+            buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
+                                       self.c_size_to_decimal(proposal.buys[0].size),
+                                       self.c_price_to_decimal(proposal.buys[0].price))
+            for buy in proposal.buys:
+                price_with_fee = self.c_price_to_decimal(buy.price) * (Decimal(1) + buy_fee.percent)
+                quote_size = self.c_size_to_decimal(buy.size) * price_with_fee
+
+                # Adjust buy order size to use remaining balance if less than the order amount
+                if quote_balance < quote_size:
+                    buy.size = float(self.c_floor_to_size_quantum(quote_balance / price_with_fee))
+                    quote_balance = s_decimal_zero
+                elif quote_balance == s_decimal_zero:
+                    buy.size = 0
+                else:
+                    quote_balance -= quote_size
+
+            proposal.buys = [o for o in proposal.buys if o.size > 0]
+
+        for sell in proposal.sells:
+            base_size = self.c_size_to_decimal(sell.size)
+
+            # Adjust sell order size to use remaining balance if less than the order amount
+            if base_balance < base_size:
+                sell.size = float(self.c_floor_to_size_quantum(base_balance))
+                base_balance = s_decimal_zero
+            elif base_balance == s_decimal_zero:
+                sell.size = 0
+            else:
+                base_balance -= base_size
+
+        proposal.sells = [o for o in proposal.sells if o.size > 0]
+
+    cdef object c_floor_to_size_quantum(self, object amount):
+        return self._size_quantum * (amount / self._size_quantum).to_integral_value(rounding=ROUND_FLOOR)
+
+    cdef c_convert_proposal_to_decimal(self, object proposal):
+        for order in proposal.buys + proposal.sells:
+            order.price = self.c_price_to_decimal(order.price)
+            order.size = self.c_size_to_decimal(order.size)
+
     cdef c_did_fill_order(self, object order_filled_event):
         cdef:
             str order_id = order_filled_event.order_id
@@ -73,6 +73,13 @@ class StrategyV2ConfigBase(BaseClientModel):
             prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
         )
     )
+    aggregate_candles: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: "Aggregate the candles of a trading pair from the feed of its finest interval (True/False): ",
+        )
+    )
 
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
@@ -204,7 +211,7 @@ class StrategyV2Base(ScriptStrategyBase):
         self.listen_to_executor_actions_task: asyncio.Task = asyncio.create_task(self.listen_to_executor_actions())
 
         # Initialize the market data provider
-        self.market_data_provider = MarketDataProvider(connectors)
+        self.market_data_provider = MarketDataProvider(connectors, aggregate_candles=config.aggregate_candles)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
         self.controllers: Dict[str, ControllerBase] = {}
         self.initialize_controllers()
@@ -216,7 +223,7 @@ class StrategyV2Base(ScriptStrategyBase):
         controllers_configs = self.config.load_controller_configs()
         for controller_config in controllers_configs:
             self.add_controller(controller_config)
-            MarketsRecorder.get_instance().store_controller_config(controller_config)
+            MarketsRecorder.get_instance().submit_controller_config(controller_config)
 
     def add_controller(self, config: ControllerConfigBase):
         try:
@@ -251,6 +258,7 @@ class StrategyV2Base(ScriptStrategyBase):
                 controller_id = actions[0].controller_id
                 controller = self.controllers.get(controller_id)
                 controller.executors_info = self.executors_info.get(controller_id, [])
+                controller.executors_index = self.executor_orchestrator.get_executors_index(controller_id)
                 controller.executors_update_event.set()
             except asyncio.CancelledError:
                 raise
@@ -268,6 +276,7 @@ class StrategyV2Base(ScriptStrategyBase):
             self.positions_held = self.executor_orchestrator.get_positions_report()
             for controllers in self.controllers.values():
                 controllers.executors_info = self.executors_info.get(controllers.config.id, [])
+                controllers.executors_index = self.executor_orchestrator.get_executors_index(controllers.config.id)
                 controllers.positions_held = self.positions_held.get(controllers.config.id, [])
         except Exception as e:
             self.logger().error(f"Error updating executors info: {e}", exc_info=True)
@@ -79,6 +79,14 @@ class ArbitrageExecutor(ExecutorBase):
         self.rate_oracle = RateOracle.get_instance()
         self._cumulative_failures = 0
 
+    def register_events(self):
+        super().register_events()
+        # React to book moves on both legs right away instead of polling them every update interval
+        self.watch_order_book_prices(self.buying_market.connector_name, self.buying_market.trading_pair,
+                                     self.order_amount)
+        self.watch_order_book_prices(self.selling_market.connector_name, self.selling_market.trading_pair,
+                                     self.order_amount)
+
     async def validate_sufficient_balance(self):
         base_asset_for_selling_exchange = self.connectors[self.selling_market.connector_name].get_available_balance(
             self.selling_market.trading_pair.split("-")[0])
@@ -1,11 +1,12 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -13,6 +14,8 @@ from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookPriceChangeEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCompletedEvent,
@@ -48,14 +51,26 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # Bumped on order events, status changes and control task iterations, the executor info is rebuilt only when
+        # it changes
+        self._version = 0
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_key: Optional[Tuple] = None
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self._versioned(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self._versioned(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._versioned(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._versioned(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._versioned(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._versioned(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._versioned(self.process_order_failed_event))
+        self._price_change_forwarder = SourceInfoEventForwarder(self.process_price_change_event)
+
+        # Order book price watches registered by the executor: (order book, volume, threshold)
+        self._price_watches: List[Tuple[OrderBook, float, float]] = []
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -103,11 +118,34 @@ class ExecutorBase(RunnableBase):
         """
         return self._status == RunnableStatus.TERMINATED
 
+    @property
+    def version(self) -> int:
+        """
+        Returns the version of the executor state, incremented when it may have changed.
+        """
+        return self._version
+
+    def increment_version(self):
+        """
+        Marks the executor state as changed, so the executor info is rebuilt the next time it is requested. Executors
+        changing their state outside of the order events, the status changes and the control task call it.
+        """
+        self._version += 1
+
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. It is cached until the version, the status or the close type of the executor change,
+        so the strategies and the orchestrator can request it on every tick. The values depending on the market prices
+        (like the net pnl of a position) are refreshed with each control task iteration.
         """
+        executor_info_key = (self._version, self.status, self.close_type, self.close_timestamp)
+        if self._executor_info is None or self._executor_info_key != executor_info_key:
+            self._executor_info = self._build_executor_info()
+            self._executor_info_key = executor_info_key
+        return self._executor_info
+
+    def _build_executor_info(self) -> ExecutorInfo:
         ei = ExecutorInfo(
             id=self.config.id,
             timestamp=self.config.timestamp,
@@ -161,6 +199,7 @@ class ExecutorBase(RunnableBase):
         """
         super().start()
         self.register_events()
+        self.increment_version()
 
     def stop(self):
         """
@@ -169,6 +208,21 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        self.increment_version()
+
+    async def _wait_for_next_iteration(self):
+        # The control task reads the market prices and may change the state of the executor
+        self.increment_version()
+        await super()._wait_for_next_iteration()
+
+    def _versioned(self, process_event: Callable[[int, Any, Any], None]) -> Callable[[int, Any, Any], None]:
+        """
+        Wraps an event processing method to increment the version of the executor with each event.
+        """
+        def process_event_and_increment_version(event_tag: int, source: Any, event: Any):
+            process_event(event_tag, source, event)
+            self.increment_version()
+        return process_event_and_increment_version
 
     async def on_start(self):
         """
@@ -258,6 +312,39 @@ class ExecutorBase(RunnableBase):
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
+        self.unwatch_order_book_prices()
+
+    def watch_order_book_prices(self, connector_name: str, trading_pair: str, volume: Decimal,
+                                threshold: Decimal = Decimal("0")):
+        """
+        Subscribes to the price changes of the order book of the specified trading pair, so the control task runs as
+        soon as the VWAP for the volume moves instead of waiting for the next update interval. Connectors without an
+        order book (AMMs) are skipped.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair.
+        :param volume: The base amount to watch the VWAP for, 0 to watch the best bid and ask.
+        :param threshold: The relative price change that wakes up the executor.
+        """
+        if self.is_amm_connector(exchange=connector_name):
+            return
+        try:
+            order_book = self.connectors[connector_name].get_order_book(trading_pair)
+        except ValueError:
+            self.logger().warning(f"No order book available to watch for {connector_name}:{trading_pair}.")
+            return
+        order_book.add_price_change_watch(float(volume), float(threshold))
+        order_book.add_listener(OrderBookEvent.PriceChangeEvent, self._price_change_forwarder)
+        self._price_watches.append((order_book, float(volume), float(threshold)))
+
+    def unwatch_order_book_prices(self):
+        """
+        Removes all the order book price watches registered by the executor.
+        """
+        for order_book, volume, threshold in self._price_watches:
+            order_book.remove_listener(OrderBookEvent.PriceChangeEvent, self._price_change_forwarder)
+            order_book.remove_price_change_watch(volume, threshold)
+        self._price_watches = []
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -403,6 +490,19 @@ class ExecutorBase(RunnableBase):
         """
         pass
 
+    def process_price_change_event(self,
+                                   event_tag: int,
+                                   order_book: OrderBook,
+                                   event: OrderBookPriceChangeEvent):
+        """
+        Processes the price change event of a watched order book by waking up the control loop.
+
+        :param event_tag: The event tag.
+        :param order_book: The order book where the event occurred.
+        :param event: The event.
+        """
+        self.wake_up()
+
     def process_order_failed_event(self,
                                    event_tag: int,
                                    market: ConnectorBase,
@@ -30,7 +30,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors import CloseType
-from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, ExecutorsIndex, PerformanceReport
 
 
 class PositionSummary(BaseModel):
@@ -115,21 +115,19 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = []
         self.cached_performance = {}
+        self.executors_indexes: Dict[str, ExecutorsIndex] = {}
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
         """
-        Initialize cached performance by querying the database for stored executors.
+        Initialize cached performance from the running totals of the stored executors of each controller.
         """
-        db_executors = MarketsRecorder.get_instance().get_all_executors()
-        for executor in db_executors:
-            controller_id = executor.controller_id
-            if controller_id not in self.cached_performance:
-                self.cached_performance[controller_id] = PerformanceReport()
-                self.active_executors[controller_id] = []
-                self.archived_executors[controller_id] = []
-                self.positions_held[controller_id] = []
-            self._update_cached_performance(controller_id, executor)
+        controllers_performance = MarketsRecorder.get_instance().get_controllers_performance()
+        for controller_id, report in controllers_performance.items():
+            self.cached_performance[controller_id] = report
+            self.active_executors[controller_id] = []
+            self.archived_executors[controller_id] = []
+            self.positions_held[controller_id] = []
 
     def _update_cached_performance(self, controller_id: str, executor_info: ExecutorInfo):
         """
@@ -158,9 +156,9 @@ class ExecutorOrchestrator:
         """
         Store all positions in the database.
         """
-        markets_recorder = MarketsRecorder.get_instance()
+        position_records = []
         for controller_id, positions_list in self.positions_held.items():
-            for position in positions_list:
+            for position in list(positions_list):
                 mid_price = self.strategy.market_data_provider.get_price_by_type(
                     position.connector_name, position.trading_pair, PriceType.MidPrice)
                 position_summary = position.get_position_summary(mid_price)
@@ -179,18 +177,23 @@ class ExecutorOrchestrator:
                     cum_fees_quote=position_summary.cum_fees_quote,
                     filled_orders=position.filled_orders
                 )
-                # Store the position in the database
-                markets_recorder.store_position(position_record)
+                position_records.append(position_record)
                 # Remove the position from the list
                 self.positions_held[controller_id].remove(position)
+        # Store the positions in the database, off the event loop
+        if len(position_records) > 0:
+            MarketsRecorder.get_instance().submit_positions(position_records)
 
     def store_all_executors(self):
+        """
+        Store all active executors in the database, off the event loop, in batches.
+        """
+        executors = []
         for controller_id, executors_list in self.active_executors.items():
-            for executor in executors_list:
-                # Store the executor in the database
-                MarketsRecorder.get_instance().store_or_update_executor(executor)
-                # Remove the executor from the list
-                self.active_executors[controller_id].remove(executor)
+            executors.extend(executors_list)
+            executors_list.clear()
+        if len(executors) > 0:
+            MarketsRecorder.get_instance().submit_executors(executors)
 
     def execute_action(self, action: ExecutorAction):
         """
@@ -280,7 +283,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} is still active.")
             return
         try:
-            MarketsRecorder.get_instance().store_or_update_executor(executor)
+            MarketsRecorder.get_instance().submit_executors([executor])
             self._update_cached_performance(controller_id, executor.executor_info)
         except Exception as e:
             self.logger().error(f"Error storing executor id {executor_id}: {str(e)}.")
@@ -292,13 +295,25 @@ class ExecutorOrchestrator:
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
-        Generate a report of all executors.
+        Generate a report of all executors. The executors info are cached by the executors until they change, the
+        index of a controller is built again only when some of them changed.
         """
         report = {}
         for controller_id, executors_list in self.active_executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+            executors_info = [executor.executor_info for executor in executors_list if executor]
+            executors_index = self.executors_indexes.get(controller_id)
+            if executors_index is None or not executors_index.is_built_from(executors_info):
+                executors_index = ExecutorsIndex(executors_info)
+                self.executors_indexes[controller_id] = executors_index
+            report[controller_id] = executors_index.executors
         return report
 
+    def get_executors_index(self, controller_id: str) -> ExecutorsIndex:
+        """
+        Returns the executors info of the controller indexed by status, side and level id, as of the last report.
+        """
+        return self.executors_indexes.get(controller_id) or ExecutorsIndex([])
+
     def get_positions_report(self) -> Dict[str, List[PositionHeld]]:
         """
         Generate a report of all positions held.
@@ -1,8 +1,8 @@
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
@@ -57,10 +57,24 @@ class GridLevel(BaseModel):
     active_open_order: Optional[TrackedOrder] = None
     active_close_order: Optional[TrackedOrder] = None
     state: GridLevelStates = GridLevelStates.NOT_ACTIVE
+    # Called when the active orders of the level are replaced, see set_orders_listener
+    _orders_listener: Optional[Callable[["GridLevel"], None]] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("active_open_order", "active_close_order") and self._orders_listener is not None:
+            self._orders_listener(self)
+
+    def set_orders_listener(self, listener: Optional[Callable[["GridLevel"], None]]):
+        """
+        Sets the function called with the level every time one of its active orders is set or reset, so the owner of
+        the level only has to update the state of the levels with orders.
+        """
+        self._orders_listener = listener
+
     def update_state(self):
         if self.active_open_order is None:
             self.state = GridLevelStates.NOT_ACTIVE
@@ -2,7 +2,9 @@ import asyncio
 import logging
 import math
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
+
+import numpy as np
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -24,6 +26,9 @@ from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
 from hummingbot.strategy_v2.utils.distributions import Distributions
 
+STATE_CODES = {state: code for code, state in enumerate(GridLevelStates)}
+NOT_ACTIVE_CODE = STATE_CODES[GridLevelStates.NOT_ACTIVE]
+
 
 class GridExecutor(ExecutorBase):
     _logger = None
@@ -59,6 +64,7 @@ class GridExecutor(ExecutorBase):
         # Grid levels
         self.grid_levels = self._generate_grid_levels()
         self.levels_by_state = {state: [] for state in GridLevelStates}
+        self._init_levels_index()
         self._close_order: Optional[TrackedOrder] = None
         self._filled_orders = []
         self._failed_orders = []
@@ -203,6 +209,45 @@ class GridExecutor(ExecutorBase):
         )
         return grid_levels
 
+    def _init_levels_index(self):
+        """
+        Builds the array-backed index of the grid levels: the prices as floats, sorted for the binary searches of the
+        activation bounds, the state code of each level and the level of each order id. Only the levels with orders
+        can change state, so they are the only ones updated by update_grid_levels.
+        """
+        self._level_indexes: Dict[str, int] = {level.id: index for index, level in enumerate(self.grid_levels)}
+        self._level_prices = np.array([float(level.price) for level in self.grid_levels], dtype=np.float64)
+        self._levels_by_price = np.argsort(self._level_prices, kind="stable")
+        self._sorted_level_prices = self._level_prices[self._levels_by_price]
+        self._level_states = np.full(len(self.grid_levels), NOT_ACTIVE_CODE, dtype=np.int8)
+        self._levels_with_orders: Set[int] = set()
+        self._order_levels: Dict[str, int] = {}
+        self._not_active_levels: List[GridLevel] = []
+        self._not_active_levels_changed = True
+        for level in self.grid_levels:
+            level.set_orders_listener(self._on_level_orders_changed)
+            if level.active_open_order is not None or level.active_close_order is not None:
+                self._on_level_orders_changed(level)
+
+    def _on_level_orders_changed(self, level: GridLevel):
+        index = self._level_indexes.get(level.id)
+        if index is None or self.grid_levels[index] is not level:
+            return
+        self._levels_with_orders.add(index)
+        for order in (level.active_open_order, level.active_close_order):
+            if order is not None:
+                self._order_levels[order.order_id] = index
+
+    def _level_with_order(self, order_id: str) -> Optional[GridLevel]:
+        index = self._order_levels.get(order_id)
+        return self.grid_levels[index] if index is not None else None
+
+    def _set_level_state(self, index: int, state: GridLevelStates):
+        code = STATE_CODES[state]
+        if (self._level_states[index] == NOT_ACTIVE_CODE) != (code == NOT_ACTIVE_CODE):
+            self._not_active_levels_changed = True
+        self._level_states[index] = code
+
     @property
     def end_time(self) -> Optional[float]:
         """
@@ -282,21 +327,35 @@ class GridExecutor(ExecutorBase):
         self.close_type = CloseType.POSITION_HOLD if keep_position else CloseType.EARLY_STOP
 
     def update_grid_levels(self):
-        self.levels_by_state = {state: [] for state in GridLevelStates}
-        for level in self.grid_levels:
+        """
+        Updates the state of the levels with orders and groups the levels by state, in the order of the grid. The levels
+        without orders are not active and keep their state, so the list of the not active levels is only built again
+        when a level is activated or reset.
+        """
+        levels_by_state = {state: [] for state in GridLevelStates}
+        for index in sorted(self._levels_with_orders):
+            level = self.grid_levels[index]
             level.update_state()
-            self.levels_by_state[level.state].append(level)
-        completed = self.levels_by_state[GridLevelStates.COMPLETE]
-        # Get completed orders and store them in the filled orders list
-        for level in completed:
-            if level.active_open_order.order.completely_filled_event.is_set() and level.active_close_order.order.completely_filled_event.is_set():
-                open_order = level.active_open_order.order.to_json()
-                close_order = level.active_close_order.order.to_json()
-                self._filled_orders.append(open_order)
-                self._filled_orders.append(close_order)
-                self.levels_by_state[GridLevelStates.COMPLETE].remove(level)
+            # Get completed orders and store them in the filled orders list
+            if level.state == GridLevelStates.COMPLETE and \
+                    level.active_open_order.order.completely_filled_event.is_set() and \
+                    level.active_close_order.order.completely_filled_event.is_set():
+                self._filled_orders.append(level.active_open_order.order.to_json())
+                self._filled_orders.append(level.active_close_order.order.to_json())
+                self._order_levels.pop(level.active_open_order.order_id, None)
+                self._order_levels.pop(level.active_close_order.order_id, None)
                 level.reset_level()
-                self.levels_by_state[GridLevelStates.NOT_ACTIVE].append(level)
+            if level.active_open_order is None and level.active_close_order is None:
+                self._levels_with_orders.discard(index)
+            self._set_level_state(index, level.state)
+            if level.state != GridLevelStates.NOT_ACTIVE:
+                levels_by_state[level.state].append(level)
+        if self._not_active_levels_changed:
+            self._not_active_levels = [self.grid_levels[index] for index in
+                                       np.flatnonzero(self._level_states == NOT_ACTIVE_CODE)]
+            self._not_active_levels_changed = False
+        levels_by_state[GridLevelStates.NOT_ACTIVE] = self._not_active_levels
+        self.levels_by_state = levels_by_state
 
     async def control_shutdown_process(self):
         """
@@ -475,14 +534,13 @@ class GridExecutor(ExecutorBase):
         is an open order. If not, it will place a new orders from the proposed grid levels based on the current price,
         max open orders, max orders per batch, activation bounds and order frequency.
         """
-        n_open_orders = len(
-            [level.active_open_order for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]])
+        n_open_orders = len(self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED])
         if (self.max_open_creation_timestamp > self._strategy.current_timestamp - self.config.order_frequency or
                 n_open_orders >= self.config.max_open_orders):
             return []
-        levels_allowed = self._filter_levels_by_activation_bounds()
-        sorted_levels_by_proximity = self._sort_levels_by_proximity(levels_allowed)
-        return sorted_levels_by_proximity[:self.config.max_orders_per_batch]
+        indexes_allowed = self._filter_levels_by_activation_bounds()
+        sorted_indexes_by_proximity = self._sort_levels_by_proximity(indexes_allowed)
+        return [self.grid_levels[index] for index in sorted_indexes_by_proximity[:self.config.max_orders_per_batch]]
 
     def get_close_orders_to_create(self):
         """
@@ -537,19 +595,41 @@ class GridExecutor(ExecutorBase):
             return close_orders_to_cancel
         return []
 
-    def _filter_levels_by_activation_bounds(self):
-        not_active_levels = self.levels_by_state[GridLevelStates.NOT_ACTIVE]
+    def _filter_levels_by_activation_bounds(self) -> np.ndarray:
+        """
+        Returns the indexes of the not active levels inside the activation bounds, in the order of the grid. The bounds
+        are found with a binary search on the sorted prices.
+        """
+        start, end = 0, len(self.grid_levels)
         if self.config.activation_bounds:
             if self.config.side == TradeType.BUY:
-                activation_bounds_price = self.mid_price * (1 - self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price >= activation_bounds_price]
+                start = self._price_position(self.mid_price * (1 - self.config.activation_bounds), side="left")
             else:
-                activation_bounds_price = self.mid_price * (1 + self.config.activation_bounds)
-                return [level for level in not_active_levels if level.price <= activation_bounds_price]
-        return not_active_levels
+                end = self._price_position(self.mid_price * (1 + self.config.activation_bounds), side="right")
+        indexes = self._levels_by_price[start:end]
+        return np.sort(indexes[self._level_states[indexes] == NOT_ACTIVE_CODE])
+
+    def _price_position(self, price: Decimal, side: str) -> int:
+        """
+        Returns the position of the price in the sorted level prices, as numpy.searchsorted, corrected with the
+        decimal prices of the levels next to it so the bound is the same as comparing the decimal prices.
+        """
+        position = int(np.searchsorted(self._sorted_level_prices, float(price), side=side))
+        levels_by_price = self._levels_by_price
+
+        def before(level_position: int) -> bool:
+            level_price = self.grid_levels[levels_by_price[level_position]].price
+            return level_price < price if side == "left" else level_price <= price
+
+        while position > 0 and not before(position - 1):
+            position -= 1
+        while position < len(levels_by_price) and before(position):
+            position += 1
+        return position
 
-    def _sort_levels_by_proximity(self, levels: List[GridLevel]):
-        return sorted(levels, key=lambda level: abs(level.price - self.mid_price))
+    def _sort_levels_by_proximity(self, indexes: np.ndarray) -> np.ndarray:
+        distances = np.abs(self._level_prices[indexes] - float(self.mid_price))
+        return indexes[np.argsort(distances, kind="stable")]
 
     def control_triple_barrier(self):
         """
@@ -731,7 +811,8 @@ class GridExecutor(ExecutorBase):
         self.update_grid_levels()
         in_flight_order = self.get_in_flight_order(self.config.connector_name, order_id)
         if in_flight_order:
-            for level in self.grid_levels:
+            level = self._level_with_order(order_id)
+            if level is not None:
                 if level.active_open_order and level.active_open_order.order_id == order_id:
                     level.active_open_order.order = in_flight_order
                 if level.active_close_order and level.active_close_order.order_id == order_id:
@@ -766,17 +847,18 @@ class GridExecutor(ExecutorBase):
         This method is responsible for processing the order canceled event
         """
         self.update_grid_levels()
-        levels_open_order_placed = [level for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]]
-        levels_close_order_placed = [level for level in self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]]
-        for level in levels_open_order_placed:
-            if event.order_id == level.active_open_order.order_id:
+        level = self._level_with_order(event.order_id)
+        if level is not None:
+            if level.state == GridLevelStates.OPEN_ORDER_PLACED and event.order_id == level.active_open_order.order_id:
                 self._canceled_orders.append(level.active_open_order.order_id)
                 self.max_open_creation_timestamp = 0
+                self._order_levels.pop(event.order_id, None)
                 level.reset_open_order()
-        for level in levels_close_order_placed:
-            if event.order_id == level.active_close_order.order_id:
+            elif level.state == GridLevelStates.CLOSE_ORDER_PLACED and \
+                    event.order_id == level.active_close_order.order_id:
                 self._canceled_orders.append(level.active_close_order.order_id)
                 self.max_close_creation_timestamp = 0
+                self._order_levels.pop(event.order_id, None)
                 level.reset_close_order()
         if self._close_order and event.order_id == self._close_order.order_id:
             self._canceled_orders.append(self._close_order.order_id)
@@ -788,17 +870,18 @@ class GridExecutor(ExecutorBase):
         failed orders list.
         """
         self.update_grid_levels()
-        levels_open_order_placed = [level for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]]
-        levels_close_order_placed = [level for level in self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]]
-        for level in levels_open_order_placed:
-            if event.order_id == level.active_open_order.order_id:
+        level = self._level_with_order(event.order_id)
+        if level is not None:
+            if level.state == GridLevelStates.OPEN_ORDER_PLACED and event.order_id == level.active_open_order.order_id:
                 self._failed_orders.append(level.active_open_order.order_id)
                 self.max_open_creation_timestamp = 0
+                self._order_levels.pop(event.order_id, None)
                 level.reset_open_order()
-        for level in levels_close_order_placed:
-            if event.order_id == level.active_close_order.order_id:
+            elif level.state == GridLevelStates.CLOSE_ORDER_PLACED and \
+                    event.order_id == level.active_close_order.order_id:
                 self._failed_orders.append(level.active_close_order.order_id)
                 self.max_close_creation_timestamp = 0
+                self._order_levels.pop(event.order_id, None)
                 level.reset_close_order()
         if self._close_order and event.order_id == self._close_order.order_id:
             self._failed_orders.append(self._close_order.order_id)
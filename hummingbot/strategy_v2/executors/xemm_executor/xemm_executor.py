@@ -100,6 +100,11 @@ class XEMMExecutor(ExecutorBase):
                          connectors=[config.buying_market.connector_name, config.selling_market.connector_name],
                          config=config, update_interval=update_interval)
 
+    def register_events(self):
+        super().register_events()
+        # Re-price the maker order as soon as the taker book moves instead of polling it every update interval
+        self.watch_order_book_prices(self.taker_connector, self.taker_trading_pair, self.config.order_amount)
+
     async def validate_sufficient_balance(self):
         mid_price = self.get_price(self.maker_connector, self.maker_trading_pair,
                                    price_type=PriceType.MidPrice)
@@ -53,6 +53,42 @@ class ExecutorInfo(BaseModel):
         return base_dict
 
 
+class ExecutorsIndex:
+    """
+    The executors info of a controller indexed by the filters the controllers use the most. The orchestrator builds it
+    again only when the executors info of the controller change.
+    """
+
+    def __init__(self, executors: List[ExecutorInfo]):
+        self.executors = executors
+        self.active: List[ExecutorInfo] = []
+        self.by_side: Dict[TradeType, List[ExecutorInfo]] = {}
+        self.by_level_id: Dict[str, List[ExecutorInfo]] = {}
+        for executor in executors:
+            if executor.is_active:
+                self.active.append(executor)
+            side = executor.side
+            if side is not None:
+                self.by_side.setdefault(side, []).append(executor)
+            level_id = executor.custom_info.get("level_id")
+            if level_id is not None:
+                self.by_level_id.setdefault(level_id, []).append(executor)
+
+    def is_built_from(self, executors: List[ExecutorInfo]) -> bool:
+        """
+        Returns True when the index was built from the same executors info objects.
+        """
+        return len(executors) == len(self.executors) and all(
+            executor is indexed_executor for executor, indexed_executor in zip(executors, self.executors))
+
+    def active_by_side(self, side: TradeType) -> List[ExecutorInfo]:
+        return [executor for executor in self.by_side.get(side, []) if executor.is_active]
+
+    def active_level_ids(self) -> List[str]:
+        return [level_id for level_id, executors in self.by_level_id.items()
+                if any(executor.is_active for executor in executors)]
+
+
 class ExecutorHandlerInfo(BaseModel):
     controller_id: str
     timestamp: float
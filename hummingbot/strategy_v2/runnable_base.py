@@ -29,6 +29,7 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._wake_up_event = asyncio.Event()
 
     @property
     def status(self):
@@ -58,6 +59,13 @@ class RunnableBase(ABC):
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
 
+    def wake_up(self):
+        """
+        Request the control loop to execute the next control task right away instead of waiting for the
+        update interval to elapse.
+        """
+        self._wake_up_event.set()
+
     async def control_loop(self):
         """
         The main control loop of the smart component.
@@ -70,9 +78,19 @@ class RunnableBase(ABC):
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
-                await asyncio.sleep(self.update_interval)
+                await self._wait_for_next_iteration()
         self.on_stop()
 
+    async def _wait_for_next_iteration(self):
+        """
+        Waits for the update interval, or less if a wake up was requested in the meantime.
+        """
+        try:
+            await asyncio.wait_for(self._wake_up_event.wait(), timeout=self.update_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_up_event.clear()
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
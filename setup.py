@@ -96,6 +96,7 @@ def main():
         "pyperclip",
         "python-dateutil",
         "python-telegram-bot==12.8",
+        "pyarrow>=13.0.0",
         "pyOpenSSL",
         "requests",
         "rsa",
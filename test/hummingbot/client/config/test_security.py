@@ -1,8 +1,10 @@
 import asyncio
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -115,6 +117,26 @@ class SecurityTest(unittest.TestCase):
 
         self.assertEqual(expected_keys, api_keys)
 
+    def test_decrypt_all_decrypts_the_connector_configs_in_the_thread_pool(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+        decryption_threads = []
+
+        def load_connector_config_map_from_file(file_path: Path) -> ClientConfigAdapter:
+            decryption_threads.append(threading.current_thread().name)
+            return config_helpers.load_connector_config_map_from_file(file_path)
+
+        with patch.object(security, "load_connector_config_map_from_file", side_effect=load_connector_config_map_from_file):
+            Security.decrypt_all()
+
+        self.assertTrue(Security.is_decryption_done())
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+        self.assertEqual(1, len(decryption_threads))
+        self.assertTrue(decryption_threads[0].startswith("connector_config_decryption"))
+
     def test_update_secure_config(self):
         password = "som-password"
         secrets_manager = ETHKeyFileSecretManger(password)
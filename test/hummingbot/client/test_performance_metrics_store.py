@@ -0,0 +1,140 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_metrics_store import PerformanceMetricsStore
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_aggregate import TradeFillAggregate
+
+
+class PerformanceMetricsStoreTests(unittest.TestCase):
+    config_file_path = "test_config.yml"
+    market = "binance"
+    trading_pair = "COINALPHA-HBOT"
+    session_start = 1640000000
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        # A file database, the in memory ones are not shared with the worker threads
+        engine_mock.return_value = create_engine(f"sqlite:///{Path(self.db_dir.name) / 'test.sqlite'}")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.store = PerformanceMetricsStore(session_start_timestamp=self.session_start)
+
+        rate_oracle = RateOracle()
+        rate_oracle._prices[self.trading_pair] = Decimal("110")
+        rate_oracle._prices["USDT-HBOT"] = Decimal("2")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        self.manager.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def trade_fill(self, trade_id: int, trade_type: str, price: int, amount: int, timestamp: int) -> TradeFill:
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("USDT", Decimal("0.5"))])
+        base, quote = self.trading_pair.split("-")
+        return TradeFill(
+            user_name="user",
+            config_file_path=self.config_file_path,
+            strategy="pure_market_making",
+            market=self.market,
+            symbol=self.trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=f"OID{trade_id}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=f"TID{trade_id}",
+            position=PositionAction.NIL.value,
+        )
+
+    def record_trade_fill(self, trade_fill: TradeFill):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(trade_fill)
+                self.store.record_trade_fill(session, trade_fill)
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, actual: PerformanceMetrics):
+        for metric in ("num_buys", "num_sells", "b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote",
+                       "avg_tot_price", "start_price", "cur_price", "hold_value", "cur_value", "trade_pnl",
+                       "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(expected, metric), getattr(actual, metric), metric)
+
+    def test_session_and_persisted_aggregates_match_full_calculation(self):
+        trades = [
+            self.trade_fill(1, "BUY", 100, 10, (self.session_start + 1) * 1000),
+            self.trade_fill(2, "SELL", 120, 15, (self.session_start + 2) * 1000),
+            self.trade_fill(3, "BUY", 105, 2, (self.session_start + 3) * 1000),
+        ]
+        for trade in trades:
+            self.record_trade_fill(trade)
+
+        with self.manager.get_new_session() as session:
+            records = TradeFillAggregate.get_records(session, self.config_file_path)
+            self.assertEqual(1, len(records))
+            self.assertTrue(records[0].is_complete)
+            session_aggregates = self.store.get_aggregates(session, self.config_file_path, self.session_start)
+            persisted_aggregates = self.store.get_aggregates(session, self.config_file_path, self.session_start - 10)
+            # Trades sorted from the newest to the oldest, as queried by the history command
+            trades = session.query(TradeFill).order_by(TradeFill.timestamp.desc()).all()
+            balances = {"COINALPHA": Decimal("100"), "HBOT": Decimal("10000")}
+            expected = self.async_run_with_timeout(PerformanceMetrics.create(self.trading_pair, trades, balances))
+
+        for aggregates in (session_aggregates, persisted_aggregates):
+            self.assertEqual(1, len(aggregates))
+            self.assertEqual(3, aggregates[0].num_trades)
+            actual = self.async_run_with_timeout(
+                PerformanceMetrics.create_from_aggregate(self.trading_pair, aggregates[0], balances))
+            self.assert_same_metrics(expected, actual)
+
+    def test_incomplete_aggregates_are_recalculated_from_trades(self):
+        # A trade recorded before the totals were kept
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(self.trade_fill(1, "BUY", 100, 10, (self.session_start - 100) * 1000))
+        self.record_trade_fill(self.trade_fill(2, "SELL", 120, 5, (self.session_start + 1) * 1000))
+
+        with self.manager.get_new_session() as session:
+            self.assertFalse(TradeFillAggregate.get_records(session, self.config_file_path)[0].is_complete)
+            self.assertIsNone(self.store.get_aggregates(session, self.config_file_path, self.session_start - 1000))
+            # The trades of the current session are still available
+            self.assertEqual(1, self.store.get_aggregates(session, self.config_file_path, self.session_start)[0].num_trades)
+
+        aggregates = self.async_run_with_timeout(self.store.recalculate_aggregates(
+            self.manager, self.config_file_path, self.session_start - 50))
+
+        self.assertEqual(1, len(aggregates))
+        self.assertEqual(1, aggregates[0].num_trades)
+        self.assertEqual(Decimal("-5"), aggregates[0].s_vol_base)
+        with self.manager.get_new_session() as session:
+            self.assertTrue(TradeFillAggregate.get_records(session, self.config_file_path)[0].is_complete)
+            all_time_aggregates = self.store.get_aggregates(session, self.config_file_path, self.session_start - 1000)
+        self.assertEqual(2, all_time_aggregates[0].num_trades)
+        self.assertEqual(Decimal("10"), all_time_aggregates[0].b_vol_base)
@@ -981,6 +981,80 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_requests_individually_only_the_orders_missing_from_open_orders(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        canceled_order = self.exchange.in_flight_orders["OID2"]
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.get(regex_url, body=json.dumps([self._order_status_request_open_mock_response(order=open_order)]))
+        order_url = self.configure_canceled_order_status_response(order=canceled_order, mock_api=mock_api)
+        trades_url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        mock_api.get(re.compile(f"^{trades_url}".replace(".", r"\.").replace("?", r"\?")), body=json.dumps([]))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_request.kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(canceled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+        self.assertTrue(open_order.is_open)
+        self.assertTrue(canceled_order.is_cancelled)
+
+    def test_orders_to_poll_prioritizes_stale_orders_and_skips_orders_updated_by_the_user_stream(self):
+        for order_id, creation_timestamp in (("OID1", 1640780010), ("OID2", 1640780000), ("OID3", 1640780020)):
+            self.exchange._set_current_timestamp(creation_timestamp)
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=None,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        # Updated by the user stream after its last status request
+        self.exchange.in_flight_orders["OID3"].last_update_timestamp = 1640780095
+        self.exchange._order_status_poll_timestamps["OID3"] = 1640780090
+        orders = list(self.exchange.in_flight_orders.values())
+
+        with patch.object(self.exchange, "_time", return_value=1640780100):
+            orders_to_poll = self.exchange._orders_to_poll(orders=orders)
+            self.assertEqual(["OID2", "OID1"], [order.client_order_id for order in orders_to_poll])
+
+            with patch.object(self.exchange, "_order_status_requests_per_poll", return_value=1):
+                orders_to_poll = self.exchange._orders_to_poll(orders=orders)
+                self.assertEqual(["OID2"], [order.client_order_id for order in orders_to_poll])
+
+        backoff_end = 1640780095 + self.exchange.ORDER_STATUS_CONFIRMATION_BACKOFF
+        with patch.object(self.exchange, "_time", return_value=backoff_end):
+            orders_to_poll = self.exchange._orders_to_poll(orders=orders)
+            self.assertEqual(["OID2", "OID1", "OID3"], [order.client_order_id for order in orders_to_poll])
+
+    def test_order_status_requests_per_poll_fits_in_the_rate_limits(self):
+        self.exchange._set_current_timestamp(1640780000)
+        # The most restrictive limit linked to the order status requests is the daily orders limit
+        orders_per_second = 200000 / CONSTANTS.ONE_DAY
+        expected = int(
+            orders_per_second * self.exchange.SHORT_POLL_INTERVAL * self.exchange.ORDER_STATUS_POLL_RATE_SHARE)
+
+        self.assertEqual(expected, self.exchange._order_status_requests_per_poll())
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
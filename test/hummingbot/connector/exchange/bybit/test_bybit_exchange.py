@@ -829,6 +829,189 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    def test_batch_order_max_sizes_are_only_enabled_for_unified_accounts(self):
+        self.exchange._account_type = "SPOT"
+        self.assertEqual(1, self.exchange.batch_order_create_max_size)
+        self.assertEqual(1, self.exchange.batch_order_cancel_max_size)
+
+        self.exchange._account_type = "UNIFIED"
+        self.assertEqual(CONSTANTS.MAX_ORDERS_PER_BATCH, self.exchange.batch_order_create_max_size)
+        self.assertEqual(CONSTANTS.MAX_ORDERS_PER_BATCH, self.exchange.batch_order_cancel_max_size)
+
+    def test_split_orders_for_batch_uses_the_batch_max_size(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"OID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1"),
+                creation_timestamp=1640780000,
+                price=Decimal("10000"),
+            )
+            for i in range(CONSTANTS.MAX_ORDERS_PER_BATCH + 1)
+        ]
+
+        self.exchange._account_type = "UNIFIED"
+        create_batches = self.exchange._split_orders_for_batch_create(orders)
+        cancel_batches = self.exchange._split_orders_for_batch_cancel(orders)
+        self.assertEqual([CONSTANTS.MAX_ORDERS_PER_BATCH, 1], [len(batch) for batch in create_batches])
+        self.assertEqual([CONSTANTS.MAX_ORDERS_PER_BATCH, 1], [len(batch) for batch in cancel_batches])
+
+        self.exchange._account_type = "SPOT"
+        create_batches = self.exchange._split_orders_for_batch_create(orders)
+        self.assertEqual([1] * len(orders), [len(batch) for batch in create_batches])
+
+    @aioresponses()
+    def test_create_orders_in_the_same_iteration_uses_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange._account_type = "UNIFIED"
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_PLACE_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "someExchId", "orderLinkId": "OID1"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "", "orderLinkId": "OID2"},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 170131, "msg": "Insufficient balance."},
+                ]
+            },
+            "time": 1640780000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        async def create_orders():
+            await asyncio.gather(
+                self.exchange._create_order(
+                    trade_type=TradeType.BUY,
+                    order_id="OID1",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("100"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("10000"),
+                ),
+                self.exchange._create_order(
+                    trade_type=TradeType.SELL,
+                    order_id="OID2",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("100"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("10001"),
+                ),
+            )
+
+        self.async_run_with_timeout(create_orders())
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(order_request[1]))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["orderLinkId"] for order_data in request_data["request"]])
+        self.assertEqual([CONSTANTS.SIDE_BUY, CONSTANTS.SIDE_SELL], [order_data["side"] for order_data in request_data["request"]])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("someExchId", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(0, len(self.sell_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    @aioresponses()
+    def test_cancel_orders_batch_reports_the_result_of_each_order(self, mock_api):
+        self.exchange._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+        orders = [
+            InFlightOrder(
+                client_order_id="OID1",
+                exchange_order_id="4",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("100"),
+                creation_timestamp=1640780000,
+                price=Decimal("10000"),
+            ),
+            InFlightOrder(
+                client_order_id="OID2",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.SELL,
+                amount=Decimal("100"),
+                creation_timestamp=1640780000,
+                price=Decimal("10001"),
+            ),
+        ]
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "4", "orderLinkId": "OID1"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "", "orderLinkId": ""},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 170213, "msg": "Order does not exist."},
+                ]
+            },
+            "time": 1640780000
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._cancel_orders_batch(orders))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(cancel_request[1][0])
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual(
+            [{"symbol": self.ex_trading_pair, "orderId": "4"}, {"symbol": self.ex_trading_pair, "orderLinkId": "OID2"}],
+            request_data["request"])
+
+        self.assertEqual(2, len(results))
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual("Order does not exist.", str(results[1]))
+
+    @aioresponses()
+    def test_cancel_orders_batch_raises_when_the_whole_request_fails(self, mock_api):
+        self.exchange._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+        order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("100"),
+            creation_timestamp=1640780000,
+            price=Decimal("10000"),
+        )
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {"retCode": 10001, "retMsg": "params error", "result": {}, "retExtInfo": {}, "time": 1640780000}
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.exchange._cancel_orders_batch([order]))
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
@@ -12,6 +12,7 @@ from bidict import bidict
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.gate_io import gate_io_constants as CONSTANTS
+from hummingbot.connector.exchange.gate_io.gate_io_api_order_book_data_source import GateIoAPIOrderBookDataSource
 from hummingbot.connector.exchange.gate_io.gate_io_exchange import GateIoExchange
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.trading_rule import TradingRule
@@ -21,6 +22,7 @@ from hummingbot.core.data_type.common import OrderType, PositionAction, TradeTyp
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -487,6 +489,61 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertEqual(order_id, create_event.order_id)
         self.assertEqual(resp["id"], create_event.exchange_order_id)
 
+    @aioresponses()
+    def test_create_orders_in_the_same_iteration_uses_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        successful_order_resp = self.get_order_create_response_mock(exchange_order_id="someExchId")
+        successful_order_resp.update({"text": "someId1", "succeeded": True})
+        failed_order_resp = {
+            "text": "someId2",
+            "succeeded": False,
+            "label": "BALANCE_NOT_ENOUGH",
+            "message": "Not enough balance",
+        }
+        mock_api.post(regex_url, body=json.dumps([successful_order_resp, failed_order_resp]), status=201)
+
+        async def create_orders():
+            await asyncio.gather(
+                self.exchange._create_order(
+                    trade_type=TradeType.BUY,
+                    order_id="someId1",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("1"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("5.1"),
+                ),
+                self.exchange._create_order(
+                    trade_type=TradeType.SELL,
+                    order_id="someId2",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("1"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("5.2"),
+                ),
+            )
+
+        self.async_run_with_timeout(create_orders())
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(order_request[1]))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["someId1", "someId2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+
+        self.assertIn("someId1", self.exchange.in_flight_orders)
+        self.assertNotIn("someId2", self.exchange.in_flight_orders)
+        self.assertEqual("someExchId", self.exchange.in_flight_orders["someId1"].exchange_order_id)
+
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(0, len(self.sell_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("someId2", failure_event.order_id)
+
     @aioresponses()
     def test_create_limit_maker_order(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -941,20 +998,36 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertIn("OID2", self.exchange.in_flight_orders)
         order2 = self.exchange.in_flight_orders["OID2"]
 
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order1.exchange_order_id)}"
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        response = self.get_order_create_response_mock(cancelled=True, exchange_order_id=order1.exchange_order_id)
-
-        mock_api.delete(regex_url, body=json.dumps(response))
-
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order2.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = [
+            {
+                "currency_pair": self.ex_trading_pair,
+                "id": order1.exchange_order_id,
+                "succeeded": True,
+            },
+            {
+                "currency_pair": self.ex_trading_pair,
+                "id": order2.exchange_order_id,
+                "succeeded": False,
+                "label": "INVALID_PARAM_VALUE",
+                "message": "Invalid parameter value",
+            },
+        ]
 
-        mock_api.delete(regex_url, status=400)
+        mock_api.post(regex_url, body=json.dumps(response))
 
         cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
 
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": order1.exchange_order_id},
+             {"currency_pair": self.ex_trading_pair, "id": order2.exchange_order_id}],
+            request_data)
+
         self.assertEqual(2, len(cancellation_results))
         self.assertEqual(CancellationResult(order1.client_order_id, True), cancellation_results[0])
         self.assertEqual(CancellationResult(order2.client_order_id, False), cancellation_results[1])
@@ -971,6 +1044,82 @@ class TestGateIoExchange(unittest.TestCase):
             )
         )
 
+    def _start_tracking_orders_for_batch_cancel(self):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "4"), ("OID2", "5")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+
+    @aioresponses()
+    def test_batch_cancel_does_not_wait_for_orders_without_exchange_order_id(self, mock_api):
+        self._start_tracking_orders_for_batch_cancel()
+        self.exchange.in_flight_orders["OID2"].exchange_order_id = None
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = [{"currency_pair": self.ex_trading_pair, "id": "4", "succeeded": True}]
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        async def cancel_orders():
+            return await asyncio.gather(
+                self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID1"),
+                self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID2"),
+            )
+
+        results = self.async_run_with_timeout(cancel_orders())
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual([{"currency_pair": self.ex_trading_pair, "id": "4"}], request_data)
+        self.assertEqual(["OID1", None], results)
+        self.assertEqual(["OID1"], [event.order_id for event in self.order_cancelled_logger.event_log])
+        self.assertTrue(
+            self._is_logged(
+                "WARNING",
+                "Failed to cancel the order OID2 because it does not have an exchange order id yet"
+            )
+        )
+        self.assertFalse(
+            self._is_logged(
+                "WARNING",
+                "Failed to cancel the order OID1 because it does not have an exchange order id yet"
+            )
+        )
+
+    @aioresponses()
+    def test_batch_cancel_sends_an_order_canceled_twice_once(self, mock_api):
+        self._start_tracking_orders_for_batch_cancel()
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_DELETE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = [
+            {"currency_pair": self.ex_trading_pair, "id": "4", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "5", "succeeded": True},
+        ]
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        async def cancel_orders():
+            return await asyncio.gather(
+                self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID1"),
+                self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID2"),
+                self.exchange._execute_cancel(trading_pair=self.trading_pair, order_id="OID1"),
+            )
+
+        results = self.async_run_with_timeout(cancel_orders())
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(cancel_request[1]))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual(["4", "5"], [order_data["id"] for order_data in request_data])
+        self.assertEqual(["OID1", "OID2", "OID1"], results)
+
     @aioresponses()
     def test_update_balances(self, mock_api):
         url = f"{CONSTANTS.REST_URL}/{CONSTANTS.USER_BALANCES_PATH_URL}"
@@ -1807,3 +1956,54 @@ class TestGateIoExchange(unittest.TestCase):
         exception = IOError("HTTP status is 403. "
                             "Error: {'label':'REQUEST_EXPIRED','message':'gap between request Timestamp and server time exceeds 60'}")
         self.assertTrue(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
+
+    def test_rest_connections_are_kept_alive_with_pings(self):
+        self.exchange._make_network_check_request = AsyncMock()
+        self.exchange._sleep = AsyncMock(side_effect=[None, asyncio.CancelledError])
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(self.exchange._rest_connections_keepalive_loop())
+
+        self.assertEqual(2 * self.exchange.REST_CONNECTIONS_WARM_UP_COUNT,
+                         self.exchange._make_network_check_request.call_count)
+        self.exchange._sleep.assert_called_with(30.0)
+
+    def test_rest_connections_keepalive_pings_can_be_disabled(self):
+        self.client_config_map.rest_connection_pool.rest_connection_keepalive_ping_interval = 0
+        exchange = GateIoExchange(
+            client_config_map=self.client_config_map,
+            gate_io_api_key=self.api_key,
+            gate_io_secret_key=self.api_secret,
+            trading_pairs=[self.trading_pair])
+        exchange._make_network_check_request = AsyncMock()
+        exchange._sleep = AsyncMock()
+
+        self.async_run_with_timeout(exchange._rest_connections_keepalive_loop())
+
+        self.assertEqual(exchange.REST_CONNECTIONS_WARM_UP_COUNT, exchange._make_network_check_request.call_count)
+        exchange._sleep.assert_not_called()
+
+    def _create_exchange_served_by_market_data_daemon(self) -> GateIoExchange:
+        self.client_config_map.market_data_daemon.market_data_daemon_enabled = True
+        self.client_config_map.market_data_daemon.market_data_daemon_connectors = "gate_io"
+        exchange = GateIoExchange(
+            client_config_map=self.client_config_map,
+            gate_io_api_key=self.api_key,
+            gate_io_secret_key=self.api_secret,
+            trading_pairs=[self.trading_pair])
+        exchange.logger().setLevel(1)
+        exchange.logger().addHandler(self)
+        return exchange
+
+    def test_order_books_are_read_from_the_market_data_daemon(self):
+        exchange = self._create_exchange_served_by_market_data_daemon()
+
+        self.assertIsInstance(exchange.order_book_tracker.data_source, RemoteAPIOrderBookDataSource)
+
+    @patch.object(RemoteAPIOrderBookDataSource, "SUPPORTED_CONNECTORS", frozenset())
+    def test_order_books_are_read_from_the_exchange_when_the_daemon_does_not_support_the_connector(self):
+        exchange = self._create_exchange_served_by_market_data_daemon()
+
+        self.assertIsInstance(exchange.order_book_tracker.data_source, GateIoAPIOrderBookDataSource)
+        self.assertTrue(self._is_logged(
+            "WARNING", "The market data daemon can't serve gate_io, its order books are read from the exchange."))
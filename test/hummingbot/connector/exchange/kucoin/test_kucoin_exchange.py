@@ -715,6 +715,139 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    def test_split_orders_for_batch_create_groups_limit_orders_by_pair(self):
+        other_pair = f"OTHER-{self.quote_asset}"
+
+        def limit_order(order_id: str, trading_pair: str) -> InFlightOrder:
+            return InFlightOrder(
+                client_order_id=order_id,
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1"),
+                creation_timestamp=1640780000,
+                price=Decimal("10"),
+            )
+
+        orders = [limit_order(f"OID{i}", self.trading_pair) for i in range(CONSTANTS.MAX_ORDERS_PER_BATCH + 1)]
+        orders.append(limit_order("OTHER1", other_pair))
+        orders.append(InFlightOrder(
+            client_order_id="MARKET1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.MARKET,
+            trade_type=TradeType.SELL,
+            amount=Decimal("1"),
+            creation_timestamp=1640780000,
+        ))
+
+        batches = self.exchange._split_orders_for_batch_create(orders)
+
+        self.assertEqual(
+            [["MARKET1"],
+             [f"OID{i}" for i in range(CONSTANTS.MAX_ORDERS_PER_BATCH)],
+             [f"OID{CONSTANTS.MAX_ORDERS_PER_BATCH}"],
+             ["OTHER1"]],
+            [[order.client_order_id for order in batch] for batch in batches])
+
+    @aioresponses()
+    def test_create_orders_in_the_same_iteration_uses_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {
+                        "symbol": self.exchange_trading_pair,
+                        "side": "buy",
+                        "type": "limit",
+                        "size": "100",
+                        "price": "10000",
+                        "clientOid": "OID1",
+                        "id": "5bd6e9286d99522a52e458de",
+                        "status": "success",
+                        "failMsg": None,
+                    },
+                    {
+                        "symbol": self.exchange_trading_pair,
+                        "side": "sell",
+                        "type": "limit",
+                        "size": "100",
+                        "price": "10001",
+                        "clientOid": "OID2",
+                        "id": None,
+                        "status": "fail",
+                        "failMsg": "Balance insufficient!",
+                    },
+                ]
+            }
+        }
+        mock_api.post(regex_url, body=json.dumps(creation_response))
+
+        async def create_orders():
+            await asyncio.gather(
+                self.exchange._create_order(
+                    trade_type=TradeType.BUY,
+                    order_id="OID1",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("100"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("10000"),
+                ),
+                self.exchange._create_order(
+                    trade_type=TradeType.SELL,
+                    order_id="OID2",
+                    trading_pair=self.trading_pair,
+                    amount=Decimal("100"),
+                    order_type=OrderType.LIMIT,
+                    price=Decimal("10001"),
+                ),
+            )
+
+        self.async_run_with_timeout(create_orders())
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(order_request[1]))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data["orderList"]])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("5bd6e9286d99522a52e458de", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(0, len(self.sell_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    @aioresponses()
+    def test_place_orders_batch_raises_when_the_response_has_no_data(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.post(regex_url, body=json.dumps({"code": "200000", "data": None}))
+
+        order = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("100"),
+            creation_timestamp=1640780000,
+            price=Decimal("10000"),
+        )
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.exchange._place_orders_batch([order]))
+
     @aioresponses()
     def test_create_order_fails_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
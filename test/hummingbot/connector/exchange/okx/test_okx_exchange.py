@@ -17,7 +17,13 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -545,12 +551,28 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both cancelations are sent in the same batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "Bulk operation partially succeeded.",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1283,3 +1305,53 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 f"{Decimal('100.000000')} {self.trading_pair} at {Decimal('10000')}."
             )
         )
+
+    @aioresponses()
+    def test_create_orders_in_the_same_iteration_uses_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH)
+
+        buy_order_id = self.place_buy_order()
+        sell_order_id = self.place_sell_order()
+
+        creation_response = {
+            "code": "2",
+            "msg": "Bulk operation partially succeeded.",
+            "data": [
+                {
+                    "clOrdId": buy_order_id,
+                    "ordId": self.expected_exchange_order_id,
+                    "tag": "",
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": sell_order_id,
+                    "ordId": "",
+                    "tag": "",
+                    "sCode": "51008",
+                    "sMsg": "Order failed. Insufficient balance."
+                },
+            ]
+        }
+        mock_api.post(url,
+                      body=json.dumps(creation_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(order_request)
+        request_data = json.loads(order_request.kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["clOrdId"] for order_data in request_data])
+
+        self.assertIn(buy_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(0, len(self.sell_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(sell_order_id, failure_event.order_id)
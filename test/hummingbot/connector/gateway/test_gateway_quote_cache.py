@@ -0,0 +1,112 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import patch
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+
+
+class GatewayQuoteCacheTests(IsolatedAsyncioWrapperTestCase):
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.cache = GatewayQuoteCache(ttl=5.0, amount_significant_digits=4)
+        self.requests_count = 0
+        self.request_release = asyncio.Event()
+        self.request_release.set()
+
+    async def request_quote(self) -> Decimal:
+        self.requests_count += 1
+        await self.request_release.wait()
+        return Decimal("10")
+
+    def test_amount_bucket(self):
+        self.assertEqual(Decimal("1235"), self.cache.amount_bucket(Decimal("1234.56")))
+        self.assertEqual(Decimal("0.001235"), self.cache.amount_bucket(Decimal("0.00123456")))
+        self.assertEqual(self.cache.amount_bucket(Decimal("1000")), self.cache.amount_bucket(Decimal("1000.01")))
+        self.assertEqual(Decimal("0"), self.cache.amount_bucket(Decimal("0")))
+
+    async def test_quotes_are_cached_until_expired(self):
+        with patch.object(GatewayQuoteCache, "_time") as time_mock:
+            time_mock.return_value = 1000
+            self.assertEqual(Decimal("10"), await self.cache.get("key", self.request_quote))
+            time_mock.return_value = 1005
+            self.assertEqual(Decimal("10"), await self.cache.get("key", self.request_quote))
+
+            self.assertEqual(1, self.requests_count)
+
+            time_mock.return_value = 1005.1
+            await self.cache.get("key", self.request_quote)
+
+        self.assertEqual(2, self.requests_count)
+        self.assertEqual(1, self.cache.stats["hits"])
+        self.assertEqual(2, self.cache.stats["misses"])
+
+    async def test_new_block_invalidates_the_quotes(self):
+        self.cache.update_block_number(100)
+        await self.cache.get("key", self.request_quote)
+        self.cache.update_block_number(100)
+        await self.cache.get("key", self.request_quote)
+
+        self.assertEqual(1, self.requests_count)
+
+        self.cache.update_block_number(101)
+        await self.cache.get("key", self.request_quote)
+
+        self.assertEqual(2, self.requests_count)
+
+    async def test_concurrent_requests_are_merged(self):
+        self.request_release.clear()
+        tasks = [asyncio.ensure_future(self.cache.get("key", self.request_quote)) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.request_release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual([Decimal("10")] * 3, results)
+        self.assertEqual(1, self.requests_count)
+        self.assertEqual(2, self.cache.stats["merged_requests"])
+        self.assertAlmostEqual(2 / 3, self.cache.hit_rate)
+
+    async def test_failed_requests_are_not_cached(self):
+        async def failed_request():
+            self.requests_count += 1
+            return None
+
+        self.assertIsNone(await self.cache.get("key", failed_request))
+        self.assertIsNone(await self.cache.get("key", failed_request))
+
+        self.assertEqual(2, self.requests_count)
+        self.assertFalse(self.cache.has_quotes)
+
+    async def test_cancelled_caller_does_not_cancel_the_merged_callers(self):
+        self.request_release.clear()
+        first_caller = asyncio.ensure_future(self.cache.get("key", self.request_quote))
+        await asyncio.sleep(0)
+        second_caller = asyncio.ensure_future(self.cache.get("key", self.request_quote))
+        await asyncio.sleep(0)
+
+        first_caller.cancel()
+        await asyncio.sleep(0)
+        self.request_release.set()
+
+        self.assertEqual(Decimal("10"), await second_caller)
+        self.assertTrue(first_caller.cancelled())
+        self.assertEqual(1, self.requests_count)
+
+    async def test_request_is_cancelled_when_all_callers_are_cancelled(self):
+        self.request_release.clear()
+        caller = asyncio.ensure_future(self.cache.get("key", self.request_quote))
+        await asyncio.sleep(0)
+        request_task = self.cache._in_flight_requests["key"]
+
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        self.assertTrue(request_task.cancelled())
+        self.assertFalse(self.cache.has_quotes)
+
+        self.request_release.set()
+        self.assertEqual(Decimal("10"), await self.cache.get("key", self.request_quote))
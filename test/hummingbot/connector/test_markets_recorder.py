@@ -1,7 +1,9 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
-from typing import Awaitable
+from typing import Awaitable, List, Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -495,3 +497,110 @@ class MarketsRecorderTests(TestCase):
             query = session.query(Executors)
             executors = query.all()
         self.assertEqual(1, len(executors))
+
+    def create_recorder(self, manager: SQLConnectionManager, markets: Optional[List] = None) -> MarketsRecorder:
+        return MarketsRecorder(
+            sql=manager,
+            markets=[self] if markets is None else markets,
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+    @staticmethod
+    def create_executor_mock(executor_id: str, net_pnl_quote: Decimal, close_type: CloseType,
+                             controller_id: str = "test_controller"):
+        executor_mock = MagicMock(spec=PositionExecutor)
+        executor_config = PositionExecutorConfig(
+            id=executor_id, timestamp=1234, trading_pair="ETH-USDT", connector_name="binance", side=TradeType.BUY,
+            entry_price=Decimal("1000"), amount=Decimal("1"), leverage=1,
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.1"), stop_loss=Decimal("0.2")),
+        )
+        executor_mock.config = executor_config
+        executor_mock.executor_info = ExecutorInfo(
+            id=executor_id, timestamp=1234, type="position_executor", close_timestamp=1235, close_type=close_type,
+            status=RunnableStatus.TERMINATED, controller_id=controller_id, custom_info={},
+            config=executor_config, net_pnl_pct=Decimal("0.1"), net_pnl_quote=net_pnl_quote,
+            cum_fees_quote=Decimal("0.1"), filled_amount_quote=Decimal("100"), is_active=False, is_trading=False)
+        return executor_mock
+
+    def test_store_or_update_executors_updates_controllers_performance(self):
+        recorder = self.create_recorder(self.manager)
+        first_executor = self.create_executor_mock("1", Decimal("10"), CloseType.TAKE_PROFIT)
+        recorder.store_or_update_executors([first_executor,
+                                            self.create_executor_mock("2", Decimal("-5"), CloseType.STOP_LOSS),
+                                            self.create_executor_mock("3", Decimal("1"), None, controller_id=None)])
+        first_executor.executor_info.net_pnl_quote = Decimal("20")
+        first_executor.executor_info.close_type = CloseType.TIME_LIMIT
+        recorder.store_or_update_executors([first_executor])
+
+        with self.manager.get_new_session() as session:
+            executors = session.query(Executors).order_by(Executors.id).all()
+        self.assertEqual(3, len(executors))
+        self.assertEqual(20, executors[0].net_pnl_quote)
+
+        performance = recorder.get_controllers_performance()
+        self.assertEqual({"test_controller", None}, set(performance.keys()))
+        self.assertEqual(Decimal("15"), performance["test_controller"].realized_pnl_quote)
+        self.assertEqual(Decimal("200"), performance["test_controller"].volume_traded)
+        self.assertEqual({CloseType.TIME_LIMIT: 1, CloseType.STOP_LOSS: 1},
+                         performance["test_controller"].close_type_counts)
+        self.assertEqual(Decimal("1"), performance[None].realized_pnl_quote)
+
+    def test_controllers_performance_built_from_executors_stored_without_it(self):
+        rows = MarketsRecorder._executors_rows([
+            self.create_executor_mock("1", Decimal("10"), CloseType.TAKE_PROFIT),
+            self.create_executor_mock("2", Decimal("3"), CloseType.TAKE_PROFIT),
+        ])
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                Executors.upsert(session, rows)
+        recorder = self.create_recorder(self.manager)
+
+        performance = recorder.get_controllers_performance()
+
+        self.assertEqual(Decimal("13"), performance["test_controller"].realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2}, performance["test_controller"].close_type_counts)
+
+    def test_submitted_executors_and_positions_are_stored_off_the_event_loop(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                           db_path=os.path.join(temp_dir, "test.sqlite"))
+            recorder = self.create_recorder(manager, markets=[])
+            executors = [self.create_executor_mock(str(i), Decimal("1"), CloseType.TAKE_PROFIT) for i in range(120)]
+            position = Position(id="123", timestamp=123, controller_id="test_controller", connector_name="binance",
+                                trading_pair="ETH-USDT", amount=Decimal("1"), breakeven_price=Decimal("1000"),
+                                unrealized_pnl_quote=Decimal("0"), cum_fees_quote=Decimal("0"),
+                                volume_traded_quote=Decimal("10"), filled_orders=[], )
+
+            recorder.submit_executors(executors)
+            recorder.submit_positions([position])
+            self.async_run_with_timeout(recorder.flush(), timeout=10)
+            recorder.stop()
+
+            with manager.get_new_session() as session:
+                self.assertEqual(120, session.query(Executors).count())
+                self.assertEqual(1, session.query(Position).count())
+            performance = recorder.get_controllers_performance()
+            self.assertEqual(Decimal("120"), performance["test_controller"].realized_pnl_quote)
+            manager.engine.dispose()
+
+    def test_writes_submitted_after_stop_are_stored(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                           db_path=os.path.join(temp_dir, "test.sqlite"))
+            recorder = self.create_recorder(manager, markets=[])
+            recorder.submit_executors([self.create_executor_mock("1", Decimal("1"), CloseType.TAKE_PROFIT)])
+            recorder.stop()
+
+            future = recorder.submit_executors([self.create_executor_mock("2", Decimal("2"), CloseType.TAKE_PROFIT)])
+
+            self.assertTrue(future.done())
+            self.assertIsNone(future.result())
+            with manager.get_new_session() as session:
+                self.assertEqual(2, session.query(Executors).count())
+            manager.engine.dispose()
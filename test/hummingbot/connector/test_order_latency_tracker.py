@@ -0,0 +1,145 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.connector.order_latency_tracker import (
+    CANCEL_RTT_METRIC,
+    EXCHANGE_ACK_STAGE,
+    FIRST_FILL_STAGE,
+    ORDER_ACK_METRIC,
+    REST_ACK_STAGE,
+    REST_RTT_METRIC,
+    SUBMITTED_STAGE,
+    THROTTLER_WAIT_METRIC,
+    WS_ACK_DELAY_METRIC,
+    LatencyHistogram,
+    OrderLatencyTracker,
+    render_prometheus_metrics,
+)
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_observe_and_quantiles(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+        for value in (0.005, 0.005, 0.05, 0.5):
+            histogram.observe(value)
+
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(0.56, histogram.sum)
+        self.assertEqual(0.5, histogram.max)
+        self.assertEqual(0.01, histogram.quantile(0.5))
+        self.assertEqual(0.1, histogram.quantile(0.75))
+        self.assertEqual(0.5, histogram.quantile(0.99))
+        self.assertEqual([(0.01, 2), (0.1, 3), (1.0, 4), (float("inf"), 4)], histogram.cumulative_counts())
+
+    def test_values_above_last_bucket_use_max_as_quantile(self):
+        histogram = LatencyHistogram(buckets=(0.01,))
+        histogram.observe(3.0)
+
+        self.assertEqual(3.0, histogram.quantile(0.5))
+        self.assertEqual([(0.01, 0), (float("inf"), 1)], histogram.cumulative_counts())
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0.0, histogram.mean)
+        self.assertEqual(0.0, histogram.quantile(0.9))
+
+
+class OrderLatencyTrackerTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderLatencyTracker()
+        self.order = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640000000,
+            price=Decimal("10"),
+        )
+
+    def _order_update(self) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=self.order.client_order_id,
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=1640000001,
+            new_state=OrderState.OPEN,
+        )
+
+    @patch("hummingbot.connector.order_latency_tracker.OrderLatencyTracker.now")
+    def test_rest_ack_before_exchange_ack(self, now_mock):
+        now_mock.return_value = 1.0
+        self.tracker.record_submission(self.order.client_order_id)
+        self.tracker.record_order_tracked(self.order)
+        now_mock.return_value = 1.01
+        self.tracker.record_request_sent(self.order)
+
+        rest_update = self._order_update()
+        now_mock.return_value = 1.05
+        self.tracker.record_rest_ack(self.order, rest_update, [(0.01, 0.03)])
+        # The update built from the REST response is not an exchange acknowledgement
+        self.tracker.record_order_update(self.order, rest_update)
+        self.assertNotIn(EXCHANGE_ACK_STAGE, self.order.lifecycle_timestamps)
+
+        now_mock.return_value = 1.07
+        self.tracker.record_order_update(self.order, self._order_update())
+        now_mock.return_value = 1.2
+        self.tracker.record_trade_update(self.order)
+
+        self.assertEqual(1.0, self.order.lifecycle_timestamps[SUBMITTED_STAGE])
+        self.assertEqual(1.05, self.order.lifecycle_timestamps[REST_ACK_STAGE])
+        self.assertEqual(1.07, self.order.lifecycle_timestamps[EXCHANGE_ACK_STAGE])
+        self.assertEqual(1.2, self.order.lifecycle_timestamps[FIRST_FILL_STAGE])
+        self.assertAlmostEqual(0.01, self.tracker.histogram(self.trading_pair, THROTTLER_WAIT_METRIC).sum)
+        self.assertAlmostEqual(0.03, self.tracker.histogram(self.trading_pair, REST_RTT_METRIC).sum)
+        self.assertAlmostEqual(0.05, self.tracker.histogram(self.trading_pair, ORDER_ACK_METRIC).sum)
+        ws_ack_delay = self.tracker.histogram(self.trading_pair, WS_ACK_DELAY_METRIC)
+        self.assertEqual(1, ws_ack_delay.count)
+        self.assertAlmostEqual(0.02, ws_ack_delay.sum)
+
+    @patch("hummingbot.connector.order_latency_tracker.OrderLatencyTracker.now")
+    def test_exchange_ack_before_rest_ack(self, now_mock):
+        now_mock.return_value = 1.0
+        self.tracker.record_order_tracked(self.order)
+        self.tracker.record_request_sent(self.order)
+        now_mock.return_value = 1.02
+        self.tracker.record_order_update(self.order, self._order_update())
+        now_mock.return_value = 1.04
+        self.tracker.record_rest_ack(self.order, self._order_update())
+
+        ws_ack_delay = self.tracker.histogram(self.trading_pair, WS_ACK_DELAY_METRIC)
+        self.assertEqual(1, ws_ack_delay.count)
+        self.assertEqual(0.0, ws_ack_delay.sum)
+        # Without request timings the round trip is measured from the moment the request was sent
+        self.assertAlmostEqual(0.04, self.tracker.histogram(self.trading_pair, REST_RTT_METRIC).sum)
+
+    @patch("hummingbot.connector.order_latency_tracker.OrderLatencyTracker.now")
+    def test_record_cancel(self, now_mock):
+        now_mock.return_value = 2.5
+        self.tracker.record_cancel(self.order, start_timestamp=2.0)
+
+        self.assertEqual(0.5, self.tracker.histogram(self.trading_pair, CANCEL_RTT_METRIC).sum)
+        self.assertEqual({self.trading_pair: {CANCEL_RTT_METRIC: {
+            "count": 1, "mean": 0.5, "p50": 0.5, "p90": 0.5, "p99": 0.5, "max": 0.5}}},
+            self.tracker.to_dict())
+        self.assertIn(f"{self.trading_pair:<16}{CANCEL_RTT_METRIC:<16}", self.tracker.format_status("exchange"))
+
+    def test_render_prometheus_metrics(self):
+        self.tracker.observe(self.trading_pair, CANCEL_RTT_METRIC, 0.003)
+
+        metrics = render_prometheus_metrics({"exchange": self.tracker})
+
+        labels = f'connector="exchange",trading_pair="{self.trading_pair}",stage="{CANCEL_RTT_METRIC}"'
+        self.assertIn("# TYPE hummingbot_order_latency_seconds histogram", metrics)
+        self.assertIn(f'hummingbot_order_latency_seconds_bucket{{{labels},le="0.0025"}} 0', metrics)
+        self.assertIn(f'hummingbot_order_latency_seconds_bucket{{{labels},le="0.005"}} 1', metrics)
+        self.assertIn(f'hummingbot_order_latency_seconds_bucket{{{labels},le="+Inf"}} 1', metrics)
+        self.assertIn(f"hummingbot_order_latency_seconds_count{{{labels}}} 1", metrics)
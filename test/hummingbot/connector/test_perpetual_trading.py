@@ -111,6 +111,38 @@ class PerpetualTest(unittest.TestCase):
         self.assertTrue(self.perpetual_trading.is_funding_info_initialized())
         self.assertEqual(1, len(self.perpetual_trading.funding_info))
 
+    def test_funding_info_listeners_are_notified(self):
+        received = []
+        self.perpetual_trading.add_funding_info_listener(received.append)
+        funding_info = FundingInfo(
+            self.trading_pair,
+            index_price=Decimal("1"),
+            mark_price=Decimal("2"),
+            next_funding_utc_timestamp=3,
+            rate=Decimal("4"),
+        )
+        self.perpetual_trading.initialize_funding_info(funding_info)
+
+        async def return_update():
+            return FundingInfoUpdate(self.trading_pair, rate=Decimal("5"))
+
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = [return_update(), asyncio.CancelledError()]
+        self.perpetual_trading._funding_info_stream = mock_queue
+        self.perpetual_trading.start()
+        self.listening_task = self.perpetual_trading._funding_info_updater_task
+        try:
+            self.async_run_with_timeout(self.listening_task)
+        except asyncio.CancelledError:
+            pass
+
+        self.assertEqual(2, len(received))
+        self.assertEqual(Decimal("5"), received[-1].rate)
+
+        self.perpetual_trading.remove_funding_info_listener(received.append)
+        self.perpetual_trading.initialize_funding_info(funding_info)
+        self.assertEqual(2, len(received))
+
     def test_updating_funding_info_logs_exception(self):
         mock_queue = MagicMock()
         mock_queue.get.side_effect = [
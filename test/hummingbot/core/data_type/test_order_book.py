@@ -3,6 +3,9 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +53,117 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_price_change_watch_notifies_on_top_of_book_change(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.PriceChangeEvent, event_logger)
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.add_price_change_watch(volume=0, threshold=0.01)
+
+        # A change deeper in the book does not move the top of book
+        order_book.apply_numpy_diffs(np.array([[1, 5, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+        event = event_logger.event_log[0]
+        self.assertEqual(3, event.update_id)
+        self.assertEqual(0, event.volume)
+        self.assertEqual(3.5, event.bid_price)
+        self.assertEqual(4, event.ask_price)
+
+    def test_price_change_watch_ignores_changes_below_threshold(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.PriceChangeEvent, event_logger)
+        bids_array = np.array([[99, 1, 1], [100, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[105, 1, 1], [106, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.add_price_change_watch(volume=0, threshold=0.01)
+        no_entries = np.empty((0, 3), dtype=np.float64)
+
+        order_book.apply_numpy_diffs(np.array([[100.5, 1, 2]], dtype=np.float64), no_entries)
+        order_book.apply_numpy_diffs(np.array([[100.9, 1, 3]], dtype=np.float64), no_entries)
+        order_book.apply_numpy_diffs(no_entries, np.array([[104, 1, 4]], dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        # The move accumulates against the last notified price
+        order_book.apply_numpy_diffs(np.array([[101.2, 1, 5]], dtype=np.float64), no_entries)
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual(101.2, event_logger.event_log[0].bid_price)
+        self.assertEqual(104, event_logger.event_log[0].ask_price)
+
+    def test_price_change_watch_for_vwap_volume(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.PriceChangeEvent, event_logger)
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.add_price_change_watch(volume=2, threshold=0)
+        self.assertEqual({2.0: (2.5, 4.5)}, order_book.price_watches)
+
+        # Levels beyond the VWAP depth do not trigger a notification
+        order_book.apply_numpy_diffs(np.array([[1, 3, 2]], dtype=np.float64), np.array([[6, 3, 2]], dtype=np.float64))
+        self.assertEqual(0, len(event_logger.event_log))
+
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.array([[4, 0, 3]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+        event = event_logger.event_log[0]
+        self.assertEqual(2, event.volume)
+        self.assertEqual(2.5, event.bid_price)
+        self.assertEqual(5.5, event.ask_price)
+        self.assertEqual(order_book.get_vwap_for_volume(True, 2).result_price, event.ask_price)
+
+        order_book.remove_price_change_watch(volume=2, threshold=0)
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.array([[5, 0, 4]], dtype=np.float64))
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual({}, order_book.price_watches)
+
+    def test_price_change_listeners_can_change_the_watches(self):
+        class WatchReplacingListener(EventListener):
+            def __init__(self, order_book: OrderBook):
+                super().__init__()
+                self.order_book = order_book
+                self.event_log = []
+
+            def __call__(self, event):
+                self.event_log.append(event)
+                self.order_book.remove_price_change_watch(volume=event.volume, threshold=0)
+                self.order_book.add_price_change_watch(volume=event.volume + 1, threshold=0)
+
+        order_book = OrderBook()
+        listener = WatchReplacingListener(order_book)
+        order_book.add_listener(OrderBookEvent.PriceChangeEvent, listener)
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.add_price_change_watch(volume=1, threshold=0)
+        order_book.add_price_change_watch(volume=2, threshold=0)
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+
+        self.assertEqual([1, 2], [event.volume for event in listener.event_log])
+        self.assertEqual({2.0, 3.0}, set(order_book.price_watches.keys()))
+
+    def test_copy_top_levels(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 4, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        bid_prices, bid_amounts, ask_prices, ask_amounts = np.full((4, 2), np.nan)
+
+        counts = order_book.copy_top_levels(bid_prices, bid_amounts, ask_prices, ask_amounts)
+
+        self.assertEqual((2, 1), counts)
+        self.assertEqual([3, 2], bid_prices.tolist())
+        self.assertEqual([3, 2], bid_amounts.tolist())
+        self.assertEqual(4, ask_prices[0])
+        self.assertEqual(4, ask_amounts[0])
+        self.assertTrue(np.isnan(ask_prices[1]))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
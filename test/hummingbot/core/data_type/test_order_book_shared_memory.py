@@ -0,0 +1,124 @@
+import os
+import struct
+import subprocess
+import sys
+import unittest
+from multiprocessing.shared_memory import SharedMemory
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_shared_memory import (
+    PUBLISHER_PID_SLOT,
+    SEQUENCE_SLOT,
+    SLOT_SIZE,
+    OrderBookSharedMemoryReader,
+    OrderBookSharedMemorySegment,
+    segment_name,
+    segment_size,
+)
+
+
+class OrderBookSharedMemoryTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.segment = OrderBookSharedMemorySegment(name=segment_name("test_exchange", "COINALPHA-HBOT"), depth=2)
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot(
+            bids=[OrderBookRow(9.0, 1.0, 1), OrderBookRow(8.0, 2.0, 1), OrderBookRow(7.0, 3.0, 1)],
+            asks=[OrderBookRow(11.0, 1.5, 1)],
+            update_id=1,
+        )
+        self.order_book.enable_shared_memory_publishing(self.segment)
+        self.reader = OrderBookSharedMemoryReader(self.segment.name)
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.order_book.disable_shared_memory_publishing()
+        self.segment.close()
+        super().tearDown()
+
+    def test_segment_name(self):
+        self.assertEqual("hb_ob_binance_BTC_USDT", segment_name("binance", "BTC-USDT"))
+        long_name = segment_name("binance_perpetual_testnet", "1000SHIB-USDT")
+        self.assertEqual(30, len(long_name))
+        self.assertNotEqual(long_name, segment_name("binance_perpetual_testnet", "1000PEPE-USDT"))
+
+    def test_top_levels_published_when_enabled(self):
+        snapshot = self.reader.read()
+
+        self.assertEqual(1, snapshot.update_id)
+        self.assertEqual(9.0, snapshot.best_bid)
+        self.assertEqual(11.0, snapshot.best_ask)
+        self.assertEqual([(9.0, 1.0), (8.0, 2.0)], snapshot.bids)
+        self.assertEqual([(11.0, 1.5)], snapshot.asks)
+        self.assertGreater(snapshot.timestamp, 0)
+
+    def test_diffs_update_published_levels(self):
+        self.order_book.apply_diffs(bids=[OrderBookRow(9.5, 4.0, 2)], asks=[OrderBookRow(12.0, 1.0, 2)], update_id=2)
+
+        snapshot = self.reader.read()
+
+        self.assertEqual(2, snapshot.update_id)
+        self.assertEqual(9.5, snapshot.best_bid)
+        self.assertEqual([(9.5, 4.0), (9.0, 1.0)], snapshot.bids)
+        self.assertEqual([(11.0, 1.5), (12.0, 1.0)], snapshot.asks)
+
+    def test_diffs_below_published_levels_only_update_header(self):
+        self.order_book.apply_diffs(bids=[OrderBookRow(7.0, 0.0, 2)], asks=[], update_id=2)
+
+        snapshot = self.reader.read()
+
+        self.assertEqual(2, snapshot.update_id)
+        self.assertEqual([(9.0, 1.0), (8.0, 2.0)], snapshot.bids)
+
+        # Removing a published level brings the next one up
+        self.order_book.apply_diffs(bids=[OrderBookRow(8.0, 0.0, 3)], asks=[], update_id=3)
+
+        self.assertEqual([(9.0, 1.0)], self.reader.read().bids)
+
+    def test_snapshot_replaces_published_levels(self):
+        self.order_book.apply_snapshot(bids=[OrderBookRow(5.0, 1.0, 10)], asks=[], update_id=10)
+
+        snapshot = self.reader.read()
+
+        self.assertEqual(10, snapshot.update_id)
+        self.assertEqual([(5.0, 1.0)], snapshot.bids)
+        self.assertEqual([], snapshot.asks)
+
+    def test_read_times_out_while_publisher_is_writing(self):
+        self.segment.int_slots[SEQUENCE_SLOT] += 1
+
+        with self.assertRaises(TimeoutError):
+            self.reader.read(timeout=0.01)
+
+        self.segment.int_slots[SEQUENCE_SLOT] += 1
+        self.assertEqual(1, self.reader.read().update_id)
+
+    def test_segment_of_a_running_publisher_is_not_taken_over(self):
+        with self.assertRaises(FileExistsError):
+            OrderBookSharedMemorySegment(name=self.segment.name, depth=2)
+
+        self.assertEqual(1, self.reader.read().update_id)
+
+    def test_segment_of_a_stopped_publisher_is_replaced(self):
+        name = segment_name("test_exchange", "WETH-HBOT")
+        # Left by a publisher that did not stop cleanly
+        stale_shared_memory = SharedMemory(name=name, create=True, size=segment_size(2))
+        struct.pack_into("=q", stale_shared_memory.buf, PUBLISHER_PID_SLOT * SLOT_SIZE, self._stopped_process_pid())
+        stale_shared_memory.close()
+
+        segment = OrderBookSharedMemorySegment(name=name, depth=3)
+        reader = OrderBookSharedMemoryReader(name)
+
+        self.assertEqual(3, reader.depth)
+        self.assertEqual(os.getpid(), segment.int_slots[PUBLISHER_PID_SLOT])
+
+        reader.close()
+        segment.close()
+
+    @staticmethod
+    def _stopped_process_pid() -> int:
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        return process.pid
@@ -0,0 +1,142 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_recording import (
+    OrderBookMessageRecordReader,
+    OrderBookMessageRecordWriter,
+)
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_data_source import (
+    OrderBookReplayIterator,
+    ReplayOrderBookDataSource,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class ReplayOrderBookDataSourceTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    other_trading_pair = "WETH-HBOT"
+    start_timestamp = 1640000000.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.recording_dir = tempfile.TemporaryDirectory()
+        self.recording_path = Path(self.recording_dir.name) / "exchange.hbob.gz"
+        self.write_recording([
+            # Received before the first snapshot, can't be applied
+            self.diff_message(0.5, 1, bids=[(8.0, 1.0)], asks=[]),
+            self.snapshot_message(1.0, 1, bids=[(9.0, 1.0)], asks=[(11.0, 2.0)]),
+            self.snapshot_message(1.0, 5, bids=[(99.0, 1.0)], asks=[(101.0, 2.0)], trading_pair=self.other_trading_pair),
+            self.diff_message(2.0, 2, bids=[(9.5, 3.0)], asks=[(11.0, 0.0), (12.0, 1.0)]),
+            self.trade_message(2.5, 1, TradeType.SELL, price=9.5, amount=0.5),
+            self.diff_message(4.0, 3, bids=[(9.5, 0.0)], asks=[]),
+        ])
+
+    def tearDown(self) -> None:
+        self.recording_dir.cleanup()
+        super().tearDown()
+
+    def write_recording(self, messages: List[OrderBookMessage]):
+        writer = OrderBookMessageRecordWriter(self.recording_path)
+        for message in messages:
+            writer.write(message)
+        writer.close()
+
+    def snapshot_message(self, delay: float, update_id: int, bids: list, asks: list, trading_pair: str = None):
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": trading_pair or self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=self.start_timestamp + delay,
+        )
+
+    def diff_message(self, delay: float, update_id: int, bids: list, asks: list):
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=self.start_timestamp + delay,
+        )
+
+    def trade_message(self, delay: float, trade_id, trade_type: TradeType, price: float, amount: float):
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_type": float(trade_type.value), "trade_id": trade_id,
+             "update_id": -1, "price": str(price), "amount": str(amount)},
+            timestamp=self.start_timestamp + delay,
+        )
+
+    def test_recording_round_trip(self):
+        messages = list(OrderBookMessageRecordReader(self.recording_path))
+
+        self.assertEqual(6, len(messages))
+        snapshot = messages[1]
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(self.trading_pair, snapshot.trading_pair)
+        self.assertEqual(self.start_timestamp + 1.0, snapshot.timestamp)
+        self.assertEqual(1, snapshot.update_id)
+        self.assertEqual([(9.0, 1.0)], [(row.price, row.amount) for row in snapshot.bids])
+        self.assertEqual([(11.0, 2.0)], [(row.price, row.amount) for row in snapshot.asks])
+        self.assertEqual(self.other_trading_pair, messages[2].trading_pair)
+        diff = messages[3]
+        self.assertEqual(OrderBookMessageType.DIFF, diff.type)
+        self.assertEqual([(11.0, 0.0), (12.0, 1.0)], [(row.price, row.amount) for row in diff.asks])
+        trade = messages[4]
+        self.assertEqual(1, trade.trade_id)
+        self.assertEqual(float(TradeType.SELL.value), trade.content["trade_type"])
+        self.assertEqual(9.5, trade.content["price"])
+        self.assertEqual(0.5, trade.content["amount"])
+
+    def test_truncated_recording_ends_the_replay(self):
+        truncated_path = Path(self.recording_dir.name) / "truncated.hbob"
+        writer = OrderBookMessageRecordWriter(truncated_path)
+        writer.write(self.snapshot_message(1.0, 1, bids=[(9.0, 1.0)], asks=[]))
+        writer.close()
+        truncated_path.write_bytes(truncated_path.read_bytes()[:-4])
+
+        self.assertEqual([], list(OrderBookMessageRecordReader(truncated_path)))
+
+    def test_backtest_replays_messages_on_clock_ticks(self):
+        data_source = ReplayOrderBookDataSource(trading_pairs=[self.trading_pair], recording_path=self.recording_path)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        replay_iterator = OrderBookReplayIterator(tracker)
+        clock = Clock(ClockMode.BACKTEST, tick_size=1.0, start_time=self.start_timestamp,
+                      end_time=self.start_timestamp + 10)
+        clock.add_iterator(replay_iterator)
+
+        clock.backtest_til(self.start_timestamp + 1)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual([self.trading_pair], list(tracker.order_books))
+        order_book = tracker.order_books[self.trading_pair]
+        self.assertEqual([(9.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+
+        trade_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_logger)
+        clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertEqual([(9.5, 3.0), (9.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(12.0, 1.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(TradeType.SELL, trade_logger.event_log[0].type)
+        self.assertEqual(9.5, order_book.last_trade_price)
+        self.assertEqual({self.trading_pair: 9.5}, data_source.last_traded_prices)
+
+        clock.backtest_til(self.start_timestamp + 10)
+
+        self.assertEqual([(9.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+
+    def test_snapshot_lookup_keeps_the_messages_to_replay(self):
+        data_source = ReplayOrderBookDataSource(trading_pairs=[self.trading_pair, self.other_trading_pair],
+                                                recording_path=self.recording_path)
+
+        order_book = asyncio.run(data_source.get_new_order_book(self.other_trading_pair))
+
+        self.assertEqual(5, order_book.snapshot_uid)
+        replayed_messages = data_source.replay_until(self.start_timestamp + 10)
+        self.assertEqual(6, len(replayed_messages))
@@ -2,11 +2,14 @@ import asyncio
 import json
 import unittest
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 
+from hummingbot.client.config import config_validators
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
@@ -36,9 +39,12 @@ class TestTradingPairFetcher(unittest.TestCase):
         self._original_async_loop = asyncio.get_event_loop()
         self.async_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.async_loop)
+        self.cache_dir = TemporaryDirectory()
+        self.cache_path = Path(self.cache_dir.name) / "trading_pairs_cache.json"
 
     def tearDown(self) -> None:
         super().tearDown()
+        self.cache_dir.cleanup()
         self.async_loop.stop()
         self.async_loop.close()
         asyncio.set_event_loop(self._original_async_loop)
@@ -98,7 +104,8 @@ class TestTradingPairFetcher(unittest.TestCase):
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         client_config_map.fetch_pairs_from_all_exchanges = True
-        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_all(client_config_map), 1.0)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
@@ -119,7 +126,8 @@ class TestTradingPairFetcher(unittest.TestCase):
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         client_config_map.fetch_pairs_from_all_exchanges = False
         self.assertTrue(Security.connector_config_file_exists("binance"))
-        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        trading_pair_fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.async_run_with_timeout(trading_pair_fetcher.fetch_all(client_config_map), 1.0)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
@@ -247,8 +255,8 @@ class TestTradingPairFetcher(unittest.TestCase):
         }
         mock_api.get(url, body=json.dumps(mock_response))
 
-        fetcher = TradingPairFetcher(client_config_map)
-        asyncio.get_event_loop().run_until_complete(fetcher._fetch_task)
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        asyncio.get_event_loop().run_until_complete(fetcher.fetch_all(client_config_map))
         trading_pairs = fetcher.trading_pairs
 
         self.assertEqual(1, len(trading_pairs.keys()))
@@ -258,3 +266,80 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertIn("ETH-BTC", binance_pairs)
         self.assertIn("LTC-BTC", binance_pairs)
         self.assertNotIn("BNB-BTC", binance_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_are_fetched_on_demand_and_cached(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "binance": self.MockConnectorSetting(name="binance", connector=connector),
+            "kucoin": self.MockConnectorSetting(name="kucoin", connector=AsyncMock()),
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.assertTrue(fetcher.ready)
+        self.assertEqual([], fetcher.get_trading_pairs("binance"))
+        self.assertEqual(["MOCK-HBOT"], self.async_run_with_timeout(fetcher.fetch_trading_pairs("binance")))
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("binance"))
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+        self.assertNotIn("kucoin", fetcher.trading_pairs)
+        fetcher._refresh_task.cancel()
+
+        # The trading pairs are loaded from the cache by the next instance
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.assertEqual(["MOCK-HBOT"], fetcher.get_trading_pairs("binance"))
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_stale_trading_pairs_are_fetched_again(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = [["MOCK-HBOT"], Exception("Test error"), ["MOCK-HBOT", "BTC-HBOT"]]
+        mock_connector_settings.return_value = {
+            "binance": self.MockConnectorSetting(name="binance", connector=connector),
+            "binance_paper_trade": self.MockConnectorSetting(name="binance_paper_trade", parent_name="binance"),
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.async_run_with_timeout(fetcher.fetch_trading_pairs("binance_paper_trade"))
+        fetcher._refresh_task.cancel()
+        now = fetcher._time() + fetcher.CACHE_TTL
+
+        with patch.object(fetcher, "_time", return_value=now):
+            # The cached trading pairs are kept when the fetch fails, and the fetch is not retried right away
+            for _ in range(2):
+                trading_pairs = self.async_run_with_timeout(fetcher.fetch_trading_pairs("binance_paper_trade"))
+                self.assertEqual(["MOCK-HBOT"], trading_pairs)
+            self.assertEqual(2, connector.all_trading_pairs.call_count)
+
+        with patch.object(fetcher, "_time", return_value=now + fetcher.RETRY_INTERVAL):
+            self.assertEqual(["MOCK-HBOT", "BTC-HBOT"],
+                             self.async_run_with_timeout(fetcher.fetch_trading_pairs("binance_paper_trade")))
+        self.assertEqual(3, connector.all_trading_pairs.call_count)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pair_missing_from_the_cache_is_validated_after_fetching_again(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = [["MOCK-HBOT"], ["MOCK-HBOT", "NEW-HBOT"]]
+        mock_connector_settings.return_value = {
+            "binance": self.MockConnectorSetting(name="binance", connector=connector),
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        fetcher = TradingPairFetcher(client_config_map, cache_path=self.cache_path)
+        self.async_run_with_timeout(fetcher.fetch_trading_pairs("binance"))
+        fetcher._refresh_task.cancel()
+
+        with patch.object(TradingPairFetcher, "_sf_shared_instance", fetcher):
+            # The trading pairs were just fetched, so the missing one is rejected
+            self.assertEqual("NEW-HBOT is not an active market on binance.",
+                             config_validators.validate_market_trading_pair("binance", "NEW-HBOT"))
+            self.assertEqual(1, connector.all_trading_pairs.call_count)
+
+            with patch.object(fetcher, "_time", return_value=fetcher._time() + fetcher.RETRY_INTERVAL):
+                self.assertIsNone(config_validators.validate_market_trading_pair("binance", "NEW-HBOT"))
+                self.async_run_with_timeout(fetcher._fetch_tasks["binance"])
+                self.assertEqual(2, connector.all_trading_pairs.call_count)
+                self.assertIsNone(config_validators.validate_market_trading_pair("binance", "NEW-HBOT"))
+                self.assertEqual("OLD-HBOT is not an active market on binance.",
+                                 config_validators.validate_market_trading_pair("binance", "OLD-HBOT"))
+                self.assertEqual(2, connector.all_trading_pairs.call_count)
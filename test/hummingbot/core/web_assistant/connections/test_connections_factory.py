@@ -34,3 +34,26 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_tuned_connection_pool(self):
+        factory = ConnectionsFactory(limit_per_host=10, keepalive_timeout=30, dns_cache_ttl=120)
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        connector = rest_connection._client_session.connector
+
+        self.assertEqual(10, connector.limit_per_host)
+        self.assertTrue(connector.use_dns_cache)
+        self.assertEqual(30, connector._keepalive_timeout)
+        self.assertEqual(120, connector._ttl_dns_cache)
+        self.assertEqual(1, len(rest_connection._client_session._trace_configs))
+
+    def test_configure_connection_pool_before_the_shared_client_is_created(self):
+        factory = ConnectionsFactory()
+        factory.configure_connection_pool(limit_per_host=5, keepalive_timeout=15, dns_cache_ttl=60)
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        connector = rest_connection._client_session.connector
+
+        self.assertEqual(5, connector.limit_per_host)
+        self.assertEqual(15, connector._keepalive_timeout)
+        self.assertEqual(60, connector._ttl_dns_cache)
@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant.connections.request_timing_metrics import (
+    UNKNOWN_REQUEST_KEY,
+    RequestTimingMetrics,
+)
+
+
+class RequestTimingMetricsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.metrics = RequestTimingMetrics()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _simulate_request(self, context: SimpleNamespace, times, new_connection: bool):
+        with patch.object(RequestTimingMetrics, "_time", side_effect=times):
+            await self.metrics._on_request_start(None, context, None)
+            if new_connection:
+                await self.metrics._on_connection_create_start(None, context, None)
+                await self.metrics._on_dns_resolvehost_start(None, context, None)
+                await self.metrics._on_dns_resolvehost_end(None, context, None)
+                await self.metrics._on_connection_create_end(None, context, None)
+            await self.metrics._on_request_headers_sent(None, context, None)
+            await self.metrics._on_request_end(None, context, None)
+
+    def test_request_on_new_connection_records_all_stages(self):
+        context = SimpleNamespace(trace_request_ctx="/order")
+
+        self.async_run_with_timeout(self._simulate_request(
+            context=context, times=[10, 10.1, 10.1, 10.2, 10.5, 10.6, 10.9], new_connection=True))
+
+        stats = self.metrics.stats_for("/order")
+        self.assertEqual(1, stats.count)
+        self.assertEqual(0, stats.reused_connections)
+        self.assertAlmostEqual(0.1, stats.last.dns)
+        self.assertAlmostEqual(0.3, stats.last.connect)
+        self.assertAlmostEqual(0.3, stats.last.ttfb)
+        self.assertAlmostEqual(0.9, stats.last.total)
+
+    def test_request_on_reused_connection_has_no_connect_time(self):
+        context = SimpleNamespace(trace_request_ctx="/order")
+        self.async_run_with_timeout(self._simulate_request(
+            context=context, times=[10, 10.1, 10.3], new_connection=False))
+        context = SimpleNamespace(trace_request_ctx="/order")
+        self.async_run_with_timeout(self._simulate_request(
+            context=context, times=[20, 20.1, 20.5], new_connection=False))
+
+        stats = self.metrics.stats_for("/order")
+        self.assertEqual(2, stats.count)
+        self.assertEqual(2, stats.reused_connections)
+        self.assertEqual(0, stats.max_duration["connect"])
+        self.assertAlmostEqual(0.3, stats.mean("ttfb"))
+        self.assertAlmostEqual(0.4, stats.max_duration["ttfb"])
+
+    def test_request_exceptions_are_counted_by_key(self):
+        self.async_run_with_timeout(
+            self.metrics._on_request_exception(None, SimpleNamespace(trace_request_ctx=None), None))
+
+        self.assertEqual(1, self.metrics.stats_for(UNKNOWN_REQUEST_KEY).errors)
+        self.assertEqual(0, self.metrics.stats_for(UNKNOWN_REQUEST_KEY).count)
+
+        self.metrics.reset()
+
+        self.assertEqual({}, self.metrics.stats)
@@ -0,0 +1,87 @@
+import unittest
+from collections import deque
+from unittest.mock import MagicMock
+
+from hummingbot.data_feed.candles_feed.aggregated_candles import AggregatedCandles
+
+
+class AggregatedCandlesTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.base_feed = MagicMock()
+        self.base_feed.interval = "1m"
+        self.base_feed.interval_in_seconds = 60
+        self.base_feed._candles = deque(maxlen=100)
+
+    @staticmethod
+    def base_candle(timestamp: float, open_price: float, close_price: float, volume: float = 1.0):
+        return [timestamp, open_price, max(open_price, close_price) + 1, min(open_price, close_price) - 1, close_price,
+                volume, volume * close_price, 2, volume / 2, volume * close_price / 2]
+
+    def test_candles_are_rolled_up_and_aligned(self):
+        # 300 is the start of a 5m candle, 240 is part of a partial one
+        self.base_feed._candles.extend([self.base_candle(240 + 60 * i, 100 + i, 101 + i) for i in range(8)])
+        aggregated = AggregatedCandles(base_feed=self.base_feed, interval="5m", max_records=10)
+
+        candles_df = aggregated.candles_df
+
+        self.assertEqual([300, 600], candles_df["timestamp"].tolist())
+        first_candle = candles_df.iloc[0]
+        self.assertEqual(101, first_candle["open"])
+        self.assertEqual(106, first_candle["close"])
+        self.assertEqual(107, first_candle["high"])
+        self.assertEqual(100, first_candle["low"])
+        self.assertEqual(5, first_candle["volume"])
+        self.assertEqual(10, first_candle["n_trades"])
+        self.assertEqual(2.5, first_candle["taker_buy_base_volume"])
+        # The last candle is in progress
+        self.assertEqual(2, candles_df.iloc[1]["volume"])
+
+    def test_candles_are_updated_incrementally(self):
+        self.base_feed._candles.extend([self.base_candle(300 + 60 * i, 100, 100) for i in range(6)])
+        aggregated = AggregatedCandles(base_feed=self.base_feed, interval="5m", max_records=10)
+        self.assertEqual(2, len(aggregated.candles_df))
+
+        self.base_feed._candles[-1] = self.base_candle(600, 100, 110, volume=3)
+        self.assertEqual(110, aggregated.candles_df.iloc[-1]["close"])
+        self.assertEqual(3, aggregated.candles_df.iloc[-1]["volume"])
+
+        self.base_feed._candles.append(self.base_candle(660, 110, 90))
+        candles_df = aggregated.candles_df
+        self.assertEqual(2, len(candles_df))
+        self.assertEqual(90, candles_df.iloc[-1]["close"])
+        self.assertEqual(89, candles_df.iloc[-1]["low"])
+        self.assertEqual(4, candles_df.iloc[-1]["volume"])
+
+    def test_candles_are_rebuilt_when_the_history_is_filled(self):
+        self.base_feed._candles.extend([self.base_candle(600 + 60 * i, 100, 100) for i in range(3)])
+        aggregated = AggregatedCandles(base_feed=self.base_feed, interval="5m", max_records=2)
+        self.assertEqual([600], aggregated.candles_df["timestamp"].tolist())
+        self.assertFalse(aggregated.ready)
+
+        self.base_feed._candles.extendleft([self.base_candle(540 - 60 * i, 100, 100) for i in range(5)])
+
+        self.assertEqual([300, 600], aggregated.candles_df["timestamp"].tolist())
+        self.assertTrue(aggregated.ready)
+
+    def test_candles_are_cleared_with_the_base_candles(self):
+        self.base_feed._candles.extend([self.base_candle(300 + 60 * i, 100, 100) for i in range(6)])
+        aggregated = AggregatedCandles(base_feed=self.base_feed, interval="5m", max_records=10)
+        self.assertEqual(2, len(aggregated.candles_df))
+
+        self.base_feed._candles.clear()
+
+        self.assertEqual(0, len(aggregated.candles_df))
+
+    def test_unsupported_intervals(self):
+        self.assertTrue(AggregatedCandles.supports_interval("1d"))
+        self.assertFalse(AggregatedCandles.supports_interval("1w"))
+        with self.assertRaises(ValueError):
+            AggregatedCandles(base_feed=self.base_feed, interval="1w")
+        self.base_feed.interval_in_seconds = 180
+        with self.assertRaises(ValueError):
+            AggregatedCandles(base_feed=self.base_feed, interval="5m")
+
+    def test_required_base_records(self):
+        self.assertEqual(505, AggregatedCandles.required_base_records(interval="5m", max_records=100, base_interval="1m"))
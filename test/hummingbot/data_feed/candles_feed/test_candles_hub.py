@@ -0,0 +1,145 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_perpetual_candles import (
+    BinancePerpetualCandles,
+    constants as PERPETUAL_CONSTANTS,
+)
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
+
+class CandlesHubTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub(connector_name="binance", rate_limits=CONSTANTS.RATE_LIMITS,
+                              max_subscriptions_per_connection=2)
+        self.feeds = []
+
+    def tearDown(self) -> None:
+        for feed in self.feeds:
+            self.hub.unsubscribe(feed)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def create_feed(self, trading_pair: str, interval: str = "1m") -> BinanceSpotCandles:
+        feed = BinanceSpotCandles(trading_pair=trading_pair, interval=interval)
+        feed.set_hub(self.hub)
+        self.feeds.append(feed)
+        return feed
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str = "1m"):
+        return {
+            "e": "kline",
+            "E": 1718667728540,
+            "s": symbol,
+            "k": {
+                "t": 1718667720000, "T": 1718667779999, "s": symbol, "i": interval, "f": 3640284441, "L": 3640284686,
+                "o": "66477.91", "c": "66472.20", "h": "66477.91", "l": "66468.00", "v": "10.75", "n": 246,
+                "x": False, "q": "714783.46", "V": "9.29", "Q": "617844.95", "B": "0",
+            }
+        }
+
+    @patch("hummingbot.data_feed.candles_feed.candles_hub._CandlesHubConnection._listen", new_callable=AsyncMock)
+    def test_feeds_of_the_same_stream_share_a_subscription(self, _):
+        first_feed = self.create_feed("BTC-USDT")
+        second_feed = self.create_feed("BTC-USDT")
+        third_feed = self.create_feed("ETH-USDT")
+
+        self.hub.subscribe(first_feed)
+        self.hub.subscribe(second_feed)
+        self.hub.subscribe(third_feed)
+
+        self.assertEqual(2, self.hub.subscriptions_count)
+        self.assertEqual(1, self.hub.connections_count)
+        self.assertEqual([first_feed, second_feed], self.hub.feeds(("BTCUSDT", "1m")))
+
+        self.hub.unsubscribe(first_feed)
+        self.assertEqual(2, self.hub.subscriptions_count)
+
+        self.hub.unsubscribe(second_feed)
+        self.hub.unsubscribe(third_feed)
+        self.assertEqual(0, self.hub.subscriptions_count)
+        self.assertEqual(0, self.hub.connections_count)
+
+    @patch("hummingbot.data_feed.candles_feed.candles_hub._CandlesHubConnection._listen", new_callable=AsyncMock)
+    def test_new_connection_when_the_connections_are_full(self, _):
+        for trading_pair in ("BTC-USDT", "ETH-USDT", "SOL-USDT"):
+            self.hub.subscribe(self.create_feed(trading_pair))
+
+        self.assertEqual(3, self.hub.subscriptions_count)
+        self.assertEqual(2, self.hub.connections_count)
+
+    def test_feeds_share_the_rest_throttler(self):
+        first_feed = self.create_feed("BTC-USDT")
+        second_feed = self.create_feed("ETH-USDT")
+
+        self.assertIs(self.hub.api_factory, first_feed._api_factory)
+        self.assertIs(first_feed._api_factory, second_feed._api_factory)
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_one_message_updates_all_the_feeds_of_the_stream(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        first_feed = self.create_feed("BTC-USDT")
+        second_feed = self.create_feed("BTC-USDT")
+        third_feed = self.create_feed("ETH-USDT")
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("BTCUSDT")))
+
+        self.async_run_with_timeout(first_feed.start_network())
+        self.async_run_with_timeout(second_feed.start_network())
+        self.async_run_with_timeout(third_feed.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m"],
+                         [param for message in sent_messages for param in message["params"]])
+        self.assertEqual(1, len(first_feed._candles))
+        self.assertEqual(1, len(second_feed._candles))
+        self.assertEqual(66472.20, second_feed._candles[-1][4])
+        self.assertEqual(0, len(third_feed._candles))
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_perpetual_messages_update_the_feeds_of_the_stream(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub = CandlesHub(connector_name="binance_perpetual", rate_limits=PERPETUAL_CONSTANTS.RATE_LIMITS,
+                              max_subscriptions_per_connection=2)
+        feeds = [BinancePerpetualCandles(trading_pair="BTC-USDT", interval="1m") for _ in range(2)]
+        for feed in feeds:
+            feed.set_hub(self.hub)
+            self.feeds.append(feed)
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("BTCUSDT")))
+
+        for feed in feeds:
+            self.async_run_with_timeout(feed.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual([feeds[0], feeds[1]], self.hub.feeds(("BTCUSDT", "1m")))
+        self.assertEqual(1, len(feeds[0]._candles))
+        self.assertEqual(1, len(feeds[1]._candles))
+        self.assertEqual(66472.20, feeds[1]._candles[-1][4])
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import socket
+import tempfile
+from pathlib import Path
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.remote_api_order_book_data_source import RemoteAPIOrderBookDataSource
+from hummingbot.data_feed.market_data_daemon import protocol
+from hummingbot.data_feed.market_data_daemon.market_data_daemon import MarketDataDaemon
+
+
+class MockExchangeOrderBookDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshots: Dict[str, OrderBookMessage] = {}
+        self.diff_messages = asyncio.Queue()
+        self.trade_messages = asyncio.Queue()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: 1.0 for trading_pair in trading_pairs}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return self.snapshots[trading_pair]
+
+    async def listen_for_subscriptions(self):
+        await asyncio.Event().wait()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self.diff_messages.get())
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        await asyncio.Event().wait()
+
+    async def listen_for_trades(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        while True:
+            output.put_nowait(await self.trade_messages.get())
+
+
+class MarketDataDaemonTests(IsolatedAsyncioWrapperTestCase):
+    connector_name = "exchange"
+    trading_pair = "COINALPHA-HBOT"
+    other_trading_pair = "WETH-HBOT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.socket_dir = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self.socket_dir.name) / "market_data.sock")
+        self.exchange_data_source = MockExchangeOrderBookDataSource([self.trading_pair, self.other_trading_pair])
+        for trading_pair in (self.trading_pair, self.other_trading_pair):
+            self.exchange_data_source.snapshots[trading_pair] = OrderBookMessage(
+                OrderBookMessageType.SNAPSHOT,
+                {"trading_pair": trading_pair, "update_id": 1, "bids": [(9.0, 1.0)], "asks": [(11.0, 2.0)]},
+                timestamp=1640000000,
+            )
+        self.daemon = MarketDataDaemon(socket_path=self.socket_path,
+                                       data_sources={self.connector_name: self.exchange_data_source})
+        await self.daemon.start()
+        self.client = RemoteAPIOrderBookDataSource(trading_pairs=[self.trading_pair],
+                                                   connector_name=self.connector_name,
+                                                   socket_path=self.socket_path)
+        self.client_task = asyncio.ensure_future(self.client.listen_for_subscriptions())
+
+    async def asyncTearDown(self) -> None:
+        self.client_task.cancel()
+        await self.daemon.stop()
+        self.socket_dir.cleanup()
+        await super().asyncTearDown()
+
+    def diff_message(self, update_id: int, bids: list, asks: list) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=1640000001,
+        )
+
+    async def test_order_book_snapshot_and_diffs_are_relayed(self):
+        order_book = await asyncio.wait_for(self.client.get_new_order_book(self.trading_pair), timeout=1)
+
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual([(9.0, 1.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(11.0, 2.0)], [(row.price, row.amount) for row in order_book.ask_entries()])
+
+        self.exchange_data_source.diff_messages.put_nowait(self.diff_message(2, [(9.5, 3.0)], [(11.0, 0.0)]))
+        diff_queue = self.client._message_queue[self.client._diff_messages_queue_key]
+        diff_message: OrderBookMessage = await asyncio.wait_for(diff_queue.get(), timeout=1)
+
+        self.assertEqual(2, diff_message.update_id)
+        self.assertEqual(self.trading_pair, diff_message.trading_pair)
+        # The snapshots served by the daemon include the diffs already published
+        snapshot = await asyncio.wait_for(self.client._order_book_snapshot(self.trading_pair), timeout=1)
+        self.assertEqual(2, snapshot.update_id)
+        self.assertEqual([(9.5, 3.0), (9.0, 1.0)], [(row.price, row.amount) for row in snapshot.bids])
+        self.assertEqual([], snapshot.asks)
+
+    async def test_messages_are_only_sent_to_the_subscribers_of_the_trading_pair(self):
+        await asyncio.wait_for(self.client.get_new_order_book(self.trading_pair), timeout=1)
+
+        self.exchange_data_source.diff_messages.put_nowait(OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.other_trading_pair, "update_id": 2, "bids": [(9.5, 3.0)], "asks": []},
+            timestamp=1640000001,
+        ))
+        self.exchange_data_source.diff_messages.put_nowait(self.diff_message(3, [], [(10.5, 1.0)]))
+        diff_queue = self.client._message_queue[self.client._diff_messages_queue_key]
+        diff_message: OrderBookMessage = await asyncio.wait_for(diff_queue.get(), timeout=1)
+
+        self.assertEqual(self.trading_pair, diff_message.trading_pair)
+        self.assertEqual(3, diff_message.update_id)
+        self.assertTrue(diff_queue.empty())
+
+    async def test_last_traded_prices(self):
+        await asyncio.wait_for(self.client.get_new_order_book(self.trading_pair), timeout=1)
+        self.exchange_data_source.trade_messages.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_type": 1.0, "trade_id": 1, "update_id": 1,
+             "price": 10.5, "amount": 1.0},
+            timestamp=1640000002,
+        ))
+        trade_queue = self.client._message_queue[self.client._trade_messages_queue_key]
+        trade_message: OrderBookMessage = await asyncio.wait_for(trade_queue.get(), timeout=1)
+        self.assertEqual(1, trade_message.trade_id)
+
+        prices = await asyncio.wait_for(
+            self.client.get_last_traded_prices([self.trading_pair, self.other_trading_pair]), timeout=1)
+
+        # The prices without trades yet are requested to the exchange
+        self.assertEqual({self.trading_pair: 10.5, self.other_trading_pair: 1.0}, prices)
+
+    async def test_subscription_to_unknown_connector_fails(self):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        writer.write(protocol.encode_message({"type": protocol.SUBSCRIBE,
+                                              "request_id": 1,
+                                              "connector": "unknown",
+                                              "trading_pairs": [self.trading_pair]}))
+
+        response = await asyncio.wait_for(protocol.read_message(reader), timeout=1)
+        writer.close()
+
+        self.assertEqual(protocol.ERROR, response["type"])
+        self.assertEqual(1, response["request_id"])
+        self.assertEqual("The market data daemon does not serve unknown.", response["error"])
+
+    async def test_snapshot_of_untracked_trading_pair_fails(self):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        writer.write(protocol.encode_message({"type": protocol.SNAPSHOT,
+                                              "request_id": 1,
+                                              "connector": self.connector_name,
+                                              "trading_pair": "UNKNOWN-HBOT"}))
+
+        response = await asyncio.wait_for(protocol.read_message(reader), timeout=1)
+        writer.close()
+
+        self.assertEqual(protocol.ERROR, response["type"])
+        self.assertEqual(1, response["request_id"])
+        self.assertEqual(f"The market data daemon does not track UNKNOWN-HBOT on {self.connector_name}.",
+                         response["error"])
+
+    async def test_start_fails_when_another_daemon_serves_the_socket(self):
+        other_daemon = MarketDataDaemon(socket_path=self.socket_path,
+                                        data_sources={self.connector_name: self.exchange_data_source})
+
+        with self.assertRaises(FileExistsError):
+            await other_daemon.start()
+
+        # The socket of the running daemon is kept
+        await asyncio.wait_for(self.client.get_new_order_book(self.trading_pair), timeout=1)
+
+    async def test_stale_socket_is_replaced(self):
+        await self.daemon.stop()
+        stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale_socket.bind(self.socket_path)
+        stale_socket.close()
+
+        await self.daemon.start()
+
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        writer.write(protocol.encode_message({"type": protocol.SUBSCRIBE,
+                                              "request_id": 1,
+                                              "connector": self.connector_name,
+                                              "trading_pairs": [self.trading_pair]}))
+        response = await asyncio.wait_for(protocol.read_message(reader), timeout=1)
+        writer.close()
+
+        self.assertEqual({"type": protocol.SUBSCRIBE, "request_id": 1}, response)
+
+    async def test_start_fails_when_the_socket_directory_is_not_private(self):
+        await self.daemon.stop()
+        os.chmod(self.socket_dir.name, 0o755)
+
+        with self.assertRaises(PermissionError):
+            await self.daemon.start()
+
+    async def test_start_fails_when_the_path_is_not_a_socket(self):
+        await self.daemon.stop()
+        Path(self.socket_path).write_text("")
+
+        with self.assertRaises(FileExistsError):
+            await self.daemon.start()
+
+        self.assertTrue(os.path.exists(self.socket_path))
+
+    async def test_malformed_messages_disconnect_the_client(self):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        payload = b"not json"
+        writer.write(protocol.FRAME_HEADER.pack(len(payload)) + payload)
+
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await asyncio.wait_for(protocol.read_message(reader), timeout=1)
+        writer.close()
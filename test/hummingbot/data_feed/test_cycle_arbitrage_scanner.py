@@ -0,0 +1,113 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.data_feed.cycle_arbitrage_scanner import CycleArbitrageScanner
+
+
+class CycleArbitrageScannerTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.order_books: Dict[str, OrderBook] = {
+            "BTC-USDT": self._order_book(bid=100, ask=101),
+            "ETH-USDT": self._order_book(bid=10, ask=10.1),
+            "ETH-BTC": self._order_book(bid=0.1, ask=0.101),
+            "SOL-EUR": self._order_book(bid=1, ask=1.1),
+        }
+        self.scanner = CycleArbitrageScanner(
+            order_books=self.order_books,
+            start_amounts={"USDT": Decimal("100")},
+        )
+
+    @staticmethod
+    def _order_book(bid: float, ask: float, amount: float = 1000) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(bid, amount, 1)], [OrderBookRow(ask, amount, 1)], 1)
+        return order_book
+
+    def test_cycles_are_indexed_by_pair(self):
+        self.assertEqual(2, len(self.scanner.cycles))
+        self.assertEqual(2, len(self.scanner.cycles_for_pair("ETH-BTC")))
+        self.assertEqual(0, len(self.scanner.cycles_for_pair("SOL-EUR")))
+        paths = sorted([" ".join(leg.from_asset for leg in cycle) for cycle in self.scanner.cycles])
+        self.assertEqual(["USDT BTC ETH", "USDT ETH BTC"], paths)
+
+    def test_scan_reports_profitable_cycles_only(self):
+        self.assertEqual([], self.scanner.scan())
+
+        # ETH is now cheap against USDT: USDT -> ETH -> BTC -> USDT is profitable
+        self.order_books["ETH-USDT"].apply_snapshot([OrderBookRow(9, 1000, 2)], [OrderBookRow(9.1, 1000, 2)], 2)
+        opportunities = self.scanner.scan()
+
+        self.assertEqual(1, len(opportunities))
+        opportunity = opportunities[0]
+        self.assertEqual("USDT -> ETH -> BTC -> USDT", opportunity.path)
+        expected_end_amount = Decimal("100") / Decimal("9.1") * Decimal("0.1") * Decimal("100")
+        self.assertAlmostEqual(expected_end_amount, opportunity.end_amount, places=6)
+        self.assertGreater(opportunity.profitability, Decimal("0"))
+
+    def test_scan_only_evaluates_cycles_of_changed_pairs(self):
+        self.scanner.scan()
+        self.assertEqual([], self.scanner.scan())
+
+        self.order_books["SOL-EUR"].apply_diffs([OrderBookRow(1.05, 1, 2)], [], 2)
+        self.assertEqual(0, len(self.scanner._dirty_pairs))
+
+        self.order_books["BTC-USDT"].apply_diffs([OrderBookRow(100.5, 1, 2)], [], 2)
+        self.assertEqual({"BTC-USDT"}, self.scanner._dirty_pairs)
+
+    def test_fees_are_charged_on_every_leg(self):
+        scanner = CycleArbitrageScanner(
+            order_books=self.order_books,
+            start_amounts={"USDT": Decimal("100")},
+            trade_fee_schema=TradeFeeSchema(taker_percent_fee_decimal=Decimal("0.01")),
+            min_profitability=Decimal("-1"),
+        )
+        opportunities = scanner.scan()
+        without_fees = self.scanner.evaluate_cycle(opportunities[0].legs)
+        self.assertAlmostEqual(without_fees.end_amount * Decimal("0.99") ** 3, opportunities[0].end_amount, places=6)
+
+    def test_insufficient_depth_skips_cycle(self):
+        self.order_books["ETH-BTC"].apply_snapshot([OrderBookRow(0.1, 0.01, 2)], [OrderBookRow(0.101, 0.01, 2)], 2)
+        for cycle in self.scanner.cycles:
+            self.assertIsNone(self.scanner.evaluate_cycle(cycle))
+
+    async def test_scan_loop_notifies_opportunities(self):
+        received = []
+        scanner = CycleArbitrageScanner(
+            order_books=self.order_books,
+            start_amounts={"USDT": Decimal("100")},
+            min_profitability=Decimal("-1"),
+            on_opportunities=received.append,
+        )
+        scanner.start()
+        await asyncio.sleep(0.01)
+        scanner.stop()
+        self.assertEqual(1, len(received))
+        self.assertEqual(2, len(received[0]))
+
+    async def test_scan_loop_only_notifies_changed_opportunities(self):
+        received = []
+        scanner = CycleArbitrageScanner(
+            order_books=self.order_books,
+            start_amounts={"USDT": Decimal("100")},
+            min_profitability=Decimal("-1"),
+            update_interval=0.01,
+            on_opportunities=received.append,
+        )
+        scanner.start()
+        await asyncio.sleep(0.02)
+        # A scan that doesn't change the opportunities
+        scanner._changed_event.set()
+        await asyncio.sleep(0.02)
+        self.order_books["BTC-USDT"].apply_snapshot([OrderBookRow(100.5, 1000, 2)], [OrderBookRow(101, 1000, 2)], 2)
+        await asyncio.sleep(0.02)
+        scanner.stop()
+
+        self.assertEqual(2, len(received))
+        self.assertNotEqual([opportunity.end_amount for opportunity in received[0]],
+                            [opportunity.end_amount for opportunity in received[1]])
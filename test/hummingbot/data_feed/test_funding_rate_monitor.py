@@ -0,0 +1,153 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+
+from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.data_feed.funding_rate_monitor import FundingRateMonitor
+
+
+class MockPerpetualConnector(PubSub):
+    def __init__(self, trading_pairs: List[str], funding_info: Dict[str, FundingInfo]):
+        super().__init__()
+        self.trading_pairs = trading_pairs
+        self._funding_info = funding_info
+
+    def get_funding_info(self, trading_pair: str) -> FundingInfo:
+        return self._funding_info[trading_pair]
+
+    def update_rate(self, trading_pair: str, rate: Decimal):
+        funding_info = funding_info_for(trading_pair, rate)
+        self._funding_info[trading_pair] = funding_info
+        self.trigger_event(MarketEvent.FundingInfo, funding_info)
+
+
+def funding_info_for(trading_pair: str, rate: Decimal) -> FundingInfo:
+    return FundingInfo(trading_pair=trading_pair,
+                       index_price=Decimal("100"),
+                       mark_price=Decimal("101"),
+                       next_funding_utc_timestamp=1700000000,
+                       rate=rate)
+
+
+class FundingRateMonitorTests(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.binance = MockPerpetualConnector(
+            trading_pairs=["BTC-USDT", "ETH-USDT"],
+            funding_info={"BTC-USDT": funding_info_for("BTC-USDT", Decimal("0.0001")),
+                          "ETH-USDT": funding_info_for("ETH-USDT", Decimal("0.0001"))})
+        self.hyperliquid = MockPerpetualConnector(
+            trading_pairs=["BTC-USD", "ETH-USD"],
+            funding_info={"BTC-USD": funding_info_for("BTC-USD", Decimal("0.0001"))})
+        self.monitor = FundingRateMonitor(
+            connectors={"binance_perpetual": self.binance, "hyperliquid_perpetual": self.hyperliquid},
+            funding_intervals={"hyperliquid_perpetual": 60 * 60},
+            update_interval=0.01,
+        )
+
+    def tearDown(self):
+        self.monitor.stop()
+        super().tearDown()
+
+    def test_funding_table_is_loaded_from_the_connectors(self):
+        self.monitor.start()
+
+        table = self.monitor.funding_table()
+
+        self.assertEqual(3, len(table))
+        self.assertEqual(0.0001, table.loc[("hyperliquid_perpetual", "BTC-USD"), "rate"])
+        self.assertEqual(101, table.loc[("binance_perpetual", "ETH-USDT"), "mark_price"])
+
+    def test_spreads_are_normalized_by_funding_interval(self):
+        self.monitor.start()
+
+        opportunities = self.monitor.evaluate(timestamp=1)
+
+        self.assertEqual(1, len(opportunities))
+        opportunity = opportunities[0]
+        self.assertEqual("BTC", opportunity.token)
+        self.assertEqual("binance_perpetual", opportunity.long_connector)
+        self.assertEqual("hyperliquid_perpetual", opportunity.short_connector)
+        self.assertEqual("BTC-USD", opportunity.short_trading_pair)
+        # 0.0001 per hour against 0.0001 per 8 hours, over a day
+        self.assertAlmostEqual(Decimal("0.0021"), opportunity.spread, places=10)
+
+    def test_updates_only_reevaluate_their_token(self):
+        self.monitor.start()
+        self.monitor.evaluate()
+
+        self.hyperliquid.update_rate("ETH-USD", Decimal("-0.0001"))
+        self.binance.update_rate("BTC-USDT", Decimal("0.0008"))
+        opportunities = self.monitor.evaluate()
+
+        self.assertEqual(["ETH"], [opportunity.token for opportunity in opportunities])
+        self.assertEqual("hyperliquid_perpetual", opportunities[0].long_connector)
+        history = self.monitor.funding_history(connector_name="binance_perpetual", trading_pair="BTC-USDT")
+        self.assertEqual([0.0001, 0.0008], history["rate"].tolist())
+
+    def test_history_keeps_the_last_updates(self):
+        monitor = FundingRateMonitor(connectors={"binance_perpetual": self.binance}, history_size=2)
+        for i, rate in enumerate(["0.1", "0.2", "0.3"]):
+            monitor.update_funding_info("binance_perpetual", funding_info_for("BTC-USDT", Decimal(rate)), timestamp=i)
+
+        history = monitor.funding_history()
+
+        self.assertEqual([1, 2], history.index.tolist())
+        self.assertEqual([0.2, 0.3], history["rate"].tolist())
+
+    async def test_evaluation_loop_notifies_opportunities(self):
+        received = []
+        monitor = FundingRateMonitor(
+            connectors={"binance_perpetual": self.binance, "hyperliquid_perpetual": self.hyperliquid},
+            funding_intervals={"hyperliquid_perpetual": 60 * 60},
+            on_opportunities=received.append,
+        )
+        monitor.start()
+        await asyncio.sleep(0.01)
+        monitor.stop()
+
+        self.assertEqual(1, len(received))
+        self.assertEqual("BTC", received[0][0].token)
+
+    async def test_evaluation_loop_only_notifies_changed_opportunities(self):
+        received = []
+        monitor = FundingRateMonitor(
+            connectors={"binance_perpetual": self.binance, "hyperliquid_perpetual": self.hyperliquid},
+            funding_intervals={"hyperliquid_perpetual": 60 * 60},
+            update_interval=0.01,
+            on_opportunities=received.append,
+        )
+        monitor.start()
+        await asyncio.sleep(0.02)
+        # Same rate, the opportunities don't change
+        self.binance.update_rate("BTC-USDT", Decimal("0.0001"))
+        await asyncio.sleep(0.02)
+        self.binance.update_rate("BTC-USDT", Decimal("0.0002"))
+        await asyncio.sleep(0.02)
+        monitor.stop()
+
+        self.assertEqual(2, len(received))
+        self.assertAlmostEqual(Decimal("0.0018"), received[1][0].spread, places=10)
+
+    def test_trading_pairs_of_the_same_venue_are_not_compared(self):
+        binance = MockPerpetualConnector(
+            trading_pairs=["BTC-USDT", "BTC-USDC"],
+            funding_info={"BTC-USDT": funding_info_for("BTC-USDT", Decimal("0.0001")),
+                          "BTC-USDC": funding_info_for("BTC-USDC", Decimal("0.0006"))})
+        hyperliquid = MockPerpetualConnector(
+            trading_pairs=["BTC-USD"],
+            funding_info={"BTC-USD": funding_info_for("BTC-USD", Decimal("0.0003"))})
+        monitor = FundingRateMonitor(connectors={"binance_perpetual": binance, "hyperliquid_perpetual": hyperliquid})
+        monitor.start()
+
+        opportunities = monitor.evaluate(timestamp=1)
+        monitor.stop()
+
+        self.assertEqual(
+            [("hyperliquid_perpetual", "BTC-USD", "binance_perpetual", "BTC-USDC"),
+             ("binance_perpetual", "BTC-USDT", "hyperliquid_perpetual", "BTC-USD")],
+            [(opportunity.long_connector, opportunity.long_trading_pair,
+              opportunity.short_connector, opportunity.short_trading_pair) for opportunity in opportunities])
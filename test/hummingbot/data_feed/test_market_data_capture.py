@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.data_feed.market_data_capture import MarketDataCapture
+
+
+class MarketDataCaptureTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+    # 2022-01-01 00:00:00 UTC
+    start_timestamp = 1640995200.0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.capture = MarketDataCapture(output_dir=self.output_dir.name, connector_name="exchange", depth=2)
+        self.order_book = OrderBook()
+        self.order_book.apply_numpy_snapshot(
+            np.array([[9, 1, 1], [8, 2, 1], [7, 3, 1]], dtype=np.float64),
+            np.array([[11, 1.5, 1]], dtype=np.float64))
+
+    def tearDown(self) -> None:
+        self.output_dir.cleanup()
+        super().tearDown()
+
+    def directory(self, data_type: str, date: str) -> Path:
+        return Path(self.output_dir.name) / f"exchange_{self.trading_pair}_{data_type}" / date
+
+    def test_order_book_states_are_captured_once_per_update(self):
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp, self.order_book)
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp + 1, self.order_book)
+        self.order_book.apply_numpy_diffs(np.array([[9.5, 4, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp + 2, self.order_book)
+        self.capture.close()
+
+        table = pq.read_table(self.directory("order_book", "20220101")).to_pydict()
+
+        self.assertEqual([int(self.start_timestamp * 1e6), int((self.start_timestamp + 2) * 1e6)], table["timestamp"])
+        self.assertEqual([1, 2], table["update_id"])
+        self.assertEqual([9, 9.5], table["bid_price_0"])
+        self.assertEqual([8, 9], table["bid_price_1"])
+        self.assertEqual([2, 1], table["bid_amount_1"])
+        self.assertEqual([11, 11], table["ask_price_0"])
+        self.assertTrue(all(np.isnan(table["ask_price_1"])))
+
+    def test_files_are_rotated_per_day(self):
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp - 1, self.order_book)
+        self.order_book.apply_numpy_diffs(np.array([[9.5, 4, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp, self.order_book)
+        self.capture.capture_trade(OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                                       timestamp=self.start_timestamp + 1,
+                                                       type=TradeType.SELL,
+                                                       price=9.5,
+                                                       amount=0.5,
+                                                       trade_id=123))
+        self.capture.close()
+
+        previous_day = pq.read_table(self.directory("order_book", "20211231")).to_pydict()
+        current_day = pq.read_table(self.directory("order_book", "20220101")).to_pydict()
+        trades = pq.read_table(self.directory("trades", "20220101")).to_pydict()
+
+        self.assertEqual([1], previous_day["update_id"])
+        self.assertEqual([2], current_day["update_id"])
+        self.assertEqual([9.5], trades["price"])
+        self.assertEqual([0.5], trades["amount"])
+        self.assertEqual(["sell"], trades["side"])
+        self.assertEqual(["123"], trades["trade_id"])
+
+    def test_each_chunk_is_written_to_a_new_part(self):
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp, self.order_book)
+        self.capture.flush()
+
+        directory = self.directory("order_book", "20220101")
+        self.assertEqual(["part-0.parquet"], sorted(path.name for path in directory.iterdir()))
+        # The part is complete before the capture is closed
+        self.assertEqual([1], pq.read_table(directory / "part-0.parquet").to_pydict()["update_id"])
+
+        self.order_book.apply_numpy_diffs(np.array([[9.5, 4, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp + 1, self.order_book)
+        self.capture.close()
+
+        self.assertEqual(["part-0.parquet", "part-1.parquet"], sorted(path.name for path in directory.iterdir()))
+        self.assertEqual([1, 2], pq.read_table(directory).to_pydict()["update_id"])
+
+    def test_parts_of_a_previous_capture_are_kept(self):
+        self.capture.capture_order_book(self.trading_pair, self.start_timestamp, self.order_book)
+        self.capture.close()
+
+        capture = MarketDataCapture(output_dir=self.output_dir.name, connector_name="exchange", depth=2)
+        self.order_book.apply_numpy_diffs(np.array([[9.5, 4, 2]], dtype=np.float64), np.empty((0, 3)))
+        capture.capture_order_book(self.trading_pair, self.start_timestamp + 1, self.order_book)
+        capture.close()
+
+        directory = self.directory("order_book", "20220101")
+        self.assertEqual([1], pq.read_table(directory / "part-0.parquet").to_pydict()["update_id"])
+        self.assertEqual([2], pq.read_table(directory / "part-1.parquet").to_pydict()["update_id"])
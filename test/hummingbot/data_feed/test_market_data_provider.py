@@ -62,6 +62,27 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    @patch.object(CandlesBase, "stop", MagicMock())
+    def test_aggregated_candles_share_the_finest_interval_feed(self):
+        provider = MarketDataProvider(self.connectors, aggregate_candles=True)
+        provider.initialize_candles_feed_list([
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=100),
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100),
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1h", max_records=10),
+        ])
+
+        self.assertEqual(["binance_BTC-USDT_1m"], list(provider._base_candles_feeds.keys()))
+        base_feed = provider._base_candles_feeds["binance_BTC-USDT_1m"]
+        self.assertEqual(660, base_feed.max_records)
+        for interval in ("1m", "5m", "1h"):
+            self.assertIs(base_feed, provider.candles_feeds[f"binance_BTC-USDT_{interval}"].base_feed)
+
+        for interval in ("1m", "5m", "1h"):
+            provider.stop_candle_feed(
+                CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval=interval, max_records=100))
+        self.assertEqual(0, len(provider._base_candles_feeds))
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
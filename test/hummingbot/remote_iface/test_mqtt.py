@@ -1006,6 +1006,36 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(events_topic, evt_type, msg_key = 'type'))
         self.assertTrue(self.is_msg_received(events_topic, {}, msg_key = 'data'))
 
+    @patch("hummingbot.remote_iface.mqtt.MQTTMarketEventForwarder._MAX_QUEUE_SIZE", 2)
+    def test_mqtt_eventforwarder_drops_oldest_events_when_queue_is_full(self):
+        self.start_mqtt()
+        for i in range(3):
+            self.gateway._market_events._send_mqtt_event(event_tag=999,
+                                                         pubsub=None,
+                                                         event={"event_number": i})
+
+        self.assertEqual(1, self.gateway._market_events.dropped_events_count)
+        self.assertTrue(self._is_logged("WARNING", "The MQTT events queue is full, 1 events were dropped so far."))
+
+        events_topic = f"hbot/{self.instance_id}/events"
+        self.async_run_with_timeout(
+            self.wait_for_rcv(events_topic, {"event_number": 2}, msg_key = 'data'), timeout=10)
+        self.assertTrue(self.is_msg_received(events_topic, {"event_number": 1}, msg_key = 'data'))
+        self.assertFalse(self.is_msg_received(events_topic, {"event_number": 0}, msg_key = 'data'))
+
+    def test_mqtt_eventforwarder_publishes_events_of_the_same_interval_together(self):
+        self.start_mqtt()
+        market_events = self.gateway._market_events
+        market_events._publish_events = MagicMock()
+        for i in range(3):
+            market_events._send_mqtt_event(event_tag=999, pubsub=None, event={"event_number": i})
+
+        self.async_run_with_timeout(asyncio.sleep(market_events._BATCH_INTERVAL * 3))
+
+        market_events._publish_events.assert_called_once()
+        self.assertEqual([(999, {"event_number": i}) for i in range(3)],
+                         market_events._publish_events.call_args[0][0])
+
     def test_mqtt_notifier_fakes(self):
         self.start_mqtt()
         self.assertEqual(self.gateway._notifier.start(), None)
@@ -379,6 +379,26 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertAlmostEqual(Decimal("3.0"), maker_fill.amount)
         self.assertAlmostEqual(Decimal("3.0"), taker_fill.amount)
 
+    @patch('hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making.'
+           'CrossExchangeMarketMakingStrategy.is_gateway_market')
+    def test_maker_fill_is_hedged_from_the_fill_event(self, is_gateway_mock: unittest.mock.Mock):
+        is_gateway_mock.return_value = False
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+        bid_order: LimitOrder = self.strategy.active_maker_bids[0][1]
+
+        self.simulate_limit_order_fill(self.maker_market, bid_order)
+
+        # The hedge is submitted without waiting for a task or the next tick
+        self.assertEqual([], self.strategy._hedge_maker_order_tasks)
+        self.assertEqual(1, len(self.strategy._maker_to_taker_order_ids[bid_order.client_order_id]))
+        self.assertEqual(1, len(self.taker_market.queued_orders))
+        hedge_order = self.taker_market.queued_orders[0]
+        self.assertFalse(hedge_order.is_buy)
+        self.assertEqual(Decimal("3.0"), hedge_order.amount)
+
     def test_top_depth_tolerance(self):  # TODO
         self.clock.remove_iterator(self.strategy)
         self.clock.add_iterator(self.strategy_with_top_depth_tolerance)
@@ -0,0 +1,53 @@
+import math
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.strategy.cross_exchange_market_making.taker_vwap_cache import TakerVWAPCache
+
+
+class TakerVWAPCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 1], [3, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 1], [6, 1, 1]], dtype=np.float64)
+        self.order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.cache = TakerVWAPCache()
+
+    def test_vwaps_follow_the_order_book_diffs(self):
+        self.assertEqual(Decimal("2.5"), self.cache.get_vwap(self.order_book, False, Decimal("2")))
+        self.assertEqual(Decimal("4.5"), self.cache.get_vwap(self.order_book, True, Decimal("2")))
+        self.assertEqual({(self.order_book, 2.0)}, self.cache.watches)
+
+        self.order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64), np.array([[4, 0, 2]], dtype=np.float64))
+
+        self.assertEqual(Decimal("5.5"), self.cache.get_vwap(self.order_book, True, Decimal("2")))
+        self.assertEqual(
+            self.order_book.get_vwap_for_volume(True, 2).result_price,
+            float(self.cache.get_vwap(self.order_book, True, Decimal("2")))
+        )
+
+    def test_vwap_is_nan_when_the_order_book_is_not_deep_enough(self):
+        self.assertTrue(math.isnan(self.cache.get_vwap(self.order_book, True, Decimal("4"))))
+
+    def test_unused_watches_are_pruned(self):
+        self.cache.get_vwap(self.order_book, True, Decimal("1"))
+        self.cache.get_vwap(self.order_book, True, Decimal("2"))
+        self.cache.prune()
+        self.cache.get_vwap(self.order_book, False, Decimal("2"))
+        self.cache.prune()
+
+        self.assertEqual({(self.order_book, 2.0)}, self.cache.watches)
+        self.assertEqual([2.0], list(self.order_book.price_watches.keys()))
+
+        self.cache.clear()
+
+        self.assertEqual(set(), self.cache.watches)
+        self.assertEqual({}, self.order_book.price_watches)
+
+    def test_composite_order_books_are_not_supported(self):
+        self.assertTrue(TakerVWAPCache.is_supported(self.order_book))
+        self.assertFalse(TakerVWAPCache.is_supported(CompositeOrderBook()))
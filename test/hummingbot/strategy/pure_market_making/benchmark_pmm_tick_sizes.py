@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+"""
+Measures the time of the pure market making ticks when the proposals are computed in floats on the tick grids of the
+trading rules, and when they are computed in Decimals through the market quantization.
+
+Every strategy creates a new 20 levels proposal, with the order optimization, the transaction costs and the inventory
+skew, on every tick (the order refresh time is 0 and the active orders are kept by the refresh tolerance).
+
+Usage, from the root of the repository: python -m test.hummingbot.strategy.pure_market_making.benchmark_pmm_tick_sizes
+"""
+
+import time
+from decimal import Decimal
+from typing import List, Tuple
+
+from bin import path_util  # noqa: F401
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+QUOTE_ASSET = "USDT"
+TRADING_PAIRS = [f"COIN{index}-{QUOTE_ASSET}" for index in range(10)]
+ORDER_LEVELS = 20
+TICKS = 200
+START_TIMESTAMP = 1546300800.0
+
+
+class TickSizesPureMarketMakingStrategy(PureMarketMakingStrategy):
+    # The price and amount quantums of the mock market
+    def get_tick_sizes(self):
+        return Decimal("0.01"), Decimal("0.001")
+
+
+def create_market() -> MockPaperExchange:
+    market = MockPaperExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.001"),
+                                        taker_percent_fee_decimal=Decimal("0.002")),
+    )
+    market.set_balance(QUOTE_ASSET, 1000000)
+    for trading_pair in TRADING_PAIRS:
+        market.set_balanced_order_book(trading_pair=trading_pair,
+                                       mid_price=100,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        market.set_quantization_param(QuantizationParams(trading_pair, 6, 2, 6, 3))
+        market.set_balance(trading_pair.split("-")[0], 1000)
+    return market
+
+
+def create_strategies(strategy_class, market: MockPaperExchange) -> List[PureMarketMakingStrategy]:
+    strategies = []
+    for trading_pair in TRADING_PAIRS:
+        strategy = strategy_class()
+        strategy.init_params(
+            MarketTradingPairTuple(market, trading_pair, trading_pair.split("-")[0], QUOTE_ASSET),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=ORDER_LEVELS,
+            order_level_spread=Decimal("0.001"),
+            order_level_amount=Decimal("0.1"),
+            order_refresh_time=0,
+            order_refresh_tolerance_pct=Decimal("0.01"),
+            order_optimization_enabled=True,
+            add_transaction_costs_to_orders=True,
+            inventory_skew_enabled=True,
+            inventory_target_base_pct=Decimal("0.09"),
+            inventory_range_multiplier=Decimal("1"),
+            minimum_spread=-1,
+        )
+        strategies.append(strategy)
+    return strategies
+
+
+def run(strategy_class) -> Tuple[float, int]:
+    """
+    Returns the mean duration of a tick, in seconds, and the number of orders placed on the first tick.
+    """
+    market = create_market()
+    strategies = create_strategies(strategy_class, market)
+    clock = Clock(ClockMode.BACKTEST, 1.0, START_TIMESTAMP, START_TIMESTAMP + TICKS + 10)
+    clock.add_iterator(market)
+    for strategy in strategies:
+        clock.add_iterator(strategy)
+    # The first tick places the orders
+    clock.backtest_til(START_TIMESTAMP + 1)
+    orders = len(market.limit_orders)
+
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        timestamp = START_TIMESTAMP + 2 + tick
+        for strategy in strategies:
+            strategy.tick(timestamp)
+    return (time.perf_counter() - start) / (TICKS * len(strategies)), orders
+
+
+def main():
+    for name, strategy_class in (("Decimal", PureMarketMakingStrategy),
+                                 ("ticks", TickSizesPureMarketMakingStrategy)):
+        duration, orders = run(strategy_class)
+        print(f"{name:>8}: {duration * 1e6:8.1f} us per tick ({len(TRADING_PAIRS)} pairs, {ORDER_LEVELS} levels, "
+              f"{orders} orders)")
+
+
+if __name__ == "__main__":
+    main()
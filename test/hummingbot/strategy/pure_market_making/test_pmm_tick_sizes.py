@@ -0,0 +1,302 @@
+import unittest
+from decimal import Decimal
+from typing import List, Tuple
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+# Removes the order book entries above the top bid and below the top ask, for a wider bid ask spread
+def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask: float):
+    bid_diffs: List[OrderBookRow] = []
+    ask_diffs: List[OrderBookRow] = []
+    update_id: int = order_book.last_diff_uid + 1
+    for row in order_book.bid_entries():
+        if row.price > top_bid:
+            bid_diffs.append(OrderBookRow(row.price, 0, update_id))
+        else:
+            break
+    for row in order_book.ask_entries():
+        if row.price < top_ask:
+            ask_diffs.append(OrderBookRow(row.price, 0, update_id))
+        else:
+            break
+    order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
+
+
+class TickSizesPureMarketMakingStrategy(PureMarketMakingStrategy):
+    def get_tick_sizes(self):
+        return Decimal("0.01"), Decimal("0.1")
+
+
+class CustomQuantumBinanceExchange(BinanceExchange):
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.5")
+
+
+class PureMMTickSizesUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def setUp(self):
+        self.clock_tick_size = 1
+        self.clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+        self.market: MockPaperExchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap())
+        )
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                            mid_price=100,
+                                            min_price=1,
+                                            max_price=200,
+                                            price_step_size=1,
+                                            volume_step_size=10)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(
+            QuantizationParams(
+                self.trading_pair, 6, 6, 6, 6
+            )
+        )
+        self.market_info = MarketTradingPairTuple(self.market, self.trading_pair,
+                                                  self.base_asset, self.quote_asset)
+        self.clock.add_iterator(self.market)
+
+        self.strategy = TickSizesPureMarketMakingStrategy()
+        self.strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("1"),
+            minimum_spread=-1,
+        )
+
+    def test_markets_without_trading_rules_have_no_tick_sizes(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(self.market_info,
+                             bid_spread=Decimal("0.01"),
+                             ask_spread=Decimal("0.01"),
+                             order_amount=Decimal("1"))
+
+        self.assertIsNone(strategy.get_tick_sizes())
+
+    def test_orders_are_created_on_the_tick_grids(self):
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        buys = self.strategy.active_buys
+        sells = self.strategy.active_sells
+        self.assertEqual([Decimal("99"), Decimal("98"), Decimal("97")], [buy.price for buy in buys])
+        self.assertEqual([Decimal("1"), Decimal("2"), Decimal("3")], [buy.quantity for buy in buys])
+        self.assertEqual([Decimal("101"), Decimal("102"), Decimal("103")], [sell.price for sell in sells])
+        self.assertEqual([Decimal("1"), Decimal("2"), Decimal("3")], [sell.quantity for sell in sells])
+        self.assertTrue(all(isinstance(order.price, Decimal) for order in buys + sells))
+
+    def test_budget_constraint_rounds_sizes_down_to_the_amount_increment(self):
+        self.market.set_balance("HBOT", Decimal("2.25"))
+        self.market.set_balance("ETH", Decimal("250"))
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual([Decimal("1"), Decimal("1.5")], [buy.quantity for buy in self.strategy.active_buys])
+        self.assertEqual([Decimal("1"), Decimal("1.2")], [sell.quantity for sell in self.strategy.active_sells])
+
+    def test_budget_constraint_does_not_round_a_balance_just_below_an_increment_up(self):
+        self.market.set_balance("HBOT", Decimal("2.19999999999"))
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual([Decimal("1"), Decimal("1.1")], [sell.quantity for sell in self.strategy.active_sells])
+
+    def test_tick_sizes_are_the_trading_rule_increments_of_exchange_py_base_markets(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        exchange = BinanceExchange(client_config_map=client_config_map,
+                                   binance_api_key="testAPIKey",
+                                   binance_api_secret="testSecret",
+                                   trading_pairs=[self.trading_pair],
+                                   trading_required=False)
+        custom_quantum_exchange = CustomQuantumBinanceExchange(client_config_map=client_config_map,
+                                                               binance_api_key="testAPIKey",
+                                                               binance_api_secret="testSecret",
+                                                               trading_pairs=[self.trading_pair],
+                                                               trading_required=False)
+        strategies = []
+        for market in (exchange, custom_quantum_exchange):
+            strategy = PureMarketMakingStrategy()
+            strategy.init_params(MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+                                 bid_spread=Decimal("0.01"),
+                                 ask_spread=Decimal("0.01"),
+                                 order_amount=Decimal("1"))
+            strategies.append(strategy)
+
+        # No trading rule yet
+        self.assertIsNone(strategies[0].get_tick_sizes())
+
+        for market in (exchange, custom_quantum_exchange):
+            market._trading_rules[self.trading_pair] = TradingRule(trading_pair=self.trading_pair,
+                                                                   min_order_size=Decimal("0.01"),
+                                                                   min_price_increment=Decimal("0.0001"),
+                                                                   min_base_amount_increment=Decimal("0.001"))
+
+        self.assertEqual((Decimal("0.0001"), Decimal("0.001")), strategies[0].get_tick_sizes())
+        # The market quantizes the prices with its own quantum
+        self.assertIsNone(strategies[1].get_tick_sizes())
+
+        exchange._trading_rules[self.trading_pair] = TradingRule(trading_pair=self.trading_pair,
+                                                                 min_order_size=Decimal("0.01"),
+                                                                 min_price_increment=Decimal("0"),
+                                                                 min_base_amount_increment=Decimal("0.001"))
+
+        self.assertIsNone(strategies[0].get_tick_sizes())
+
+
+class PureMMTickSizesParityUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def setUp(self):
+        self.clock_tick_size = 1
+        self.params = dict(
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("0.5"),
+            minimum_spread=-1,
+        )
+
+    def create_market(self) -> MockPaperExchange:
+        market = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.001"),
+                                            taker_percent_fee_decimal=Decimal("0.002")),
+        )
+        market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                       mid_price=100,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        # Top bid 97.5 and top ask 102.5, so that the order optimization moves the prices
+        simulate_order_book_widening(market.order_books[self.trading_pair], 98, 102)
+        market.set_balance("HBOT", 47)
+        market.set_balance("ETH", 5000)
+        # The price and amount quantums of the market are the tick sizes, 0.01 and 0.1
+        market.set_quantization_param(
+            QuantizationParams(
+                self.trading_pair, 6, 2, 6, 1
+            )
+        )
+        return market
+
+    def place_orders(self, strategy: PureMarketMakingStrategy, **params) -> List[Tuple[bool, Decimal, Decimal]]:
+        clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+        market = self.create_market()
+        strategy.init_params(MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+                             **{**self.params, **params})
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        # The Decimal chain can propose prices between two price increments (e.g. the order levels of the order
+        # optimization), the market rounds them down when placing the orders, so the orders are compared as the
+        # market placed them
+        return sorted((order.is_buy, order.price, order.quantity) for order in market.limit_orders)
+
+    def assert_same_orders_in_ticks_and_in_decimals(self, **params) -> List[Tuple[bool, Decimal, Decimal]]:
+        orders_in_ticks = self.place_orders(TickSizesPureMarketMakingStrategy(), **params)
+        orders_in_decimals = self.place_orders(PureMarketMakingStrategy(), **params)
+
+        self.assertGreater(len(orders_in_ticks), 0)
+        self.assertEqual(orders_in_decimals, orders_in_ticks)
+        return orders_in_ticks
+
+    def test_base_proposal(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals()
+
+        self.assertEqual([Decimal("99"), Decimal("98"), Decimal("97")],
+                         [price for is_buy, price, _ in reversed(orders) if is_buy])
+
+    def test_order_optimization(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals(order_optimization_enabled=True)
+
+        self.assertEqual(Decimal("97.51"), max(price for is_buy, price, _ in orders if is_buy))
+        self.assertEqual(Decimal("102.49"), min(price for is_buy, price, _ in orders if not is_buy))
+
+    def test_order_optimization_with_split_order_levels(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals(
+            order_optimization_enabled=True,
+            split_order_levels_enabled=True,
+            bid_order_level_spreads=[Decimal("1"), Decimal("2")],
+            ask_order_level_spreads=[Decimal("1"), Decimal("2")],
+            order_override={"split_level_0": ["buy", Decimal("1"), Decimal("1")],
+                            "split_level_1": ["buy", Decimal("2"), Decimal("2")],
+                            "split_level_2": ["sell", Decimal("1"), Decimal("1")],
+                            "split_level_3": ["sell", Decimal("2"), Decimal("2")]},
+        )
+
+        self.assertEqual(4, len(orders))
+        self.assertEqual(Decimal("97.51"), max(price for is_buy, price, _ in orders if is_buy))
+
+    def test_add_transaction_costs(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals(add_transaction_costs_to_orders=True)
+
+        self.assertEqual(Decimal("98.90"), max(price for is_buy, price, _ in orders if is_buy))
+        self.assertEqual(Decimal("101.10"), min(price for is_buy, price, _ in orders if not is_buy))
+
+    def test_inventory_skew(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals(inventory_skew_enabled=True,
+                                                                  inventory_target_base_pct=Decimal("0.5"),
+                                                                  inventory_range_multiplier=Decimal("1"))
+
+        self.assertNotEqual([Decimal("1"), Decimal("1.5"), Decimal("2")],
+                            sorted(size for is_buy, _, size in orders if is_buy))
+
+    def test_order_override(self):
+        orders = self.assert_same_orders_in_ticks_and_in_decimals(
+            order_override={"order_one": ["buy", 0.5, 0.7],
+                            "order_two": ["buy", 1.3, 1.1],
+                            "order_three": ["sell", 1.1, 2]},
+        )
+
+        self.assertEqual([(False, Decimal("101.10"), Decimal("2")),
+                          (True, Decimal("98.70"), Decimal("1.1")),
+                          (True, Decimal("99.50"), Decimal("0.7"))],
+                         orders)
+
+    def test_all_modifiers(self):
+        self.assert_same_orders_in_ticks_and_in_decimals(order_optimization_enabled=True,
+                                                         add_transaction_costs_to_orders=True,
+                                                         inventory_skew_enabled=True,
+                                                         inventory_target_base_pct=Decimal("0.5"),
+                                                         inventory_range_multiplier=Decimal("1"))
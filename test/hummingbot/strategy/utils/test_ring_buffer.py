@@ -107,3 +107,38 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_sums(self):
+        buffer = RingBuffer(5)
+        values = [3, -1, 4, 1, -5, 9, 2, -6, 5, 3, 5, 8]
+        for i, value in enumerate(values):
+            buffer.add_value(value)
+            expected = np.array(values[max(0, i - 4):i + 1], dtype=np.float64)
+            self.assertEqual(expected.size, buffer.size)
+            self.assertEqual(expected.size, len(buffer))
+            self.assertAlmostEqual(np.sum(expected), buffer.sum)
+            self.assertAlmostEqual(np.sum(np.square(expected)), buffer.sum_of_squares)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(expected))), buffer.sum_of_squared_differences)
+            self.assertEqual(expected[0], buffer.get_first_value())
+
+    def test_running_sums_recover_from_nan_values(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2, 3, 4]:
+            buffer.add_value(value)
+        self.assertEqual(9, buffer.sum)
+        self.assertEqual(2, buffer.sum_of_squared_differences)
+
+    def test_views(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        older, newer = buffer.get_views()
+
+        self.assertTrue(np.array_equal(np.array([2, 3]), older))
+        self.assertTrue(np.array_equal(np.array([4, 5]), newer))
+        # Views of the buffer, not copies
+        self.assertIsNotNone(older.base)
+        self.assertIsNotNone(newer.base)
+        self.assertFalse(older.flags.writeable)
+        self.assertFalse(newer.flags.writeable)
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+import pandas as pd
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_calculate_ema_over_the_sampling_buffer(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 3 + 7)
+        self.indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, self.indicator.current_value, 8)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH)
+        self.indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 5
+        self.indicator.add_sample(100)
+
+        expected = pd.Series(np.append(samples[-4:], 100)).ewm(span=5, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, self.indicator.current_value, 8)
+
+    def test_processing_length_should_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, processing_length=2)
@@ -20,3 +20,13 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_is_calculated_over_the_sampling_buffer(self):
+        samples = np.random.normal(100, 10, 95)
+        self.indicator = InstantVolatilityIndicator(30, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i - 29):i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 6)
@@ -259,3 +259,34 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_samples_leaving_the_buffer_are_removed_from_the_estimation(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+
+        # The first sample follows a different curve, it leaves the buffer when the third sample is added
+        for curve_params, amount_factor in (((10, 1), 1), ((a, b), 0.5), ((a, b), 0.5)):
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+            timestamp += 1
+            for p in trade_price_levels:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=p,
+                    amount=curve_fn(p - last_price, *curve_params) * amount_factor,
+                    type=TradeType.SELL,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+        alpha, kappa = trading_intensity_indicator.current_value
+        self.assertAlmostEqual(a, alpha, 6)
+        self.assertAlmostEqual(b, kappa, 6)
@@ -17,7 +17,7 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
 )
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
-from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevelStates
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevel, GridLevelStates
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop, TripleBarrierConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
@@ -266,6 +266,81 @@ class TestGridExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor.update_grid_levels()
         self.assertTrue(len(executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]) < 5)
 
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("110")))
+    def test_activation_bounds_match_decimal_prices(self):
+        for side in (TradeType.BUY, TradeType.SELL):
+            config = GridExecutorConfig(
+                id="test",
+                timestamp=123,
+                side=side,
+                connector_name="binance",
+                trading_pair="ETH-USDT",
+                start_price=Decimal("100"),
+                end_price=Decimal("120"),
+                total_amount_quote=Decimal("100"),
+                min_spread_between_orders=Decimal("0.01"),
+                min_order_amount_quote=Decimal("9"),
+                activation_bounds=Decimal("0.05"),
+                limit_price=Decimal("90"),
+                triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.001")),
+            )
+            executor = self.get_grid_executor_from_config(config)
+            executor.update_grid_levels()
+            executor.grid_levels[5].active_open_order = TrackedOrder("OID-BUY-1")
+            executor.update_grid_levels()
+            factor = 1 - config.activation_bounds if side == TradeType.BUY else 1 + config.activation_bounds
+            # Bounds between levels and exactly on a level price
+            for mid_price in (Decimal("101"), Decimal("110.3"), executor.grid_levels[4].price / factor):
+                executor.mid_price = mid_price
+                bound = mid_price * factor
+                expected = [level for level in executor.levels_by_state[GridLevelStates.NOT_ACTIVE]
+                            if (level.price >= bound if side == TradeType.BUY else level.price <= bound)]
+                self.assertEqual([level.id for level in expected],
+                                 [executor.grid_levels[index].id
+                                  for index in executor._filter_levels_by_activation_bounds()])
+                expected_by_proximity = sorted(expected, key=lambda level: abs(level.price - mid_price))
+                self.assertEqual([level.id for level in expected_by_proximity],
+                                 [executor.grid_levels[index].id for index in
+                                  executor._sort_levels_by_proximity(executor._filter_levels_by_activation_bounds())])
+
+    @patch.object(GridExecutor, "get_price", MagicMock(return_value=Decimal("110")))
+    def test_update_grid_levels_only_updates_levels_with_orders(self):
+        config = GridExecutorConfig(
+            id="test",
+            timestamp=123,
+            side=TradeType.BUY,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("100"),
+            end_price=Decimal("120"),
+            total_amount_quote=Decimal("100"),
+            min_spread_between_orders=Decimal("0.01"),
+            min_order_amount_quote=Decimal("9"),
+            limit_price=Decimal("90"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.001")),
+        )
+        executor = self.get_grid_executor_from_config(config)
+        executor.update_grid_levels()
+        self.assertEqual(10, len(executor.levels_by_state[GridLevelStates.NOT_ACTIVE]))
+
+        level = executor.grid_levels[3]
+        level.active_open_order = TrackedOrder("OID-BUY-1")
+        with patch.object(GridLevel, "update_state", autospec=True, side_effect=GridLevel.update_state) as update_mock:
+            executor.update_grid_levels()
+        update_mock.assert_called_once_with(level)
+        self.assertEqual([level], executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED])
+        self.assertEqual(9, len(executor.levels_by_state[GridLevelStates.NOT_ACTIVE]))
+        self.assertNotIn(level, executor.levels_by_state[GridLevelStates.NOT_ACTIVE])
+
+        executor.process_order_canceled_event(1, MagicMock(), OrderCancelledEvent(
+            timestamp=1234567890, order_id="OID-BUY-1"))
+        executor.update_grid_levels()
+        self.assertIsNone(level.active_open_order)
+        self.assertEqual(["OID-BUY-1"], executor._canceled_orders)
+        self.assertEqual(0, len(executor.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]))
+        self.assertEqual([level.id for level in executor.grid_levels],
+                         [level.id for level in executor.levels_by_state[GridLevelStates.NOT_ACTIVE]])
+
     @patch.object(GridExecutor, "get_price")
     async def test_grid_activation_bounds_close_orders(self, get_price_mock):
         get_price_mock.return_value = Decimal("100")
@@ -7,6 +7,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -162,6 +163,26 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct")
+    @patch.object(ExecutorBase, "get_net_pnl_quote")
+    @patch.object(ExecutorBase, "get_cum_fees_quote")
+    def test_executor_info_is_cached_until_the_executor_changes(self, cum_fees_quote_mock, net_pnl_quote_mock,
+                                                                net_pnl_pct_mock):
+        net_pnl_pct_mock.return_value = Decimal("0.01")
+        net_pnl_quote_mock.return_value = Decimal("1.0")
+        cum_fees_quote_mock.return_value = Decimal("0.1")
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+        self.assertEqual(1, cum_fees_quote_mock.call_count)
+
+        self.component._fill_order_forwarder(MagicMock())
+        net_pnl_quote_mock.return_value = Decimal("2.0")
+        self.assertEqual(Decimal("2.0"), self.component.executor_info.net_pnl_quote)
+
+        self.component._status = RunnableStatus.TERMINATED
+        self.assertEqual(RunnableStatus.TERMINATED, self.component.executor_info.status)
+        self.assertEqual(3, cum_fees_quote_mock.call_count)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
@@ -170,6 +191,19 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         order_book = self.component.get_order_book("connector1", "ETH-USDT")
         self.assertEqual(order_book.last_diff_uid, 0)
 
+    def test_watch_order_book_prices_wakes_up_control_loop(self):
+        order_book = self.strategy.connectors["connector1"].get_order_book.return_value
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.component.watch_order_book_prices("connector1", "ETH-USDT", Decimal("0"))
+        self.assertEqual({0.0: (99, 101)}, order_book.price_watches)
+        self.assertFalse(self.component._wake_up_event.is_set())
+
+        order_book.apply_diffs([OrderBookRow(100, 1, 2)], [], 2)
+        self.assertTrue(self.component._wake_up_event.is_set())
+
+        self.component.unwatch_order_book_prices()
+        self.assertEqual({}, order_book.price_watches)
+
     def test_get_total_and_available_balance(self):
         balance = self.component.get_balance("connector1", "ETH")
         self.assertEqual(balance, Decimal("0.0"))
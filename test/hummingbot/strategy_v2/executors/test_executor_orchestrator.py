@@ -128,6 +128,44 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 0)
 
+    def test_get_executors_report_indexes_the_executors(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        executors = []
+        for executor_id, side, level_id, is_active in (("1", TradeType.BUY, "buy_0", True),
+                                                       ("2", TradeType.SELL, "sell_0", True),
+                                                       ("3", TradeType.BUY, "buy_0", False)):
+            executor = MagicMock(spec=PositionExecutor)
+            executor.executor_info = ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor",
+                status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED, config=config,
+                filled_amount_quote=Decimal(0), net_pnl_quote=Decimal(0), net_pnl_pct=Decimal(0),
+                cum_fees_quote=Decimal(0), is_trading=False, is_active=is_active,
+                custom_info={"side": side, "level_id": level_id}
+            )
+            executors.append(executor)
+        self.orchestrator.active_executors["test"] = executors
+
+        report = self.orchestrator.get_executors_report()
+        index = self.orchestrator.get_executors_index("test")
+
+        self.assertEqual(["1", "2", "3"], [executor_info.id for executor_info in report["test"]])
+        self.assertEqual(["1", "2"], [executor_info.id for executor_info in index.active])
+        self.assertEqual(["1", "3"], [executor_info.id for executor_info in index.by_side[TradeType.BUY]])
+        self.assertEqual(["1"], [executor_info.id for executor_info in index.active_by_side(TradeType.BUY)])
+        self.assertEqual(["buy_0", "sell_0"], index.active_level_ids())
+
+        # The index is kept while the executors info don't change
+        self.orchestrator.get_executors_report()
+        self.assertIs(index, self.orchestrator.get_executors_index("test"))
+
+        executors.pop()
+        self.orchestrator.get_executors_report()
+        self.assertIsNot(index, self.orchestrator.get_executors_index("test"))
+        self.assertEqual(0, len(self.orchestrator.get_executors_index("unknown").executors))
+
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_performance_report(self, mock_get_instance):
         # Create a mock for MarketsRecorder and its get_executors_by_controller method
@@ -180,23 +218,16 @@ class TestExecutorOrchestrator(unittest.TestCase):
         mock_markets_recorder = MagicMock(spec=MarketsRecorder)
         mock_get_instance.return_value = mock_markets_recorder
 
-        # Create mock executor info
-        executor_info = ExecutorInfo(
-            id="123", timestamp=1234, type="position_executor",
-            status=RunnableStatus.RUNNING, config=PositionExecutorConfig(
-                timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
-                side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
-            ),
-            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(10), net_pnl_pct=Decimal(10),
-            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={"side": TradeType.BUY},
-            controller_id="test",
-        )
-
-        # Set up mock to return executor info
-        mock_markets_recorder.get_all_executors.return_value = [executor_info]
+        # Set up mock to return the stored performance of a controller
+        mock_markets_recorder.get_controllers_performance.return_value = {
+            "test": PerformanceReport(realized_pnl_quote=Decimal(10), volume_traded=Decimal(100),
+                                      close_type_counts={CloseType.TAKE_PROFIT: 1}),
+        }
 
         orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy)
         self.assertEqual(len(orchestrator.cached_performance), 1)
+        self.assertEqual(Decimal(10), orchestrator.cached_performance["test"].realized_pnl_quote)
+        self.assertEqual([], orchestrator.active_executors["test"])
 
     @patch.object(MarketsRecorder, "get_instance")
     def test_store_all_positions(self, markets_recorder_mock):
@@ -259,6 +290,7 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.active_executors["test"] = [position_executor]
         self.orchestrator.store_all_executors()
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 0)
+        markets_recorder_mock.return_value.submit_executors.assert_called_once_with([position_executor])
 
     @patch.object(ExecutorOrchestrator, "store_all_positions")
     def test_stop(self, store_all_positions):
@@ -25,3 +25,20 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+    async def test_wake_up_runs_control_task_before_update_interval(self):
+        self.component.update_interval = 10
+        calls = []
+
+        async def control_task():
+            calls.append(1)
+
+        self.component.control_task = control_task
+        self.component.start()
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, len(calls))
+        self.component.wake_up()
+        await asyncio.sleep(0.01)
+        self.assertEqual(2, len(calls))
+        self.component.stop()
+        self.component.wake_up()